@@ -113,8 +113,8 @@ async def _stream_export(
     Common pipeline shared by every dataset endpoint:
       1. Persist the audit row (status=started) so an interrupted download is
          still recorded.
-      2. Wrap the dataset iterator with a row counter.
-      3. Wrap the formatter generator so we mark the audit row completed
+      2. Open the service's body stream, which tallies rows into a counter.
+      3. Wrap that stream so we mark the audit row completed
          (or failed) when the response finishes.
     """
     audit_row = await service.audit_start(
@@ -135,15 +135,8 @@ async def _stream_export(
     )
 
     row_counter = {"n": 0}
-
-    async def _counted_rows():
-        """Yield dataset rows while tallying them into ``row_counter``."""
-        async for row in service.iter_dataset(dataset_type, filters):
-            row_counter["n"] += 1
-            yield row
-
-    body_iter = service.format_iterator(
-        dataset_type, export_format.value, _counted_rows()
+    body_iter = service.stream_export(
+        dataset_type, export_format.value, filters, row_counter
     )
 
     async def _wrapped():
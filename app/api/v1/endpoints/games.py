@@ -2,8 +2,8 @@
 Aggregator for /games endpoints.
 
 The original monolithic implementation was split by sub-resource into
-``games_crud``, ``games_strategy``, ``games_tasks``, ``games_points`` and
-``games_users``. This module only:
+``games_crud``, ``games_strategy``, ``games_tasks``, ``games_points``,
+``games_users`` and ``games_leaderboard``. This module only:
 
 * Combines those sub-routers into a single ``router`` exposed to the API.
 * Re-exports endpoint callables and shared module-level symbols so existing
@@ -15,6 +15,7 @@ from fastapi import APIRouter
 
 from app.api.v1.endpoints import (
     games_crud,
+    games_leaderboard,
     games_points,
     games_strategy,
     games_tasks,
@@ -40,9 +41,13 @@ from app.api.v1.endpoints.games_crud import (
     patch_game,
 )
 
+# Leaderboards
+from app.api.v1.endpoints.games_leaderboard import get_leaderboard, get_leaderboard_user
+
 # Points / actions
 from app.api.v1.endpoints.games_points import (
     assign_points_to_user,
+    assign_points_to_users_batch,
     get_points_by_gameId,
     get_points_by_gameId_with_details,
     get_points_by_task_id,
@@ -80,6 +85,7 @@ router.include_router(games_strategy.router)
 router.include_router(games_tasks.router)
 router.include_router(games_points.router)
 router.include_router(games_users.router)
+router.include_router(games_leaderboard.router)
 
 __all__ = [
     "router",
@@ -99,6 +105,7 @@ __all__ = [
     "valid_access_token",
     # endpoint callables
     "assign_points_to_user",
+    "assign_points_to_users_batch",
     "create_game",
     "create_task",
     "create_tasks_bulk",
@@ -108,6 +115,8 @@ __all__ = [
     "duplicate_task",
     "get_game_by_id",
     "get_games_list",
+    "get_leaderboard",
+    "get_leaderboard_user",
     "get_points_by_gameId",
     "get_points_by_gameId_with_details",
     "get_points_by_task_id",
@@ -0,0 +1,279 @@
+import logging
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Query
+
+from app.api.v1.endpoints.games_common import _game_access_kwargs
+from app.core.container import Container
+from app.middlewares.auth_context import AuditLogger, audit_log
+from app.middlewares.authentication import auth_api_key_or_oauth2
+from app.schema.leaderboard_schema import (
+    Leaderboard,
+    LeaderboardPeriod,
+    LeaderboardStanding,
+)
+from app.services.leaderboard_service import LeaderboardService
+
+router = APIRouter(
+    prefix="/games",
+    tags=["games"],
+)
+
+logger = logging.getLogger(__name__)
+
+_responses_common = {
+    401: {
+        "description": "Unauthorized: missing/invalid credentials",
+        "content": {
+            "application/json": {
+                "example": {"detail": "Invalid authentication credentials"}
+            }
+        },
+    },
+    403: {
+        "description": "Forbidden: the caller may not access this game",
+        "content": {
+            "application/json": {
+                "example": {"detail": "You do not have permission to access this game"}
+            }
+        },
+    },
+    422: {
+        "description": "Validation error in path or query parameters",
+    },
+}
+
+
+summary_get_leaderboard = "Retrieve the Leaderboard of a Game"
+response_example_get_leaderboard = {
+    "gameId": "4ce32be2-77f6-4ffc-8e07-78dc220f0520",
+    "period": "week",
+    "periodStart": "2026-02-09T00:00:00Z",
+    "entries": [
+        {"rank": 1, "externalUserId": "user-123", "points": 120},
+        {"rank": 2, "externalUserId": "user-456", "points": 95},
+        {"rank": 2, "externalUserId": "user-789", "points": 95},
+    ],
+}
+
+responses_get_leaderboard = {
+    200: {
+        "description": "Leaderboard retrieved successfully",
+        "content": {"application/json": {"example": response_example_get_leaderboard}},
+    },
+    **_responses_common,
+    404: {
+        "description": "Game not found",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Game not found by gameId: 4ce32be2-77f6-4ffc-8e07-78dc220f0520"
+                }
+            }
+        },
+    },
+}
+
+description_get_leaderboard = """
+Returns the best users of a game over one time window.
+
+Scores are kept up to date as points are assigned, so the cost of this call
+does not grow with the game's award history.
+
+### Path Parameter
+- `gameId` (`UUID`, required): Internal game identifier.
+
+### Query Parameters
+- `period` (`all` | `day` | `week`, default `all`): Window granularity. Days
+  start at UTC midnight, weeks on Monday (UTC).
+- `limit` (`integer`, default `10`, max `1000`): Number of entries.
+- `date` (`datetime`, optional): Any instant inside the wanted window;
+  defaults to now.
+
+### Authentication
+- Requires either `X-API-Key` or `Authorization: Bearer <access_token>`.
+
+### Success (200)
+- `periodStart`: start of the window (UTC)
+- `entries[]`: `rank`, `externalUserId` and `points`, best first. Tied
+  scores share a rank.
+
+### Error Cases
+- `401`: missing or invalid auth credentials
+- `403`: the caller may not access the game
+- `404`: game not found
+- `422`: malformed parameters
+
+<sub>**Id_endpoint:** `get_leaderboard`</sub>
+"""  # noqa
+
+
+@router.get(
+    "/{gameId}/leaderboard",
+    response_model=Leaderboard,
+    summary=summary_get_leaderboard,
+    description=description_get_leaderboard,
+    responses=responses_get_leaderboard,
+    dependencies=[Depends(auth_api_key_or_oauth2)],
+)
+@inject
+async def get_leaderboard(
+    gameId: UUID,
+    period: LeaderboardPeriod = Query(
+        default=LeaderboardPeriod.ALL, description="Window granularity."
+    ),
+    limit: int = Query(default=10, ge=1, le=1000, description="Entries to return."),
+    date: Optional[datetime] = Query(
+        default=None, description="Any instant inside the wanted window."
+    ),
+    service: LeaderboardService = Depends(Provide[Container.leaderboard_service]),
+    audit: AuditLogger = Depends(audit_log("game")),
+):
+    """
+    Retrieve the top users of a game's leaderboard.
+
+    Args:
+        gameId (UUID): The ID of the game.
+        period (LeaderboardPeriod): Window granularity.
+        limit (int): Number of entries to return.
+        date (Optional[datetime]): Instant selecting the window.
+        service (LeaderboardService): Injected LeaderboardService dependency.
+        audit (AuditLogger): Per-request audit logger bound to the auth context.
+
+    Returns:
+        Leaderboard: The window and its ranked entries.
+    """
+    auth = audit.auth
+    await audit.info(
+        "Leaderboard retrieval by game ID",
+        {"gameId": str(gameId), "period": period.value},
+    )
+    return await service.get_leaderboard(
+        gameId,
+        period,
+        limit,
+        date,
+        **_game_access_kwargs(auth.api_key, auth.oauth_user_id, auth.is_admin),
+    )
+
+
+summary_get_leaderboard_user = "Retrieve a User's Rank on a Game Leaderboard"
+response_example_get_leaderboard_user = {
+    "gameId": "4ce32be2-77f6-4ffc-8e07-78dc220f0520",
+    "period": "all",
+    "periodStart": "1970-01-01T00:00:00Z",
+    "entry": {"rank": 42, "externalUserId": "user-123", "points": 310},
+    "above": [{"rank": 41, "externalUserId": "user-456", "points": 315}],
+    "below": [{"rank": 43, "externalUserId": "user-789", "points": 300}],
+}
+
+responses_get_leaderboard_user = {
+    200: {
+        "description": "User standing retrieved successfully",
+        "content": {
+            "application/json": {"example": response_example_get_leaderboard_user}
+        },
+    },
+    **_responses_common,
+    404: {
+        "description": "Game or user not found, or the user has no points "
+        "in the window",
+        "content": {
+            "application/json": {
+                "example": {"detail": "User not found: user-123"},
+            }
+        },
+    },
+}
+
+description_get_leaderboard_user = """
+Returns a user's rank on a game leaderboard, optionally with the users
+directly ahead of and behind them.
+
+### Path Parameters
+- `gameId` (`UUID`, required): Internal game identifier.
+- `externalUserId` (`string`, required): External user identifier.
+
+### Query Parameters
+- `period` (`all` | `day` | `week`, default `all`): Window granularity.
+- `neighbours` (`integer`, default `0`, max `100`): Entries to include on
+  each side of the user.
+- `date` (`datetime`, optional): Any instant inside the wanted window;
+  defaults to now.
+
+### Authentication
+- Requires either `X-API-Key` or `Authorization: Bearer <access_token>`.
+
+### Success (200)
+- `entry`: the user's `rank`, `externalUserId` and `points`
+- `above[]` / `below[]`: neighbouring entries, in rank order
+
+### Error Cases
+- `401`: missing or invalid auth credentials
+- `403`: the caller may not access the game
+- `404`: game or user not found, or no points in the window
+- `422`: malformed parameters
+
+<sub>**Id_endpoint:** `get_leaderboard_user`</sub>
+"""  # noqa
+
+
+@router.get(
+    "/{gameId}/leaderboard/users/{externalUserId}",
+    response_model=LeaderboardStanding,
+    summary=summary_get_leaderboard_user,
+    description=description_get_leaderboard_user,
+    responses=responses_get_leaderboard_user,
+    dependencies=[Depends(auth_api_key_or_oauth2)],
+)
+@inject
+async def get_leaderboard_user(
+    gameId: UUID,
+    externalUserId: str,
+    period: LeaderboardPeriod = Query(
+        default=LeaderboardPeriod.ALL, description="Window granularity."
+    ),
+    neighbours: int = Query(
+        default=0, ge=0, le=100, description="Entries on each side of the user."
+    ),
+    date: Optional[datetime] = Query(
+        default=None, description="Any instant inside the wanted window."
+    ),
+    service: LeaderboardService = Depends(Provide[Container.leaderboard_service]),
+    audit: AuditLogger = Depends(audit_log("game")),
+):
+    """
+    Retrieve a user's rank on a game leaderboard and its neighbours.
+
+    Args:
+        gameId (UUID): The ID of the game.
+        externalUserId (str): The external ID of the user.
+        period (LeaderboardPeriod): Window granularity.
+        neighbours (int): Entries to include on each side of the user.
+        date (Optional[datetime]): Instant selecting the window.
+        service (LeaderboardService): Injected LeaderboardService dependency.
+        audit (AuditLogger): Per-request audit logger bound to the auth context.
+
+    Returns:
+        LeaderboardStanding: The user's entry and its neighbours.
+    """
+    auth = audit.auth
+    await audit.info(
+        "Leaderboard standing retrieval",
+        {
+            "gameId": str(gameId),
+            "externalUserId": externalUserId,
+            "period": period.value,
+        },
+    )
+    return await service.get_user_standing(
+        gameId,
+        externalUserId,
+        period,
+        neighbours,
+        date,
+        **_game_access_kwargs(auth.api_key, auth.oauth_user_id, auth.is_admin),
+    )
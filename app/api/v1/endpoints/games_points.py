@@ -4,7 +4,7 @@ from typing import List
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Body, Depends, Request
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
 
 from app.api.v1.endpoints.games_common import (
     _game_access_kwargs,
@@ -20,7 +20,9 @@ from app.middlewares.authentication import auth_api_key_or_oauth2, auth_oauth2
 from app.schema.task_schema import (
     AddActionDidByUserInTask,
     AsignPointsToExternalUserId,
+    AssignedPointsBatch,
     AssignedPointsToExternalUserId,
+    AssignPointsBatch,
     ResponseAddActionDidByUserInTask,
     SimulatedPointsAssignedToUser,
 )
@@ -1030,6 +1032,183 @@ async def assign_points_to_user(
         raise mapped_exc
 
 
+summary_assign_points_to_users_batch = "Assign Points for a Batch of Events"
+response_example_assign_points_to_users_batch = {
+    "succeeded": 1,
+    "failed": 1,
+    "results": [
+        {
+            "index": 0,
+            "externalTaskId": "task-login",
+            "externalUserId": "user-123",
+            "result": response_example_assign_points_to_user,
+            "statusCode": None,
+            "error": None,
+        },
+        {
+            "index": 1,
+            "externalTaskId": "task-unknown",
+            "externalUserId": "user-456",
+            "result": None,
+            "statusCode": 404,
+            "error": "Task not found with externalTaskId: task-unknown",
+        },
+    ],
+}
+
+responses_assign_points_to_users_batch = {
+    200: {
+        "description": "Batch processed; see per-event results",
+        "content": {
+            "application/json": {
+                "example": response_example_assign_points_to_users_batch
+            }
+        },
+    },
+    401: responses_assign_points_to_user[401],
+    403: responses_assign_points_to_user[403],
+    404: {
+        "description": "Game not found for provided gameId",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": "Game with gameId 4ce32be2-77f6-4ffc-8e07-78dc220f0521 not found"
+                }
+            }
+        },
+    },
+    422: {
+        "description": "Validation error in path/body payload or batch too large",
+    },
+    429: responses_assign_points_to_user[429],
+    500: {
+        "description": "Internal server error while processing the batch",
+    },
+}
+
+description_assign_points_to_users_batch = """
+Scores many events of one game in a single call.
+
+Game, tasks, users and strategies are resolved once for the whole batch,
+events are scored concurrently, and all successful events are persisted
+(points, wallet balances and wallet transactions) in one transaction.
+
+### Path Parameters
+- `gameId` (`UUID`, required): Internal game identifier.
+
+### Authentication
+- Requires either `X-API-Key` or `Authorization: Bearer <access_token>`.
+
+### Request Body
+- `events` (`array`, required): Events to score. Each has `externalTaskId`,
+  `externalUserId` and optional `data`. Put an `eventId` in `data` to make
+  retries idempotent.
+
+### Success (200)
+Returns `succeeded`, `failed` and one `results` entry per event, in request
+order, with either `result` (the assigned points) or `statusCode` + `error`.
+Events in one batch are scored concurrently, so strategies see each user's
+history as it was before the batch.
+
+### Error Cases
+- `401`: missing or invalid auth credentials
+- `403`: API key rejected or inactive
+- `404`: game not found
+- `422`: malformed payload or more than `POINTS_BATCH_MAX_EVENTS` events
+- `429`: rate limit exceeded; each event counts as one request
+- `500`: batch failure
+
+<sub>**Id_endpoint:** `assign_points_to_users_batch`</sub>
+"""  # noqa
+
+
+@router.post(
+    "/{gameId}/points/batch",
+    response_model=AssignedPointsBatch,
+    summary=summary_assign_points_to_users_batch,
+    description=description_assign_points_to_users_batch,
+    responses=responses_assign_points_to_users_batch,
+    dependencies=[Depends(auth_api_key_or_oauth2)],
+)
+@inject
+async def assign_points_to_users_batch(
+    gameId: UUID,
+    request: Request,
+    schema: AssignPointsBatch = Body(..., examples=[AssignPointsBatch.example()]),
+    service: UserPointsService = Depends(Provide[Container.user_points_service]),
+    abuse_prevention_service: AbusePreventionService = Depends(
+        Provide[Container.abuse_prevention_service]
+    ),
+    audit: AuditLogger = Depends(audit_log("game")),
+):
+    """
+    Assign points for a batch of events of one game.
+
+    Args:
+        gameId (UUID): The ID of the game.
+        schema (AssignPointsBatch): The events to score.
+        service (UserPointsService): Injected UserPointsService dependency.
+        audit (AuditLogger): Per-request audit logger bound to the auth context.
+
+    Returns:
+        AssignedPointsBatch: Per-event outcome of the batch.
+    """
+    if len(schema.events) > configs.POINTS_BATCH_MAX_EVENTS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=(
+                f"Batch has {len(schema.events)} events; the maximum is "
+                f"{configs.POINTS_BATCH_MAX_EVENTS}."
+            ),
+        )
+    auth = audit.auth
+    correlation_id = _resolve_correlation_id(request)
+    for event in schema.events:
+        if event.data is None:
+            event.data = {}
+        if isinstance(event.data, dict):
+            event.data.setdefault("correlationId", correlation_id)
+    # Every event is charged against the limits as if it had been sent alone.
+    await abuse_prevention_service.enforce_task_mutation_batch_limits(
+        api_key=auth.api_key,
+        client_ip=abuse_prevention_service.extract_client_ip(request),
+        external_user_ids=[event.externalUserId for event in schema.events],
+    )
+    await audit.info(
+        "Batched points assignment",
+        {
+            "gameId": str(gameId),
+            "correlationId": correlation_id,
+            "events": len(schema.events),
+        },
+    )
+    try:
+        return await service.assign_points_to_users_batch(
+            gameId,
+            schema.events,
+            auth.api_key,
+            oauth_user_id=auth.oauth_user_id,
+            is_admin=auth.is_admin,
+            enforce_scope=True,
+        )
+    except Exception as exc:
+        mapped_exc = _map_write_exception(exc, correlation_id=correlation_id)
+        error_payload = {
+            "gameId": str(gameId),
+            "correlationId": correlation_id,
+            "events": len(schema.events),
+            "errorType": type(exc).__name__,
+            "error": str(exc),
+            "traceback": traceback.format_exc(),
+        }
+        logger.exception(
+            "assign_points_to_users_batch failed",
+            extra=error_payload,
+        )
+        await audit.error("Batched points assignment failed", error_payload)
+        raise mapped_exc
+
+
 summary_get_points_by_task_id = "Retrieve Points by Task ID"
 response_example_get_points_by_task_id = [
     {
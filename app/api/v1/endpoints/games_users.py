@@ -1,8 +1,9 @@
 import logging
+from typing import Optional
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from app.api.v1.endpoints.games_common import _game_access_kwargs
 from app.core.container import Container
@@ -110,11 +111,15 @@ Returns users associated with each task in the specified game.
 ### Path Parameter
 - `gameId` (`UUID`, required): Internal game identifier.
 
+### Query Parameters
+- `page` (`integer`, optional): Page of tasks to return (1-based, default `1`).
+- `page_size` (`integer`, optional): Tasks per page. Omit to return every task.
+
 ### Authentication
 - Requires either `X-API-Key` or `Authorization: Bearer <access_token>`.
 
 ### Success (200)
-Returns a task-grouped structure:
+Returns a task-grouped structure, with tasks ordered by `externalTaskId`:
 - `gameId`: requested game identifier
 - `tasks`: list of tasks in the game
 - `tasks[].externalTaskId`: external task identifier
@@ -145,6 +150,15 @@ Returns a task-grouped structure:
 @inject
 async def get_users_by_gameId(
     gameId: UUID,
+    page: Optional[int] = Query(
+        default=None, ge=1, description="Page of tasks to return (1-based)."
+    ),
+    page_size: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=1000,
+        description="Tasks per page. Omit to return every task.",
+    ),
     service: UserPointsService = Depends(Provide[Container.user_points_service]),
     audit: AuditLogger = Depends(audit_log("game")),
 ):
@@ -153,6 +167,8 @@ async def get_users_by_gameId(
 
     Args:
         gameId (UUID): The ID of the game.
+        page (Optional[int]): Page of tasks to return.
+        page_size (Optional[int]): Tasks per page; ``None`` returns all.
         service (UserPointsService): Injected UserPointsService dependency.
         audit (AuditLogger): Per-request audit logger bound to the auth context.
 
@@ -163,5 +179,8 @@ async def get_users_by_gameId(
     auth = audit.auth
     await audit.info("Users retrieval by game ID", {"gameId": str(gameId)})
     return await service.get_users_by_gameId(
-        gameId, **_game_access_kwargs(auth.api_key, auth.oauth_user_id, auth.is_admin)
+        gameId,
+        page=page,
+        page_size=page_size,
+        **_game_access_kwargs(auth.api_key, auth.oauth_user_id, auth.is_admin),
     )
@@ -215,6 +215,41 @@ class Configs(BaseSettings):
           external user id inside the short window.
         ABUSE_DAILY_QUOTA_PER_API_KEY (int): Daily quota for sensitive
           operations per API key.
+        ABUSE_RATE_LIMIT_LEASE_SIZE (int): Counter values each worker
+          reserves from the shared rate-limit backend at once; ``1`` counts
+          every request against the backend.
+        POINTS_BATCH_MAX_EVENTS (int): Maximum events accepted by one batched
+          points assignment.
+        USER_TASK_STATS_READS_ENABLED (bool): Answers scoring analytics from
+          the ``user_task_stats`` rollup instead of scanning ``user_points``.
+        METADATA_CACHE_BACKEND (str): Backend of the game/task/strategy
+          metadata cache used by scoring ("memory" or "redis").
+        METADATA_CACHE_TTL_SECONDS (int): Lifetime of a cached metadata entry;
+          ``0`` disables the cache.
+        METADATA_CACHE_MAX_ENTRIES (int): Size bound of the in-memory backend.
+        METADATA_CACHE_REDIS_KEY_PREFIX (str): Key namespace of the Redis
+          backend.
+        LEADERBOARD_BACKEND (str): Backend serving the leaderboard reads
+          ("database" or "redis").
+        LEADERBOARD_REDIS_KEY_PREFIX (str): Key namespace of the Redis
+          leaderboard sorted sets.
+        LEADERBOARD_WINDOW_TTL_SECONDS (int): Lifetime of the daily/weekly
+          sorted sets after their last write.
+        AUDIT_LOG_BUFFER_ENABLED (bool): Writes audit log rows from a
+          background queue instead of inline.
+        AUDIT_LOG_QUEUE_MAXSIZE (int): Pending audit rows kept before new
+          ones are dropped.
+        AUDIT_LOG_BATCH_SIZE (int): Maximum rows per audit log INSERT.
+        AUDIT_LOG_FLUSH_INTERVAL_MS (int): Longest a queued audit row waits
+          for its batch to fill.
+        EXPORT_BULK_COPY_ENABLED (bool): Produces CSV/JSON exports inside
+          Postgres (COPY / json_build_object) instead of row by row.
+        DASHBOARD_ROLLUP_ENABLED (bool): Reads closed days of the dashboard
+          summaries from the daily rollup table once it has been backfilled.
+        JWT_CLAIMS_CACHE_MAX_ENTRIES (int): Verified bearer tokens (and known
+          OAuth subjects) remembered per process; ``0`` disables the caches.
+        JWKS_REFRESH_INTERVAL_SECONDS (int): Period of the background JWKS
+          signing-key refresh; ``0`` disables it.
 
         SQLALCHEMY_ECHO (bool): Enables SQLAlchemy SQL logging.
         DB_POOL_PRE_PING (bool): Enables connection health-check before use.
@@ -343,6 +378,23 @@ class Configs(BaseSettings):
         "RATE_LIMIT_REDIS_KEY_PREFIX", "game:rl:"
     )
     RATE_LIMIT_TTL_BUFFER_SECONDS: int = _env_to_int("RATE_LIMIT_TTL_BUFFER_SECONDS", 5)
+    # Above 1, each worker reserves this many counter values per bucket from
+    # the shared backend and answers from them in-process. The limiter never
+    # admits past a cap, but N workers may reject up to N * (size - 1)
+    # requests early, so keep it well below the smallest limit.
+    ABUSE_RATE_LIMIT_LEASE_SIZE: int = _env_to_int("ABUSE_RATE_LIMIT_LEASE_SIZE", 1)
+
+    # Upper bound on events accepted by the batched points endpoint. The
+    # whole batch is written in one transaction, so this also caps the
+    # size of that transaction's multi-row inserts.
+    POINTS_BATCH_MAX_EVENTS: int = _env_to_int("POINTS_BATCH_MAX_EVENTS", 500)
+
+    # The user_task_stats rollup is always written alongside user_points;
+    # reads switch to it only once it has been backfilled with
+    # ``scripts/user_task_stats.py rebuild``.
+    USER_TASK_STATS_READS_ENABLED: bool = _env_to_bool(
+        "USER_TASK_STATS_READS_ENABLED", False
+    )
 
     SQLALCHEMY_ECHO: bool = _env_to_bool("SQLALCHEMY_ECHO", False)
     DB_POOL_PRE_PING: bool = _env_to_bool("DB_POOL_PRE_PING", True)
@@ -362,6 +414,30 @@ class Configs(BaseSettings):
         "APIKEY_CACHE_REDIS_KEY_PREFIX", "game:apikey:"
     )
 
+    # Game/task/custom-strategy metadata read on every award. Writes
+    # through the services invalidate entries explicitly; the TTL bounds
+    # staleness across workers with the "memory" backend (invalidations
+    # only reach the worker that performed the write) and for anything
+    # that edits those rows outside the services.
+    METADATA_CACHE_BACKEND: str = os.getenv("METADATA_CACHE_BACKEND", "memory")
+    METADATA_CACHE_TTL_SECONDS: int = _env_to_int("METADATA_CACHE_TTL_SECONDS", 30)
+    METADATA_CACHE_MAX_ENTRIES: int = _env_to_int("METADATA_CACHE_MAX_ENTRIES", 10_000)
+    METADATA_CACHE_REDIS_KEY_PREFIX: str = os.getenv(
+        "METADATA_CACHE_REDIS_KEY_PREFIX", "game:metadata:"
+    )
+
+    # game_leaderboard is always maintained alongside user_points; "redis"
+    # additionally mirrors each board into a sorted set (O(log n) ranks).
+    # Daily/weekly sets expire this long after their last write, after
+    # which those windows are read from the database again.
+    LEADERBOARD_BACKEND: str = os.getenv("LEADERBOARD_BACKEND", "database")
+    LEADERBOARD_REDIS_KEY_PREFIX: str = os.getenv(
+        "LEADERBOARD_REDIS_KEY_PREFIX", "game:lb:"
+    )
+    LEADERBOARD_WINDOW_TTL_SECONDS: int = _env_to_int(
+        "LEADERBOARD_WINDOW_TTL_SECONDS", 2_678_400
+    )
+
     # DSL interpreter limits. The validator rejects ASTs whose
     # static node count or depth exceeds these thresholds, so runtime should
     # never hit them - they are belt-and-braces guards in case future changes
@@ -371,6 +447,16 @@ class Configs(BaseSettings):
     DSL_EXECUTION_TIMEOUT_MS: int = _env_to_int("DSL_EXECUTION_TIMEOUT_MS", 500)
     DSL_MAX_NODES: int = _env_to_int("DSL_MAX_NODES", 1000)
     DSL_MAX_DEPTH: int = _env_to_int("DSL_MAX_DEPTH", 32)
+    # Analytics fields an AST references are fetched concurrently before the
+    # walk. Each in-flight fetch holds a pool connection, so this caps how
+    # many one DSL run may hold at once. Fields covered by the one-query
+    # scoring snapshot are coalesced into a single fetch when two or more
+    # are referenced; DSL_ANALYTICS_COALESCE_ENABLED=false fetches each
+    # field with its own query.
+    DSL_ANALYTICS_MAX_CONCURRENCY: int = _env_to_int("DSL_ANALYTICS_MAX_CONCURRENCY", 4)
+    DSL_ANALYTICS_COALESCE_ENABLED: bool = _env_to_bool(
+        "DSL_ANALYTICS_COALESCE_ENABLED", True
+    )
 
     # Sampled persistence of DSL execution traces. Errors are
     # always persisted regardless of the sample rate -- the rate only
@@ -399,6 +485,45 @@ class Configs(BaseSettings):
         "DSL_EXECUTION_LOG_QUEUE_MAXSIZE", 1000
     )
 
+    # Audit rows (the ``logs`` table) are queued and written by a background
+    # worker (see AuditLogSink) in multi-row INSERTs of up to
+    # AUDIT_LOG_BATCH_SIZE rows, at most AUDIT_LOG_FLUSH_INTERVAL_MS after the
+    # first row of a batch arrived. A full queue drops rows (counted via
+    # audit_log_rows_dropped_total) instead of slowing requests down.
+    # Disabling the buffer writes every row inline, as before.
+    AUDIT_LOG_BUFFER_ENABLED: bool = _env_to_bool("AUDIT_LOG_BUFFER_ENABLED", True)
+    AUDIT_LOG_QUEUE_MAXSIZE: int = _env_to_int("AUDIT_LOG_QUEUE_MAXSIZE", 10000)
+    AUDIT_LOG_BATCH_SIZE: int = _env_to_int("AUDIT_LOG_BATCH_SIZE", 500)
+    AUDIT_LOG_FLUSH_INTERVAL_MS: int = _env_to_int("AUDIT_LOG_FLUSH_INTERVAL_MS", 200)
+
+    # On Postgres, CSV exports are streamed straight out of
+    # ``COPY (SELECT ...) TO STDOUT WITH CSV`` and JSON exports are assembled
+    # by ``json_build_object``, both coalesced into ~64 KB writes. Disabling
+    # the switch sends them through the per-row ORM formatters (the only path
+    # on other engines and for XLSX).
+    EXPORT_BULK_COPY_ENABLED: bool = _env_to_bool("EXPORT_BULK_COPY_ENABLED", True)
+
+    # The dashboard summaries read closed UTC days from dashboard_daily_rollup
+    # and only aggregate raw rows for today and the partial days at the edges
+    # of a range. The rollup is backfilled with scripts/dashboard_rollup.py;
+    # once it has rows, each summary request first rolls up the days closed
+    # since. An empty rollup (or DASHBOARD_ROLLUP_ENABLED=false) aggregates
+    # the raw tables for the whole range.
+    DASHBOARD_ROLLUP_ENABLED: bool = _env_to_bool("DASHBOARD_ROLLUP_ENABLED", True)
+
+    # Bearer tokens that validated are remembered (by sha256) until their
+    # ``exp``, so repeat requests with the same token skip the RS256 check;
+    # the same bound caps the per-process set of OAuth subjects known to
+    # have a user row. 0 disables both. Signing keys are looked up by ``kid``
+    # in memory and refreshed from the realm's JWKS every
+    # JWKS_REFRESH_INTERVAL_SECONDS (0 only fetches them on a ``kid`` miss).
+    JWT_CLAIMS_CACHE_MAX_ENTRIES: int = _env_to_int(
+        "JWT_CLAIMS_CACHE_MAX_ENTRIES", 10_000
+    )
+    JWKS_REFRESH_INTERVAL_SECONDS: int = _env_to_int(
+        "JWKS_REFRESH_INTERVAL_SECONDS", 300
+    )
+
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @classmethod
     def _coerce_cors_origins(cls, value: Union[str, List[str], None]) -> List[str]:
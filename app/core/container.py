@@ -10,6 +10,7 @@ from app.repository import (
     ApiKeyRepository,
     ApiRequestsRepository,
     ExportAuditLogRepository,
+    GameLeaderboardRepository,
     GameParamsRepository,
     GameRepository,
     KpiMetricsRepository,
@@ -39,8 +40,10 @@ from app.services import (
     GameParamsService,
     GameService,
     KpiMetricsService,
+    LeaderboardService,
     StrategyDefinitionService,
     StrategyObservabilityService,
+    StrategyReplayService,
     StrategyService,
     TaskService,
     UptimeLogsService,
@@ -52,12 +55,15 @@ from app.services import (
     UserService,
     WalletService,
     WalletTransactionService,
+    build_leaderboard_backend,
     build_rate_limit_counter_backend,
     dashboard_service,
     logs_service,
     oauth_users_service,
 )
 from app.services.apikey_cache_backend import build_apikey_cache_backend
+from app.services.audit_log_sink import AuditLogSink
+from app.services.metadata_cache import build_scoring_metadata_cache
 
 
 class Container(containers.DeclarativeContainer):
@@ -80,6 +86,8 @@ class Container(containers.DeclarativeContainer):
           UserActionsRepository.
         user_points_repository (providers.Factory): Factory provider for
           UserPointsRepository.
+        game_leaderboard_repository (providers.Factory): Factory provider for
+          GameLeaderboardRepository.
         user_repository (providers.Factory): Factory provider for
           UserRepository.
         wallet_repository (providers.Factory): Factory provider for
@@ -104,14 +112,22 @@ class Container(containers.DeclarativeContainer):
           OAuthUsersRepository.
         logs_repository (providers.Factory): Factory provider for
           LogsRepository.
+        metadata_cache (providers.Singleton): Singleton provider for the
+          ScoringMetadataCache shared by the scoring and admin write paths.
+        leaderboard_backend (providers.Singleton): Singleton provider for the
+          LeaderboardBackend fed by scoring and read by LeaderboardService.
         game_params_service (providers.Factory): Factory provider for
           GameParamsService.
         strategy_service (providers.Factory): Factory provider for
           StrategyService.
+        strategy_replay_service (providers.Factory): Factory provider for
+          StrategyReplayService.
         game_service (providers.Factory): Factory provider for GameService.
         task_service (providers.Factory): Factory provider for TaskService.
         user_points_service (providers.Factory): Factory provider for
           UserPointsService.
+        leaderboard_service (providers.Factory): Factory provider for
+          LeaderboardService.
         user_service (providers.Factory): Factory provider for UserService.
         user_game_config_service (providers.Factory): Factory provider for
           UserGameConfigService.
@@ -136,6 +152,7 @@ class Container(containers.DeclarativeContainer):
           DashboardService.
         oauth_users_service (providers.Factory): Factory provider for
           OAuthUsersService.
+        audit_log_sink (providers.Singleton): Buffered audit log writer.
         logs_service (providers.Factory): Factory provider for LogsService.
     """
 
@@ -143,6 +160,7 @@ class Container(containers.DeclarativeContainer):
         modules=[
             "app.api.v1.endpoints.games",
             "app.api.v1.endpoints.games_crud",
+            "app.api.v1.endpoints.games_leaderboard",
             "app.api.v1.endpoints.games_points",
             "app.api.v1.endpoints.games_strategy",
             "app.api.v1.endpoints.games_tasks",
@@ -197,6 +215,10 @@ class Container(containers.DeclarativeContainer):
         UserPointsRepository, session_factory=db.provided.session
     )
 
+    game_leaderboard_repository = providers.Factory(
+        GameLeaderboardRepository, session_factory=db.provided.session
+    )
+
     user_repository = providers.Factory(
         UserRepository, session_factory=db.provided.session
     )
@@ -251,6 +273,13 @@ class Container(containers.DeclarativeContainer):
         session_factory=db.provided.session,
     )
 
+    # Buffered writer for audit log rows. Singleton so every LogsService
+    # feeds the same queue and the lifespan hook can flush it on shutdown.
+    audit_log_sink = providers.Singleton(
+        AuditLogSink,
+        logs_repository=logs_repository,
+    )
+
     export_audit_log_repository = providers.Factory(
         ExportAuditLogRepository, session_factory=db.provided.session
     )
@@ -266,6 +295,29 @@ class Container(containers.DeclarativeContainer):
 
     # Services (Add in here)
 
+    # One cache per process (or one shared Redis keyspace), so the
+    # invalidations issued by the write-path services reach the reads of
+    # every other service instance.
+    metadata_cache = providers.Singleton(
+        build_scoring_metadata_cache,
+        backend_name=configs.METADATA_CACHE_BACKEND,
+        redis_url=configs.REDIS_URL,
+        redis_key_prefix=configs.METADATA_CACHE_REDIS_KEY_PREFIX,
+        ttl_seconds=configs.METADATA_CACHE_TTL_SECONDS,
+        max_entries=configs.METADATA_CACHE_MAX_ENTRIES,
+    )
+
+    # One backend per process: the Redis client (when selected) holds the
+    # connection pool shared by the scoring writes and the leaderboard reads.
+    leaderboard_backend = providers.Singleton(
+        build_leaderboard_backend,
+        repository=game_leaderboard_repository,
+        backend_name=configs.LEADERBOARD_BACKEND,
+        redis_url=configs.REDIS_URL,
+        redis_key_prefix=configs.LEADERBOARD_REDIS_KEY_PREFIX,
+        window_ttl_seconds=configs.LEADERBOARD_WINDOW_TTL_SECONDS,
+    )
+
     game_params_service = providers.Factory(
         GameParamsService, game_params_repository=game_params_repository
     )
@@ -280,6 +332,7 @@ class Container(containers.DeclarativeContainer):
         # supplies them.
         game_repository=game_repository,
         task_repository=task_repository,
+        metadata_cache=metadata_cache,
     )
 
     # Declared before strategy_service so the latter can inject it for
@@ -314,6 +367,7 @@ class Container(containers.DeclarativeContainer):
         dsl_interpreter=dsl_interpreter,
         analytics_service=user_points_analytics_service,
         execution_observer=dsl_execution_observer,
+        metadata_cache=metadata_cache,
     )
 
     game_service = providers.Factory(
@@ -330,6 +384,7 @@ class Container(containers.DeclarativeContainer):
         # Needed by duplicate_game to deep-copy each
         # task's params into the new game.
         task_params_repository=task_params_repository,
+        metadata_cache=metadata_cache,
     )
 
     task_service = providers.Factory(
@@ -342,6 +397,7 @@ class Container(containers.DeclarativeContainer):
         game_params_repository=game_params_repository,
         task_params_repository=task_params_repository,
         strategy_definition_service=strategy_definition_service,
+        metadata_cache=metadata_cache,
     )
 
     user_actions_service = providers.Factory(
@@ -350,6 +406,7 @@ class Container(containers.DeclarativeContainer):
         users_repository=user_repository,
         game_repository=game_repository,
         task_repository=task_repository,
+        metadata_cache=metadata_cache,
     )
 
     user_points_service = providers.Factory(
@@ -362,6 +419,16 @@ class Container(containers.DeclarativeContainer):
         wallet_repository=wallet_repository,
         wallet_transaction_repository=wallet_transaction_repository,
         strategy_service=strategy_service,
+        metadata_cache=metadata_cache,
+        leaderboard_backend=leaderboard_backend,
+    )
+
+    leaderboard_service = providers.Factory(
+        LeaderboardService,
+        game_repository=game_repository,
+        user_repository=user_repository,
+        leaderboard_repository=game_leaderboard_repository,
+        leaderboard_backend=leaderboard_backend,
     )
 
     user_service = providers.Factory(
@@ -371,6 +438,7 @@ class Container(containers.DeclarativeContainer):
         task_repository=task_repository,
         wallet_repository=wallet_repository,
         wallet_transaction_repository=wallet_transaction_repository,
+        leaderboard_backend=leaderboard_backend,
     )
 
     wallet_service = providers.Factory(
@@ -408,6 +476,7 @@ class Container(containers.DeclarativeContainer):
         backend_name=configs.ABUSE_PREVENTION_BACKEND,
         redis_url=configs.REDIS_URL,
         redis_key_prefix=configs.RATE_LIMIT_REDIS_KEY_PREFIX,
+        lease_size=configs.ABUSE_RATE_LIMIT_LEASE_SIZE,
     )
 
     abuse_prevention_service = providers.Factory(
@@ -453,6 +522,7 @@ class Container(containers.DeclarativeContainer):
     logs_service = providers.Factory(
         logs_service.LogsService,
         logs_repository=logs_repository,
+        audit_log_sink=audit_log_sink,
     )
 
     export_service = providers.Factory(
@@ -466,6 +536,16 @@ class Container(containers.DeclarativeContainer):
         user_points_analytics_service=user_points_analytics_service,
     )
 
+    # Offline re-scoring of a game's recorded events with a candidate
+    # strategy (``scripts/strategy_replay.py``); reads only.
+    strategy_replay_service = providers.Factory(
+        StrategyReplayService,
+        game_repository=game_repository,
+        user_points_repository=user_points_repository,
+        user_actions_repository=user_actions_repository,
+        strategy_service=strategy_service,
+    )
+
     # Aggregates rows from ``strategyexecutionlog`` into the
     # observability dashboard view (status mix, latency percentiles,
     # case-name and error-code breakdowns) and the A/B comparison view.
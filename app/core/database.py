@@ -98,6 +98,15 @@ class Database:
         async with self._engine.begin() as conn:
             await conn.run_sync(BaseModel.metadata.create_all)
 
+    async def dispose(self) -> None:
+        """
+        Close every pooled connection.
+
+        For short-lived processes (scripts, one-off commands) that must not
+        leave connections to be collected after the event loop has closed.
+        """
+        await self._engine.dispose()
+
     @asynccontextmanager
     async def session(self) -> AsyncIterator[AsyncSession]:
         """
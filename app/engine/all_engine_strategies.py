@@ -17,16 +17,27 @@ This module now:
 3. Returns instances of every class currently in the registry. Third-party
    strategies declared via the ``game.strategies`` entry point are loaded
    lazily by the registry.
+
+Building an instance is expensive (``BaseStrategy.__init__`` hashes the
+source of ``calculate_points`` and each strategy constructs its container
+services), so request paths use :func:`engine_strategy` /
+:func:`engine_strategy_metadata` instead: one shared instance per id and its
+API payload, built on first use and rebuilt only when the registry changes
+(e.g. an entry-point strategy registers late) or on
+:func:`refresh_engine_strategies`.
 """
 
 from __future__ import annotations
 
+import copy
 import importlib
 import logging
 import pkgutil
+import threading
+from typing import Any
 
 from app.engine.check_base_strategy_class import check_class_methods_and_variables
-from app.engine.strategy_registry import registered_strategies
+from app.engine.strategy_registry import registered_strategies, registry_generation
 
 _log = logging.getLogger(__name__)
 
@@ -46,6 +57,14 @@ _DISCOVERY_SKIP: frozenset[str] = frozenset(
 
 _discovery_done = False
 
+# Shared instance table: ``{id: instance}`` plus ``{id: payload}`` with the
+# precomputed ``list_all_strategies`` entry of each, and the registry
+# generation they were built from (``None``: not built yet).
+_instances: dict[str, Any] = {}
+_metadata: dict[str, dict[str, Any]] = {}
+_table_generation: int | None = None
+_table_lock = threading.Lock()
+
 
 def _discover_strategy_modules() -> None:
     """Import every strategy module in :mod:`app.engine`.
@@ -112,3 +131,79 @@ def all_engine_strategies() -> list:
         instance.id = strategy_id
         instances.append(instance)
     return instances
+
+
+def _strategy_metadata(strategy: Any) -> dict[str, Any]:
+    """The API payload of a built-in strategy (``GET /strategies`` entry)."""
+    hash_version = getattr(strategy, "hash_version", None)
+    if hash_version is None:
+        hash_version = strategy._generate_hash_of_calculate_points()
+    return {
+        "id": strategy.id,
+        "name": strategy.get_strategy_name(),
+        "description": strategy.get_strategy_description(),
+        "version": strategy.get_strategy_version(),
+        # Snapshot: callers overlay game/task params onto their copy.
+        "variables": copy.deepcopy(strategy.get_variables()),
+        "hash_version": hash_version,
+    }
+
+
+def refresh_engine_strategies() -> dict[str, Any]:
+    """(Re)build the shared instance table from the registry.
+
+    Runs discovery, instantiates every valid strategy once and precomputes
+    its metadata. Called lazily by the lookups below; call it directly to
+    pick up strategies registered outside the ``register_strategy``
+    decorator's bookkeeping.
+
+    :return: The new ``{id: instance}`` table.
+    :rtype: dict
+    """
+    global _instances, _metadata, _table_generation
+    with _table_lock:
+        _discover_strategy_modules()
+        generation = registry_generation()
+        instances = {strategy.id: strategy for strategy in all_engine_strategies()}
+        _metadata = {
+            strategy_id: _strategy_metadata(strategy)
+            for strategy_id, strategy in instances.items()
+        }
+        _instances = instances
+        _table_generation = generation
+    return instances
+
+
+def _engine_strategy_table() -> dict[str, Any]:
+    """The instance table, rebuilt first when the registry moved on."""
+    if _table_generation is None or _table_generation != registry_generation():
+        return refresh_engine_strategies()
+    return _instances
+
+
+def engine_strategy(strategy_id: str) -> Any | None:
+    """Return the shared instance of a built-in strategy, or ``None``.
+
+    The instance is reused across requests, so strategies must not keep
+    per-call state on ``self``.
+
+    :param strategy_id: Registered strategy id (e.g. ``"default"``).
+    :return: The strategy instance, or ``None`` if no valid strategy is
+        registered under ``strategy_id``.
+    """
+    return _engine_strategy_table().get(strategy_id)
+
+
+def engine_strategy_metadata(strategy_id: str | None = None) -> Any:
+    """Return the precomputed API payload of the built-in strategies.
+
+    :param strategy_id: When given, only that strategy's payload (or
+        ``None`` if it is not registered); otherwise a list of all of them,
+        in registry order.
+    :return: Fresh copies, safe for the caller to mutate.
+    """
+    _engine_strategy_table()
+    if strategy_id is not None:
+        entry = _metadata.get(strategy_id)
+        return None if entry is None else copy.deepcopy(entry)
+    return [copy.deepcopy(entry) for entry in _metadata.values()]
@@ -184,6 +184,9 @@ class FieldResolution:
     kind: str  # "static" or "analytics"
     method: Optional[str] = None
     arg_fn: Optional[Callable[[Any], Tuple[Any, ...]]] = None
+    # ``ScoringSnapshot`` attribute carrying the same value, so several
+    # analytics fields can be answered by one ``get_scoring_snapshot`` call.
+    snapshot_field: Optional[str] = None
 
 
 def _static(path: str, getter: Callable[[Any], Any]) -> Tuple[str, FieldResolution]:
@@ -204,7 +207,10 @@ def _static(path: str, getter: Callable[[Any], Any]) -> Tuple[str, FieldResoluti
 
 
 def _analytics(
-    path: str, method: str, arg_fn: Callable[[Any], Tuple[Any, ...]]
+    path: str,
+    method: str,
+    arg_fn: Callable[[Any], Tuple[Any, ...]],
+    snapshot_field: Optional[str] = None,
 ) -> Tuple[str, FieldResolution]:
     """
     Build a ``(path, FieldResolution)`` entry for an analytics-backed field.
@@ -216,13 +222,20 @@ def _analytics(
         path (str): The whitelisted field path.
         method (str): Name of the analytics-service method to invoke.
         arg_fn (Callable): Builds the positional-args tuple from the context.
+        snapshot_field (Optional[str]): ``ScoringSnapshot`` attribute holding
+            the same value, when the field can be coalesced into one
+            snapshot query.
 
     Returns:
         tuple: ``(path, FieldResolution)`` for inclusion in
         :data:`FIELD_RESOLVERS`.
     """
     return path, FieldResolution(
-        path=path, kind="analytics", method=method, arg_fn=arg_fn
+        path=path,
+        kind="analytics",
+        method=method,
+        arg_fn=arg_fn,
+        snapshot_field=snapshot_field,
     )
 
 
@@ -249,6 +262,7 @@ FIELD_RESOLVERS: Dict[str, FieldResolution] = dict(
             "user.measurements_count",
             "get_user_task_measurements_count",
             lambda ctx: (ctx.externalTaskId, ctx.externalUserId),
+            snapshot_field="user_task_measurements_count",
         ),
         # Rolling-window count used by ``constantEffortStrategy``.
         # The window in seconds is currently hard-coded to 300 (5 minutes,
@@ -263,26 +277,31 @@ FIELD_RESOLVERS: Dict[str, FieldResolution] = dict(
             "task.measurements_count",
             "count_measurements_by_external_task_id",
             lambda ctx: (ctx.externalTaskId,),
+            snapshot_field="task_measurements_count",
         ),
         _analytics(
             "user.avg_time",
             "get_avg_time_between_tasks_by_user_and_game_task",
             lambda ctx: (ctx.externalGameId, ctx.externalTaskId, ctx.externalUserId),
+            snapshot_field="user_avg_time_between_tasks",
         ),
         _analytics(
             "all.avg_time",
             "get_avg_time_between_tasks_for_all_users",
             lambda ctx: (ctx.externalGameId, ctx.externalTaskId),
+            snapshot_field="all_avg_time_between_tasks",
         ),
         _analytics(
             "user.last_window_diff",
             "get_last_window_time_diff",
             lambda ctx: (ctx.externalTaskId, ctx.externalUserId),
+            snapshot_field="last_window_time_diff",
         ),
         _analytics(
             "user.new_last_window_diff",
             "get_new_last_window_time_diff",
             lambda ctx: (ctx.externalTaskId, ctx.externalUserId, ctx.externalGameId),
+            snapshot_field="new_last_window_time_diff",
         ),
     ]
 )
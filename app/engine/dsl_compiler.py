@@ -0,0 +1,634 @@
+"""
+Closure compiler for the strategy DSL.
+
+:class:`~app.engine.dsl_interpreter.DslInterpreter` walks the JSON AST on
+every event: a dict dispatch on ``node["type"]`` and an awaited coroutine
+frame per node. For PUBLISHED definitions - immutable, already validated and
+run thousands of times - :func:`compile_program` does that dispatch once and
+returns a :class:`CompiledProgram`: a tree of pre-bound synchronous closures,
+one per node, each taking ``(fields, state)``.
+
+The compiled form is a drop-in for the walker and keeps its guarantees:
+
+* Same sandbox: closures only close over literals, whitelisted operator
+  handlers and ``field`` paths; field values still come from the frozen
+  ``ExecutionContext.resolved_fields``.
+* Same node budget and trace: every closure counts its node exactly where
+  the walker calls ``_step`` (including the double count of a bare
+  expression used as a condition) and appends the same trace entries, so
+  ``nodesExecuted``, traces and ``DslLimitExceededError`` match the walker.
+* Depth, operator, function-name and arity checks depend only on the AST,
+  so they are resolved at compile time. An AST the walker would reject at
+  run time (or that is malformed) is not compiled at all - ``compile_program``
+  returns ``None`` and the caller keeps walking it, which raises at the very
+  point it always did.
+* Cooperative yielding: closures are synchronous, so the driver awaits
+  ``asyncio.sleep(0)`` at rule boundaries once ``yield_every`` nodes ran
+  since the last yield. A single rule is bounded by ``max_nodes``, so a
+  timeout still lands within one rule of the budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from app.core.exceptions import DslExecutionError, DslLimitExceededError
+from app.engine.dsl_ast import (
+    ALLOWED_ARITH_OPS,
+    ALLOWED_COMPARE_OPS,
+    ALLOWED_FUNC_NAMES,
+    FUNC_ARITY,
+    NODE_AND,
+    NODE_ARITH,
+    NODE_ASSIGN_POINTS,
+    NODE_COMPARE,
+    NODE_FIELD,
+    NODE_FUNC_CALL,
+    NODE_LITERAL,
+    NODE_NOT,
+    NODE_OR,
+    NODE_RETURN,
+    NODE_SET_CALLBACK_DATA,
+    NODE_SET_CASE_NAME,
+    NODE_SET_DATA,
+    NODE_SET_POINTS,
+    NODE_VETO,
+)
+from app.engine.dsl_execution_context import ExecutionContext
+from app.engine.dsl_interpreter import (
+    _ARITH_HANDLERS,
+    _COMPARE_HANDLERS,
+    _FUNC_HANDLERS,
+    DslExecutionResult,
+    _DslHalt,
+    _RunState,
+)
+
+# ``(fields, state) -> value`` - every compiled node has this shape.
+_Compiled = Callable[[Mapping[str, Any], _RunState], Any]
+
+
+class _NotCompilable(Exception):
+    """The AST needs the walker (it would fail at run time, or is malformed)."""
+
+
+class CompiledProgram:
+    """
+    A program compiled by :func:`compile_program`.
+
+    :meth:`execute` has the walker's signature and returns the same
+    :class:`~app.engine.dsl_interpreter.DslExecutionResult`.
+    """
+
+    __slots__ = ("_program_step", "_sections", "_default", "_yield_every")
+
+    def __init__(
+        self,
+        program_step: Callable[[_RunState], None],
+        sections: Dict[str, List[_Compiled]],
+        default: Optional[_Compiled],
+        yield_every: int,
+    ) -> None:
+        self._program_step = program_step
+        self._sections = sections
+        self._default = default
+        self._yield_every = yield_every
+
+    async def execute(
+        self,
+        ctx: ExecutionContext,
+        *,
+        mode: str = "full",
+        initial_data: Optional[Dict[str, Any]] = None,
+        parent_result: Optional[Dict[str, Any]] = None,
+    ) -> DslExecutionResult:
+        """
+        Run the compiled program; see :meth:`DslInterpreter.execute`.
+        """
+        state = _RunState()
+        if initial_data is not None:
+            state.working_data = dict(initial_data)
+        if parent_result is not None:
+            state.points = float(parent_result.get("points") or 0)
+            state.case_name = parent_result.get("case_name")
+            state.callback_data = dict(parent_result.get("callback_data") or {})
+            state.matched = True
+
+        fields = ctx.resolved_fields
+        if mode == "full":
+            rules = self._sections["rules"]
+        else:
+            rules = self._sections["pre_rules" if mode == "pre" else "post_rules"]
+        try:
+            self._program_step(state)
+            yielded_at = 0
+            for rule in rules:
+                if state.count - yielded_at >= self._yield_every:
+                    await asyncio.sleep(0)
+                    yielded_at = state.count
+                rule(fields, state)
+            if mode == "full" and self._default is not None and not state.matched:
+                self._default(fields, state)
+        except _DslHalt:
+            pass
+
+        return {
+            "points": state.points if state.matched else 0,
+            "case_name": state.case_name,
+            "callback_data": state.callback_data,
+            "trace": state.trace,
+            "working_data": state.working_data,
+            "vetoed": state.vetoed,
+        }
+
+
+def compile_program(
+    ast: Dict[str, Any],
+    *,
+    max_nodes: int,
+    max_depth: int,
+    yield_every: int = 64,
+) -> Optional[CompiledProgram]:
+    """
+    Compile a validated program AST into closures.
+
+    Args:
+        ast (Dict[str, Any]): The program node.
+        max_nodes (int): Executed-node budget, as for the walker.
+        max_depth (int): Recursion-depth budget, as for the walker.
+        yield_every (int): Nodes between cooperative yields.
+
+    Returns:
+        Optional[CompiledProgram]: The compiled program, or ``None`` when the
+        AST has to be walked (see the module docstring).
+    """
+    try:
+        return _Compiler(max_nodes, max_depth).program(ast, max(yield_every, 1))
+    except (_NotCompilable, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _node_limit_error(max_nodes: int, node_id: Any) -> DslLimitExceededError:
+    """The walker's ``_step`` error, for a node past the budget."""
+    return DslLimitExceededError(
+        detail=f"DSL execution exceeded maximum node count ({max_nodes}).",
+        headers={"X-Node-Id": str(node_id)},
+    )
+
+
+def _not_a_number(stmt: str, node_id: Any, value: Any, code: str):
+    """The walker's error for a non-numeric ``assign_points``/``set_points``."""
+    return DslExecutionError(
+        detail=f"{stmt}.value must evaluate to a number.",
+        headers={"X-Node-Id": str(node_id)},
+        code=code,
+        params={"nodeId": node_id, "actualType": type(value).__name__},
+    )
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class _Compiler:
+    """Builds closures for one program under fixed node/depth budgets."""
+
+    def __init__(self, max_nodes: int, max_depth: int) -> None:
+        self.max_nodes = max_nodes
+        self.max_depth = max_depth
+
+    def _depth(self, depth: int) -> None:
+        # The walker raises when it *reaches* a node this deep; leave such
+        # programs to it so the error surfaces at the same point.
+        if depth > self.max_depth:
+            raise _NotCompilable()
+
+    def program(self, node: Dict[str, Any], yield_every: int) -> CompiledProgram:
+        max_nodes = self.max_nodes
+        program_id = node.get("id")
+
+        def program_step(state: _RunState) -> None:
+            state.count += 1
+            if state.count > max_nodes:
+                raise _node_limit_error(max_nodes, program_id)
+
+        sections = {
+            key: [self.rule(rule, 1) for rule in node.get(key) or []]
+            for key in ("rules", "pre_rules", "post_rules")
+        }
+        default_node = node.get("default")
+        default = None if default_node is None else self.statement(default_node, 1)
+        return CompiledProgram(program_step, sections, default, yield_every)
+
+    # rules
+
+    def _statements(self, nodes, depth: int) -> Tuple[_Compiled, ...]:
+        return tuple(self.statement(stmt, depth) for stmt in nodes or [])
+
+    def rule(self, node: Dict[str, Any], depth: int) -> _Compiled:
+        self._depth(depth)
+        max_nodes = self.max_nodes
+        rule_id = node.get("id")
+        when = self.condition(node["when"], depth + 1)
+        then = self._statements(node.get("then"), depth + 1)
+        else_ifs = tuple(
+            (
+                branch.get("id"),
+                self.condition(branch["when"], depth + 1),
+                self._statements(branch.get("then"), depth + 1),
+            )
+            for branch in node.get("else_if") or []
+        )
+        else_stmts = node.get("else")
+        else_body = self._statements(else_stmts, depth + 1) if else_stmts else None
+
+        def run_rule(fields, state: _RunState) -> None:
+            state.count += 1
+            if state.count > max_nodes:
+                raise _node_limit_error(max_nodes, rule_id)
+            if when(fields, state):
+                state.trace.append(
+                    {
+                        "nodeId": rule_id,
+                        "type": "rule",
+                        "value": True,
+                        "branch": "match",
+                    }
+                )
+                for stmt in then:
+                    stmt(fields, state)
+                return
+            for index, (branch_id, branch_when, branch_then) in enumerate(else_ifs):
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, branch_id)
+                if branch_when(fields, state):
+                    state.trace.append(
+                        {
+                            "nodeId": rule_id,
+                            "type": "rule",
+                            "value": True,
+                            "branch": f"elseif:{index}",
+                        }
+                    )
+                    for stmt in branch_then:
+                        stmt(fields, state)
+                    return
+            if else_body is not None:
+                state.trace.append(
+                    {
+                        "nodeId": rule_id,
+                        "type": "rule",
+                        "value": False,
+                        "branch": "else",
+                    }
+                )
+                for stmt in else_body:
+                    stmt(fields, state)
+                return
+            state.trace.append(
+                {"nodeId": rule_id, "type": "rule", "value": False, "branch": "skip"}
+            )
+
+        return run_rule
+
+    # statements
+
+    def statement(self, node: Dict[str, Any], depth: int) -> _Compiled:
+        self._depth(depth)
+        max_nodes = self.max_nodes
+        node_id = node.get("id")
+        ntype = node.get("type")
+
+        if ntype == NODE_ASSIGN_POINTS:
+            value_fn = self.expression(node["value"], depth + 1)
+            case_name = node["case_name"]
+
+            def assign_points(fields, state: _RunState) -> None:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                value = value_fn(fields, state)
+                if not _is_number(value):
+                    raise _not_a_number(
+                        "assign_points", node_id, value, "DSL_ASSIGN_POINTS_NOT_NUMBER"
+                    )
+                state.points = value
+                state.case_name = case_name
+                state.matched = True
+                state.trace.append(
+                    {
+                        "nodeId": node_id,
+                        "type": ntype,
+                        "value": value,
+                        "branch": "match",
+                    }
+                )
+                raise _DslHalt()
+
+            return assign_points
+
+        if ntype in (NODE_SET_CALLBACK_DATA, NODE_SET_DATA):
+            value_fn = self.expression(node["value"], depth + 1)
+            key = node["key"]
+            to_working_data = ntype == NODE_SET_DATA
+
+            def set_entry(fields, state: _RunState) -> None:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                value = value_fn(fields, state)
+                if to_working_data:
+                    state.working_data[key] = value
+                else:
+                    state.callback_data[key] = value
+                state.trace.append({"nodeId": node_id, "type": ntype, "value": value})
+
+            return set_entry
+
+        if ntype == NODE_VETO:
+            case_name = node["case_name"]
+
+            def veto(fields, state: _RunState) -> None:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                state.points = 0
+                state.case_name = case_name
+                state.matched = True
+                state.vetoed = True
+                state.trace.append(
+                    {
+                        "nodeId": node_id,
+                        "type": ntype,
+                        "value": case_name,
+                        "branch": "veto",
+                    }
+                )
+                raise _DslHalt()
+
+            return veto
+
+        if ntype == NODE_SET_POINTS:
+            value_fn = self.expression(node["value"], depth + 1)
+
+            def set_points(fields, state: _RunState) -> None:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                value = value_fn(fields, state)
+                if not _is_number(value):
+                    raise _not_a_number(
+                        "set_points", node_id, value, "DSL_SET_POINTS_NOT_NUMBER"
+                    )
+                state.points = value
+                state.matched = True
+                state.trace.append({"nodeId": node_id, "type": ntype, "value": value})
+
+            return set_points
+
+        if ntype == NODE_SET_CASE_NAME:
+            value_fn = self.expression(node["value"], depth + 1)
+
+            def set_case_name(fields, state: _RunState) -> None:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                value = value_fn(fields, state)
+                if not isinstance(value, str):
+                    raise DslExecutionError(
+                        detail="set_case_name.value must evaluate to a string.",
+                        headers={"X-Node-Id": str(node_id)},
+                        code="DSL_SET_CASE_NAME_NOT_STRING",
+                        params={"nodeId": node_id, "actualType": type(value).__name__},
+                    )
+                state.case_name = value
+                state.matched = True
+                state.trace.append({"nodeId": node_id, "type": ntype, "value": value})
+
+            return set_case_name
+
+        if ntype == NODE_RETURN:
+
+            def halt(fields, state: _RunState) -> None:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                state.trace.append(
+                    {"nodeId": node_id, "type": ntype, "value": None, "branch": "halt"}
+                )
+                raise _DslHalt()
+
+            return halt
+
+        raise _NotCompilable()
+
+    # conditions
+
+    def condition(self, node: Dict[str, Any], depth: int) -> _Compiled:
+        self._depth(depth)
+        max_nodes = self.max_nodes
+        node_id = node.get("id")
+        ntype = node.get("type")
+
+        if ntype in (NODE_AND, NODE_OR):
+            args = tuple(self.condition(arg, depth + 1) for arg in node["args"])
+            # AND stops at the first falsy arg, OR at the first truthy one.
+            stop_on = ntype == NODE_OR
+
+            def junction(fields, state: _RunState) -> bool:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                for index, arg in enumerate(args):
+                    if bool(arg(fields, state)) is stop_on:
+                        state.trace.append(
+                            {
+                                "nodeId": node_id,
+                                "type": ntype,
+                                "value": stop_on,
+                                "branch": f"short_circuit:{index}",
+                            }
+                        )
+                        return stop_on
+                state.trace.append(
+                    {"nodeId": node_id, "type": ntype, "value": not stop_on}
+                )
+                return not stop_on
+
+            return junction
+
+        if ntype == NODE_NOT:
+            arg = self.condition(node["arg"], depth + 1)
+
+            def negate(fields, state: _RunState) -> bool:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                value = not arg(fields, state)
+                state.trace.append({"nodeId": node_id, "type": ntype, "value": value})
+                return value
+
+            return negate
+
+        if ntype == NODE_COMPARE:
+            left_fn = self.expression(node["left"], depth + 1)
+            right_fn = self.expression(node["right"], depth + 1)
+            op = node["op"]
+            if op not in ALLOWED_COMPARE_OPS:
+                raise _NotCompilable()
+            handler = _COMPARE_HANDLERS[op]
+
+            def compare(fields, state: _RunState) -> bool:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                left = left_fn(fields, state)
+                right = right_fn(fields, state)
+                try:
+                    result = bool(handler(left, right))
+                except TypeError as exc:
+                    raise DslExecutionError(
+                        detail=(
+                            f"compare {op!r} between incompatible types "
+                            f"{type(left).__name__} and {type(right).__name__}."
+                        ),
+                        headers={"X-Node-Id": str(node_id)},
+                        code="DSL_COMPARE_TYPE_MISMATCH",
+                        params={
+                            "nodeId": node_id,
+                            "op": op,
+                            "leftType": type(left).__name__,
+                            "rightType": type(right).__name__,
+                        },
+                    ) from exc
+                state.trace.append({"nodeId": node_id, "type": ntype, "value": result})
+                return result
+
+            return compare
+
+        # Bare expression as a condition: the walker counts the node once as
+        # a condition and again as an expression.
+        expression = self.expression(node, depth)
+
+        def truthy(fields, state: _RunState) -> bool:
+            state.count += 1
+            if state.count > max_nodes:
+                raise _node_limit_error(max_nodes, node_id)
+            return bool(expression(fields, state))
+
+        return truthy
+
+    # expressions
+
+    def expression(self, node: Dict[str, Any], depth: int) -> _Compiled:
+        self._depth(depth)
+        max_nodes = self.max_nodes
+        node_id = node.get("id")
+        ntype = node.get("type")
+
+        if ntype == NODE_LITERAL:
+            literal = node["value"]
+
+            def constant(fields, state: _RunState) -> Any:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                state.trace.append({"nodeId": node_id, "type": ntype, "value": literal})
+                return literal
+
+            return constant
+
+        if ntype == NODE_FIELD:
+            path = node["path"]
+
+            def read_field(fields, state: _RunState) -> Any:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                if path not in fields:
+                    raise DslExecutionError(
+                        detail=(
+                            f"field.path '{path}' was not precomputed. This "
+                            "usually means the validator was bypassed."
+                        ),
+                        headers={"X-Node-Id": str(node_id)},
+                        code="DSL_FIELD_NOT_PRECOMPUTED",
+                        params={"nodeId": node_id, "path": path},
+                    )
+                value = fields[path]
+                state.trace.append({"nodeId": node_id, "type": ntype, "value": value})
+                return value
+
+            return read_field
+
+        if ntype == NODE_ARITH:
+            left_fn = self.expression(node["left"], depth + 1)
+            right_fn = self.expression(node["right"], depth + 1)
+            op = node["op"]
+            if op not in ALLOWED_ARITH_OPS:
+                raise _NotCompilable()
+            handler = _ARITH_HANDLERS[op]
+
+            def arith(fields, state: _RunState) -> Any:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                left = left_fn(fields, state)
+                right = right_fn(fields, state)
+                try:
+                    result = handler(left, right)
+                except ZeroDivisionError as exc:
+                    raise DslExecutionError(
+                        detail="division by zero",
+                        headers={"X-Node-Id": str(node_id)},
+                        code="DSL_ARITH_DIV_BY_ZERO",
+                        params={"nodeId": node_id, "op": op},
+                    ) from exc
+                except TypeError as exc:
+                    raise DslExecutionError(
+                        detail=(
+                            f"arith {op!r} between incompatible types "
+                            f"{type(left).__name__} and {type(right).__name__}."
+                        ),
+                        headers={"X-Node-Id": str(node_id)},
+                        code="DSL_ARITH_TYPE_MISMATCH",
+                        params={
+                            "nodeId": node_id,
+                            "op": op,
+                            "leftType": type(left).__name__,
+                            "rightType": type(right).__name__,
+                        },
+                    ) from exc
+                state.trace.append({"nodeId": node_id, "type": ntype, "value": result})
+                return result
+
+            return arith
+
+        if ntype == NODE_FUNC_CALL:
+            name = node.get("name")
+            args_nodes = node.get("args") or []
+            if name not in ALLOWED_FUNC_NAMES or len(args_nodes) != FUNC_ARITY[name]:
+                raise _NotCompilable()
+            arg_fns = tuple(self.expression(arg, depth + 1) for arg in args_nodes)
+            func = _FUNC_HANDLERS[name]
+
+            def call(fields, state: _RunState) -> Any:
+                state.count += 1
+                if state.count > max_nodes:
+                    raise _node_limit_error(max_nodes, node_id)
+                args = [arg_fn(fields, state) for arg_fn in arg_fns]
+                try:
+                    result = func(args)
+                except (TypeError, ValueError, ZeroDivisionError) as exc:
+                    raise DslExecutionError(
+                        detail=f"func_call '{name}' failed: {exc}",
+                        headers={"X-Node-Id": str(node_id)},
+                    ) from exc
+                state.trace.append({"nodeId": node_id, "type": ntype, "value": result})
+                return result
+
+            return call
+
+        raise _NotCompilable()
@@ -14,18 +14,26 @@ prefixes). When present, the precompute uses the mock value verbatim and
 never calls the analytics service. This is what lets a designer iterate
 on logic against synthetic inputs while still hitting real production
 analytics methods when ``mock_state`` is left unset.
+
+Analytics fields are independent reads, so they are fetched concurrently,
+at most ``DSL_ANALYTICS_MAX_CONCURRENCY`` at a time (each fetch holds its
+own pooled session). Two or more fields that ``ScoringSnapshot`` also
+carries are answered by one ``get_scoring_snapshot`` query instead.
 """
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Any, Dict, Mapping, Optional, Set
+from typing import AbstractSet, Any, Awaitable, Callable, Dict, List, Mapping, Optional
 
+from app.core.config import configs
 from app.engine.dsl_ast import (
     DATA_FIELD_PREFIX,
     FIELD_RESOLVERS,
     PARENT_FIELD_PATHS,
+    FieldResolution,
     enumerate_field_paths,
     is_parent_field_path,
     is_valid_data_path,
@@ -53,6 +61,9 @@ class ExecutionContext:
         mock_state: Optional[Dict[str, Any]] = None,
         parent_result: Optional[Dict[str, Any]] = None,
         analytics_cache: Optional[Dict[str, Any]] = None,
+        field_paths: Optional[AbstractSet[str]] = None,
+        max_concurrency: Optional[int] = None,
+        coalesce: Optional[bool] = None,
     ) -> "ExecutionContext":
         """
         Precompute every field referenced by ``ast`` and return a frozen
@@ -73,6 +84,14 @@ class ExecutionContext:
         and ``data.*`` fields legitimately differ between phases because
         pre-rules may mutate ``data``. Pass ``None`` (the default) to opt
         out - DSL_FULL builds a single context and gains nothing.
+
+        ``field_paths`` is ``enumerate_field_paths(ast)`` precomputed by the
+        caller; ``DslStrategy`` walks its AST once at construction and
+        passes the result here so a reused strategy never re-walks it.
+
+        ``max_concurrency`` and ``coalesce`` override
+        ``DSL_ANALYTICS_MAX_CONCURRENCY`` / ``DSL_ANALYTICS_COALESCE_ENABLED``
+        for this build.
         """
         data_payload: Dict[str, Any] = dict(data or {})
         mocks = mock_state or {}
@@ -87,8 +106,11 @@ class ExecutionContext:
             externalUserId=externalUserId,
         )
 
-        referenced: Set[str] = enumerate_field_paths(ast)
+        referenced: AbstractSet[str] = (
+            field_paths if field_paths is not None else enumerate_field_paths(ast)
+        )
         resolved: Dict[str, Any] = {}
+        pending: Dict[str, FieldResolution] = {}
 
         for path in referenced:
             if path in mocks:
@@ -103,12 +125,7 @@ class ExecutionContext:
                     if analytics_cache is not None and path in analytics_cache:
                         resolved[path] = analytics_cache[path]
                         continue
-                    method = getattr(analytics_service, resolution.method)
-                    args = resolution.arg_fn(ctx_for_args)
-                    value = await method(*args)
-                    resolved[path] = value
-                    if analytics_cache is not None:
-                        analytics_cache[path] = value
+                    pending[path] = resolution
                     continue
             if is_valid_data_path(path):
                 key = path[len(DATA_FIELD_PREFIX) :]
@@ -127,6 +144,26 @@ class ExecutionContext:
             # field unresolved and let the interpreter surface a clean
             # error rather than silently returning None.
 
+        if pending:
+            fetched = await _fetch_analytics(
+                pending,
+                analytics_service,
+                ctx_for_args,
+                max_concurrency=(
+                    configs.DSL_ANALYTICS_MAX_CONCURRENCY
+                    if max_concurrency is None
+                    else max_concurrency
+                ),
+                coalesce=(
+                    configs.DSL_ANALYTICS_COALESCE_ENABLED
+                    if coalesce is None
+                    else coalesce
+                ),
+            )
+            resolved.update(fetched)
+            if analytics_cache is not None:
+                analytics_cache.update(fetched)
+
         # Inject parent.* AFTER the regular resolution loop so
         # post-rule execution can read the parent built-in's output via
         # the same ``ctx.resolved_fields`` lookup used for analytics.
@@ -156,3 +193,85 @@ class _IdsOnly:
     externalGameId: str
     externalTaskId: str
     externalUserId: str
+
+
+async def _fetch_analytics(
+    pending: Mapping[str, FieldResolution],
+    analytics_service: Any,
+    ids: _IdsOnly,
+    *,
+    max_concurrency: int,
+    coalesce: bool,
+) -> Dict[str, Any]:
+    """
+    Resolve ``pending`` analytics fields with concurrent service calls.
+
+    When ``coalesce`` is set and two or more fields carry a
+    ``snapshot_field``, they share one ``get_scoring_snapshot`` call; every
+    other field gets its own call. At most ``max_concurrency`` calls are in
+    flight. If any call fails the rest are cancelled and the first error
+    propagates, as it did when the fields were awaited one by one.
+
+    Args:
+        pending (Mapping[str, FieldResolution]): Analytics fields to fetch.
+        analytics_service: Service exposing the resolver methods.
+        ids (_IdsOnly): External ids the resolvers build their args from.
+        max_concurrency (int): Cap on in-flight calls (values below 1 run
+            the calls one at a time).
+        coalesce (bool): Whether snapshot-covered fields may share a query.
+
+    Returns:
+        Dict[str, Any]: Field path to resolved value.
+    """
+    fetches: List[Callable[[], Awaitable[Dict[str, Any]]]] = []
+    singles = dict(pending)
+
+    snapshot_paths = {
+        path: resolution.snapshot_field
+        for path, resolution in pending.items()
+        if resolution.snapshot_field is not None
+    }
+    if coalesce and len(snapshot_paths) >= 2:
+        for path in snapshot_paths:
+            del singles[path]
+
+        async def fetch_snapshot() -> Dict[str, Any]:
+            snapshot = await analytics_service.get_scoring_snapshot(
+                ids.externalGameId, ids.externalTaskId, ids.externalUserId
+            )
+            return {
+                path: getattr(snapshot, attr) for path, attr in snapshot_paths.items()
+            }
+
+        fetches.append(fetch_snapshot)
+
+    for path, resolution in singles.items():
+
+        async def fetch_one(
+            path: str = path, resolution: FieldResolution = resolution
+        ) -> Dict[str, Any]:
+            method = getattr(analytics_service, resolution.method)
+            return {path: await method(*resolution.arg_fn(ids))}
+
+        fetches.append(fetch_one)
+
+    if len(fetches) == 1:
+        return await fetches[0]()
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def bounded(fetch: Callable[[], Awaitable[Dict[str, Any]]]):
+        async with semaphore:
+            return await fetch()
+
+    tasks = [asyncio.ensure_future(bounded(fetch)) for fetch in fetches]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    fetched: Dict[str, Any] = {}
+    for result in results:
+        fetched.update(result)
+    return fetched
@@ -35,7 +35,7 @@ Execution semantics mirror ``app/engine/default.py``:
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict
 
 from app.core.exceptions import (
     DslExecutionError,
@@ -65,6 +65,9 @@ from app.engine.dsl_ast import (
 )
 from app.engine.dsl_execution_context import ExecutionContext
 
+if TYPE_CHECKING:
+    from app.engine.dsl_compiler import CompiledProgram
+
 
 class DslExecutionResult(TypedDict, total=False):
     points: float
@@ -95,6 +98,28 @@ class DslInterpreter:
         self._max_depth = max_depth
         self._yield_every = max(yield_every, 1)
 
+    def compile(self, ast: Dict[str, Any]) -> Optional["CompiledProgram"]:
+        """
+        Compile ``ast`` into closures under this interpreter's limits.
+
+        The result's ``execute`` is a drop-in for :meth:`execute` (same
+        results, traces and node budget); see ``app/engine/dsl_compiler.py``.
+
+        Returns:
+            Optional[CompiledProgram]: The compiled program, or ``None`` when
+            the AST has to be walked.
+        """
+        # Imported here: the compiler builds on this module's run state and
+        # operator tables.
+        from app.engine.dsl_compiler import compile_program
+
+        return compile_program(
+            ast,
+            max_nodes=self._max_nodes,
+            max_depth=self._max_depth,
+            yield_every=self._yield_every,
+        )
+
     async def execute(
         self,
         ast: Dict[str, Any],
@@ -30,15 +30,16 @@ from app.core.exceptions import (
     DslValidationError,
 )
 from app.engine.base_strategy import BaseStrategy
+from app.engine.dsl_ast import enumerate_field_paths
 from app.engine.dsl_execution_context import ExecutionContext
 from app.engine.dsl_interpreter import DslInterpreter
 from app.schema.strategy_definition_schema import StrategyDefinitionRead
 
 # The idempotency hash is a canonical-JSON dump of the AST
-# plus a SHA-256 - pure CPU, but ``UserPointsService`` constructs a fresh
-# ``DslStrategy`` on every scoring call, so a busy strategy re-hashes the
-# same multi-KB AST thousands of times a minute. We memoise the result
-# keyed by ``(strategyId, version)``.
+# plus a SHA-256 - pure CPU, but a ``DslStrategy`` is constructed for every
+# cache miss, simulation and draft run, so a busy strategy would re-hash the
+# same multi-KB AST over and over. We memoise the result keyed by
+# ``(strategyId, version)``.
 #
 # Only PUBLISHED definitions are cached: editing a DRAFT patches the row
 # *in place* without bumping the version (see
@@ -101,6 +102,71 @@ def _cached_published_ast_hash(
     return value
 
 
+# Ready-to-run ``DslStrategy`` instances for PUBLISHED definitions, keyed by
+# ``(realmId, strategyId)``. ``StrategyService`` used to re-read the
+# definition row and rebuild the strategy (AST hash, field-path walk, parent
+# lookup) for every scored event; a hit here skips all of that, including
+# the ``strategydefinition`` read. The same immutability argument as the
+# hash cache applies: a published row never changes its AST or version (an
+# edit forks a new row with a new id), so the id pins the version. Lifecycle
+# changes (publish / archive / rollback) still evict the realm's entries via
+# :func:`invalidate_published_strategies` so the cached definition's status
+# stays accurate in the worker that made the change.
+_PUBLISHED_STRATEGY_CACHE: "OrderedDict[Tuple[Optional[str], str], DslStrategy]" = (
+    OrderedDict()
+)
+_PUBLISHED_STRATEGY_CACHE_MAXSIZE = 512
+
+
+def get_cached_published_strategy(
+    realm_id: Optional[str], strategy_id: str
+) -> Optional["DslStrategy"]:
+    """
+    Return the cached strategy for a published definition, if any.
+
+    Args:
+        realm_id (Optional[str]): Realm the definition was resolved for.
+        strategy_id (str): The strategy definition id.
+
+    Returns:
+        Optional[DslStrategy]: The ready-to-run strategy, or ``None``.
+    """
+    key = (realm_id, str(strategy_id))
+    strategy = _PUBLISHED_STRATEGY_CACHE.get(key)
+    if strategy is not None:
+        _PUBLISHED_STRATEGY_CACHE.move_to_end(key)
+    return strategy
+
+
+def cache_published_strategy(realm_id: Optional[str], strategy: "DslStrategy") -> None:
+    """
+    Remember a strategy built from a PUBLISHED definition (no-op otherwise).
+
+    Args:
+        realm_id (Optional[str]): Realm the definition was resolved for.
+        strategy (DslStrategy): The strategy to reuse for later events.
+    """
+    definition = strategy._definition
+    if getattr(definition, "status", None) != "PUBLISHED":
+        return
+    key = (realm_id, str(definition.id))
+    _PUBLISHED_STRATEGY_CACHE[key] = strategy
+    _PUBLISHED_STRATEGY_CACHE.move_to_end(key)
+    if len(_PUBLISHED_STRATEGY_CACHE) > _PUBLISHED_STRATEGY_CACHE_MAXSIZE:
+        _PUBLISHED_STRATEGY_CACHE.popitem(last=False)
+
+
+def invalidate_published_strategies(realm_id: Optional[str]) -> None:
+    """
+    Evict every cached strategy resolved for ``realm_id``.
+
+    Args:
+        realm_id (Optional[str]): Realm whose definitions changed.
+    """
+    for key in [key for key in _PUBLISHED_STRATEGY_CACHE if key[0] == realm_id]:
+        del _PUBLISHED_STRATEGY_CACHE[key]
+
+
 class DslStrategy(BaseStrategy):
     def __init__(
         self,
@@ -134,12 +200,18 @@ class DslStrategy(BaseStrategy):
         # container keep working unchanged. The container wires the
         # real DslExecutionObserver in production.
         self._observer = observer
-        # Filled by _run_phase on every interpreter call so
-        # the calculate_points wrapper can hand the observer a trace
-        # without threading return values through DSL_EXTEND's three
-        # phases. Reset at the top of every calculate_points entry.
-        self._last_trace: Optional[list] = None
-        self._last_nodes_executed: int = 0
+        # Every ``field`` path the AST reads, walked once here instead of
+        # on each ExecutionContext build (twice per event for DSL_EXTEND).
+        self._field_paths = frozenset(enumerate_field_paths(definition.astJson))
+        # Published definitions are immutable and run on every event, so
+        # they execute as pre-bound closures instead of walking the JSON.
+        # ``None`` (drafts, or an AST only the walker can report on) keeps
+        # the interpreter walk.
+        self._compiled = (
+            interpreter.compile(definition.astJson)
+            if definition.status == "PUBLISHED" and definition.astJson is not None
+            else None
+        )
         self.hash_version = self._generate_hash_of_calculate_points()
 
     def _generate_hash_of_calculate_points(self) -> str:
@@ -203,11 +275,10 @@ class DslStrategy(BaseStrategy):
         if self._definition.astJson is None:
             return 0, None
 
-        # Reset per-call observability state so a previous run's trace
-        # (e.g. from a re-used strategy instance) doesn't leak into
-        # this one's observer payload.
-        self._last_trace = None
-        self._last_nodes_executed = 0
+        # Per-call observability state: each phase appends its trace here.
+        # Kept off the instance because StrategyService reuses one
+        # instance for concurrent events of a published strategy.
+        phase_traces: list = []
 
         # Every execution gets a single observation envelope
         # so metrics + sampled persistence cover both DSL_FULL and
@@ -228,6 +299,7 @@ class DslStrategy(BaseStrategy):
                     externalTaskId,
                     externalUserId,
                     data,
+                    phase_traces=phase_traces,
                 )
             else:
                 result = await self._calculate_dsl_extend(
@@ -235,16 +307,18 @@ class DslStrategy(BaseStrategy):
                     externalTaskId,
                     externalUserId,
                     data,
+                    phase_traces=phase_traces,
                 )
             # ``result`` is the 2- or 3-tuple
             # (points, case_name [, callback_data]). Normalise for the
             # observer; the caller still gets the original tuple back.
             padded = result + (None,)
             points_emitted, case_name_emitted, _cb = padded[:3]
-            # Pull the last-run trace / node count off the strategy so
-            # we don't have to thread them through every return path.
-            trace = self._last_trace
-            nodes_executed = self._last_nodes_executed
+            # One sequential trace for the whole pipeline (pre + post for
+            # DSL_EXTEND); ``None`` when no interpreter phase ran.
+            if phase_traces:
+                trace = [step for phase in phase_traces for step in phase]
+                nodes_executed = len(trace)
             return result
         except DslTimeoutError as exc:
             status = "timeout"
@@ -304,6 +378,8 @@ class DslStrategy(BaseStrategy):
         externalTaskId: Optional[str],
         externalUserId: Optional[str],
         data: Optional[dict],
+        *,
+        phase_traces: list,
     ) -> Tuple:
         """
         Run the DSL_FULL pipeline: build a context and execute the program.
@@ -316,6 +392,8 @@ class DslStrategy(BaseStrategy):
             externalTaskId (Optional[str]): External identifier of the task.
             externalUserId (Optional[str]): External identifier of the user.
             data (Optional[dict]): Event payload available to the program.
+            phase_traces (list): Per-call accumulator the phase trace is
+                appended to.
 
         Returns:
             tuple: The ``(points, case_name[, callback_data])`` result.
@@ -327,12 +405,14 @@ class DslStrategy(BaseStrategy):
             externalUserId=externalUserId,
             data=data,
             analytics_service=self._analytics,
+            field_paths=self._field_paths,
         )
         result = await self._run_phase(
             ctx,
             mode="full",
             initial_data=None,
             parent_result=None,
+            phase_traces=phase_traces,
         )
         return self._format_result(result)
 
@@ -342,6 +422,8 @@ class DslStrategy(BaseStrategy):
         externalTaskId: Optional[str],
         externalUserId: Optional[str],
         data: Optional[dict],
+        *,
+        phase_traces: list,
     ) -> Tuple:
         """
         3-phase pipeline:
@@ -385,12 +467,14 @@ class DslStrategy(BaseStrategy):
                 data=working_data,
                 analytics_service=self._analytics,
                 analytics_cache=analytics_cache,
+                field_paths=self._field_paths,
             )
             pre_result = await self._run_phase(
                 pre_ctx,
                 mode="pre",
                 initial_data=working_data,
                 parent_result=None,
+                phase_traces=phase_traces,
             )
             if pre_result.get("vetoed"):
                 # Pre-rule veto short-circuits the whole pipeline: parent
@@ -447,12 +531,14 @@ class DslStrategy(BaseStrategy):
             analytics_service=self._analytics,
             parent_result=parent_result,
             analytics_cache=analytics_cache,
+            field_paths=self._field_paths,
         )
         post_result = await self._run_phase(
             post_ctx,
             mode="post",
             initial_data=None,
             parent_result=parent_result,
+            phase_traces=phase_traces,
         )
         return self._format_result(post_result)
 
@@ -463,26 +549,35 @@ class DslStrategy(BaseStrategy):
         mode: str,
         initial_data: Optional[dict],
         parent_result: Optional[dict],
+        phase_traces: list,
     ) -> dict:
         """Run one phase under the per-call timeout and return the raw
         DslExecutionResult dict (which carries working_data and vetoed
         for pre/post phases - see the TypedDict in dsl_interpreter).
 
-        The trace produced by each phase is appended to
-        ``self._last_trace`` so the calculate_points wrapper hands the
-        observer a single sequential trace for the whole pipeline (pre
-        + post for DSL_EXTEND, just the full run for DSL_FULL). Node
-        counts are summed for the same reason.
+        The trace produced by each phase is appended to ``phase_traces``
+        so the calculate_points wrapper hands the observer a single
+        sequential trace for the whole pipeline (pre + post for
+        DSL_EXTEND, just the full run for DSL_FULL).
         """
+        if self._compiled is not None:
+            run = self._compiled.execute(
+                ctx,
+                mode=mode,
+                initial_data=initial_data,
+                parent_result=parent_result,
+            )
+        else:
+            run = self._interpreter.execute(
+                self._definition.astJson,
+                ctx,
+                mode=mode,
+                initial_data=initial_data,
+                parent_result=parent_result,
+            )
         try:
             result = await asyncio.wait_for(
-                self._interpreter.execute(
-                    self._definition.astJson,
-                    ctx,
-                    mode=mode,
-                    initial_data=initial_data,
-                    parent_result=parent_result,
-                ),
+                run,
                 timeout=configs.DSL_EXECUTION_TIMEOUT_MS / 1000,
             )
         except asyncio.TimeoutError as exc:
@@ -493,12 +588,7 @@ class DslStrategy(BaseStrategy):
                 )
             ) from exc
 
-        phase_trace = result.get("trace") or []
-        if self._last_trace is None:
-            self._last_trace = list(phase_trace)
-        else:
-            self._last_trace.extend(phase_trace)
-        self._last_nodes_executed += len(phase_trace)
+        phase_traces.append(list(result.get("trace") or []))
         return dict(result)
 
     def _format_result(self, run: dict) -> Tuple:
@@ -12,28 +12,35 @@ from app.engine.strategy_registry import register_strategy
 logger = logging.getLogger(__name__)
 
 
-def _build_rook_weights(rows: int, cols: int) -> np.ndarray:
+def _rook_neighbourhood_sums(array: np.ndarray) -> np.ndarray:
     """
-    Build a rook-contiguity weights matrix (including self-neighbors).
+    Sum each cell with its rook neighbours (up, down, left, right).
 
-    Each cell is connected to itself and to direct neighbors
-    (up, down, left, right) when they exist.
+    Equivalent to multiplying the flattened grid by a rook-contiguity
+    weights matrix that includes self-neighbours, computed with shifted
+    slices instead of materialising the ``n x n`` matrix.
     """
-    n = rows * cols
-    weights = np.zeros((n, n), dtype=float)
+    sums = array.copy()
+    sums[1:, :] += array[:-1, :]
+    sums[:-1, :] += array[1:, :]
+    sums[:, 1:] += array[:, :-1]
+    sums[:, :-1] += array[:, 1:]
+    return sums
 
-    def idx(r: int, c: int) -> int:
-        """Flatten a ``(row, col)`` cell coordinate into a 1D matrix index."""
-        return r * cols + c
 
-    for r in range(rows):
-        for c in range(cols):
-            i = idx(r, c)
-            weights[i, i] = 1.0
-            for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
-                if 0 <= nr < rows and 0 <= nc < cols:
-                    weights[i, idx(nr, nc)] = 1.0
-    return weights
+def _rook_neighbourhood_counts(rows: int, cols: int) -> np.ndarray:
+    """
+    Number of cells in each cell's rook neighbourhood, itself included.
+
+    This is the row sum of the binary weights matrix - and, the weights
+    being 0/1, also the row sum of its squares.
+    """
+    counts = np.ones((rows, cols), dtype=float)
+    counts[1:, :] += 1
+    counts[:-1, :] += 1
+    counts[:, 1:] += 1
+    counts[:, :-1] += 1
+    return counts
 
 
 def compute_getis_ord_gi_star(grid: Iterable[Iterable[float]]) -> np.ndarray:
@@ -41,37 +48,33 @@ def compute_getis_ord_gi_star(grid: Iterable[Iterable[float]]) -> np.ndarray:
     Compute Getis-Ord Gi* z-scores for a 2D numeric grid.
 
     This implementation uses rook adjacency and includes the focal cell in the
-    local neighborhood. It returns a matrix with one Gi* score per cell.
+    local neighborhood. It returns a matrix with one Gi* score per cell. The
+    neighbourhood sums and weight counts are stencil operations over the
+    grid, so memory and time are linear in the number of cells.
     """
     array = np.asarray(grid, dtype=float)
     if array.ndim != 2:
         raise ValueError("grid must be a 2D structure")
 
     rows, cols = array.shape
-    x = array.reshape(-1)
-    n = x.size
+    n = array.size
     if n < 2:
         return np.zeros_like(array, dtype=float)
 
-    mean_x = np.mean(x)
+    mean_x = np.mean(array)
     # Population standard deviation term used in classical Gi* implementation.
-    std_x = np.sqrt((np.sum(x * x) / n) - (mean_x**2))
+    std_x = np.sqrt((np.sum(array * array) / n) - (mean_x**2))
     if std_x == 0:
         return np.zeros_like(array, dtype=float)
 
-    weights = _build_rook_weights(rows, cols)
-    scores = np.zeros(n, dtype=float)
-
-    for i in range(n):
-        w_i = weights[i]
-        sum_w = np.sum(w_i)
-        sum_w_sq = np.sum(w_i * w_i)
-        numerator = np.sum(w_i * x) - (mean_x * sum_w)
-        denom_term = ((n * sum_w_sq) - (sum_w**2)) / (n - 1)
-        denominator = std_x * np.sqrt(max(denom_term, 0.0))
-        scores[i] = 0.0 if denominator == 0 else numerator / denominator
-
-    return scores.reshape(rows, cols)
+    sum_w = _rook_neighbourhood_counts(rows, cols)
+    numerator = _rook_neighbourhood_sums(array) - (mean_x * sum_w)
+    # Binary weights: the sum of squared weights equals the sum of weights.
+    denom_term = ((n * sum_w) - (sum_w**2)) / (n - 1)
+    denominator = std_x * np.sqrt(np.maximum(denom_term, 0.0))
+    scores = np.zeros_like(array, dtype=float)
+    np.divide(numerator, denominator, out=scores, where=denominator != 0)
+    return scores
 
 
 def rank_hotspots(
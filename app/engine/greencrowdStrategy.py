@@ -24,21 +24,29 @@ from app.util.calculate_hash_simulated_strategy import calculate_hash_simulated_
 logger = logging.getLogger(__name__)
 
 
-def get_random_values_from_tasks(all_records):
+DIMENSIONS = ["DIM_BP", "DIM_LBE", "DIM_TD", "DIM_PP", "DIM_S"]
+
+# Hour ranges of the DIM_TD time slots, in slot order.
+TIME_SLOTS = {
+    "Late Night": (0, 6),
+    "Morning": (6, 12),
+    "Afternoon": (12, 18),
+    "Evening": (18, 24),
+}
+
+
+def _collect_dimension_values(all_records):
     """
-    Extracts all dimensions from the tasks and generates random values
-    within the range of the minimum and maximum values found in the tasks.
+    Gather every recorded value of each dimension from the records' task
+    payloads (``callbackData`` replaces ``tasks`` when present).
 
     Args:
-        all_records (list): A list of all tasks.
+        all_records (list): Points records carrying a ``data`` payload.
 
     Returns:
-        dict: A dictionary containing random values for each dimension.
+        dict: The list of recorded values for each dimension.
     """
-
-    dimensions = ["DIM_BP", "DIM_LBE", "DIM_TD", "DIM_PP", "DIM_S"]
-
-    values = {dim: [] for dim in dimensions}
+    values = {dim: [] for dim in DIMENSIONS}
 
     for record in all_records:
         # if have callbackData replace tasks with callbackData
@@ -52,17 +60,40 @@ def get_random_values_from_tasks(all_records):
                     if dim in values:
                         values[dim].append(value)
 
-    min_max_values = {
+    return values
+
+
+def _dimension_ranges(all_records):
+    """
+    ``(min, max)`` of each dimension across the records, ``(0, 10)`` for a
+    dimension that was never recorded.
+    """
+    return {
         dim: (np.min(vals), np.max(vals)) if vals else (0, 10)
-        for dim, vals in values.items()
+        for dim, vals in _collect_dimension_values(all_records).items()
     }
 
-    random_values = {
+
+def _draw_random_values(min_max_values):
+    """Draw one random integer per dimension within its ``(min, max)``."""
+    return {
         dim: random.randint(min_val, max_val)
         for dim, (min_val, max_val) in min_max_values.items()
     }
 
-    return random_values
+
+def get_random_values_from_tasks(all_records):
+    """
+    Extracts all dimensions from the tasks and generates random values
+    within the range of the minimum and maximum values found in the tasks.
+
+    Args:
+        all_records (list): A list of all tasks.
+
+    Returns:
+        dict: A dictionary containing random values for each dimension.
+    """
+    return _draw_random_values(_dimension_ranges(all_records))
 
 
 def get_average_values_from_tasks(task, all_records):
@@ -76,27 +107,174 @@ def get_average_values_from_tasks(task, all_records):
     Returns:
         dict: Average integer value for each dimension.
     """
+    return {
+        dim: int(round(np.mean(vals))) if vals else 5
+        for dim, vals in _collect_dimension_values(all_records).items()
+    }
 
-    dimensions = ["DIM_BP", "DIM_LBE", "DIM_TD", "DIM_PP", "DIM_S"]
 
-    values = {dim: [] for dim in dimensions}
+class DynamicSimulationIndex:
+    """
+    Indexes over a game's points records for the ``dynamic_calculation``
+    group, built in one pass so each task's dimensions are O(1) lookups.
 
-    for record in all_records:
-        tasks = record.data.get("tasks", [])
-        callbackData = record.data.get("callbackData", [])
-        if callbackData:
-            tasks = callbackData
-        for task in tasks:
-            for dim_dict in task.get("dimensions", []):
-                for dim, value in dim_dict.items():
-                    if dim in values:
-                        values[dim].append(value)
+    Holds the tasks of each POI, the POIs with at least one record, the
+    record count and per-time-slot count of each task, and the simulated
+    user's sorted award times and award days. DIM_PP and DIM_S depend only
+    on the user, so they are computed once here.
+    """
 
-    average_values = {
-        dim: int(round(np.mean(vals))) if vals else 5 for dim, vals in values.items()
-    }
+    def __init__(self, list_ids_tasks, all_records, user_id, now=None):
+        """
+        Args:
+            list_ids_tasks (list): ``{"id", "externalTaskId"}`` of every task
+                being simulated.
+            all_records (list): Points records of those tasks.
+            user_id: Internal id of the simulated user.
+            now (datetime, optional): Reference time; defaults to now (UTC).
+        """
+        self.now = now or datetime.datetime.now(datetime.timezone.utc)
+        self.poi_task_map = defaultdict(set)
+        for t in list_ids_tasks:
+            try:
+                poi_id = t["externalTaskId"].split("_")[1]
+                self.poi_task_map[poi_id].add(t["id"])
+            except Exception:
+                logger.exception("Error processing task %s", t.get("externalTaskId"))
+        poi_of_task = {
+            task_id: poi_id
+            for poi_id, task_ids in self.poi_task_map.items()
+            for task_id in task_ids
+        }
+
+        self.total_records = 0
+        self.records_per_task = defaultdict(int)
+        self.slot_counts = defaultdict(lambda: defaultdict(int))
+        self.tasks_with_records_in_poi = defaultdict(set)
+        user_times = []
+        for r in all_records:
+            self.total_records += 1
+            self.records_per_task[r.taskId] += 1
+            self.slot_counts[r.taskId][self._slot_of(r.created_at.hour)] += 1
+            if r.taskId in poi_of_task:
+                self.tasks_with_records_in_poi[poi_of_task[r.taskId]].add(r.taskId)
+            if r.userId == user_id:
+                user_times.append(r.created_at)
+        user_times.sort()
+
+        self.current_slot = self._slot_of(self.now.hour)
+        self.user_times = user_times
+
+    @staticmethod
+    def _slot_of(hour):
+        """Name of the DIM_TD time slot containing ``hour``."""
+        return next(
+            slot for slot, (start, end) in TIME_SLOTS.items() if start <= hour < end
+        )
+
+    def _personal_performance(self, variable_basic_points):
+        """DIM_PP from the user's average and latest award gap."""
+        user_records = self.user_times
+        time_diffs = [
+            (user_records[i] - user_records[i - 1]).total_seconds() / 60
+            for i in range(1, len(user_records))
+        ]
+
+        avg_time_window = np.mean(time_diffs) if time_diffs else 0
+        last_time_window = (
+            (self.now - user_records[-1]).total_seconds() / 60 if user_records else 0
+        )
+
+        alpha = (
+            min(0.5, max(0.1, 1 - (last_time_window / avg_time_window)))
+            if avg_time_window > 0
+            else 0.3
+        )
+        smoothed_factor = (
+            alpha * (avg_time_window - last_time_window) + (1 - alpha) * avg_time_window
+            if avg_time_window > 0
+            else 0
+        )
+        return int(
+            round(
+                (max(0, smoothed_factor / avg_time_window) * variable_basic_points)
+                if avg_time_window > 0
+                else 0
+            )
+        )
+
+    def _streak(self, variable_basic_points):
+        """DIM_S from the user's consecutive award days."""
+        unique_days = sorted({created_at.date() for created_at in self.user_times})
+        today = self.now.date()
+        consecutive_days = sum(
+            1
+            for i in range(len(unique_days) - 1, -1, -1)
+            if unique_days[i] >= (today - datetime.timedelta(days=i))
+        )
+        return round(variable_basic_points * (2 ** (consecutive_days / 5)))
+
+    def values_for(self, task, variable_basic_points, variable_lbe_multiplier):
+        """
+        Dimension values of ``task``, as :func:`get_dynamic_values_from_tasks`
+        computes them.
+
+        Args:
+            task (object): The task to score.
+            variable_basic_points (int): The base points per participation.
+            variable_lbe_multiplier (float): The location-based equity
+                multiplier.
+
+        Returns:
+            dict: The value of each dimension.
+        """
+        try:
+            poi_external_id = task.externalTaskId.split("_")[1]
+        except Exception:
+            logger.exception(
+                "Error extracting POI ID from task %s", task.externalTaskId
+            )
+            return {dim: 0 for dim in DIMENSIONS}
+
+        dim_bp_value = 0
+        count_total_task_in_poi = len(self.poi_task_map.get(poi_external_id, ()))
+        count_unique_task_in_poi = len(
+            self.tasks_with_records_in_poi.get(poi_external_id, ())
+        )
+        if count_total_task_in_poi > 0:
+            dim_bp_value = variable_basic_points - int(
+                round(
+                    variable_basic_points
+                    * (count_unique_task_in_poi / count_total_task_in_poi)
+                )
+            )
+
+        #  DIM_LBE
+        count_POI_records = self.records_per_task.get(task.id, 0)
+        avg_POI = self.total_records / max(len(self.poi_task_map), 1)
+        dim_lbe_value = (
+            round(variable_basic_points * variable_lbe_multiplier)
+            if avg_POI > 0 and count_POI_records < avg_POI
+            else 0
+        )
+
+        #  DIM_TD
+        slot_counts = self.slot_counts.get(task.id, {})
+        current_count = slot_counts.get(self.current_slot, 0)
+        total_other_slots = sum(slot_counts.values()) - current_count
+        dim_td_value = (
+            round((1 - (current_count / total_other_slots)) * variable_basic_points)
+            if total_other_slots > 0
+            else variable_basic_points
+        )
 
-    return average_values
+        return {
+            "DIM_BP": dim_bp_value,
+            "DIM_LBE": dim_lbe_value,
+            "DIM_TD": dim_td_value,
+            "DIM_PP": self._personal_performance(variable_basic_points),
+            "DIM_S": self._streak(variable_basic_points),
+        }
 
 
 def get_dynamic_values_from_tasks(
@@ -126,142 +304,8 @@ def get_dynamic_values_from_tasks(
             - "DIM_PP": Points adjusted for participation periodicity.
             - "DIM_S": Streak-based points for continuous participation.
     """
-    all_records = all_records.all()
-    try:
-        poi_external_id = task.externalTaskId.split("_")[1]
-    except Exception:
-        logger.exception("Error extracting POI ID from task %s", task.externalTaskId)
-        return {
-            "DIM_BP": 0,
-            "DIM_LBE": 0,
-            "DIM_TD": 0,
-            "DIM_PP": 0,
-            "DIM_S": 0,
-        }
-    user_id = user.id
-
-    dim_bp_value = dim_lbe_value = dim_td_value = dim_pp_value = dim_s_value = 0
-
-    #
-    poi_task_map = defaultdict(set)
-    for t in list_ids_tasks:
-        try:
-            poi_id = t["externalTaskId"].split("_")[1]
-            poi_task_map[poi_id].add(t["id"])
-        except Exception:
-            logger.exception("Error processing task %s", t.get("externalTaskId"))
-
-    count_total_task_in_poi = len(poi_task_map.get(poi_external_id, []))
-    count_unique_task_in_poi = len(
-        {r.taskId for r in all_records if r.taskId in poi_task_map[poi_external_id]}
-    )
-
-    if count_total_task_in_poi > 0:
-        dim_bp_value = variable_basic_points - int(
-            round(
-                variable_basic_points
-                * (count_unique_task_in_poi / count_total_task_in_poi)
-            )
-        )
-
-    #  DIM_LBE
-    count_POI_records = sum(1 for r in all_records if r.taskId == task.id)
-    avg_POI = len(all_records) / max(len(poi_task_map), 1)
-    dim_lbe_value = (
-        round(variable_basic_points * variable_lbe_multiplier)
-        if avg_POI > 0 and count_POI_records < avg_POI
-        else 0
-    )
-
-    #  DIM_TD
-    time_slots = {
-        "Late Night": (0, 6),
-        "Morning": (6, 12),
-        "Afternoon": (12, 18),
-        "Evening": (18, 24),
-    }
-    slot_counts = defaultdict(int)
-
-    for r in all_records:
-        if r.taskId == task.id:
-            record_hour = r.created_at.hour
-            for slot, (start, end) in time_slots.items():
-                if start <= record_hour < end:
-                    slot_counts[slot] += 1
-                    break
-
-    current_slot = next(
-        slot
-        for slot, (start, end) in time_slots.items()
-        if start <= datetime.datetime.now(datetime.timezone.utc).hour < end
-    )
-    total_other_slots = sum(slot_counts.values()) - slot_counts[current_slot]
-    dim_td_value = (
-        round(
-            (1 - (slot_counts[current_slot] / total_other_slots))
-            * variable_basic_points
-        )
-        if total_other_slots > 0
-        else variable_basic_points
-    )
-
-    #  DIM_PP
-    user_records = sorted([r.created_at for r in all_records if r.userId == user_id])
-    time_diffs = [
-        (user_records[i] - user_records[i - 1]).total_seconds() / 60
-        for i in range(1, len(user_records))
-    ]
-
-    avg_time_window = np.mean(time_diffs) if time_diffs else 0
-    last_time_window = (
-        (
-            datetime.datetime.now(datetime.timezone.utc) - user_records[-1]
-        ).total_seconds()
-        / 60
-        if user_records
-        else 0
-    )
-
-    alpha = (
-        min(0.5, max(0.1, 1 - (last_time_window / avg_time_window)))
-        if avg_time_window > 0
-        else 0.3
-    )
-    smoothed_factor = (
-        alpha * (avg_time_window - last_time_window) + (1 - alpha) * avg_time_window
-        if avg_time_window > 0
-        else 0
-    )
-    dim_pp_value = int(
-        round(
-            (max(0, smoothed_factor / avg_time_window) * variable_basic_points)
-            if avg_time_window > 0
-            else 0
-        )
-    )
-
-    #  DIM_S
-    unique_days = sorted(
-        {r.created_at.date() for r in all_records if r.userId == user_id}
-    )
-    consecutive_days = sum(
-        1
-        for i in range(len(unique_days) - 1, -1, -1)
-        if unique_days[i]
-        >= (
-            datetime.datetime.now(datetime.timezone.utc).date()
-            - datetime.timedelta(days=i)
-        )
-    )
-    dim_s_value = round(variable_basic_points * (2 ** (consecutive_days / 5)))
-
-    return {
-        "DIM_BP": dim_bp_value,
-        "DIM_LBE": dim_lbe_value,
-        "DIM_TD": dim_td_value,
-        "DIM_PP": dim_pp_value,
-        "DIM_S": dim_s_value,
-    }
+    index = DynamicSimulationIndex(list_ids_tasks, all_records.all(), user.id)
+    return index.values_for(task, variable_basic_points, variable_lbe_multiplier)
 
 
 def assign_random_scores(min_value: int, max_value: int):
@@ -487,43 +531,16 @@ class GREENCROWDGamificationStrategy(BaseStrategy):  # noqa
         if not task_to_simulate or not allTasks or not external_user_id:
             return InternalServerError("Missing data to simulate the strategy")
 
-        total_simulated_points = 0
-
-        DIM_BP = 0
-        DIM_LBE = 0
-        DIM_TD = 0
-        DIM_PP = 0
-        DIM_S = 0
-        expiration_date = datetime.datetime.now() + datetime.timedelta(
-            minutes=self.variable_simulation_valid_until
-        )
-        expiration_date = expiration_date.replace(tzinfo=datetime.timezone.utc)
-        externalTaskId_simulate = task_to_simulate.externalTaskId
-        if user_last_task is not None and (
-            user_last_task.taskId == task_to_simulate.id
-            and (
-                (
-                    datetime.datetime.now(datetime.timezone.utc)
-                    - user_last_task.created_at
-                ).total_seconds()
-            )
-            > 300  # 5 minutes
-        ):
-            return SimulatedTaskPoints(
-                externalUserId=external_user_id,
-                externalTaskId=str(externalTaskId_simulate),
-                userGroup=userGroup,
-                dimensions=[
-                    {"DIM_BP": DIM_BP},
-                    {"DIM_LBE": DIM_LBE},
-                    {"DIM_TD": DIM_TD},
-                    {"DIM_PP": DIM_PP},
-                    {"DIM_S": DIM_S},
-                ],
-                totalSimulatedPoints=total_simulated_points,
-                expirationDate=str(expiration_date),
+        expiration_date = self._simulation_expiration_date()
+        dimensions = {dim: 0 for dim in DIMENSIONS}
+        if self._is_last_task_stale(task_to_simulate, user_last_task):
+            return self._simulated_task_points(
+                task_to_simulate,
+                external_user_id,
+                userGroup,
+                dimensions,
+                expiration_date,
             )
-        # RANDOM_RAGE ########################################################
 
         list_ids_tasks = []
         list_ids_tasks_to_ask = []
@@ -538,32 +555,14 @@ class GREENCROWDGamificationStrategy(BaseStrategy):  # noqa
         )
 
         if userGroup == "random_range":
-            random_calculated = get_random_values_from_tasks(all_records)
+            dimensions = get_random_values_from_tasks(all_records)
 
-            DIM_BP = random_calculated.get("DIM_BP")
-            DIM_LBE = random_calculated.get("DIM_LBE")
-            DIM_TD = random_calculated.get("DIM_TD")
-            DIM_PP = random_calculated.get("DIM_PP")
-            DIM_S = random_calculated.get("DIM_S")
-
-        # END RANDOM_RAGE ########################################################
-
-        # AVERAGE_SCORE ########################################################
         if userGroup == "average_score":
-            average_calculated = get_average_values_from_tasks(task, all_records)
-
-            DIM_BP = average_calculated.get("DIM_BP")
-            DIM_LBE = average_calculated.get("DIM_LBE")
-            DIM_TD = average_calculated.get("DIM_TD")
-            DIM_PP = average_calculated.get("DIM_PP")
-            DIM_S = average_calculated.get("DIM_S")
+            dimensions = get_average_values_from_tasks(task, all_records)
 
-        # END AVERAGE_SCORE ########################################################
-
-        # DYNAMIC_CALCULATION ########################################################
         if userGroup == "dynamic_calculation":
             user = self.user_service.get_user_by_externalUserId(external_user_id)
-            dynamic_calculated = get_dynamic_values_from_tasks(
+            dimensions = get_dynamic_values_from_tasks(
                 task_to_simulate,
                 list_ids_tasks,
                 all_records,
@@ -571,26 +570,127 @@ class GREENCROWDGamificationStrategy(BaseStrategy):  # noqa
                 self.variable_basic_points,
                 self.variable_lbe_multiplier,
             )
-            DIM_BP = dynamic_calculated.get("DIM_BP")
-            DIM_LBE = dynamic_calculated.get("DIM_LBE")
-            DIM_TD = dynamic_calculated.get("DIM_TD")
-            DIM_PP = dynamic_calculated.get("DIM_PP")
-            DIM_S = dynamic_calculated.get("DIM_S")
-        # END DYNAMIC_CALCULATION ########################################################
-        total_simulated_points = DIM_BP + DIM_LBE + DIM_TD + DIM_PP + DIM_S
 
+        return self._simulated_task_points(
+            task_to_simulate,
+            external_user_id,
+            userGroup,
+            dimensions,
+            expiration_date,
+        )
+
+    async def simulate_tasks(
+        self,
+        tasks,
+        externalUserId: str,
+        user,
+        userGroup: str = "dynamic",
+        user_last_task=None,
+    ) -> list[SimulatedTaskPoints]:
+        """Simulate every task of a game for one user from a single load.
+
+        Same results as calling :meth:`simulate_strategy` once per task, but
+        the tasks' points records are fetched once and the per-group inputs
+        (dimension ranges, averages or the :class:`DynamicSimulationIndex`)
+        are built once, so the cost is linear in records plus tasks rather
+        than their product.
+
+        Args:
+            tasks (list): The tasks to simulate (all tasks using this
+                strategy in the game).
+            externalUserId (str): The user the simulation is run for.
+            user: The user's row, read for its internal ``id``.
+            userGroup (str): ``random_range``, ``average_score`` or
+                ``dynamic_calculation``.
+            user_last_task (optional): The user's most recent points row.
+
+        Returns:
+            list[SimulatedTaskPoints]: One simulation per task, in order.
+        """
+        all_records = await self.user_points_service.get_all_point_of_tasks_list(
+            [task.id for task in tasks], withData=True
+        )
+
+        def zeros(task):
+            return {dim: 0 for dim in DIMENSIONS}
+
+        dimensions_of = zeros
+        if userGroup == "random_range":
+            ranges = _dimension_ranges(all_records)
+
+            def dimensions_of(task):
+                return _draw_random_values(ranges)
+
+        elif userGroup == "average_score":
+            averages = get_average_values_from_tasks(None, all_records)
+
+            def dimensions_of(task):
+                return dict(averages)
+
+        elif userGroup == "dynamic_calculation":
+            index = DynamicSimulationIndex(
+                [
+                    {"id": task.id, "externalTaskId": task.externalTaskId}
+                    for task in tasks
+                ],
+                all_records,
+                user.id,
+            )
+
+            def dimensions_of(task):
+                return index.values_for(
+                    task, self.variable_basic_points, self.variable_lbe_multiplier
+                )
+
+        expiration_date = self._simulation_expiration_date()
+        return [
+            self._simulated_task_points(
+                task,
+                externalUserId,
+                userGroup,
+                (
+                    zeros(task)
+                    if self._is_last_task_stale(task, user_last_task)
+                    else dimensions_of(task)
+                ),
+                expiration_date,
+            )
+            for task in tasks
+        ]
+
+    def _simulation_expiration_date(self):
+        """When a simulation produced now stops being valid."""
+        expiration_date = datetime.datetime.now() + datetime.timedelta(
+            minutes=self.variable_simulation_valid_until
+        )
+        return expiration_date.replace(tzinfo=datetime.timezone.utc)
+
+    @staticmethod
+    def _is_last_task_stale(task, user_last_task):
+        """Whether the user's last award was on ``task`` over 5 minutes ago,
+        which zeroes that task's simulation."""
+        return user_last_task is not None and (
+            user_last_task.taskId == task.id
+            and (
+                (
+                    datetime.datetime.now(datetime.timezone.utc)
+                    - user_last_task.created_at
+                ).total_seconds()
+            )
+            > 300  # 5 minutes
+        )
+
+    @staticmethod
+    def _simulated_task_points(
+        task, external_user_id, userGroup, dimensions, expiration_date
+    ):
+        """Wrap one task's dimension values into a ``SimulatedTaskPoints``."""
         return SimulatedTaskPoints(
             externalUserId=external_user_id,
-            externalTaskId=str(externalTaskId_simulate),
+            externalTaskId=str(task.externalTaskId),
             userGroup=userGroup,
-            dimensions=[
-                {"DIM_BP": DIM_BP},
-                {"DIM_LBE": DIM_LBE},
-                {"DIM_TD": DIM_TD},
-                {"DIM_PP": DIM_PP},
-                {"DIM_S": DIM_S},
-            ],
-            totalSimulatedPoints=total_simulated_points,
+            dimensions=[{dim: dimensions.get(dim)} for dim in DIMENSIONS],
+            totalSimulatedPoints=sum(dimensions.get(dim) for dim in DIMENSIONS),
             expirationDate=str(expiration_date),
         )
 
@@ -193,7 +193,8 @@ class GREENGAGEGamificationStrategy(BaseStrategy):  # noqa
         Requires a numeric ``minutes`` value in ``data``. The award follows
         the Case 1.1–4.2 decision tree (see :meth:`generate_logic_graph`),
         weighting the configured default points by total complexity and the
-        user's history/averages.
+        user's history/averages, all read from one
+        :meth:`UserPointsAnalyticsService.get_effort_snapshot` query.
 
         Args:
             externalGameId: External identifier of the game.
@@ -232,31 +233,23 @@ class GREENGAGEGamificationStrategy(BaseStrategy):  # noqa
 
         points_to_award = self.variable_default_points
 
-        user_has_record_before = await self.user_points_analytics_service.user_has_record_before_in_externalTaskId_last_min(
-            externalTaskId, externalUserId, self.variable_minutes_to_check
+        snapshot = await self.user_points_analytics_service.get_effort_snapshot(
+            externalGameId,
+            externalTaskId,
+            externalUserId,
+            self.variable_minutes_to_check,
         )
         if minutes == 0:
-            if not user_has_record_before:
+            if not snapshot.has_recent_record:
                 return (points_to_award, "Case 1.1 (DP)")
             return (points_to_award / 2, "Case 1.2 (DP/2)")
 
-        count_personal_records_in_game = await self.user_points_analytics_service.count_personal_records_by_external_game_id(
-            externalGameId, externalUserId
-        )
-        if count_personal_records_in_game < 2:
+        if snapshot.personal_records_count < 2:
             return (points_to_award * 2, "Case 2 (DP x 2)")
 
-        global_avg_game = (
-            await self.user_points_analytics_service.get_global_avg_by_external_game_id(
-                externalGameId
-            )
-        )
-        if minutes > global_avg_game:
+        if minutes > snapshot.global_avg_minutes:
             return (self.get_BP(points_to_award, minutes), "Case 3 (BP)")
 
-        personal_avg_game = await self.user_points_analytics_service.get_personal_avg_by_external_game_id(
-            externalGameId, externalUserId
-        )
-        if minutes > personal_avg_game:
+        if minutes > snapshot.personal_avg_minutes:
             return (self.get_PBP(points_to_award, minutes), "Case 4.1 (PBP)")
         return (self.get_DPTE(points_to_award, minutes), "Case 4.2 (DPTE)")
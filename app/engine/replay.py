@@ -0,0 +1,617 @@
+"""
+Offline replay of recorded scoring events against a candidate strategy.
+
+A replay walks a game's ``user_points`` history in chronological order and
+re-scores every event in the requested window with a candidate strategy (a
+built-in or a DSL definition), then aggregates how the candidate's awards
+differ from what was actually awarded. Nothing is persisted.
+
+The candidate never reaches the database. Its analytics service is a
+:class:`ReplayAnalyticsState`: per-task and per-(task, user) aggregates that
+are updated incrementally as events go by, and answer each analytics method
+with the same value (sentinels included) the ``user_points`` query would
+have returned when the event was scored. Events before the window are
+folded into the state without being scored so the window starts from the
+real history.
+
+Every analytics field the replayable strategies read is scoped to one task,
+so events are sharded by ``externalTaskId`` and the shards replayed in
+separate processes without changing any answer. Events are never collected:
+each shard's worker keeps its state for the whole replay and is fed bounded
+chunks as the stream is read, so memory does not grow with the history.
+
+Differences with live scoring, by construction:
+
+* Counts are scoped to the replayed game, whereas the live task counts span
+  every task sharing the ``externalTaskId`` across games.
+* The analytics state is the recorded history. Candidate awards do not feed
+  it, so every event is scored against the same past as the original one.
+* Look-back windows ("awards in the last N seconds") are answered from the
+  last ``horizon_seconds`` of history; longer windows are rejected.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import queue
+import zlib
+from collections import Counter, deque
+from concurrent.futures import Executor
+from concurrent.futures.process import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
+from multiprocessing import get_context
+from typing import (
+    Any,
+    AsyncIterable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from app.core.config import configs
+from app.engine.all_engine_strategies import engine_strategy
+from app.engine.dsl_interpreter import DslInterpreter
+from app.engine.dsl_strategy import DslStrategy
+from app.repository.user_points_repository import _as_utc, _mean_gap_seconds
+from app.schema.strategy_definition_schema import StrategyDefinitionRead
+from app.schema.user_points_schema import ScoringSnapshot
+
+# Built-ins whose ``calculate_points`` only reads analytics the replay state
+# answers. The others query tasks, users or points directly.
+REPLAYABLE_BUILTIN_STRATEGIES = frozenset(
+    {"default", "socio_bee", "constantEffortStrategy"}
+)
+
+# Case name of points assigned directly (no strategy ran); see
+# ``UserPointsService.assign_points_to_user_directly``.
+DIRECT_ASSIGNMENT_CASE_NAME = "External_points_assigned"
+
+DEFAULT_HORIZON_SECONDS = 3600
+
+# A sharded replay sends each worker chunks of this many events through a
+# queue of this many chunks; a full queue holds the stream back.
+REPLAY_CHUNK_EVENTS = 1000
+REPLAY_QUEUED_CHUNKS = 4
+
+_SEND_POLL_SECONDS = 0.5
+
+# Event kinds.
+HISTORY = "history"  # before the window: analytics state only
+AWARD = "award"  # strategy award in the window: re-scored and recorded
+DIRECT = "direct"  # direct assignment in the window: recorded, not re-scored
+ACTION = "action"  # user action in the window: re-scored, never recorded
+
+
+class ReplayHorizonError(ValueError):
+    """The candidate looked further back than the replay keeps history."""
+
+
+class ReplayEvent(NamedTuple):
+    """One recorded event, in the plain form shipped to replay workers."""
+
+    kind: str
+    created_at: datetime
+    externalTaskId: str
+    externalUserId: str
+    points: Optional[float] = None
+    caseName: Optional[str] = None
+    data: Optional[dict] = None
+
+
+class _Series:
+    """Running aggregates of one award series."""
+
+    __slots__ = ("count", "first_at", "last_at", "previous_at", "recent")
+
+    def __init__(self, keep_recent: bool) -> None:
+        self.count = 0
+        self.first_at: Optional[datetime] = None
+        self.last_at: Optional[datetime] = None
+        self.previous_at: Optional[datetime] = None
+        self.recent: Optional[Deque[datetime]] = deque() if keep_recent else None
+
+    def add(self, at: datetime, horizon: timedelta) -> None:
+        self.count += 1
+        if self.first_at is None:
+            self.first_at = at
+        self.previous_at, self.last_at = self.last_at, at
+        if self.recent is not None:
+            self.recent.append(at)
+            while self.recent[0] <= at - horizon:
+                self.recent.popleft()
+
+
+class ReplayAnalyticsState:
+    """
+    In-memory stand-in for ``UserPointsAnalyticsService`` during a replay.
+
+    ``now`` is the timestamp of the event being scored; :meth:`record` adds
+    an award to the history once it has been scored. Only the methods the
+    replayable strategies use are implemented.
+
+    Args:
+        horizon_seconds (int): Longest look-back window answered.
+    """
+
+    def __init__(self, horizon_seconds: int = DEFAULT_HORIZON_SECONDS) -> None:
+        self.horizon_seconds = horizon_seconds
+        self._horizon = timedelta(seconds=horizon_seconds)
+        self._tasks: Dict[str, _Series] = {}
+        self._users: Dict[Tuple[str, str], _Series] = {}
+        self.now: Optional[datetime] = None
+
+    def record(self, event: ReplayEvent) -> None:
+        """Add ``event`` to the award history."""
+        at = _as_utc(event.created_at)
+        task = self._tasks.get(event.externalTaskId)
+        if task is None:
+            task = self._tasks[event.externalTaskId] = _Series(keep_recent=False)
+        task.add(at, self._horizon)
+        key = (event.externalTaskId, event.externalUserId)
+        user = self._users.get(key)
+        if user is None:
+            user = self._users[key] = _Series(keep_recent=True)
+        user.add(at, self._horizon)
+
+    def _task(self, externalTaskId) -> Optional[_Series]:
+        return self._tasks.get(externalTaskId)
+
+    def _user(self, externalTaskId, externalUserId) -> Optional[_Series]:
+        return self._users.get((externalTaskId, externalUserId))
+
+    def _count_since(self, externalTaskId, externalUserId, seconds) -> int:
+        """The user's awards on the task within the last ``seconds``."""
+        if seconds > self.horizon_seconds:
+            raise ReplayHorizonError(
+                f"Look-back window of {seconds}s exceeds the replay horizon "
+                f"of {self.horizon_seconds}s."
+            )
+        user = self._user(externalTaskId, externalUserId)
+        if user is None:
+            return 0
+        since = _as_utc(self.now) - timedelta(seconds=seconds)
+        count = 0
+        for at in reversed(user.recent):
+            if at <= since:
+                break
+            count += 1
+        return count
+
+    async def count_measurements_by_external_task_id(self, external_task_id) -> int:
+        task = self._task(external_task_id)
+        return task.count if task else 0
+
+    async def get_user_task_measurements_count(
+        self, externalTaskId, externalUserId
+    ) -> int:
+        user = self._user(externalTaskId, externalUserId)
+        return user.count if user else 0
+
+    async def get_user_task_measurements_count_the_last_seconds(
+        self, externalTaskId, externalUserId, seconds
+    ) -> int:
+        return self._count_since(externalTaskId, externalUserId, seconds)
+
+    async def user_has_record_before_in_externalTaskId_last_min(
+        self, externalTaskId, externalUserId, minutes
+    ) -> bool:
+        return self._count_since(externalTaskId, externalUserId, minutes * 60) > 0
+
+    async def get_avg_time_between_tasks_by_user_and_game_task(
+        self, externalGameId, externalTaskId, externalUserId
+    ) -> float:
+        user = self._user(externalTaskId, externalUserId)
+        if user is None:
+            return -1
+        return _mean_gap_seconds(user.count, user.first_at, user.last_at)
+
+    async def get_avg_time_between_tasks_for_all_users(
+        self, externalGameId, externalTaskId
+    ) -> float:
+        task = self._task(externalTaskId)
+        if task is None:
+            return -1
+        return _mean_gap_seconds(task.count, task.first_at, task.last_at)
+
+    async def get_last_window_time_diff(self, externalTaskId, externalUserId) -> float:
+        user = self._user(externalTaskId, externalUserId)
+        if user is None or user.count < 2:
+            return 0
+        return (user.last_at - user.previous_at).total_seconds()
+
+    async def get_new_last_window_time_diff(
+        self, externalTaskId, externalUserId, externalGameId
+    ) -> float:
+        user = self._user(externalTaskId, externalUserId)
+        if user is None:
+            return 0
+        return (_as_utc(self.now) - user.last_at).total_seconds()
+
+    async def get_scoring_snapshot(
+        self, externalGameId, externalTaskId, externalUserId
+    ) -> ScoringSnapshot:
+        return ScoringSnapshot(
+            task_measurements_count=await self.count_measurements_by_external_task_id(
+                externalTaskId
+            ),
+            user_task_measurements_count=await self.get_user_task_measurements_count(
+                externalTaskId, externalUserId
+            ),
+            user_avg_time_between_tasks=(
+                await self.get_avg_time_between_tasks_by_user_and_game_task(
+                    externalGameId, externalTaskId, externalUserId
+                )
+            ),
+            all_avg_time_between_tasks=(
+                await self.get_avg_time_between_tasks_for_all_users(
+                    externalGameId, externalTaskId
+                )
+            ),
+            last_window_time_diff=await self.get_last_window_time_diff(
+                externalTaskId, externalUserId
+            ),
+            new_last_window_time_diff=await self.get_new_last_window_time_diff(
+                externalTaskId, externalUserId, externalGameId
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class CandidateStrategy:
+    """
+    Picklable description of the strategy a replay scores with.
+
+    Attributes:
+        strategy_id (str): Built-in id, or ``custom:<uuid>``.
+        definition (Optional[dict]): Dumped ``StrategyDefinitionRead`` of a
+            custom strategy.
+        variables (Mapping[str, Any]): ``variable_*`` overrides applied to a
+            built-in candidate.
+    """
+
+    strategy_id: str
+    definition: Optional[dict] = None
+    variables: Mapping[str, Any] = field(default_factory=dict)
+
+
+def _bind_builtin(
+    strategy_id: str, variables: Mapping[str, Any], state: ReplayAnalyticsState
+):
+    """Copy of a built-in strategy reading its analytics from ``state``."""
+    if strategy_id not in REPLAYABLE_BUILTIN_STRATEGIES:
+        raise ValueError(
+            f"Strategy '{strategy_id}' cannot be replayed offline; replayable "
+            f"built-ins: {', '.join(sorted(REPLAYABLE_BUILTIN_STRATEGIES))}."
+        )
+    shared = engine_strategy(strategy_id)
+    if shared is None:
+        raise ValueError(f"Strategy not found with id: {strategy_id}")
+    strategy = copy.copy(shared)
+    strategy.set_variables(dict(variables))
+    strategy.user_points_analytics_service = state
+    return strategy
+
+
+def build_candidate(candidate: CandidateStrategy, state: ReplayAnalyticsState):
+    """
+    Instantiate ``candidate`` against a replay analytics state.
+
+    Raises:
+        ValueError: If the candidate (or a DSL_EXTEND parent) is a built-in
+            that cannot be replayed.
+    """
+    if candidate.definition is None:
+        return _bind_builtin(candidate.strategy_id, candidate.variables, state)
+    definition = StrategyDefinitionRead.model_validate(candidate.definition)
+    parent = None
+    if definition.type == "DSL_EXTEND":
+        parent = _bind_builtin(definition.parentStrategyId, {}, state)
+    return DslStrategy(
+        definition=definition,
+        interpreter=DslInterpreter(
+            max_nodes=configs.DSL_MAX_NODES, max_depth=configs.DSL_MAX_DEPTH
+        ),
+        analytics_service=state,
+        parent_strategy=parent,
+    )
+
+
+@dataclass
+class ReplayDiff:
+    """
+    Aggregate differences between recorded and candidate awards.
+
+    Partial diffs of separate shards combine with :meth:`merge`.
+    """
+
+    events: int = 0
+    changed: int = 0
+    skipped: int = 0
+    actual_points: float = 0
+    candidate_points: float = 0
+    errors: Counter = field(default_factory=Counter)
+    cases: Counter = field(default_factory=Counter)
+    tasks: Dict[str, List[float]] = field(default_factory=dict)
+    users: Dict[str, List[float]] = field(default_factory=dict)
+
+    def add(self, event: ReplayEvent, points: float, case_name: Optional[str]):
+        """Account one re-scored event."""
+        actual = event.points or 0
+        self.events += 1
+        self.actual_points += actual
+        self.candidate_points += points
+        if points != actual or case_name != event.caseName:
+            self.changed += 1
+        self.cases[(event.caseName, case_name)] += 1
+        task = self.tasks.setdefault(event.externalTaskId, [0, 0, 0])
+        task[0] += 1
+        task[1] += actual
+        task[2] += points
+        user = self.users.setdefault(event.externalUserId, [0, 0])
+        user[0] += actual
+        user[1] += points
+
+    def add_error(self, event: ReplayEvent, reason: str) -> None:
+        """Account an event the candidate could not score (awarding 0)."""
+        self.errors[reason] += 1
+        self.add(event, 0, None)
+
+    def merge(self, other: "ReplayDiff") -> "ReplayDiff":
+        """Fold ``other`` into this diff and return it."""
+        self.events += other.events
+        self.changed += other.changed
+        self.skipped += other.skipped
+        self.actual_points += other.actual_points
+        self.candidate_points += other.candidate_points
+        self.errors.update(other.errors)
+        self.cases.update(other.cases)
+        for key, values in other.tasks.items():
+            mine = self.tasks.setdefault(key, [0] * len(values))
+            for index, value in enumerate(values):
+                mine[index] += value
+        for key, values in other.users.items():
+            mine = self.users.setdefault(key, [0] * len(values))
+            for index, value in enumerate(values):
+                mine[index] += value
+        return self
+
+    def as_dict(self, top_users: int = 10) -> Dict[str, Any]:
+        """
+        JSON-ready report.
+
+        Args:
+            top_users (int): Users listed under ``largestUserDeltas``.
+        """
+        # Ties broken by key so the report does not depend on shard order.
+        users = sorted(
+            self.users.items(),
+            key=lambda item: (-abs(item[1][1] - item[1][0]), item[0]),
+        )
+        cases = sorted(
+            self.cases.items(),
+            key=lambda item: (-item[1], str(item[0][0]), str(item[0][1])),
+        )
+        return {
+            "events": self.events,
+            "changedEvents": self.changed,
+            "skippedDirectAssignments": self.skipped,
+            "actualPoints": self.actual_points,
+            "candidatePoints": self.candidate_points,
+            "pointsDelta": self.candidate_points - self.actual_points,
+            "errors": dict(self.errors),
+            "caseTransitions": [
+                {"actual": actual, "candidate": candidate, "count": count}
+                for (actual, candidate), count in cases
+            ],
+            "tasks": {
+                task: {"events": events, "actual": actual, "candidate": candidate}
+                for task, (events, actual, candidate) in sorted(self.tasks.items())
+            },
+            "largestUserDeltas": [
+                {
+                    "externalUserId": user,
+                    "actual": actual,
+                    "candidate": candidate,
+                    "delta": candidate - actual,
+                }
+                for user, (actual, candidate) in users[: max(0, top_users)]
+            ],
+        }
+
+
+class _ShardReplay:
+    """The analytics state, candidate and diff of one shard, fed in order."""
+
+    def __init__(
+        self,
+        candidate: CandidateStrategy,
+        externalGameId: str,
+        horizon_seconds: int,
+    ) -> None:
+        self.state = ReplayAnalyticsState(horizon_seconds)
+        self.strategy = build_candidate(candidate, self.state)
+        self.externalGameId = externalGameId
+        self.diff = ReplayDiff()
+
+    async def feed(self, event: ReplayEvent) -> None:
+        """Score ``event`` if it is in the window, then record it."""
+        if event.kind in (AWARD, ACTION):
+            self.state.now = event.created_at
+            data = dict(event.data or {})
+            # Written back by the original strategy, not part of the event.
+            data.pop("callbackData", None)
+            try:
+                result = await self.strategy.calculate_points(
+                    externalGameId=self.externalGameId,
+                    externalTaskId=event.externalTaskId,
+                    externalUserId=event.externalUserId,
+                    data=data,
+                )
+            except ReplayHorizonError:
+                raise
+            except Exception as exc:
+                self.diff.add_error(event, exc.__class__.__name__)
+            else:
+                points, case_name = (tuple(result or ()) + (None, None))[:2]
+                # Live scoring rejects the event on -1 and fails on None.
+                if points == -1:
+                    self.diff.add_error(event, "rejected")
+                elif points is None:
+                    self.diff.add_error(event, "no_points")
+                else:
+                    self.diff.add(event, points, case_name)
+        elif event.kind == DIRECT:
+            self.diff.skipped += 1
+        if event.kind != ACTION:
+            self.state.record(event)
+
+
+def replay_shard(
+    candidate: CandidateStrategy,
+    externalGameId: str,
+    inbox,
+    horizon_seconds: int = DEFAULT_HORIZON_SECONDS,
+) -> ReplayDiff:
+    """
+    Worker entry point: replay the event chunks read from ``inbox``.
+
+    The shard's state lives here for the whole replay; ``None`` on the
+    queue ends it.
+    """
+
+    async def consume() -> ReplayDiff:
+        shard = _ShardReplay(candidate, externalGameId, horizon_seconds)
+        while (chunk := inbox.get()) is not None:
+            for event in chunk:
+                await shard.feed(event)
+        return shard.diff
+
+    return asyncio.run(consume())
+
+
+async def _send(inbox, chunk: Optional[List[ReplayEvent]], worker) -> None:
+    """
+    Put ``chunk`` on a shard's bounded queue without blocking the event
+    loop, raising the worker's error if it stopped before taking it.
+    """
+    loop = asyncio.get_running_loop()
+    while not worker.done():
+        try:
+            await loop.run_in_executor(
+                None, partial(inbox.put, chunk, timeout=_SEND_POLL_SECONDS)
+            )
+            return
+        except queue.Full:
+            continue
+    worker.result()
+
+
+def shard_of(externalTaskId: str, shards: int) -> int:
+    """Stable shard index of a task (``hash()`` is salted per process)."""
+    return zlib.crc32(str(externalTaskId).encode()) % shards
+
+
+async def run_replay(
+    candidate: CandidateStrategy,
+    externalGameId: str,
+    events: AsyncIterable[ReplayEvent],
+    *,
+    shards: int = 1,
+    horizon_seconds: int = DEFAULT_HORIZON_SECONDS,
+    executor: Optional[Executor] = None,
+    chunk_events: int = REPLAY_CHUNK_EVENTS,
+    queued_chunks: int = REPLAY_QUEUED_CHUNKS,
+) -> ReplayDiff:
+    """
+    Replay ``events`` (chronological) with ``candidate`` and diff the window.
+
+    Events are consumed as they arrive and never collected. In process,
+    each one is scored and folded into the state before the next is read.
+    With ``shards > 1`` they are split by task into chunks of
+    ``chunk_events``, and each shard's chunks go through a queue holding at
+    most ``queued_chunks`` to one worker that keeps the shard's state. A
+    full queue stops the stream until its worker catches up, so at most
+    ``shards * (queued_chunks + 2)`` chunks are held at once. The workers
+    run in a process pool of ``shards`` processes. ``executor`` overrides
+    it and must run ``shards`` calls at once.
+
+    Args:
+        candidate (CandidateStrategy): Strategy to score with.
+        externalGameId (str): The replayed game.
+        events (AsyncIterable[ReplayEvent]): History then window events.
+        shards (int): Number of task shards.
+        horizon_seconds (int): Longest look-back window answered.
+        executor (Optional[Executor]): Runs the :func:`replay_shard` workers.
+        chunk_events (int): Events sent to a worker at a time.
+        queued_chunks (int): Chunks a shard's queue holds before the
+            stream waits.
+
+    Returns:
+        ReplayDiff: The merged diff.
+
+    Raises:
+        ValueError: If the candidate cannot be replayed, or queries a window
+            longer than ``horizon_seconds`` (:class:`ReplayHorizonError`).
+    """
+    shards = max(1, shards)
+    # Fail before reading the history when the candidate is not replayable.
+    shard = _ShardReplay(candidate, externalGameId, horizon_seconds)
+    if shards == 1:
+        async for event in events:
+            await shard.feed(event)
+        return shard.diff
+
+    loop = asyncio.get_running_loop()
+    owned = executor is None
+    if owned:
+        # spawn: the parent holds DB connections and threads a fork would copy.
+        executor = ProcessPoolExecutor(
+            max_workers=shards, mp_context=get_context("spawn")
+        )
+    manager = None
+    if isinstance(executor, ProcessPoolExecutor):
+        # Plain queues cannot be handed to pool workers; manager proxies can.
+        manager = get_context("spawn").Manager()
+        inboxes = [manager.Queue(max(1, queued_chunks)) for _ in range(shards)]
+    else:
+        inboxes = [queue.Queue(max(1, queued_chunks)) for _ in range(shards)]
+    workers = [
+        loop.run_in_executor(
+            executor, replay_shard, candidate, externalGameId, inbox, horizon_seconds
+        )
+        for inbox in inboxes
+    ]
+    try:
+        chunk_events = max(1, chunk_events)
+        chunks: List[List[ReplayEvent]] = [[] for _ in range(shards)]
+        async for event in events:
+            index = shard_of(event.externalTaskId, shards)
+            chunks[index].append(event)
+            if len(chunks[index]) >= chunk_events:
+                await _send(inboxes[index], chunks[index], workers[index])
+                chunks[index] = []
+        for inbox, chunk, worker in zip(inboxes, chunks, workers):
+            if chunk:
+                await _send(inbox, chunk, worker)
+    finally:
+        for inbox, worker in zip(inboxes, workers):
+            if not worker.done():
+                await _send(inbox, None, worker)
+        diffs = await asyncio.gather(*workers, return_exceptions=True)
+        if manager is not None:
+            manager.shutdown()
+        if owned:
+            executor.shutdown(wait=True)
+    total = ReplayDiff()
+    for diff in diffs:
+        if isinstance(diff, BaseException):
+            raise diff
+        total.merge(diff)
+    return total
@@ -39,7 +39,9 @@ class SocioBeeStrategy(BaseStrategy):  # noqa
         """
         Score an event by comparing the user's pace to the global average.
 
-        Until the task has enough history a flat basic award is granted
+        All history aggregates come from one
+        :meth:`UserPointsAnalyticsService.get_scoring_snapshot` query. Until
+        the task has enough history a flat basic award is granted
         (``BasicEngagement``). Once history exists, the user's average time
         between tasks is compared to all users' average and individual/global
         adjustment points are added or subtracted accordingly, returning the
@@ -55,30 +57,23 @@ class SocioBeeStrategy(BaseStrategy):  # noqa
             tuple[int, str]: The points to award and the case name describing
             which branch produced them.
         """
-        task_measurements_count = await self.user_points_analytics_service.count_measurements_by_external_task_id(
-            externalTaskId
+        snapshot = await self.user_points_analytics_service.get_scoring_snapshot(
+            externalGameId, externalTaskId, externalUserId
         )
+        task_measurements_count = snapshot.task_measurements_count
         self.debug_print(f"task_measurements_count: {task_measurements_count}")
         if task_measurements_count < 2:
             return (self.variable_basic_points, "BasicEngagement")
-        user_task_measurements_count = (
-            await self.user_points_analytics_service.get_user_task_measurements_count(
-                externalTaskId, externalUserId
-            )
-        )
+        user_task_measurements_count = snapshot.user_task_measurements_count
         self.debug_print(
             f"user_task_measurements_count: {user_task_measurements_count}"
         )
 
         if user_task_measurements_count > 2:
-            user_avg_time_taken = await self.user_points_analytics_service.get_avg_time_between_tasks_by_user_and_game_task(  # noqa
-                externalGameId, externalTaskId, externalUserId
-            )
+            user_avg_time_taken = snapshot.user_avg_time_between_tasks
             self.debug_print(f"user_avg_time_taken: {user_avg_time_taken}")
 
-            all_avg_time_taken = await self.user_points_analytics_service.get_avg_time_between_tasks_for_all_users(  # noqa
-                externalGameId, externalTaskId
-            )
+            all_avg_time_taken = snapshot.all_avg_time_between_tasks
             self.debug_print(f"all_avg_time_taken: {all_avg_time_taken}")
 
             if user_avg_time_taken < all_avg_time_taken:
@@ -88,20 +83,12 @@ class SocioBeeStrategy(BaseStrategy):  # noqa
                     points,
                     "PerformanceBonus",
                 )
-            user_last_window_time_diff = (
-                await self.user_points_analytics_service.get_last_window_time_diff(
-                    externalTaskId, externalUserId
-                )
-            )
+            user_last_window_time_diff = snapshot.last_window_time_diff
             self.debug_print(
                 f"user_last_window_time_diff: {user_last_window_time_diff}"
             )
 
-            user_new_last_window_time_diff = (
-                await self.user_points_analytics_service.get_new_last_window_time_diff(
-                    externalTaskId, externalUserId, externalGameId
-                )
-            )
+            user_new_last_window_time_diff = snapshot.new_last_window_time_diff
             self.debug_print(
                 f"user_new_last_window_time_diff: " f"{user_new_last_window_time_diff}"
             )
@@ -19,6 +19,10 @@ T = TypeVar("T", bound=type)
 
 _REGISTRY: dict[str, type] = {}
 _external_loaded: bool = False
+# Bumped whenever the registry's contents change, so instance tables built
+# from a snapshot (see :func:`app.engine.all_engine_strategies.engine_strategy`)
+# can tell they are stale.
+_generation: int = 0
 
 
 def register_strategy(id: str, *, version: str | None = None) -> Callable[[T], T]:
@@ -48,10 +52,13 @@ def register_strategy(id: str, *, version: str | None = None) -> Callable[[T], T
                 f"Strategy id {id!r} already registered by "
                 f"{existing.__module__}.{existing.__name__}"
             )
+        global _generation
         cls.__strategy_id__ = id
         if version is not None:
             cls.__strategy_version__ = version
-        _REGISTRY[id] = cls
+        if existing is None:
+            _REGISTRY[id] = cls
+            _generation += 1
         return cls
 
     return decorator
@@ -90,8 +97,18 @@ def get_registered_class(strategy_id: str) -> type | None:
     return _REGISTRY.get(strategy_id)
 
 
+def registry_generation() -> int:
+    """Counter that changes whenever a strategy is registered or removed.
+
+    Loads the entry-point strategies first, like :func:`registered_strategies`.
+    """
+    _load_external_strategies()
+    return _generation
+
+
 def clear_registry() -> None:
     """Reset the registry. Intended for tests only."""
-    global _external_loaded
+    global _external_loaded, _generation
     _REGISTRY.clear()
     _external_loaded = False
+    _generation += 1
@@ -15,7 +15,9 @@ from starlette.middleware.cors import CORSMiddleware
 from app.api.v1.routes import routers as v1_routers
 from app.core.config import configs
 from app.core.container import Container
+from app.engine.all_engine_strategies import refresh_engine_strategies
 from app.middlewares.error_handler import CatchUnhandledErrorsMiddleware
+from app.middlewares.valid_access_token import start_jwks_refresh, stop_jwks_refresh
 from app.util.class_object import singleton
 
 
@@ -90,18 +92,27 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
-    FastAPI lifespan context manager handling graceful shutdown.
+    FastAPI lifespan context manager handling startup and graceful shutdown.
 
-    Yields immediately on startup (no startup work needed) and, on shutdown,
-    flushes the buffered DSL execution-log queue so a graceful stop does not
-    drop pending audit rows. The flush is best-effort: failures are logged
-    and swallowed so they never block shutdown.
+    On startup it builds the shared built-in strategy table so the first
+    scoring request does not pay for instantiating every strategy (a failure
+    is logged and the table is built on first use instead), and starts the
+    background JWKS signing-key refresher. On shutdown it stops the refresher
+    and flushes the buffered DSL execution-log and audit-log queues so a graceful
+    stop does not drop pending audit rows. The flush is best-effort: failures
+    are logged and swallowed so they never block shutdown.
 
     Args:
         app (FastAPI): The application instance whose ``state`` may hold the
-            ``dsl_execution_observer`` to flush.
+            ``dsl_execution_observer`` and ``audit_log_sink`` to flush.
     """
+    try:
+        refresh_engine_strategies()
+    except Exception:  # pragma: no cover - startup best-effort
+        logger.warning("Failed to build the built-in strategy table", exc_info=True)
+    start_jwks_refresh()
     yield
+    await stop_jwks_refresh()
     # Flush the DSL execution-log queue so a graceful
     # shutdown doesn't drop buffered audit rows. ``aclose`` is
     # idempotent and tolerant of an observer that never enqueued.
@@ -114,6 +125,12 @@ async def lifespan(app: FastAPI):
                 "Failed to flush DSL execution-log queue on shutdown",
                 exc_info=True,
             )
+    sink = getattr(app.state, "audit_log_sink", None)
+    if sink is not None:
+        try:
+            await sink.aclose()
+        except Exception:  # pragma: no cover - shutdown best-effort
+            logger.warning("Failed to flush audit log queue on shutdown", exc_info=True)
 
 
 def get_project_data():
@@ -249,6 +266,7 @@ class AppCreator:
         # Expose the singleton execution-log observer so the
         # lifespan shutdown hook can flush its background queue.
         self.app.state.dsl_execution_observer = self.container.dsl_execution_observer()
+        self.app.state.audit_log_sink = self.container.audit_log_sink()
         # Added before CORSMiddleware on purpose: add_middleware prepends, so
         # the CORS layer added below stays the outermost user middleware and
         # wraps this one. That lets unhandled 500s be rendered from inside the
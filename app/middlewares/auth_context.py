@@ -1,9 +1,11 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Optional
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import Depends, Request
 
+from app.core.config import configs
 from app.core.container import Container
 from app.middlewares.valid_access_token import oauth_2_scheme, valid_access_token
 from app.schema.oauth_users_schema import CreateOAuthUser
@@ -13,6 +15,27 @@ from app.services.oauth_users_service import OAuthUsersService
 from app.util.add_log import add_log
 from app.util.check_role import check_role
 
+# OAuth subjects already known to have an ``oauth_users`` row, so the
+# bootstrap check costs one DB read per subject per process instead of one
+# per request. LRU-bounded by ``JWT_CLAIMS_CACHE_MAX_ENTRIES``.
+_KNOWN_OAUTH_SUBS: "OrderedDict[str, None]" = OrderedDict()
+
+
+def _reset_known_oauth_subs_for_tests() -> None:
+    """Test hook: forget which OAuth subjects have a user row."""
+    _KNOWN_OAUTH_SUBS.clear()
+
+
+def _remember_oauth_sub(sub: str) -> None:
+    """Record that ``sub`` has a user row (no-op when caching is off)."""
+    max_entries = configs.JWT_CLAIMS_CACHE_MAX_ENTRIES
+    if max_entries <= 0:
+        return
+    _KNOWN_OAUTH_SUBS[sub] = None
+    _KNOWN_OAUTH_SUBS.move_to_end(sub)
+    while len(_KNOWN_OAUTH_SUBS) > max_entries:
+        _KNOWN_OAUTH_SUBS.popitem(last=False)
+
 
 @dataclass(frozen=True)
 class AuthContext:
@@ -112,7 +135,9 @@ async def get_auth_context(
       - validates it via `valid_access_token`,
       - extracts `sub` and admin role,
       - bootstraps a Keycloak OAuth user record if missing (and writes a
-        single `auth / OAuth user bootstrapped` audit entry).
+        single `auth / OAuth user bootstrapped` audit entry). Subjects seen
+        with a record are remembered, so the lookup runs once per subject
+        per process.
     """
     api_key = getattr(getattr(api_key_header, "data", None), "apiKey", None)
     oauth_user_id: Optional[str] = None
@@ -126,7 +151,11 @@ async def get_auth_context(
         token_data = validated.data
         oauth_user_id = token_data["sub"]
         is_admin = check_role(token_data, "AdministratorGAME")
-        if await service_oauth.get_user_by_sub(oauth_user_id) is None:
+        if oauth_user_id in _KNOWN_OAUTH_SUBS:
+            _KNOWN_OAUTH_SUBS.move_to_end(oauth_user_id)
+        elif await service_oauth.get_user_by_sub(oauth_user_id) is not None:
+            _remember_oauth_sub(oauth_user_id)
+        else:
             await service_oauth.add(
                 CreateOAuthUser(
                     provider="keycloak",
@@ -143,6 +172,7 @@ async def get_auth_context(
                 api_key=api_key,
                 oauth_user_id=oauth_user_id,
             )
+            _remember_oauth_sub(oauth_user_id)
 
     return AuthContext(
         api_key=api_key,
@@ -1,6 +1,9 @@
 import asyncio
+import hashlib
 import logging
-from typing import Annotated, Any, Optional
+import time
+from collections import OrderedDict
+from typing import Annotated, Any, Dict, Optional, Tuple
 
 import httpx
 import jwt
@@ -59,10 +62,161 @@ def _get_jwks_client() -> PyJWKClient:
     return _JWKS_CLIENT
 
 
+# Realm signing keys by ``kid``. Filled by the first token that needs each
+# key and kept current by the background refresher, so validating a token
+# normally costs a dict lookup instead of a worker-thread JWKS call.
+_SIGNING_KEYS: Dict[str, Any] = {}
+_JWKS_REFRESH_TASK: Optional[asyncio.Task] = None
+
+# Claims of tokens that already passed validation, keyed by the token's
+# sha256 and dropped once ``exp`` is reached. LRU-bounded by
+# ``JWT_CLAIMS_CACHE_MAX_ENTRIES``.
+_VERIFIED_CLAIMS: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+
+
 def _reset_jwks_client_for_tests() -> None:
-    """Test hook: drop the cached PyJWKClient so monkeypatched classes apply."""
-    global _JWKS_CLIENT
+    """Test hook: drop the cached PyJWKClient, signing keys and claims."""
+    global _JWKS_CLIENT, _SIGNING_KEYS
     _JWKS_CLIENT = None
+    _SIGNING_KEYS = {}
+    _VERIFIED_CLAIMS.clear()
+
+
+def _cached_claims(cache_key: bytes) -> Optional[dict]:
+    """
+    Return the verified claims cached under ``cache_key``, if still valid.
+
+    Args:
+        cache_key (bytes): sha256 digest of the access token.
+
+    Returns:
+        Optional[dict]: A copy of the cached claims, or ``None`` when absent
+        or past the token's ``exp``.
+    """
+    entry = _VERIFIED_CLAIMS.get(cache_key)
+    if entry is None:
+        return None
+    expires_at, claims = entry
+    if expires_at <= time.time():
+        _VERIFIED_CLAIMS.pop(cache_key, None)
+        return None
+    _VERIFIED_CLAIMS.move_to_end(cache_key)
+    return dict(claims)
+
+
+def _remember_claims(cache_key: bytes, claims: dict) -> None:
+    """
+    Cache verified ``claims`` until the token's ``exp``.
+
+    Tokens without a numeric ``exp`` are not cached, and neither is anything
+    when ``JWT_CLAIMS_CACHE_MAX_ENTRIES`` is ``0``.
+
+    Args:
+        cache_key (bytes): sha256 digest of the access token.
+        claims (dict): The normalized claims returned to the caller.
+    """
+    max_entries = configs.JWT_CLAIMS_CACHE_MAX_ENTRIES
+    expires_at = claims.get("exp")
+    if (
+        max_entries <= 0
+        or isinstance(expires_at, bool)
+        or not isinstance(expires_at, (int, float))
+    ):
+        return
+    _VERIFIED_CLAIMS[cache_key] = (float(expires_at), dict(claims))
+    _VERIFIED_CLAIMS.move_to_end(cache_key)
+    while len(_VERIFIED_CLAIMS) > max_entries:
+        _VERIFIED_CLAIMS.popitem(last=False)
+
+
+async def _get_signing_key(access_token: str) -> Any:
+    """
+    Resolve the key that signed ``access_token``.
+
+    Looks the token's ``kid`` up in the in-memory key set first. On a miss
+    (first use of a key, or a rotation the refresher has not seen yet) it
+    falls back to ``PyJWKClient`` in a worker thread and remembers the key.
+
+    Args:
+        access_token (str): The raw JWT.
+
+    Returns:
+        PyJWK: The signing key.
+    """
+    kid = jwt.get_unverified_header(access_token).get("kid")
+    signing_key = _SIGNING_KEYS.get(kid) if kid else None
+    if signing_key is not None:
+        return signing_key
+    jwks_client = _get_jwks_client()
+    # PyJWKClient does sync HTTP under the hood; offload to a worker thread
+    # so a JWKS roundtrip doesn't stall the event loop.
+    signing_key = await asyncio.to_thread(
+        jwks_client.get_signing_key_from_jwt, access_token
+    )
+    if kid:
+        _SIGNING_KEYS[kid] = signing_key
+    return signing_key
+
+
+def _load_signing_keys() -> Dict[str, Any]:
+    """Fetch the realm's current signing keys, by ``kid`` (blocking)."""
+    keys = _get_jwks_client().get_signing_keys(refresh=True)
+    return {key.key_id: key for key in keys if key.key_id}
+
+
+async def refresh_signing_keys() -> None:
+    """
+    Replace the in-memory key set with the realm's current JWKS.
+
+    Keys removed from the realm stop validating new tokens; tokens already
+    in the claims cache stay valid until their ``exp``.
+    """
+    global _SIGNING_KEYS
+    _SIGNING_KEYS = await asyncio.to_thread(_load_signing_keys)
+
+
+async def _jwks_refresh_loop(interval_seconds: int) -> None:
+    """Refresh the key set every ``interval_seconds`` once it is in use."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        # Nothing to keep warm until a bearer token has needed a key; this
+        # spares API-key-only deployments a JWKS call every interval.
+        if not _SIGNING_KEYS:
+            continue
+        try:
+            await refresh_signing_keys()
+        except Exception:
+            logger.warning(
+                "JWKS refresh failed; keeping the previous signing keys",
+                exc_info=True,
+            )
+
+
+def start_jwks_refresh() -> None:
+    """
+    Start the background JWKS refresher. Idempotent.
+
+    Wired into the FastAPI lifespan; ``JWKS_REFRESH_INTERVAL_SECONDS=0``
+    leaves it off (keys are then only fetched on a ``kid`` miss).
+    """
+    global _JWKS_REFRESH_TASK
+    interval_seconds = configs.JWKS_REFRESH_INTERVAL_SECONDS
+    if interval_seconds <= 0:
+        return
+    if _JWKS_REFRESH_TASK is None or _JWKS_REFRESH_TASK.done():
+        _JWKS_REFRESH_TASK = asyncio.ensure_future(_jwks_refresh_loop(interval_seconds))
+
+
+async def stop_jwks_refresh() -> None:
+    """Cancel the background JWKS refresher, if running. Idempotent."""
+    global _JWKS_REFRESH_TASK
+    task, _JWKS_REFRESH_TASK = _JWKS_REFRESH_TASK, None
+    if task is not None and not task.done():
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
 
 
 class CustomOAuth2AuthorizationCodeBearer(OAuth2AuthorizationCodeBearer):
@@ -137,10 +291,11 @@ async def valid_access_token(
     """
     Validate a Keycloak-issued JWT access token.
 
-    Fetches the realm signing key (offloaded to a worker thread so the JWKS
-    roundtrip does not block the event loop) and verifies the token's
-    signature, expiry, issuer and audience. Each failure mode is mapped to an
-    appropriate HTTP status carried inside the returned ``Response``.
+    Verifies the token's signature, expiry, issuer and audience against the
+    realm signing key (see :func:`_get_signing_key`). Each failure mode is
+    mapped to an appropriate HTTP status carried inside the returned
+    ``Response``. Claims of a token that validated are cached until its
+    ``exp``, so repeat requests with the same token skip verification.
 
     Args:
         access_token (str): The bearer token extracted by ``oauth_2_scheme``.
@@ -150,13 +305,14 @@ async def valid_access_token(
         success; ``Response.fail`` wrapping an ``HTTPException`` (401/403/500)
         describing why validation failed.
     """
+    cache_key = None
+    if isinstance(access_token, str):
+        cache_key = hashlib.sha256(access_token.encode()).digest()
+        cached = _cached_claims(cache_key)
+        if cached is not None:
+            return Response.ok(cached)
     try:
-        jwks_client = _get_jwks_client()
-        # PyJWKClient does sync HTTP under the hood; offload to a worker thread
-        # so a JWKS roundtrip doesn't stall the event loop.
-        signing_key = await asyncio.to_thread(
-            jwks_client.get_signing_key_from_jwt, access_token
-        )
+        signing_key = await _get_signing_key(access_token)
         data = jwt.decode(
             access_token,
             key=signing_key.key,
@@ -169,7 +325,10 @@ async def valid_access_token(
                 "verify_aud": True,
             },
         )
-        return _build_token_response(data)
+        response = _build_token_response(data)
+        if response.sucess and cache_key is not None:
+            _remember_claims(cache_key, response.data)
+        return response
 
     except exceptions.InvalidSignatureError as e:
         logger.warning("JWT rejected: invalid signature: %s", e)
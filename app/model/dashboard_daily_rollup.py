@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from pydantic import ConfigDict
+from sqlalchemy import BigInteger, String
+from sqlmodel import Column, DateTime, Field, SQLModel
+
+
+class DashboardDailyRollup(SQLModel, table=True):
+    """
+    One dashboard metric aggregated over one closed UTC day.
+
+    The dashboard summaries read closed days from here instead of grouping
+    the raw ``users``/``games``/``userpoints``/``useractions``/``logs`` rows,
+    so a year-long range costs a few hundred rows. Every metric gets a row
+    for every rolled-up day, including days without activity, so the rolled
+    up range is simply ``min(day)`` to ``max(day)``. ``(metric, day)`` is the
+    primary key.
+
+    Attributes:
+        metric (str): Summary series, e.g. ``new_users`` or ``logs_error``.
+        day (datetime): UTC midnight starting the day.
+        rowsCount (int): Source rows of the day (for the ``logs_*`` metrics,
+            every log row, whatever its level). A bucket with no rows is
+            left out of the summaries, exactly as the raw ``GROUP BY``
+            leaves it out.
+        value (int): The metric's aggregate over those rows (a count, or
+            the points sum for ``points_earned``).
+    """
+
+    __tablename__ = "dashboard_daily_rollup"
+
+    metric: str = Field(sa_column=Column(String(32), primary_key=True))
+    day: datetime = Field(sa_column=Column(DateTime(timezone=True), primary_key=True))
+    rowsCount: int = Field(sa_column=Column(BigInteger, nullable=False, default=0))
+    value: int = Field(sa_column=Column(BigInteger, nullable=False, default=0))
+
+    model_config = ConfigDict(from_attributes=True)
+
+    def __str__(self):
+        return (
+            "DashboardDailyRollup: "
+            f"(metric={self.metric}, day={self.day}, "
+            f"rowsCount={self.rowsCount}, value={self.value})"
+        )
+
+    def __repr__(self):
+        return self.__str__()
@@ -0,0 +1,67 @@
+from datetime import datetime
+
+from pydantic import ConfigDict
+from sqlalchemy import ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlmodel import Column, DateTime, Field, SQLModel
+
+
+class GameLeaderboard(SQLModel, table=True):
+    """
+    One user's score on one leaderboard of a game, kept in step with
+    ``user_points``.
+
+    Every game has an all-time board plus one board per UTC day and per ISO
+    week; a row holds the user's points on one of them. Rows are merged in
+    the same transaction that writes each ``user_points`` row, so leaderboard
+    reads never aggregate the awards. ``(gameId, period, periodStart,
+    userId)`` is the primary key and ``ix_game_leaderboard_rank`` orders a
+    board by score.
+
+    Attributes:
+        gameId (str): The game the board belongs to.
+        period (str): ``all``, ``day`` or ``week``.
+        periodStart (datetime): Start of the window (UTC midnight, the
+            week's Monday, or the Unix epoch for ``all``).
+        userId (str): The ranked user.
+        points (int): Sum of the user's ``points`` in the window.
+        awardsCount (int): Number of ``user_points`` rows in the window.
+    """
+
+    __tablename__ = "game_leaderboard"
+    __table_args__ = (
+        Index(
+            "ix_game_leaderboard_rank",
+            "gameId",
+            "period",
+            "periodStart",
+            "points",
+            "userId",
+        ),
+    )
+
+    gameId: str = Field(
+        sa_column=Column(UUID(as_uuid=True), ForeignKey("games.id"), primary_key=True)
+    )
+    period: str = Field(sa_column=Column(String(8), primary_key=True))
+    periodStart: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), primary_key=True)
+    )
+    userId: str = Field(
+        sa_column=Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    )
+    points: int = Field(sa_column=Column(Integer, nullable=False, default=0))
+    awardsCount: int = Field(sa_column=Column(Integer, nullable=False, default=0))
+
+    model_config = ConfigDict(from_attributes=True)
+
+    def __str__(self):
+        return (
+            "GameLeaderboard: "
+            f"(gameId={self.gameId}, period={self.period}, "
+            f"periodStart={self.periodStart}, userId={self.userId}, "
+            f"points={self.points}, awardsCount={self.awardsCount})"
+        )
+
+    def __repr__(self):
+        return self.__str__()
@@ -0,0 +1,61 @@
+from datetime import datetime
+
+from pydantic import ConfigDict
+from sqlalchemy import Float, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlmodel import Column, DateTime, Field, SQLModel
+
+
+class UserTaskStats(SQLModel, table=True):
+    """
+    Rollup of one user's awards on one task, kept in step with ``user_points``.
+
+    Updated in the same transaction that writes each ``user_points`` row, so
+    scoring can read a user's history on a task from one row instead of
+    aggregating every award. ``(taskId, userId)`` is the primary key.
+
+    Attributes:
+        taskId (str): The task the awards belong to.
+        userId (str): The user who earned the awards.
+        awardsCount (int): Number of ``user_points`` rows.
+        pointsSum (int): Sum of their ``points``.
+        firstAt (datetime): ``created_at`` of the earliest award.
+        lastAt (datetime): ``created_at`` of the latest award.
+        previousAt (datetime): ``created_at`` of the second latest award
+            (``None`` with a single award).
+        minutesSum (float): Sum of the positive ``data["minutes"]`` values.
+        minutesCount (int): Number of awards with a positive
+            ``data["minutes"]``.
+    """
+
+    __tablename__ = "user_task_stats"
+
+    taskId: str = Field(
+        sa_column=Column(UUID(as_uuid=True), ForeignKey("tasks.id"), primary_key=True)
+    )
+    userId: str = Field(
+        sa_column=Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    )
+    awardsCount: int = Field(sa_column=Column(Integer, nullable=False, default=0))
+    pointsSum: int = Field(sa_column=Column(Integer, nullable=False, default=0))
+    firstAt: datetime = Field(sa_column=Column(DateTime(timezone=True)))
+    lastAt: datetime = Field(sa_column=Column(DateTime(timezone=True)))
+    previousAt: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=True)
+    )
+    minutesSum: float = Field(sa_column=Column(Float, nullable=False, default=0))
+    minutesCount: int = Field(sa_column=Column(Integer, nullable=False, default=0))
+
+    model_config = ConfigDict(from_attributes=True)
+
+    def __str__(self):
+        return (
+            "UserTaskStats: "
+            f"(taskId={self.taskId}, userId={self.userId}, "
+            f"awardsCount={self.awardsCount}, pointsSum={self.pointsSum}, "
+            f"firstAt={self.firstAt}, lastAt={self.lastAt}, "
+            f"previousAt={self.previousAt})"
+        )
+
+    def __repr__(self):
+        return self.__str__()
@@ -14,6 +14,7 @@ from app.repository.apikey_repository import ApiKeyRepository
 from app.repository.base_repository import BaseRepository
 from app.repository.dashboard_repository import DashboardRepository
 from app.repository.export_audit_log_repository import ExportAuditLogRepository
+from app.repository.game_leaderboard_repository import GameLeaderboardRepository
 from app.repository.game_params_repository import GameParamsRepository
 from app.repository.game_repository import GameRepository
 from app.repository.kpi_metrics_repository import KpiMetricsRepository
@@ -31,6 +32,7 @@ from app.repository.user_game_config_repository import UserGameConfigRepository
 from app.repository.user_interactions_repository import UserInteractionsRepository
 from app.repository.user_points_repository import UserPointsRepository
 from app.repository.user_repository import UserRepository
+from app.repository.user_task_stats_repository import UserTaskStatsRepository
 from app.repository.wallet_repository import WalletRepository
 from app.repository.wallet_transaction_repository import WalletTransactionRepository
 
@@ -38,11 +40,13 @@ __all__ = [
     "BaseRepository",
     "AbuseLimitCounterRepository",
     "GameRepository",
+    "GameLeaderboardRepository",
     "TaskParamsRepository",
     "TaskRepository",
     "UserRepository",
     "UserActionsRepository",
     "UserPointsRepository",
+    "UserTaskStatsRepository",
     "WalletRepository",
     "WalletTransactionRepository",
     "GameParamsRepository",
@@ -1,9 +1,12 @@
+from collections import Counter
 from contextlib import AbstractAsyncContextManager
 from datetime import datetime, timezone
-from typing import Callable
+from typing import Callable, Iterable, List, Tuple
+from uuid import uuid4
 
 from sqlalchemy import select
 from sqlalchemy import update as sa_update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,6 +22,9 @@ class AbuseLimitCounterRepository(BaseRepository):
     - update existing bucket atomically (`counter = counter + 1`)
     - if bucket does not exist, insert
     - if concurrent insert collides, retry update
+
+    :meth:`increment_many` bumps several buckets with one
+    ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING`` statement instead.
     """
 
     def __init__(
@@ -104,6 +110,106 @@ class AbuseLimitCounterRepository(BaseRepository):
                 await session.commit()
                 return await self._read_counter(session, filters)
 
+    async def increment_many(
+        self, buckets: Iterable[Tuple[str, str, str, datetime, int]]
+    ) -> List[int]:
+        """
+        Increment several rate-limit buckets in one statement.
+
+        Every bucket is upserted by a single multi-row
+        ``INSERT ... ON CONFLICT DO UPDATE SET counter = counter + n
+        RETURNING`` so the whole batch costs one round trip and one commit.
+        The conflict target is ``uq_abuse_limit_counter_scope_window``, which
+        makes the statement safe under concurrent writers without the
+        update/insert/retry dance of :meth:`increment_and_get`. A bucket
+        listed more than once is moved by the sum of its amounts (Postgres
+        rejects an upsert touching the same row twice), so every occurrence
+        gets the bucket's final value.
+
+        Args:
+            buckets (Iterable[Tuple[str, str, str, datetime, int]]):
+                ``(scope_type, scope_value, window_name, window_start,
+                amount)`` tuples; naive ``window_start`` values are treated
+                as UTC.
+
+        Returns:
+            List[int]: The counter of each bucket after the increment, in
+            input order.
+        """
+        keys = []
+        hits = Counter()
+        for scope_type, scope_value, window_name, window_start, amount in buckets:
+            key = (scope_type, scope_value, window_name, self._as_utc(window_start))
+            keys.append(key)
+            hits[key] += amount
+        if not keys:
+            return []
+
+        now = datetime.now(timezone.utc)
+        insert_stmt = insert(self.model).values(
+            [
+                {
+                    "id": uuid4(),
+                    "created_at": now,
+                    "updated_at": now,
+                    "scopeType": scope_type,
+                    "scopeValue": scope_value,
+                    "windowName": window_name,
+                    "windowStart": window_start,
+                    "counter": count,
+                }
+                for (
+                    scope_type,
+                    scope_value,
+                    window_name,
+                    window_start,
+                ), count in hits.items()
+            ]
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[
+                self.model.scopeType,
+                self.model.scopeValue,
+                self.model.windowName,
+                self.model.windowStart,
+            ],
+            set_={
+                "counter": self.model.counter + insert_stmt.excluded.counter,
+                "updated_at": now,
+            },
+        ).returning(
+            self.model.scopeType,
+            self.model.scopeValue,
+            self.model.windowName,
+            self.model.windowStart,
+            self.model.counter,
+        )
+
+        async with self.session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+            await session.commit()
+
+        counters = {
+            (scope_type, scope_value, window_name, self._as_utc(window_start)): counter
+            for scope_type, scope_value, window_name, window_start, counter in rows
+        }
+        return [int(counters[key]) for key in keys]
+
+    @staticmethod
+    def _as_utc(window_start: datetime) -> datetime:
+        """
+        Return ``window_start`` as an aware UTC datetime (naive means UTC).
+
+        Args:
+            window_start (datetime): Bucket start, naive or aware.
+
+        Returns:
+            datetime: The same instant in UTC.
+        """
+        if window_start.tzinfo is None:
+            return window_start.replace(tzinfo=timezone.utc)
+        return window_start.astimezone(timezone.utc)
+
     def _build_filters(
         self,
         scope_type: str,
@@ -1,18 +1,44 @@
+import json
 from contextlib import AbstractAsyncContextManager
-from typing import Callable, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
 
 from sqlalchemy import and_
 from sqlalchemy import delete as sa_delete
 from sqlalchemy import func, select
 from sqlalchemy import update as sa_update
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import CompileError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.core.config import configs
-from app.core.exceptions import DuplicatedError, NotFoundError
+from app.core.exceptions import BadRequestError, DuplicatedError, NotFoundError
+from app.util.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+    keyset_order_by,
+)
 from app.util.query_builder import dict_to_sqlalchemy_filter_options
 
+# ``read_by_options`` schema fields that drive paging rather than filtering.
+_PAGINATION_KEYS = frozenset({"ordering", "page", "page_size", "cursor", "count"})
+# ``count`` modes of ``read_by_options``.
+_COUNT_MODES = ("exact", "estimate", "none")
+
+
+@dataclass(frozen=True)
+class _Paging:
+    """Paging fields of a search schema, resolved against the model."""
+
+    ordering: str
+    descending: bool
+    column: Any
+    page: int
+    page_size: Union[int, str]
+    cursor: Optional[str]
+    count: str
+
 
 class BaseRepository:
     """
@@ -34,56 +60,160 @@ class BaseRepository:
 
         Non-null fields on ``schema`` are turned into ``WHERE`` conditions;
         ``ordering``, ``page`` and ``page_size`` drive sorting and pagination
-        (a ``page_size`` of ``"all"`` disables the limit). The total row count
-        ignoring pagination is computed alongside the page.
+        (a ``page_size`` of ``"all"`` disables the limit).
+
+        With a ``cursor`` (``""`` for the first page) the page is read by
+        keyset instead of ``OFFSET``: rows come in ``(ordering column, id)``
+        order and start right after the row the cursor points at, so deep
+        pages cost the same as the first. Every full page reports a
+        ``next_cursor``; offset pages do too, so a client can switch to
+        cursors from any page.
+
+        ``count`` picks how ``total_count`` is computed: ``"exact"`` (the
+        default) counts the filtered rows, ``"estimate"`` uses the Postgres
+        planner's row estimate (exact count on other databases) and
+        ``"none"`` skips it (``total_count`` is ``None``).
 
         Args:
             schema: Search schema whose non-null fields become filters and
-                which may carry ``ordering``/``page``/``page_size``.
+                which may carry ``ordering``/``page``/``page_size``/
+                ``cursor``/``count``.
             eager (bool): When ``True``, eagerly join the model's ``eagers``
                 relationships.
 
         Returns:
             dict: ``{"items": [...], "search_options": {page, page_size,
-            ordering, total_count}}``.
+            ordering, total_count, cursor, count, next_cursor}}``.
+
+        Raises:
+            BadRequestError: If the cursor is malformed or was issued for
+                another ordering, or ``count`` is not a supported mode.
         """
+        schema_as_dict = schema.model_dump(exclude_none=True)
+        paging = self._paging(schema_as_dict)
+        filter_options = dict_to_sqlalchemy_filter_options(
+            self.model,
+            {
+                key: value
+                for key, value in schema_as_dict.items()
+                if key not in _PAGINATION_KEYS
+            },
+        )
+
+        stmt = select(self.model)
+        if eager:
+            for eager_rel in getattr(self.model, "eagers", []):
+                stmt = stmt.options(joinedload(getattr(self.model, eager_rel)))
+        stmt = self._paginate(stmt.filter(filter_options), paging)
         async with self.session_factory() as session:
-            schema_as_dict = schema.model_dump(exclude_none=True)
-            ordering = schema_as_dict.get("ordering", configs.ORDERING)
-            order_query = (
-                getattr(self.model, ordering[1:]).desc()
-                if ordering.startswith("-")
-                else getattr(self.model, ordering).asc()
+            result = await session.execute(stmt)
+            items = result.unique().scalars().all()
+            total_count = await self._count_rows(
+                session, select(self.model).filter(filter_options), paging.count
             )
-            page = schema_as_dict.get("page", configs.PAGE)
-            page_size = schema_as_dict.get("page_size", configs.PAGE_SIZE)
-            filter_options = dict_to_sqlalchemy_filter_options(
-                self.model, schema.model_dump(exclude_none=True)
+        return {
+            "items": items,
+            "search_options": self._search_options(paging, items, total_count),
+        }
+
+    def _paging(self, schema_as_dict: dict) -> "_Paging":
+        """Read and validate the paging fields of a search schema dict."""
+        ordering = schema_as_dict.get("ordering", configs.ORDERING)
+        count_mode = schema_as_dict.get("count", "exact")
+        if count_mode not in _COUNT_MODES:
+            raise BadRequestError(
+                detail=f"Invalid count mode '{count_mode}'. "
+                f"Choose one of: {', '.join(_COUNT_MODES)}."
             )
-
-            stmt = select(self.model)
-            if eager:
-                for eager_rel in getattr(self.model, "eagers", []):
-                    stmt = stmt.options(joinedload(getattr(self.model, eager_rel)))
-            stmt = stmt.filter(filter_options)
-            count_stmt = select(func.count()).select_from(
-                select(self.model).filter(filter_options).subquery()
+        return _Paging(
+            ordering=ordering,
+            descending=ordering.startswith("-"),
+            column=getattr(self.model, ordering.lstrip("-")),
+            page=schema_as_dict.get("page", configs.PAGE),
+            page_size=schema_as_dict.get("page_size", configs.PAGE_SIZE),
+            cursor=schema_as_dict.get("cursor"),
+            count=count_mode,
+        )
+
+    def _paginate(self, stmt, paging: "_Paging"):
+        """Order ``stmt`` and restrict it to the requested page."""
+        id_column = self.model.id
+        if paging.cursor:
+            after_value, after_id = decode_cursor(
+                paging.cursor, paging.ordering, paging.column, id_column
             )
-            stmt = stmt.order_by(order_query)
-            if page_size != "all":
-                stmt = stmt.limit(page_size).offset((page - 1) * page_size)
-            result = await session.execute(stmt)
-            items = result.unique().scalars().all()
-            total_count = (await session.execute(count_stmt)).scalar_one()
-            return {
-                "items": items,
-                "search_options": {
-                    "page": page,
-                    "page_size": page_size,
-                    "ordering": ordering,
-                    "total_count": total_count,
-                },
-            }
+            stmt = stmt.filter(
+                keyset_condition(
+                    paging.column, id_column, paging.descending, after_value, after_id
+                )
+            )
+        # ``id`` breaks ties in both modes, so an offset page and the keyset
+        # page following its ``next_cursor`` agree on the order.
+        stmt = stmt.order_by(
+            *keyset_order_by(paging.column, id_column, paging.descending)
+        )
+        if paging.page_size != "all":
+            stmt = stmt.limit(paging.page_size)
+            if paging.cursor is None:
+                stmt = stmt.offset((paging.page - 1) * paging.page_size)
+        return stmt
+
+    @staticmethod
+    def _search_options(paging: "_Paging", items, total_count) -> dict:
+        """The ``search_options`` block of a page of ``items``."""
+        next_cursor = None
+        if items and paging.page_size != "all" and len(items) == paging.page_size:
+            last = items[-1]
+            next_cursor = encode_cursor(
+                paging.ordering, getattr(last, paging.column.key), last.id
+            )
+        return {
+            "page": paging.page,
+            "page_size": paging.page_size,
+            "ordering": paging.ordering,
+            "total_count": total_count,
+            "cursor": paging.cursor,
+            "count": paging.count,
+            "next_cursor": next_cursor,
+        }
+
+    @staticmethod
+    async def _count_rows(session: AsyncSession, query, count_mode: str):
+        """
+        ``total_count`` of ``query`` in the requested ``count_mode``.
+
+        The estimate is the top plan node's row count from ``EXPLAIN``: a
+        planner statistic, free to obtain but only as fresh as the table's
+        last ``ANALYZE``. Where no estimate is available (not Postgres, or a
+        filter value that cannot be inlined) the rows are counted.
+        """
+        if count_mode == "none":
+            return None
+        if count_mode == "estimate" and session.get_bind().dialect.name == (
+            "postgresql"
+        ):
+            try:
+                sql = str(
+                    query.compile(
+                        dialect=session.get_bind().dialect,
+                        compile_kwargs={"literal_binds": True},
+                    )
+                )
+            except CompileError:
+                pass
+            else:
+                # Sent as driver SQL: ``text()`` would read a ``:word`` in an
+                # inlined filter value as a bind parameter.
+                connection = await session.connection()
+                plan = (
+                    await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+                ).scalar_one()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]["Plan"]["Plan Rows"])
+        return (
+            await session.execute(select(func.count()).select_from(query.subquery()))
+        ).scalar_one()
 
     async def read_by_id(
         self,
@@ -224,6 +354,63 @@ class BaseRepository:
             raise DuplicatedError(detail=str(e.orig))
         return entity
 
+    async def create_many(
+        self,
+        schemas,
+        session: Optional[AsyncSession] = None,
+        auto_commit: bool = True,
+    ) -> list:
+        """
+        Insert several rows built from ``schemas`` in one flush.
+
+        Batched counterpart of :meth:`create`: all entities are added to the
+        session and flushed together, which SQLAlchemy emits as a single
+        multi-row ``INSERT ... RETURNING`` instead of one round trip per row.
+        Entities are not refreshed afterwards; every column the write path
+        reads back (``id``, ``created_at``) has a Python-side default.
+
+        Args:
+            schemas: Iterable of Pydantic schemas dumped into the model.
+            session (Optional[AsyncSession]): Caller-managed session to reuse;
+                a new one is opened when ``None``.
+            auto_commit (bool): Commit immediately when ``True``; otherwise
+                only flush (requires an external ``session``).
+
+        Returns:
+            list: The persisted model instances, in input order.
+
+        Raises:
+            ValueError: If ``auto_commit=False`` is requested without an
+                external session.
+            DuplicatedError: If an insert violates a uniqueness constraint.
+        """
+        if session is None and not auto_commit:
+            raise ValueError(
+                "auto_commit=False requires an external session managed by the caller."
+            )
+        if session is None:
+            async with self.session_factory() as managed_session:
+                return await self.create_many(
+                    schemas,
+                    session=managed_session,
+                    auto_commit=auto_commit,
+                )
+
+        entities = [self.model(**schema.model_dump()) for schema in schemas]
+        if not entities:
+            return []
+        try:
+            session.add_all(entities)
+            if auto_commit:
+                await session.commit()
+            else:
+                await session.flush()
+        except IntegrityError as e:
+            if auto_commit:
+                await session.rollback()
+            raise DuplicatedError(detail=str(e.orig))
+        return entities
+
     async def update(self, id, schema):
         """
         Partially update a row, ignoring ``None`` fields on ``schema``.
@@ -1,11 +1,17 @@
+import asyncio
 from contextlib import AbstractAsyncContextManager
-from datetime import date, datetime
-from typing import Callable, Dict, List, Union
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from sqlalchemy import String, case, func, select
+from sqlalchemy import BigInteger, String, case, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Imported as a module so the repository sees the live ``configs`` object
+# even when a test reloads ``app.core.config``.
+from app.core import config as _config_module
 from app.core.exceptions import BadRequestError
+from app.model.dashboard_daily_rollup import DashboardDailyRollup
 from app.model.games import Games
 from app.model.logs import Logs
 from app.model.tasks import Tasks
@@ -14,6 +20,50 @@ from app.model.user_points import UserPoints
 from app.model.users import Users
 from app.repository.base_repository import BaseRepository
 
+_DAY = timedelta(days=1)
+# Levels reported by the logs summary, keyed by their response field.
+_LOG_LEVELS = {"info": "INFO", "success": "SUCCESS", "error": "ERROR"}
+# Rollup rows per multi-row upsert statement.
+_ROLLUP_UPSERT_BATCH = 1000
+
+Bucket = Dict[str, Union[str, int]]
+
+
+def _as_utc(value: Union[date, datetime]) -> datetime:
+    """Dates become UTC midnight and naive datetimes are read as UTC (the
+    session time zone the dashboard's ``date_trunc`` buckets assume)."""
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.min)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _floor_day(value: Union[date, datetime]) -> datetime:
+    """UTC midnight at or before ``value``."""
+    value = _as_utc(value)
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _ceil_day(value: Union[date, datetime]) -> datetime:
+    """UTC midnight at or after ``value``."""
+    floor = _floor_day(value)
+    return floor if floor == _as_utc(value) else floor + _DAY
+
+
+def _merge_buckets(*parts: List[Bucket]) -> List[Bucket]:
+    """Add up buckets sharing a label across partial results, keeping the
+    order in which labels first appear."""
+    merged: Dict[str, Any] = {}
+    for part in parts:
+        for bucket in part:
+            label = bucket["label"]
+            if label in merged:
+                merged[label] = (merged[label] or 0) + (bucket["count"] or 0)
+            else:
+                merged[label] = bucket["count"]
+    return [{"label": label, "count": count} for label, count in merged.items()]
+
 
 class DashboardRepository(BaseRepository):
     """
@@ -29,6 +79,7 @@ class DashboardRepository(BaseRepository):
         model_logs=Logs,
         model_user_points=UserPoints,
         model_user_actions=UserActions,
+        model_rollup=DashboardDailyRollup,
     ) -> None:
         """
         Initializes the DashboardRepository with the provided session factory and models.
@@ -40,6 +91,7 @@ class DashboardRepository(BaseRepository):
         self.model_logs = model_logs
         self.model_user_points = model_user_points
         self.model_user_actions = model_user_actions
+        self.model_rollup = model_rollup
         super().__init__(session_factory, model_games)
 
     @staticmethod
@@ -103,60 +155,85 @@ class DashboardRepository(BaseRepository):
         Returns:
             Any: The group_by column.
         """
+        return self._bucket_column(model.created_at, group_by)
 
+    @staticmethod
+    def _bucket_column(column, group_by: str):
+        """
+        Label expression bucketing the timestamp ``column`` by ``group_by``.
+
+        Shared by the raw tables (``created_at``) and the daily rollup
+        (``day``) so both produce identical labels for the same day.
+        """
         if group_by == "day":
-            return func.date_trunc("day", model.created_at).label("date")
+            return func.date_trunc("day", column).label("date")
         elif group_by == "week":
             return case(
                 (
-                    func.extract("day", model.created_at).between(1, 7),
-                    func.concat("week_1_", func.extract("month", model.created_at)),
+                    func.extract("day", column).between(1, 7),
+                    func.concat("week_1_", func.extract("month", column)),
                 ),
                 (
-                    func.extract("day", model.created_at).between(8, 14),
-                    func.concat("week_2_", func.extract("month", model.created_at)),
+                    func.extract("day", column).between(8, 14),
+                    func.concat("week_2_", func.extract("month", column)),
                 ),
                 (
-                    func.extract("day", model.created_at).between(15, 21),
-                    func.concat("week_3_", func.extract("month", model.created_at)),
+                    func.extract("day", column).between(15, 21),
+                    func.concat("week_3_", func.extract("month", column)),
                 ),
                 (
-                    func.extract("day", model.created_at).between(22, 28),
-                    func.concat("week_4_", func.extract("month", model.created_at)),
+                    func.extract("day", column).between(22, 28),
+                    func.concat("week_4_", func.extract("month", column)),
                 ),
                 (
-                    func.extract("day", model.created_at) >= 29,
-                    func.concat("week_5_", func.extract("month", model.created_at)),
+                    func.extract("day", column) >= 29,
+                    func.concat("week_5_", func.extract("month", column)),
                 ),
                 else_="unknown_week",
             ).label("week")
         elif group_by == "month":
             return func.lpad(
-                func.cast(func.extract("month", model.created_at), String), 2, "0"
+                func.cast(func.extract("month", column), String), 2, "0"
             ).label("month")
         else:
             raise BadRequestError(
                 "Invalid group_by value. Choose 'day', 'week', or 'month'."
             )
 
-    async def _execute_query(
-        self, model, group_by_column, start_date, end_date, aggregation_field
-    ) -> List[Dict[str, Union[str, int]]]:
-        """Executes a query for a specific model and aggregation field."""
-        async with self.session_factory() as session:
-            stmt = select(group_by_column, aggregation_field.label("count"))
-            stmt = self.process_query(
-                stmt, model, start_date, end_date, group_by_column
-            )
-            results = (await session.execute(stmt)).all()
-            return [
-                {"label": str(result[0]), "count": result.count} for result in results
-            ]
+    # Summary sources: (model, {metric: aggregate}) per scanned table
+    def _entity_sources(self) -> List[Tuple[Any, Dict[str, Any]]]:
+        """The four series of :meth:`get_dashboard_summary`."""
+        return [
+            (self.model_users, {"new_users": func.count(self.model_users.id)}),
+            (self.model_games, {"games_opened": func.count(self.model_games.id)}),
+            (
+                self.model_user_points,
+                {"points_earned": func.sum(self.model_user_points.points)},
+            ),
+            (
+                self.model_user_actions,
+                {"actions_performed": func.count(self.model_user_actions.id)},
+            ),
+        ]
 
+    def _log_aggregates(self) -> Dict[str, Any]:
+        """One count per reported level, computed in the same pass."""
+        return {
+            f"logs_{key}": func.count(case((self.model_logs.log_level == level, 1)))
+            for key, level in _LOG_LEVELS.items()
+        }
+
+    def _rollup_sources(self) -> List[Tuple[Any, Dict[str, Any]]]:
+        """Every table and metric kept in ``dashboard_daily_rollup``."""
+        return [*self._entity_sources(), (self.model_logs, self._log_aggregates())]
+
+    # Summaries
     async def get_dashboard_summary(self, start_date, end_date, group_by):
         """
         Retrieves the dashboard summary.
 
+        The four series are computed concurrently, each on its own session.
+
         Args:
             start_date: The start date for the summary.
             end_date: The end date for the summary.
@@ -165,58 +242,32 @@ class DashboardRepository(BaseRepository):
         Returns:
             Dict[str, Any]: The dashboard summary.
         """
-
-        group_by_column_users = self._get_group_by_column(self.model_users, group_by)
-        new_users = await self._execute_query(
-            self.model_users,
-            group_by_column_users,
-            start_date,
-            end_date,
-            func.count(self.model_users.id),
-        )
-
-        group_by_column_games = self._get_group_by_column(self.model_games, group_by)
-        games_opened = await self._execute_query(
-            self.model_games,
-            group_by_column_games,
-            start_date,
-            end_date,
-            func.count(self.model_games.id),
-        )
-
-        group_by_column_points = self._get_group_by_column(
-            self.model_user_points, group_by
-        )
-        points_earned = await self._execute_query(
-            self.model_user_points,
-            group_by_column_points,
-            start_date,
-            end_date,
-            func.sum(self.model_user_points.points),
-        )
-
-        group_by_column_actions = self._get_group_by_column(
-            self.model_user_actions, group_by
-        )
-        actions_performed = await self._execute_query(
-            self.model_user_actions,
-            group_by_column_actions,
-            start_date,
-            end_date,
-            func.count(self.model_user_actions.id),
+        start_date = self._parse_date_boundary(start_date)
+        end_date = self._parse_date_boundary(end_date)
+        sources = [
+            (model, self._get_group_by_column(model, group_by), aggregates)
+            for model, aggregates in self._entity_sources()
+        ]
+        coverage = await self._rollup_coverage()
+        results = await asyncio.gather(
+            *(
+                self._summarize(
+                    model, bucket, aggregates, start_date, end_date, group_by, coverage
+                )
+                for model, bucket, aggregates in sources
+            )
         )
-
-        return {
-            "new_users": new_users,
-            "games_opened": games_opened,
-            "points_earned": points_earned,
-            "actions_performed": actions_performed,
-        }
+        summary: Dict[str, List[Bucket]] = {}
+        for result in results:
+            summary.update(result)
+        return summary
 
     async def get_dashboard_summary_logs(self, start_date, end_date, group_by):
         """
         Retrieves the dashboard summary logs.
 
+        All levels are counted in one grouped pass over ``logs``.
+
         Args:
             start_date: The start date for the summary.
             end_date: The end date for the summary.
@@ -225,34 +276,317 @@ class DashboardRepository(BaseRepository):
         Returns:
             Dict[str, Any]: The dashboard summary logs.
         """
-
-        group_by_column = self._get_group_by_column(self.model_logs, group_by)
-        info = await self._execute_query(
+        start_date = self._parse_date_boundary(start_date)
+        end_date = self._parse_date_boundary(end_date)
+        bucket = self._get_group_by_column(self.model_logs, group_by)
+        coverage = await self._rollup_coverage()
+        result = await self._summarize(
             self.model_logs,
-            group_by_column,
+            bucket,
+            self._log_aggregates(),
             start_date,
             end_date,
-            func.count(case((self.model_logs.log_level == "INFO", 1))),
+            group_by,
+            coverage,
         )
+        return {key: result[f"logs_{key}"] for key in _LOG_LEVELS}
 
-        success = await self._execute_query(
-            self.model_logs,
-            group_by_column,
-            start_date,
-            end_date,
-            func.count(case((self.model_logs.log_level == "SUCCESS", 1))),
-        )
+    async def _summarize(
+        self,
+        model,
+        bucket,
+        aggregates: Dict[str, Any],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        group_by: str,
+        coverage: Optional[Tuple[datetime, datetime]],
+    ) -> Dict[str, List[Bucket]]:
+        """
+        Bucket ``aggregates`` of ``model`` over the date range.
 
-        error = await self._execute_query(
-            self.model_logs,
-            group_by_column,
-            start_date,
-            end_date,
-            func.count(case((self.model_logs.log_level == "ERROR", 1))),
+        Closed days inside the rolled-up ``coverage`` come from the rollup;
+        the partial days at either end (and today) are aggregated from the
+        raw rows, and the three parts are merged per label.
+        """
+        window = self._rollup_window(start_date, end_date, coverage)
+        if window is None:
+            return await self._aggregate_raw(
+                model, bucket, aggregates, start_date, end_date
+            )
+        first, stop = window
+        parts = []
+        if start_date is None or _as_utc(start_date) < first:
+            parts.append(
+                await self._aggregate_raw(
+                    model, bucket, aggregates, start_date, None, before=first
+                )
+            )
+        parts.append(
+            await self._aggregate_rollup(list(aggregates), first, stop, group_by)
         )
+        parts.append(
+            await self._aggregate_raw(model, bucket, aggregates, stop, end_date)
+        )
+        return {
+            metric: _merge_buckets(*(part[metric] for part in parts))
+            for metric in aggregates
+        }
 
+    @staticmethod
+    def _rollup_window(
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        coverage: Optional[Tuple[datetime, datetime]],
+    ) -> Optional[Tuple[datetime, datetime]]:
+        """
+        The ``[first, stop)`` run of whole days that lies inside both the
+        requested range and the rolled-up ``coverage`` (first and last day
+        rolled up), or ``None`` when no whole day does.
+        """
+        if coverage is None:
+            return None
+        covered_from, covered_to = coverage
+        first = covered_from
+        if start_date is not None:
+            first = max(first, _ceil_day(start_date))
+        stop = covered_to + _DAY
+        if end_date is not None:
+            # ``end_date`` is inclusive: the day it starts is only whole when
+            # ``end_date`` is the following midnight, which the raw tail reads.
+            stop = min(stop, _floor_day(end_date))
+        return (first, stop) if first < stop else None
+
+    async def _aggregate_raw(
+        self,
+        model,
+        bucket,
+        aggregates: Dict[str, Any],
+        start_date,
+        end_date,
+        before: Optional[datetime] = None,
+    ) -> Dict[str, List[Bucket]]:
+        """One grouped pass over ``model`` returning every aggregate."""
+        stmt = select(
+            bucket,
+            *(aggregate.label(metric) for metric, aggregate in aggregates.items()),
+        )
+        stmt = self.process_query(stmt, model, start_date, end_date, bucket)
+        if before is not None:
+            stmt = stmt.filter(model.created_at < before)
+        async with self.session_factory() as session:
+            rows = (await session.execute(stmt)).all()
         return {
-            "info": info,
-            "success": success,
-            "error": error,
+            metric: [
+                {"label": str(row[0]), "count": row._mapping[metric]} for row in rows
+            ]
+            for metric in aggregates
         }
+
+    async def _aggregate_rollup(
+        self, metrics: List[str], first: datetime, stop: datetime, group_by: str
+    ) -> Dict[str, List[Bucket]]:
+        """Bucket the rolled-up days ``[first, stop)`` of ``metrics``."""
+        rollup = self.model_rollup
+        bucket = self._bucket_column(rollup.day, group_by)
+        stmt = (
+            select(
+                bucket,
+                rollup.metric,
+                cast(func.sum(rollup.value), BigInteger).label("count"),
+            )
+            .where(
+                rollup.metric.in_(metrics),
+                rollup.day >= first,
+                rollup.day < stop,
+                rollup.rowsCount > 0,
+            )
+            .group_by(bucket, rollup.metric)
+        )
+        async with self.session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+        result: Dict[str, List[Bucket]] = {metric: [] for metric in metrics}
+        for row in rows:
+            result[row.metric].append({"label": str(row[0]), "count": row.count})
+        return result
+
+    # Daily rollup maintenance
+    async def _rollup_coverage(self) -> Optional[Tuple[datetime, datetime]]:
+        """
+        First and last day the summaries may read from the rollup, after
+        rolling up any day closed since the last refresh. ``None`` when the
+        rollup is disabled or was never backfilled.
+        """
+        if not _config_module.configs.DASHBOARD_ROLLUP_ENABLED:
+            return None
+        async with self.session_factory() as session:
+            coverage = await self._read_rollup_coverage(session)
+        if coverage is None:
+            return None
+        yesterday = _floor_day(datetime.now(timezone.utc)) - _DAY
+        if coverage[1] < yesterday:
+            await self.refresh_daily_rollup()
+            async with self.session_factory() as session:
+                coverage = await self._read_rollup_coverage(session)
+        return coverage
+
+    async def _read_rollup_coverage(
+        self, session: AsyncSession
+    ) -> Optional[Tuple[datetime, datetime]]:
+        """``(min(day), max(day))`` of the rollup, or ``None`` when empty."""
+        rollup = self.model_rollup
+        first, last = (
+            await session.execute(select(func.min(rollup.day), func.max(rollup.day)))
+        ).one()
+        if first is None:
+            return None
+        return _as_utc(first), _as_utc(last)
+
+    async def _earliest_day(self, session: AsyncSession) -> Optional[datetime]:
+        """Day of the oldest row in any table the rollup covers."""
+        earliest = None
+        for model, _ in self._rollup_sources():
+            value = (
+                await session.execute(select(func.min(model.created_at)))
+            ).scalar_one_or_none()
+            if value is not None and (earliest is None or _as_utc(value) < earliest):
+                earliest = _as_utc(value)
+        return None if earliest is None else _floor_day(earliest)
+
+    async def refresh_daily_rollup(self, since: Optional[datetime] = None) -> int:
+        """
+        Roll closed UTC days up into ``dashboard_daily_rollup``.
+
+        Without ``since`` the days after the last rolled-up one are added (on
+        an empty rollup: every day since the oldest row), so the call is
+        cheap and idempotent. With ``since`` every closed day from that one
+        on is recomputed, which repairs rows written into a closed day after
+        it was rolled up. One grouped pass per source table; every metric
+        gets a row for every day, including days without activity.
+
+        Args:
+            since (Optional[datetime]): First day to recompute.
+
+        Returns:
+            int: Rollup rows written.
+        """
+        today = _floor_day(datetime.now(timezone.utc))
+        async with self.session_factory() as session:
+            if since is not None:
+                since = _floor_day(since)
+            else:
+                coverage = await self._read_rollup_coverage(session)
+                if coverage is not None:
+                    since = coverage[1] + _DAY
+                else:
+                    since = await self._earliest_day(session)
+            if since is None or since >= today:
+                return 0
+
+            written = await self._upsert_rollup_days(session, since, today)
+            await session.commit()
+        return written
+
+    async def recompute_rollup_days(
+        self,
+        first: datetime,
+        last: datetime,
+        session: Optional[AsyncSession] = None,
+        auto_commit: bool = True,
+    ) -> int:
+        """
+        Recompute the rolled-up days from ``first`` to ``last``.
+
+        Used by the paths deleting source rows, which would otherwise leave
+        the rollup counting them: only days already rolled up are rewritten,
+        so an empty rollup stays empty and the next refresh still picks up
+        where the last one stopped.
+
+        Args:
+            first (datetime): Any time on the first affected day.
+            last (datetime): Any time on the last affected day.
+            session (Optional[AsyncSession]): Caller-managed session to reuse.
+            auto_commit (bool): Commit when ``True``; otherwise only flush.
+
+        Returns:
+            int: Rollup rows written.
+        """
+        if session is None and not auto_commit:
+            raise ValueError(
+                "auto_commit=False requires an external session managed by the caller."
+            )
+        if session is None:
+            async with self.session_factory() as managed_session:
+                written = await self._recompute_covered_days(
+                    managed_session, first, last
+                )
+                await managed_session.commit()
+            return written
+        written = await self._recompute_covered_days(session, first, last)
+        if auto_commit:
+            await session.commit()
+        else:
+            await session.flush()
+        return written
+
+    async def _recompute_covered_days(
+        self, session: AsyncSession, first: datetime, last: datetime
+    ) -> int:
+        """Rewrite the days of ``[first, last]`` the rollup already covers."""
+        coverage = await self._read_rollup_coverage(session)
+        if coverage is None:
+            return 0
+        since = max(_floor_day(first), coverage[0])
+        stop = min(_floor_day(last), coverage[1]) + _DAY
+        if since >= stop:
+            return 0
+        return await self._upsert_rollup_days(session, since, stop)
+
+    async def _upsert_rollup_days(
+        self, session: AsyncSession, since: datetime, stop: datetime
+    ) -> int:
+        """Compute and upsert every metric for the days ``[since, stop)``."""
+        rows = []
+        for model, aggregates in self._rollup_sources():
+            day = func.date_trunc("day", model.created_at).label("day")
+            stmt = (
+                select(
+                    day,
+                    func.count().label("rowsCount"),
+                    *(
+                        aggregate.label(metric)
+                        for metric, aggregate in aggregates.items()
+                    ),
+                )
+                .where(model.created_at >= since, model.created_at < stop)
+                .group_by(day)
+            )
+            by_day = {
+                _as_utc(row.day): row for row in (await session.execute(stmt)).all()
+            }
+            current = since
+            while current < stop:
+                found = by_day.get(current)
+                for metric in aggregates:
+                    rows.append(
+                        {
+                            "metric": metric,
+                            "day": current,
+                            "rowsCount": found.rowsCount if found else 0,
+                            "value": (found._mapping[metric] or 0) if found else 0,
+                        }
+                    )
+                current += _DAY
+
+        for offset in range(0, len(rows), _ROLLUP_UPSERT_BATCH):
+            stmt = insert(self.model_rollup).values(
+                rows[offset : offset + _ROLLUP_UPSERT_BATCH]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["metric", "day"],
+                set_={
+                    "rowsCount": stmt.excluded.rowsCount,
+                    "value": stmt.excluded.value,
+                },
+            )
+            await session.execute(stmt)
+        return len(rows)
@@ -0,0 +1,377 @@
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.game_leaderboard import GameLeaderboard
+from app.model.tasks import Tasks
+from app.model.user_points import UserPoints
+from app.model.users import Users
+from app.repository.base_repository import BaseRepository
+
+PERIODS = ("all", "day", "week")
+
+# ``periodStart`` of the all-time board; a fixed value keeps it in the key.
+ALL_TIME_START = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_REBUILD_BATCH = 5_000
+
+
+def period_start(period: str, at: datetime) -> datetime:
+    """
+    Start of the ``period`` window containing ``at``, in UTC.
+
+    Days start at UTC midnight and weeks on Monday (ISO weeks); the
+    all-time board always starts at :data:`ALL_TIME_START`.
+
+    Raises:
+        ValueError: If ``period`` is not one of :data:`PERIODS`.
+    """
+    if period == "all":
+        return ALL_TIME_START
+    if at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    day = at.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    if period == "day":
+        return day
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    raise ValueError(f"Unknown leaderboard period: {period}")
+
+
+def fold_awards(gameId, awards: Iterable, deltas: Optional[dict] = None) -> dict:
+    """
+    Fold awards into per-board score deltas.
+
+    Args:
+        gameId: Game every award belongs to.
+        awards (Iterable): Objects exposing ``userId``, ``points`` and
+            ``created_at``.
+        deltas (Optional[dict]): Fold to extend in place (a new one when
+            ``None``), so a stream can be folded award by award.
+
+    Returns:
+        dict: ``(period, periodStart, userId) -> row`` for every board each
+        award lands on, where a row carries the summed ``points`` and
+        ``awardsCount``.
+    """
+    if deltas is None:
+        deltas = {}
+    for award in awards:
+        for period in PERIODS:
+            key = (period, period_start(period, award.created_at), str(award.userId))
+            delta = deltas.get(key)
+            if delta is None:
+                deltas[key] = {
+                    "gameId": gameId,
+                    "period": period,
+                    "periodStart": key[1],
+                    "userId": award.userId,
+                    "points": award.points or 0,
+                    "awardsCount": 1,
+                }
+                continue
+            delta["points"] += award.points or 0
+            delta["awardsCount"] += 1
+    return deltas
+
+
+class GameLeaderboardRepository(BaseRepository):
+    """
+    Repository for the ``game_leaderboard`` score table.
+
+    Rows are merged by :meth:`record_awards` inside the transaction that
+    writes the awards and recomputed from ``user_points`` by
+    :meth:`rebuild`. A board is ordered by points, then ``userId``, both
+    descending -- a backward walk of ``ix_game_leaderboard_rank`` and the
+    order of a Redis ``ZREVRANGE``. Top-K and the neighbours of a user are
+    index range scans; a rank is one count over the scores above the user.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]],
+        model=GameLeaderboard,
+    ) -> None:
+        super().__init__(session_factory, model)
+
+    async def record_awards(
+        self,
+        gameId,
+        awards: Iterable,
+        session: Optional[AsyncSession] = None,
+        auto_commit: bool = True,
+    ) -> None:
+        """
+        Add newly written ``user_points`` rows to the game's boards.
+
+        Awards are folded per board and user and applied with one multi-row
+        ``INSERT ... ON CONFLICT DO UPDATE`` that adds to the stored score.
+
+        Args:
+            gameId: Game the awards belong to.
+            awards (Iterable): ``user_points`` rows (or objects exposing
+                ``userId``, ``points`` and ``created_at``).
+            session (Optional[AsyncSession]): Caller-managed session to reuse.
+            auto_commit (bool): Commit when ``True``; otherwise only flush.
+        """
+        if session is None and not auto_commit:
+            raise ValueError(
+                "auto_commit=False requires an external session managed by the caller."
+            )
+        rows = list(fold_awards(gameId, awards).values())
+        if not rows:
+            return
+        if session is None:
+            async with self.session_factory() as managed_session:
+                await self._upsert_scores(rows, managed_session)
+                await managed_session.commit()
+            return
+        await self._upsert_scores(rows, session)
+        if auto_commit:
+            await session.commit()
+        else:
+            await session.flush()
+
+    async def _upsert_scores(self, rows: list, session: AsyncSession) -> None:
+        """Apply pre-folded score deltas with one multi-row upsert."""
+        table = self.model.__table__
+        insert_stmt = insert(table).values(rows)
+        stored, incoming = table.c, insert_stmt.excluded
+        await session.execute(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[
+                    stored.gameId,
+                    stored.period,
+                    stored.periodStart,
+                    stored.userId,
+                ],
+                set_={
+                    "points": stored.points + incoming.points,
+                    "awardsCount": stored.awardsCount + incoming.awardsCount,
+                },
+            )
+        )
+
+    async def rebuild(self, gameId=None) -> int:
+        """
+        Recompute the boards from ``user_points`` in one transaction.
+
+        Used to backfill the table after the migration that creates it and
+        to repair drift. Awards are streamed and folded with the same code
+        the write path uses, so a rebuilt board matches an incrementally
+        maintained one. Existing rows in scope are replaced.
+
+        Args:
+            gameId: Restrict the rebuild to one game (all when ``None``).
+
+        Returns:
+            int: Number of leaderboard rows written.
+        """
+        awards = select(
+            Tasks.gameId, UserPoints.userId, UserPoints.points, UserPoints.created_at
+        ).join(Tasks, UserPoints.taskId == Tasks.id)
+        if gameId is not None:
+            awards = awards.filter(Tasks.gameId == gameId)
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(self.model)
+                .where(*self._scope_filter(gameId))
+                .execution_options(synchronize_session=False)
+            )
+            folds: dict = {}
+            async for award in await session.stream(awards):
+                fold_awards(award.gameId, (award,), folds.setdefault(award.gameId, {}))
+            written = 0
+            for fold in folds.values():
+                rows = list(fold.values())
+                for start in range(0, len(rows), _REBUILD_BATCH):
+                    await session.execute(
+                        insert(self.model.__table__),
+                        rows[start : start + _REBUILD_BATCH],
+                    )
+                written += len(rows)
+            await session.commit()
+            return written
+
+    def _scope_filter(self, gameId):
+        """Filter rows to one game (``None`` for all)."""
+        if gameId is None:
+            return ()
+        return (self.model.gameId == gameId,)
+
+    def _board(self, gameId, period: str, start: datetime):
+        """Conditions selecting one board."""
+        return (
+            self.model.gameId == gameId,
+            self.model.period == period,
+            self.model.periodStart == start,
+        )
+
+    async def read_boards(self, gameId=None, since: Optional[datetime] = None):
+        """
+        The boards present in the table.
+
+        Args:
+            gameId: Restrict to one game (all when ``None``).
+            since (Optional[datetime]): Skip windowed boards starting before
+                this instant; the all-time board is always included.
+
+        Returns:
+            list: Rows of ``(gameId, period, periodStart)``.
+        """
+        stmt = select(self.model.gameId, self.model.period, self.model.periodStart)
+        stmt = stmt.where(*self._scope_filter(gameId)).distinct()
+        if since is not None:
+            stmt = stmt.where(
+                or_(self.model.period == "all", self.model.periodStart >= since)
+            )
+        async with self.session_factory() as session:
+            return (await session.execute(stmt)).all()
+
+    async def read_board(self, gameId, period: str, start: datetime) -> list:
+        """
+        Every score on one board, unordered.
+
+        Returns:
+            list: Rows of ``(userId, points)``.
+        """
+        async with self.session_factory() as session:
+            stmt = select(self.model.userId, self.model.points).where(
+                *self._board(gameId, period, start)
+            )
+            return (await session.execute(stmt)).all()
+
+    async def read_top(self, gameId, period: str, start: datetime, limit: int) -> list:
+        """
+        The ``limit`` best scores of a board.
+
+        Returns:
+            list: Rows of ``(userId, points)`` in board order.
+        """
+        async with self.session_factory() as session:
+            stmt = (
+                select(self.model.userId, self.model.points)
+                .where(*self._board(gameId, period, start))
+                .order_by(self.model.points.desc(), self.model.userId.desc())
+                .limit(limit)
+            )
+            return (await session.execute(stmt)).all()
+
+    async def read_standing(self, gameId, period: str, start: datetime, userId):
+        """
+        A user's score and position on a board.
+
+        Returns:
+            Row | None: ``(points, higher, position)`` where ``higher`` counts
+            the strictly better scores (the rank is ``higher + 1``) and
+            ``position`` is the user's 0-based index in board order; ``None``
+            when the user is not on the board.
+        """
+        async with self.session_factory() as session:
+            points = (
+                await session.execute(
+                    select(self.model.points).where(
+                        *self._board(gameId, period, start),
+                        self.model.userId == userId,
+                    )
+                )
+            ).scalar_one_or_none()
+            if points is None:
+                return None
+            higher = select(func.count()).where(
+                *self._board(gameId, period, start), self.model.points > points
+            )
+            tied_before = select(func.count()).where(
+                *self._board(gameId, period, start),
+                self.model.points == points,
+                self.model.userId > userId,
+            )
+            row = (
+                await session.execute(
+                    select(
+                        higher.scalar_subquery().label("higher"),
+                        tied_before.scalar_subquery().label("tied_before"),
+                    )
+                )
+            ).one()
+            return _Standing(points, row.higher, row.higher + row.tied_before)
+
+    async def read_neighbours(
+        self, gameId, period: str, start: datetime, userId, points: int, count: int
+    ) -> tuple:
+        """
+        Up to ``count`` entries either side of a user, in board order.
+
+        Returns:
+            tuple[list, list]: ``(above, below)`` rows of ``(userId,
+            points)``, both in board order.
+        """
+        board = self._board(gameId, period, start)
+        before = or_(
+            self.model.points > points,
+            and_(self.model.points == points, self.model.userId > userId),
+        )
+        after = or_(
+            self.model.points < points,
+            and_(self.model.points == points, self.model.userId < userId),
+        )
+        columns = (self.model.userId, self.model.points)
+        async with self.session_factory() as session:
+            above = (
+                await session.execute(
+                    select(*columns)
+                    .where(*board, before)
+                    .order_by(self.model.points, self.model.userId)
+                    .limit(count)
+                )
+            ).all()
+            below = (
+                await session.execute(
+                    select(*columns)
+                    .where(*board, after)
+                    .order_by(self.model.points.desc(), self.model.userId.desc())
+                    .limit(count)
+                )
+            ).all()
+        return list(reversed(above)), below
+
+    async def count_higher(self, gameId, period: str, start: datetime, points) -> int:
+        """Number of scores on a board strictly above ``points``."""
+        async with self.session_factory() as session:
+            return (
+                await session.execute(
+                    select(func.count()).where(
+                        *self._board(gameId, period, start),
+                        self.model.points > points,
+                    )
+                )
+            ).scalar_one()
+
+    async def read_external_user_ids(self, user_ids) -> dict:
+        """Map ``str(userId)`` to ``externalUserId`` for ``user_ids``."""
+        if not user_ids:
+            return {}
+        async with self.session_factory() as session:
+            rows = (
+                await session.execute(
+                    select(Users.id, Users.externalUserId).where(Users.id.in_(user_ids))
+                )
+            ).all()
+        return {str(row.id): row.externalUserId for row in rows}
+
+
+class _Standing(tuple):
+    """``(points, higher, position)`` with attribute access."""
+
+    __slots__ = ()
+
+    def __new__(cls, points, higher, position):
+        return super().__new__(cls, (points, higher, position))
+
+    points = property(lambda self: self[0])
+    higher = property(lambda self: self[1])
+    position = property(lambda self: self[2])
@@ -8,7 +8,6 @@ from sqlalchemy import update as sa_update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import configs
 from app.core.exceptions import DuplicatedError, NotFoundError
 from app.model.game_params import GamesParams
 from app.model.games import Games
@@ -16,6 +15,7 @@ from app.model.task_params import TasksParams
 from app.model.tasks import Tasks
 from app.model.user_points import UserPoints
 from app.repository.base_repository import BaseRepository
+from app.repository.dashboard_repository import DashboardRepository
 from app.schema.games_schema import BaseGameResult, FindGameResult
 from app.util.query_builder import dict_to_sqlalchemy_filter_options
 
@@ -38,6 +38,7 @@ class GameRepository(BaseRepository):
         self.model_game_params = model_game_params
         self.model_tasks_params = model_tasks_params
         self.model_user_points = model_user_points
+        self.dashboard_repository = DashboardRepository(session_factory)
         super().__init__(session_factory, model)
 
     async def get_all_games(
@@ -68,14 +69,7 @@ class GameRepository(BaseRepository):
         """
         async with self.session_factory() as session:
             schema_as_dict = schema.model_dump(exclude_none=True)
-            ordering = schema_as_dict.get("ordering", configs.ORDERING)
-            order_query = (
-                getattr(self.model, ordering[1:]).desc()
-                if ordering.startswith("-")
-                else getattr(self.model, ordering).asc()
-            )
-            page = schema_as_dict.get("page", configs.PAGE)
-            page_size = schema_as_dict.get("page_size", configs.PAGE_SIZE)
+            paging = self._paging(schema_as_dict)
 
             filter_options = dict_to_sqlalchemy_filter_options(
                 self.model, schema_as_dict
@@ -94,12 +88,9 @@ class GameRepository(BaseRepository):
                 if not scope_filters:
                     return FindGameResult(
                         items=[],
-                        search_options={
-                            "page": page,
-                            "page_size": page_size,
-                            "ordering": ordering,
-                            "total_count": 0,
-                        },
+                        search_options=self._search_options(
+                            paging, [], None if paging.count == "none" else 0
+                        ),
                     )
                 where_clause = and_(filter_options, or_(*scope_filters))
 
@@ -107,13 +98,8 @@ class GameRepository(BaseRepository):
             # the current page - the dashboard needs it to render page
             # controls. Counting here (not len(items)) is what makes real
             # pagination possible.
-            total_count = int(
-                (
-                    await session.execute(
-                        select(func.count()).select_from(Games).filter(where_clause)
-                    )
-                ).scalar()
-                or 0
+            total_count = await self._count_rows(
+                session, select(Games).filter(where_clause), paging.count
             )
 
             # Paginate distinct games first. The previous implementation
@@ -121,9 +107,7 @@ class GameRepository(BaseRepository):
             # with N params consumed N rows of the page budget and the page
             # held fewer than page_size games. Selecting games on their own
             # keeps the page sized in games; params are fetched separately.
-            games_stmt = select(Games).filter(where_clause).order_by(order_query)
-            if page_size != "all":
-                games_stmt = games_stmt.limit(page_size).offset((page - 1) * page_size)
+            games_stmt = self._paginate(select(Games).filter(where_clause), paging)
             game_rows = (await session.execute(games_stmt)).scalars().all()
 
             params_by_game = {}
@@ -162,12 +146,7 @@ class GameRepository(BaseRepository):
 
             return FindGameResult(
                 items=items,
-                search_options={
-                    "page": page,
-                    "page_size": page_size,
-                    "ordering": ordering,
-                    "total_count": total_count,
-                },
+                search_options=self._search_options(paging, game_rows, total_count),
             )
 
     async def get_game_by_id(self, id: str):
@@ -312,6 +291,9 @@ class GameRepository(BaseRepository):
         """
         Delete a game by its internal identifier.
 
+        The rolled-up dashboard days of the game and of its removed
+        ``user_points`` rows are recomputed in the same transaction.
+
         Args:
             game_id (str): Internal game identifier.
 
@@ -349,6 +331,24 @@ class GameRepository(BaseRepository):
                     .scalars()
                     .all()
                 )
+                # Span of the dashboard rollup days losing rows.
+                affected = [game.created_at]
+                if tasks:
+                    affected.extend(
+                        (
+                            await session.execute(
+                                select(
+                                    func.min(self.model_user_points.created_at),
+                                    func.max(self.model_user_points.created_at),
+                                ).where(
+                                    self.model_user_points.taskId.in_(
+                                        [task.id for task in tasks]
+                                    )
+                                )
+                            )
+                        ).one()
+                    )
+                affected = [value for value in affected if value is not None]
                 for task in tasks:
                     await session.execute(
                         sa_delete(self.model_tasks_params).where(
@@ -368,6 +368,13 @@ class GameRepository(BaseRepository):
                 )
 
                 await session.delete(game)
+                if affected:
+                    await self.dashboard_repository.recompute_rollup_days(
+                        min(affected),
+                        max(affected),
+                        session=session,
+                        auto_commit=False,
+                    )
                 await session.commit()
                 return True
         except IntegrityError as e:
@@ -1,6 +1,9 @@
 from contextlib import AbstractAsyncContextManager
-from typing import Callable
+from datetime import datetime, timezone
+from typing import Callable, Sequence
+from uuid import uuid4
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.model.logs import Logs
@@ -32,3 +35,29 @@ class LogsRepository(BaseRepository):
             model: The SQLAlchemy model class for Logs.
         """
         super().__init__(session_factory, model)
+
+    async def insert_many(self, entries: Sequence) -> int:
+        """
+        Insert several log entries with one multi-row ``INSERT``.
+
+        Used by the buffered audit-log writer to flush a whole batch in a
+        single statement and commit, instead of one transaction per entry.
+
+        Args:
+            entries (Sequence): ``CreateLogs`` schemas (or any objects with
+                ``model_dump``) to persist.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+        now = datetime.now(timezone.utc)
+        rows = [
+            {"id": uuid4(), "created_at": now, "updated_at": now, **entry.model_dump()}
+            for entry in entries
+        ]
+        if not rows:
+            return 0
+        async with self.session_factory() as session:
+            await session.execute(insert(self.model), rows)
+            await session.commit()
+        return len(rows)
@@ -1,5 +1,5 @@
 from contextlib import AbstractAsyncContextManager
-from typing import Callable
+from typing import Callable, Dict, Iterable, List
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,6 +8,11 @@ from app.core.exceptions import NotFoundError
 from app.model.task_params import TasksParams
 from app.repository.base_repository import BaseRepository
 
+# Task ids bound per ``taskId IN (...)`` query, well under asyncpg's 32767
+# bind-parameter limit; a listing of every task of a huge game takes a few
+# queries instead of failing.
+_TASK_IDS_PER_QUERY = 10_000
+
 
 class TaskParamsRepository(BaseRepository):
     """
@@ -35,6 +40,30 @@ class TaskParamsRepository(BaseRepository):
         """
         super().__init__(session_factory, model)
 
+    async def read_by_taskIds(self, taskIds: Iterable) -> Dict[object, List]:
+        """
+        Load the params of many tasks with one ``taskId IN (...)`` query.
+
+        Args:
+            taskIds: Internal identifiers of the tasks.
+
+        Returns:
+            dict: ``{taskId: [TasksParams, ...]}``; tasks without params are
+            absent.
+        """
+        task_ids = list(dict.fromkeys(taskIds or []))
+        params_by_task: Dict[object, List] = {}
+        if not task_ids:
+            return params_by_task
+        async with self.session_factory() as session:
+            for start in range(0, len(task_ids), _TASK_IDS_PER_QUERY):
+                stmt = select(self.model).filter(
+                    self.model.taskId.in_(task_ids[start : start + _TASK_IDS_PER_QUERY])
+                )
+                for param in (await session.execute(stmt)).scalars().all():
+                    params_by_task.setdefault(param.taskId, []).append(param)
+        return params_by_task
+
     async def patch_task_params_by_id(self, id, schema):
         """
         Updates a task parameter row in place by its id.
@@ -6,15 +6,13 @@ from sqlalchemy import func, select
 from sqlalchemy import update as sa_update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from app.core.config import configs
 from app.core.exceptions import DuplicatedError, NotFoundError
 from app.model.task_params import TasksParams
 from app.model.tasks import Tasks
 from app.model.user_points import UserPoints
 from app.repository.base_repository import BaseRepository
-from app.util.query_builder import dict_to_sqlalchemy_filter_options
+from app.repository.dashboard_repository import DashboardRepository
 
 
 class TaskRepository(BaseRepository):
@@ -31,49 +29,17 @@ class TaskRepository(BaseRepository):
     ) -> None:
         self.model_task_params = model_task_params
         self.model_user_points = model_user_points
+        self.dashboard_repository = DashboardRepository(session_factory)
         super().__init__(session_factory, model)
 
     async def read_by_gameId(self, schema, eager: bool = False):
         """
         Reads tasks filtered by gameId (and any other schema fields).
-        """
-        async with self.session_factory() as session:
-            schema_as_dict = schema.model_dump(exclude_none=True)
-            ordering = schema_as_dict.get("ordering", configs.ORDERING)
-            order_query = (
-                getattr(self.model, ordering[1:]).desc()
-                if ordering.startswith("-")
-                else getattr(self.model, ordering).asc()
-            )
-            page = schema_as_dict.get("page", configs.PAGE)
-            page_size = schema_as_dict.get("page_size", configs.PAGE_SIZE)
-            filter_options = dict_to_sqlalchemy_filter_options(
-                self.model, schema.model_dump(exclude_none=True)
-            )
-
-            stmt = select(self.model).filter(filter_options)
-            if eager:
-                for eager_rel in getattr(self.model, "eagers", []):
-                    stmt = stmt.options(joinedload(getattr(self.model, eager_rel)))
 
-            count_stmt = select(func.count()).select_from(
-                select(self.model).filter(filter_options).subquery()
-            )
-            stmt = stmt.order_by(order_query)
-            if page_size != "all":
-                stmt = stmt.limit(page_size).offset((page - 1) * page_size)
-
-            items = (await session.execute(stmt)).unique().scalars().all()
-            total_count = (await session.execute(count_stmt)).scalar_one()
-            return {
-                "items": items,
-                "search_options": {
-                    "page": page,
-                    "page_size": page_size,
-                    "ordering": ordering,
-                    "total_count": total_count,
-                },
-            }
+        Same paging contract as :meth:`BaseRepository.read_by_options`,
+        including ``cursor`` and ``count``.
+        """
+        return await self.read_by_options(schema, eager=eager)
 
     async def read_by_gameId_and_externalTaskId(self, gameId, externalTaskId: str):
         """
@@ -93,6 +59,33 @@ class TaskRepository(BaseRepository):
             )
             return (await session.execute(stmt)).scalars().first()
 
+    async def read_by_gameId_and_externalTaskIds(self, gameId, externalTaskIds):
+        """
+        Batched form of :meth:`read_by_gameId_and_externalTaskId`.
+
+        Resolves every requested external task of a game in one
+        ``externalTaskId IN (...)`` query, served by
+        ``ix_tasks_game_external_task``.
+
+        Args:
+            gameId: Internal identifier of the owning game.
+            externalTaskIds: Iterable of external task identifiers.
+
+        Returns:
+            dict: ``{externalTaskId: Tasks}`` for the tasks that exist;
+            missing identifiers are simply absent.
+        """
+        external_task_ids = list(dict.fromkeys(externalTaskIds or []))
+        if not external_task_ids:
+            return {}
+        async with self.session_factory() as session:
+            stmt = select(self.model).filter(
+                self.model.gameId == gameId,
+                self.model.externalTaskId.in_(external_task_ids),
+            )
+            tasks = (await session.execute(stmt)).scalars().all()
+            return {task.externalTaskId: task for task in tasks}
+
     async def get_points_and_users_by_taskId(self, taskId):
         """
         Fetch a task by its internal id, raising if it does not exist.
@@ -141,8 +134,9 @@ class TaskRepository(BaseRepository):
         Mirrors the per-task branch of
         :meth:`GameRepository.delete_game_by_id`: task params and the
         user-points rows that reference the task are removed first so the
-        FK constraints don't block the final ``DELETE`` on the task row.
-        Returns ``True`` on success.
+        FK constraints don't block the final ``DELETE`` on the task row,
+        and the rolled-up dashboard days of those rows are recomputed in
+        the same transaction. Returns ``True`` on success.
 
         Raises :class:`NotFoundError` if the task does not exist.
         """
@@ -165,12 +159,24 @@ class TaskRepository(BaseRepository):
                         self.model_task_params.taskId == task_id
                     )
                 )
+                first, last = (
+                    await session.execute(
+                        select(
+                            func.min(self.model_user_points.created_at),
+                            func.max(self.model_user_points.created_at),
+                        ).where(self.model_user_points.taskId == task_id)
+                    )
+                ).one()
                 await session.execute(
                     sa_delete(self.model_user_points).where(
                         self.model_user_points.taskId == task_id
                     )
                 )
                 await session.delete(task)
+                if first is not None:
+                    await self.dashboard_repository.recompute_rollup_days(
+                        first, last, session=session, auto_commit=False
+                    )
                 await session.commit()
                 return True
         except IntegrityError as e:
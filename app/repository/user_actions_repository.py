@@ -1,9 +1,11 @@
 from contextlib import AbstractAsyncContextManager
-from typing import Callable
+from typing import Any, AsyncIterator, Callable
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.model.user_actions import UserActions
+from app.model.users import Users
 from app.repository.base_repository import BaseRepository
 from app.schema.task_schema import AddActionDidByUserInTask
 
@@ -61,3 +63,43 @@ class UserActionsRepository(BaseRepository):
             await session.commit()
             await session.refresh(entity)
             return entity
+
+    async def stream_game_actions(
+        self, externalGameId: str, *, since=None, until=None
+    ) -> AsyncIterator[Any]:
+        """
+        Stream the actions tagged with a game, in chronological order.
+
+        Actions are not linked to games or tasks; only those whose ``data``
+        carries ``externalGameId`` (and an ``externalTaskId``) are matched.
+
+        Args:
+            externalGameId (str): External identifier of the game.
+            since: Only actions created at or after this instant.
+            until: Only actions created before this instant.
+
+        Yields:
+            Row: ``(created_at, externalTaskId, externalUserId, data)``
+            ordered by ``created_at`` then ``id``.
+        """
+        external_task_id = UserActions.data["externalTaskId"].as_string()
+        stmt = (
+            select(
+                UserActions.created_at,
+                external_task_id.label("externalTaskId"),
+                Users.externalUserId,
+                UserActions.data,
+            )
+            .join(Users, UserActions.userId == Users.id)
+            .filter(UserActions.data["externalGameId"].as_string() == externalGameId)
+            .filter(external_task_id.is_not(None))
+            .order_by(UserActions.created_at, UserActions.id)
+        )
+        if since is not None:
+            stmt = stmt.filter(UserActions.created_at >= since)
+        if until is not None:
+            stmt = stmt.filter(UserActions.created_at < until)
+        async with self.session_factory() as session:
+            result = await session.stream(stmt)
+            async for row in result:
+                yield row
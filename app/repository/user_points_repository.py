@@ -1,20 +1,60 @@
 from contextlib import AbstractAsyncContextManager
 from datetime import timedelta, timezone
-from typing import Callable, Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, case, func, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import configs
 from app.model.games import Games
 from app.model.tasks import Tasks
 from app.model.user_points import UserPoints
+from app.model.user_task_stats import UserTaskStats
 from app.model.users import Users
 from app.repository.base_repository import BaseRepository
+from app.repository.game_leaderboard_repository import GameLeaderboardRepository
+from app.repository.user_task_stats_repository import UserTaskStatsRepository
+from app.schema.user_points_schema import EffortSnapshot, ScoringSnapshot
+
+
+def _mean_gap_seconds(count, first_at, last_at):
+    """
+    Mean seconds between consecutive timestamps, from ``count``/``min``/``max``.
+
+    The consecutive differences of a sorted series sum to ``last - first``,
+    so their mean is ``(last - first) / (count - 1)``.
+
+    Returns:
+        float: The mean gap, or ``-1`` when fewer than two timestamps exist.
+    """
+    if count < 2:
+        return -1
+    return (last_at - first_at).total_seconds() / (count - 1)
+
+
+def _as_utc(value):
+    """Attach UTC to naive datetimes (SQLite drops the offset)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _average_minutes(minutes_sum, minutes_count):
+    """Mean of the rolled-up minutes, or ``-1`` when none were reported."""
+    if not minutes_count:
+        return -1
+    return minutes_sum / minutes_count
 
 
 class UserPointsRepository(BaseRepository):
     """
     Async repository class for user points.
+
+    When ``USER_TASK_STATS_READS_ENABLED`` is set, the scoring analytics read
+    the per-(task, user) ``user_task_stats`` rollup instead of aggregating
+    ``user_points``, so per-user answers cost one row however many awards the
+    user has. Task- and game-wide answers then cost one row per user rather
+    than one per award.
     """
 
     def __init__(
@@ -24,8 +64,88 @@ class UserPointsRepository(BaseRepository):
     ) -> None:
         self.task_repository = BaseRepository(session_factory, Tasks)
         self.user_repository = BaseRepository(session_factory, Users)
+        self.task_stats_repository = UserTaskStatsRepository(session_factory)
+        self.leaderboard_repository = GameLeaderboardRepository(session_factory)
         super().__init__(session_factory, model)
 
+    def _task_stats_query(
+        self, *, externalTaskId=None, externalGameId=None, externalUserId=None
+    ):
+        """
+        Aggregate the ``user_task_stats`` rows matching the given scope.
+
+        Args:
+            externalTaskId: Restrict to tasks with this external id.
+            externalGameId: Restrict to this game's tasks.
+            externalUserId: Restrict to this user.
+
+        Returns:
+            Select: One row with ``awards_count``, ``first_at``, ``last_at``,
+            ``minutes_sum``, ``minutes_count`` and the database
+            ``current_time``.
+        """
+        stmt = select(
+            func.coalesce(func.sum(UserTaskStats.awardsCount), 0).label("awards_count"),
+            func.min(UserTaskStats.firstAt).label("first_at"),
+            func.max(UserTaskStats.lastAt).label("last_at"),
+            func.coalesce(func.sum(UserTaskStats.minutesSum), 0).label("minutes_sum"),
+            func.coalesce(func.sum(UserTaskStats.minutesCount), 0).label(
+                "minutes_count"
+            ),
+            func.now().label("current_time"),
+        ).select_from(UserTaskStats)
+        stmt = stmt.join(Tasks, UserTaskStats.taskId == Tasks.id)
+        if externalTaskId is not None:
+            stmt = stmt.filter(Tasks.externalTaskId == externalTaskId)
+        if externalGameId is not None:
+            stmt = stmt.join(Games, Tasks.gameId == Games.id).filter(
+                Games.externalGameId == externalGameId
+            )
+        if externalUserId is not None:
+            stmt = stmt.join(Users, UserTaskStats.userId == Users.id).filter(
+                Users.externalUserId == externalUserId
+            )
+        return stmt
+
+    async def _read_task_stats(self, **scope):
+        """Run :meth:`_task_stats_query` for ``scope`` and return its row."""
+        async with self.session_factory() as session:
+            return (await session.execute(self._task_stats_query(**scope))).one()
+
+    @staticmethod
+    def _stats_previous_award_at(externalTaskId, externalUserId):
+        """
+        Second latest award time of a user on a task, from the rollups.
+
+        Each rollup holds its row's two latest awards, so the user's second
+        latest award overall is the second largest of those values.
+
+        Returns:
+            ScalarSelect: Uncorrelated scalar subquery (``NULL`` with fewer
+            than two awards).
+        """
+        user_rollups = (
+            select(UserTaskStats.lastAt, UserTaskStats.previousAt)
+            .join(Tasks, UserTaskStats.taskId == Tasks.id)
+            .join(Users, UserTaskStats.userId == Users.id)
+            .filter(Tasks.externalTaskId == externalTaskId)
+            .filter(Users.externalUserId == externalUserId)
+            .subquery()
+        )
+        award_times = union_all(
+            select(user_rollups.c.lastAt.label("at")),
+            select(user_rollups.c.previousAt.label("at")),
+        ).subquery()
+        return (
+            select(award_times.c.at)
+            .filter(award_times.c.at.is_not(None))
+            .order_by(award_times.c.at.desc())
+            .offset(1)
+            .limit(1)
+            .correlate(None)
+            .scalar_subquery()
+        )
+
     async def get_first_user_points_in_external_task_id_by_user_id(
         self, externalTaskId, externalUserId
     ):
@@ -79,6 +199,44 @@ class UserPointsRepository(BaseRepository):
         )
         return (await session.execute(stmt)).scalars().first()
 
+    async def read_by_idempotency_keys(
+        self,
+        keys,
+        session: Optional[AsyncSession] = None,
+    ) -> dict:
+        """
+        Batched form of :meth:`read_by_user_task_and_idempotency`.
+
+        Args:
+            keys: Iterable of ``(user_id, task_id, idempotency_key)`` triples.
+            session (Optional[AsyncSession]): Caller-managed session to reuse.
+
+        Returns:
+            dict: ``{(str(user_id), str(task_id), idempotency_key): UserPoints}``
+            for the triples that were already persisted.
+        """
+        keys = [key for key in keys or [] if key[2]]
+        if not keys:
+            return {}
+        if session is None:
+            async with self.session_factory() as managed_session:
+                return await self.read_by_idempotency_keys(
+                    keys, session=managed_session
+                )
+
+        wanted = {(str(u), str(t), k) for u, t, k in keys}
+        stmt = select(self.model).filter(
+            self.model.userId.in_({u for u, _, _ in keys}),
+            self.model.taskId.in_({t for _, t, _ in keys}),
+            self.model.idempotencyKey.in_({k for _, _, k in keys}),
+        )
+        found = {}
+        for row in (await session.execute(stmt)).scalars().all():
+            triple = (str(row.userId), str(row.taskId), row.idempotencyKey)
+            if triple in wanted:
+                found[triple] = row
+        return found
+
     async def get_all_UserPoints_by_gameId(self, gameId):
         """
         Aggregate points per (task, user) for every task in a game.
@@ -252,6 +410,98 @@ class UserPointsRepository(BaseRepository):
             )
             return (await session.execute(stmt)).all()
 
+    async def get_first_actions_by_taskIds(self, task_ids):
+        """
+        First award per (task, user) for every task in ``task_ids``.
+
+        One ``MIN(created_at)`` grouped over ``(taskId, user)`` and joined
+        with ``users`` replaces the per-row user lookup and first-award query
+        ``get_users_by_gameId`` used to issue. ``ix_user_points_task_user_created``
+        covers the filter, the grouping and the aggregate.
+
+        Args:
+            task_ids: Iterable of internal task identifiers.
+
+        Returns:
+            list: Rows of ``(taskId, externalUserId, userCreatedAt,
+            firstAction)`` ordered by task and then first award. Empty list
+            when ``task_ids`` is empty.
+        """
+        if not task_ids:
+            return []
+        async with self.session_factory() as session:
+            first_action = func.min(UserPoints.created_at)
+            stmt = (
+                select(
+                    UserPoints.taskId.label("taskId"),
+                    Users.externalUserId.label("externalUserId"),
+                    Users.created_at.label("userCreatedAt"),
+                    first_action.label("firstAction"),
+                )
+                .join(UserPoints, Users.id == UserPoints.userId)
+                .filter(UserPoints.taskId.in_(task_ids))
+                .group_by(
+                    UserPoints.taskId,
+                    Users.id,
+                    Users.externalUserId,
+                    Users.created_at,
+                )
+                .order_by(UserPoints.taskId, first_action)
+            )
+            return (await session.execute(stmt)).all()
+
+    async def get_user_points_by_game_and_task(self, externalUserId):
+        """
+        Aggregate one user's points per (game, task) across every game.
+
+        The user-centric readers used to load each game the user touched and
+        aggregate it for *all* users, once per task row. This reads only the
+        user's own awards, grouped in a single query. Each row carries the
+        game's ownership columns so callers can apply the game access check
+        without reloading it.
+
+        Args:
+            externalUserId: External identifier of the user.
+
+        Returns:
+            list: Rows of ``(gameId, externalGameId, gameCreatedAt,
+            apiKey_used, oauth_user_id, externalTaskId, points, timesAwarded,
+            pointsData)`` ordered by game and task, where ``pointsData``
+            aggregates each award's ``points``, ``caseName`` and
+            ``created_at`` as in :meth:`get_points_and_users_by_taskIds`.
+        """
+        async with self.session_factory() as session:
+            stmt = (
+                select(
+                    Games.id.label("gameId"),
+                    Games.externalGameId.label("externalGameId"),
+                    Games.created_at.label("gameCreatedAt"),
+                    Games.apiKey_used.label("apiKey_used"),
+                    Games.oauth_user_id.label("oauth_user_id"),
+                    Tasks.externalTaskId.label("externalTaskId"),
+                    func.sum(UserPoints.points).label("points"),
+                    func.count(UserPoints.id).label("timesAwarded"),
+                    func.array_agg(
+                        func.json_build_object(
+                            "points",
+                            UserPoints.points,
+                            "caseName",
+                            UserPoints.caseName,
+                            "created_at",
+                            UserPoints.created_at,
+                        )
+                    ).label("pointsData"),
+                )
+                .select_from(Users)
+                .join(UserPoints, Users.id == UserPoints.userId)
+                .join(Tasks, UserPoints.taskId == Tasks.id)
+                .join(Games, Tasks.gameId == Games.id)
+                .filter(Users.externalUserId == externalUserId)
+                .group_by(Games.id, Tasks.id)
+                .order_by(Games.externalGameId, Tasks.externalTaskId)
+            )
+            return (await session.execute(stmt)).all()
+
     async def get_task_by_externalUserId(self, externalUserId):
         """
         Return all tasks a user has earned points on.
@@ -390,6 +640,9 @@ class UserPointsRepository(BaseRepository):
         Returns:
             int: Number of points rows linked to the task.
         """
+        if configs.USER_TASK_STATS_READS_ENABLED:
+            row = await self._read_task_stats(externalTaskId=external_task_id)
+            return row.awards_count
         async with self.session_factory() as session:
             stmt = (
                 select(func.count(UserPoints.taskId).label("measurement_count"))
@@ -432,6 +685,11 @@ class UserPointsRepository(BaseRepository):
         Returns:
             int: Number of points rows for the user on that task.
         """
+        if configs.USER_TASK_STATS_READS_ENABLED:
+            row = await self._read_task_stats(
+                externalTaskId=externalTaskId, externalUserId=externalUserId
+            )
+            return row.awards_count
         async with self.session_factory() as session:
             stmt = (
                 select(func.count(UserPoints.taskId).label("measurement_count"))
@@ -475,6 +733,12 @@ class UserPointsRepository(BaseRepository):
         """
         Average the gap between a user's consecutive awards on a task.
 
+        Computed in SQL from ``count``/``min``/``max``: the mean of
+        consecutive differences telescopes to ``(last - first) / (n - 1)``,
+        so memory and transfer stay constant however long the history is.
+        ``count(*)`` keeps the aggregate answerable from the
+        ``(taskId, userId, created_at)`` index alone.
+
         Args:
             externalGameId: External identifier of the game.
             externalTaskId: External identifier of the task.
@@ -484,27 +748,29 @@ class UserPointsRepository(BaseRepository):
             float: Mean seconds between consecutive awards, or ``-1`` when the
             user has fewer than two awards.
         """
+        if configs.USER_TASK_STATS_READS_ENABLED:
+            row = await self._read_task_stats(
+                externalGameId=externalGameId,
+                externalTaskId=externalTaskId,
+                externalUserId=externalUserId,
+            )
+            return _mean_gap_seconds(row.awards_count, row.first_at, row.last_at)
         async with self.session_factory() as session:
             stmt = (
-                select(UserPoints.created_at)
+                select(
+                    func.count().label("count"),
+                    func.min(UserPoints.created_at).label("first_at"),
+                    func.max(UserPoints.created_at).label("last_at"),
+                )
                 .join(Tasks, UserPoints.taskId == Tasks.id)
                 .join(Games, Tasks.gameId == Games.id)
                 .join(Users, UserPoints.userId == Users.id)
                 .filter(Games.externalGameId == externalGameId)
                 .filter(Tasks.externalTaskId == externalTaskId)
                 .filter(Users.externalUserId == externalUserId)
-                .order_by(UserPoints.created_at)
             )
-            timestamps = (await session.execute(stmt)).all()
-
-            if len(timestamps) < 2:
-                return -1
-
-            time_diffs = [
-                (timestamps[i + 1][0] - timestamps[i][0]).total_seconds()
-                for i in range(len(timestamps) - 1)
-            ]
-            return sum(time_diffs) / len(time_diffs)
+            row = (await session.execute(stmt)).one()
+            return _mean_gap_seconds(row.count, row.first_at, row.last_at)
 
     async def get_avg_time_between_tasks_for_all_users(
         self, externalGameId, externalTaskId
@@ -512,6 +778,9 @@ class UserPointsRepository(BaseRepository):
         """
         Average the gap between consecutive awards on a task across all users.
 
+        Uses the same constant-memory ``(last - first) / (n - 1)`` aggregate
+        as :meth:`get_avg_time_between_tasks_by_user_and_game_task`.
+
         Args:
             externalGameId: External identifier of the game.
             externalTaskId: External identifier of the task.
@@ -520,25 +789,25 @@ class UserPointsRepository(BaseRepository):
             float: Mean seconds between consecutive awards, or ``-1`` when
             fewer than two awards exist.
         """
+        if configs.USER_TASK_STATS_READS_ENABLED:
+            row = await self._read_task_stats(
+                externalGameId=externalGameId, externalTaskId=externalTaskId
+            )
+            return _mean_gap_seconds(row.awards_count, row.first_at, row.last_at)
         async with self.session_factory() as session:
             stmt = (
-                select(UserPoints.created_at)
+                select(
+                    func.count().label("count"),
+                    func.min(UserPoints.created_at).label("first_at"),
+                    func.max(UserPoints.created_at).label("last_at"),
+                )
                 .join(Tasks, UserPoints.taskId == Tasks.id)
                 .join(Games, Tasks.gameId == Games.id)
                 .filter(Tasks.externalTaskId == externalTaskId)
                 .filter(Games.externalGameId == externalGameId)
-                .order_by(UserPoints.created_at)
             )
-            timestamps = (await session.execute(stmt)).all()
-
-            if len(timestamps) < 2:
-                return -1
-
-            time_diffs = [
-                (timestamps[i + 1][0] - timestamps[i][0]).total_seconds()
-                for i in range(len(timestamps) - 1)
-            ]
-            return sum(time_diffs) / len(time_diffs)
+            row = (await session.execute(stmt)).one()
+            return _mean_gap_seconds(row.count, row.first_at, row.last_at)
 
     async def get_last_window_time_diff(self, externalTaskId, externalUserId):
         """
@@ -552,6 +821,19 @@ class UserPointsRepository(BaseRepository):
             float: Seconds between the last two awards, or ``0`` when the user
             has fewer than two.
         """
+        if configs.USER_TASK_STATS_READS_ENABLED:
+            stmt = self._task_stats_query(
+                externalTaskId=externalTaskId, externalUserId=externalUserId
+            ).add_columns(
+                self._stats_previous_award_at(externalTaskId, externalUserId).label(
+                    "previous_at"
+                )
+            )
+            async with self.session_factory() as session:
+                row = (await session.execute(stmt)).one()
+            if row.previous_at is None:
+                return 0
+            return (row.last_at - row.previous_at).total_seconds()
         async with self.session_factory() as session:
             stmt = (
                 select(UserPoints)
@@ -587,6 +869,15 @@ class UserPointsRepository(BaseRepository):
         Returns:
             float: Seconds since the last award, or ``0`` if the user has none.
         """
+        if configs.USER_TASK_STATS_READS_ENABLED:
+            row = await self._read_task_stats(
+                externalGameId=externalGameId,
+                externalTaskId=externalTaskId,
+                externalUserId=externalUserId,
+            )
+            if row.last_at is None:
+                return 0
+            return (_as_utc(row.current_time) - _as_utc(row.last_at)).total_seconds()
         async with self.session_factory() as session:
             stmt = (
                 select(UserPoints)
@@ -629,6 +920,11 @@ class UserPointsRepository(BaseRepository):
         Returns:
             int: Number of points rows for the user within the game.
         """
+        if configs.USER_TASK_STATS_READS_ENABLED:
+            row = await self._read_task_stats(
+                externalGameId=externalGameId, externalUserId=externalUserId
+            )
+            return row.awards_count
         async with self.session_factory() as session:
             stmt = (
                 select(func.count(UserPoints.id).label("record_count"))
@@ -655,6 +951,13 @@ class UserPointsRepository(BaseRepository):
         Returns:
             bool: ``True`` if at least one award exists within the window.
         """
+        if configs.USER_TASK_STATS_READS_ENABLED:
+            stmt = self._task_stats_query(
+                externalTaskId=externalTaskId, externalUserId=externalUserId
+            ).filter(UserTaskStats.lastAt > func.now() - timedelta(minutes=minutes))
+            async with self.session_factory() as session:
+                row = (await session.execute(stmt)).one()
+            return row.awards_count > 0
         async with self.session_factory() as session:
             stmt = (
                 select(func.count(UserPoints.id))
@@ -681,6 +984,9 @@ class UserPointsRepository(BaseRepository):
             float: Mean ``minutes`` over all users, or ``-1`` when no
             qualifying rows exist.
         """
+        if configs.USER_TASK_STATS_READS_ENABLED:
+            row = await self._read_task_stats(externalGameId=externalGameId)
+            return _average_minutes(row.minutes_sum, row.minutes_count)
         async with self.session_factory() as session:
             stmt = (
                 select(
@@ -713,6 +1019,11 @@ class UserPointsRepository(BaseRepository):
             float: Mean ``minutes`` for the user, or ``-1`` when no qualifying
             rows exist.
         """
+        if configs.USER_TASK_STATS_READS_ENABLED:
+            row = await self._read_task_stats(
+                externalGameId=externalGameId, externalUserId=externalUserId
+            )
+            return _average_minutes(row.minutes_sum, row.minutes_count)
         async with self.session_factory() as session:
             stmt = (
                 select(
@@ -730,6 +1041,294 @@ class UserPointsRepository(BaseRepository):
             result = (await session.execute(stmt)).one()
             return result.average_minutes if result.average_minutes is not None else -1
 
+    async def get_scoring_snapshot(
+        self, externalGameId, externalTaskId, externalUserId
+    ) -> ScoringSnapshot:
+        """
+        Load every aggregate the pace-based strategies read in one round trip.
+
+        Replaces the six sequential analytics queries used by ``default`` and
+        ``socio_bee`` with a single conditional aggregate over the task's
+        awards. Each aggregate keeps the scope of the query it replaces: the
+        counts and last-window diff span every task with ``externalTaskId``;
+        the average gaps and the time since the last award are scoped to the
+        game. Average gaps use the same aggregate as
+        :meth:`get_avg_time_between_tasks_by_user_and_game_task`.
+
+        Args:
+            externalGameId: External identifier of the game.
+            externalTaskId: External identifier of the task.
+            externalUserId: External identifier of the user.
+
+        Returns:
+            ScoringSnapshot: The aggregates, with the same sentinels as the
+            individual analytics methods.
+        """
+        if configs.USER_TASK_STATS_READS_ENABLED:
+            return await self._get_scoring_snapshot_from_stats(
+                externalGameId, externalTaskId, externalUserId
+            )
+        is_user = Users.externalUserId == externalUserId
+        in_game = Games.externalGameId == externalGameId
+        in_game_for_user = and_(in_game, is_user)
+        previous_at = (
+            select(UserPoints.created_at)
+            .join(Tasks, UserPoints.taskId == Tasks.id)
+            .join(Users, UserPoints.userId == Users.id)
+            .filter(Tasks.externalTaskId == externalTaskId)
+            .filter(Users.externalUserId == externalUserId)
+            .order_by(UserPoints.created_at.desc())
+            .offset(1)
+            .limit(1)
+            .correlate(None)
+            .scalar_subquery()
+        )
+        async with self.session_factory() as session:
+            stmt = (
+                select(
+                    func.count(UserPoints.id).label("task_count"),
+                    func.count(case((is_user, UserPoints.id))).label("user_count"),
+                    func.max(case((is_user, UserPoints.created_at))).label(
+                        "user_last_at"
+                    ),
+                    previous_at.label("user_previous_at"),
+                    func.count(case((in_game, UserPoints.id))).label("game_count"),
+                    func.min(case((in_game, UserPoints.created_at))).label(
+                        "game_first_at"
+                    ),
+                    func.max(case((in_game, UserPoints.created_at))).label(
+                        "game_last_at"
+                    ),
+                    func.count(case((in_game_for_user, UserPoints.id))).label(
+                        "game_user_count"
+                    ),
+                    func.min(case((in_game_for_user, UserPoints.created_at))).label(
+                        "game_user_first_at"
+                    ),
+                    func.max(case((in_game_for_user, UserPoints.created_at))).label(
+                        "game_user_last_at"
+                    ),
+                    func.now().label("current_time"),
+                )
+                .select_from(UserPoints)
+                .join(Tasks, UserPoints.taskId == Tasks.id)
+                .outerjoin(Games, Tasks.gameId == Games.id)
+                .outerjoin(Users, UserPoints.userId == Users.id)
+                .filter(Tasks.externalTaskId == externalTaskId)
+            )
+            row = (await session.execute(stmt)).one()
+        return self._scoring_snapshot_from_row(row)
+
+    async def _get_scoring_snapshot_from_stats(
+        self, externalGameId, externalTaskId, externalUserId
+    ) -> ScoringSnapshot:
+        """
+        :meth:`get_scoring_snapshot` answered from ``user_task_stats``.
+
+        Same conditional aggregate, over one rollup row per (task, user)
+        instead of one row per award.
+        """
+        is_user = Users.externalUserId == externalUserId
+        in_game = Games.externalGameId == externalGameId
+        in_game_for_user = and_(in_game, is_user)
+        awards = UserTaskStats.awardsCount
+        async with self.session_factory() as session:
+            stmt = (
+                select(
+                    func.coalesce(func.sum(awards), 0).label("task_count"),
+                    func.coalesce(func.sum(case((is_user, awards))), 0).label(
+                        "user_count"
+                    ),
+                    func.max(case((is_user, UserTaskStats.lastAt))).label(
+                        "user_last_at"
+                    ),
+                    self._stats_previous_award_at(externalTaskId, externalUserId).label(
+                        "user_previous_at"
+                    ),
+                    func.coalesce(func.sum(case((in_game, awards))), 0).label(
+                        "game_count"
+                    ),
+                    func.min(case((in_game, UserTaskStats.firstAt))).label(
+                        "game_first_at"
+                    ),
+                    func.max(case((in_game, UserTaskStats.lastAt))).label(
+                        "game_last_at"
+                    ),
+                    func.coalesce(func.sum(case((in_game_for_user, awards))), 0).label(
+                        "game_user_count"
+                    ),
+                    func.min(case((in_game_for_user, UserTaskStats.firstAt))).label(
+                        "game_user_first_at"
+                    ),
+                    func.max(case((in_game_for_user, UserTaskStats.lastAt))).label(
+                        "game_user_last_at"
+                    ),
+                    func.now().label("current_time"),
+                )
+                .select_from(UserTaskStats)
+                .join(Tasks, UserTaskStats.taskId == Tasks.id)
+                .outerjoin(Games, Tasks.gameId == Games.id)
+                .outerjoin(Users, UserTaskStats.userId == Users.id)
+                .filter(Tasks.externalTaskId == externalTaskId)
+            )
+            row = (await session.execute(stmt)).one()
+        return self._scoring_snapshot_from_row(row)
+
+    @staticmethod
+    def _scoring_snapshot_from_row(row) -> ScoringSnapshot:
+        """Derive a :class:`ScoringSnapshot` from its aggregate row."""
+        last_window_time_diff = 0
+        if row.user_count >= 2:
+            last_window_time_diff = (
+                row.user_last_at - row.user_previous_at
+            ).total_seconds()
+
+        new_last_window_time_diff = 0
+        if row.game_user_last_at is not None:
+            new_last_window_time_diff = (
+                _as_utc(row.current_time) - _as_utc(row.game_user_last_at)
+            ).total_seconds()
+
+        return ScoringSnapshot(
+            task_measurements_count=row.task_count,
+            user_task_measurements_count=row.user_count,
+            user_avg_time_between_tasks=_mean_gap_seconds(
+                row.game_user_count, row.game_user_first_at, row.game_user_last_at
+            ),
+            all_avg_time_between_tasks=_mean_gap_seconds(
+                row.game_count, row.game_first_at, row.game_last_at
+            ),
+            last_window_time_diff=last_window_time_diff,
+            new_last_window_time_diff=new_last_window_time_diff,
+        )
+
+    async def get_effort_snapshot(
+        self, externalGameId, externalTaskId, externalUserId, minutes
+    ) -> EffortSnapshot:
+        """
+        Load every aggregate ``greengageStrategy`` reads in one round trip.
+
+        Folds the recent-record check, the personal record count and both
+        ``data["minutes"]`` averages into a single aggregate over the game's
+        awards. The recent-record check keeps its original task scope.
+
+        Args:
+            externalGameId: External identifier of the game.
+            externalTaskId: External identifier of the task.
+            externalUserId: External identifier of the user.
+            minutes: Look-back window of the recent-record check, in minutes.
+
+        Returns:
+            EffortSnapshot: The aggregates, with the same sentinels as the
+            individual analytics methods.
+        """
+        if configs.USER_TASK_STATS_READS_ENABLED:
+            return await self._get_effort_snapshot_from_stats(
+                externalGameId, externalTaskId, externalUserId, minutes
+            )
+        is_user = Users.externalUserId == externalUserId
+        reported_minutes = UserPoints.data["minutes"].as_float()
+        has_minutes = reported_minutes > 0
+        recent_count = (
+            select(func.count(UserPoints.id))
+            .join(Tasks, UserPoints.taskId == Tasks.id)
+            .join(Users, UserPoints.userId == Users.id)
+            .filter(Tasks.externalTaskId == externalTaskId)
+            .filter(Users.externalUserId == externalUserId)
+            .filter(UserPoints.created_at > func.now() - timedelta(minutes=minutes))
+            .correlate(None)
+            .scalar_subquery()
+        )
+        async with self.session_factory() as session:
+            stmt = (
+                select(
+                    recent_count.label("recent_count"),
+                    func.count(case((is_user, UserPoints.id))).label(
+                        "personal_records_count"
+                    ),
+                    func.avg(case((has_minutes, reported_minutes))).label(
+                        "global_avg_minutes"
+                    ),
+                    func.avg(
+                        case((and_(is_user, has_minutes), reported_minutes))
+                    ).label("personal_avg_minutes"),
+                )
+                .select_from(UserPoints)
+                .join(Tasks, UserPoints.taskId == Tasks.id)
+                .join(Games, Tasks.gameId == Games.id)
+                .outerjoin(Users, UserPoints.userId == Users.id)
+                .filter(Games.externalGameId == externalGameId)
+            )
+            row = (await session.execute(stmt)).one()
+
+        return EffortSnapshot(
+            has_recent_record=row.recent_count > 0,
+            personal_records_count=row.personal_records_count,
+            global_avg_minutes=(
+                row.global_avg_minutes if row.global_avg_minutes is not None else -1
+            ),
+            personal_avg_minutes=(
+                row.personal_avg_minutes if row.personal_avg_minutes is not None else -1
+            ),
+        )
+
+    async def _get_effort_snapshot_from_stats(
+        self, externalGameId, externalTaskId, externalUserId, minutes
+    ) -> EffortSnapshot:
+        """
+        :meth:`get_effort_snapshot` answered from ``user_task_stats``.
+
+        The minutes averages are recovered from the rolled-up sums and counts;
+        a recent record exists when a matching rollup's ``lastAt`` falls
+        inside the window.
+        """
+        is_user = Users.externalUserId == externalUserId
+        recent_count = (
+            select(func.count())
+            .select_from(UserTaskStats)
+            .join(Tasks, UserTaskStats.taskId == Tasks.id)
+            .join(Users, UserTaskStats.userId == Users.id)
+            .filter(Tasks.externalTaskId == externalTaskId)
+            .filter(Users.externalUserId == externalUserId)
+            .filter(UserTaskStats.lastAt > func.now() - timedelta(minutes=minutes))
+            .correlate(None)
+            .scalar_subquery()
+        )
+        async with self.session_factory() as session:
+            stmt = (
+                select(
+                    recent_count.label("recent_count"),
+                    func.coalesce(
+                        func.sum(case((is_user, UserTaskStats.awardsCount))), 0
+                    ).label("personal_records_count"),
+                    func.sum(UserTaskStats.minutesSum).label("game_minutes_sum"),
+                    func.sum(UserTaskStats.minutesCount).label("game_minutes_count"),
+                    func.sum(case((is_user, UserTaskStats.minutesSum))).label(
+                        "user_minutes_sum"
+                    ),
+                    func.sum(case((is_user, UserTaskStats.minutesCount))).label(
+                        "user_minutes_count"
+                    ),
+                )
+                .select_from(UserTaskStats)
+                .join(Tasks, UserTaskStats.taskId == Tasks.id)
+                .join(Games, Tasks.gameId == Games.id)
+                .outerjoin(Users, UserTaskStats.userId == Users.id)
+                .filter(Games.externalGameId == externalGameId)
+            )
+            row = (await session.execute(stmt)).one()
+
+        return EffortSnapshot(
+            has_recent_record=row.recent_count > 0,
+            personal_records_count=row.personal_records_count,
+            global_avg_minutes=_average_minutes(
+                row.game_minutes_sum, row.game_minutes_count
+            ),
+            personal_avg_minutes=_average_minutes(
+                row.user_minutes_sum, row.user_minutes_count
+            ),
+        )
+
     async def get_points_of_simulated_task(
         self, externalTaskId: str, simulationHash: str
     ):
@@ -781,6 +1380,49 @@ class UserPointsRepository(BaseRepository):
 
             return (await session.execute(stmt)).scalars().all()
 
+    async def stream_game_points(
+        self, gameId, *, since=None, until=None, with_payload: bool = True
+    ) -> AsyncIterator[Any]:
+        """
+        Stream a game's points rows in chronological order.
+
+        Rows come from a server-side cursor, so the history is never held in
+        memory at once.
+
+        Args:
+            gameId: Internal game identifier.
+            since: Only rows created at or after this instant.
+            until: Only rows created before this instant.
+            with_payload (bool): Also select ``points``, ``caseName`` and
+                ``data``; without it only the timestamp and external ids.
+
+        Yields:
+            Row: ``(created_at, externalTaskId, externalUserId[, points,
+            caseName, data])`` ordered by ``created_at`` then ``id``.
+        """
+        columns = [
+            UserPoints.created_at,
+            Tasks.externalTaskId,
+            Users.externalUserId,
+        ]
+        if with_payload:
+            columns += [UserPoints.points, UserPoints.caseName, UserPoints.data]
+        stmt = (
+            select(*columns)
+            .join(Tasks, UserPoints.taskId == Tasks.id)
+            .join(Users, UserPoints.userId == Users.id)
+            .filter(Tasks.gameId == gameId)
+            .order_by(UserPoints.created_at, UserPoints.id)
+        )
+        if since is not None:
+            stmt = stmt.filter(UserPoints.created_at >= since)
+        if until is not None:
+            stmt = stmt.filter(UserPoints.created_at < until)
+        async with self.session_factory() as session:
+            result = await session.stream(stmt)
+            async for row in result:
+                yield row
+
     async def get_last_task_by_userId(self, userId):
         """
         Return a user's most recent points row.
@@ -113,3 +113,69 @@ class UserRepository(BaseRepository):
                 detail=f"User not found after upsert by externalUserId: {externalUserId}"
             )
         return user
+
+    async def read_by_externalUserIds(self, externalUserIds) -> dict:
+        """
+        Look up several users by external identifier in one query.
+
+        Args:
+            externalUserIds: Iterable of external user identifiers.
+
+        Returns:
+            dict: ``{externalUserId: Users}`` for the users that exist.
+        """
+        external_user_ids = list(dict.fromkeys(externalUserIds or []))
+        if not external_user_ids:
+            return {}
+        async with self.session_factory() as session:
+            stmt = select(self.model).filter(
+                self.model.externalUserId.in_(external_user_ids)
+            )
+            users = (await session.execute(stmt)).scalars().all()
+            return {user.externalUserId: user for user in users}
+
+    async def create_users_by_externalUserIds(
+        self,
+        externalUserIds,
+        oauth_user_id: Optional[str] = None,
+    ) -> dict:
+        """
+        Create several users in one multi-row insert.
+
+        Concurrency-safe like :meth:`create_user_by_externalUserId`: rows a
+        parallel transaction inserted first are skipped via
+        ``ON CONFLICT DO NOTHING`` and then read back, so every requested id
+        is present in the result.
+
+        Args:
+            externalUserIds: Iterable of external user identifiers.
+            oauth_user_id (Optional[str]): OAuth subject stamped on new rows.
+
+        Returns:
+            dict: ``{externalUserId: Users}`` for every requested id.
+        """
+        external_user_ids = list(dict.fromkeys(externalUserIds or []))
+        if not external_user_ids:
+            return {}
+        async with self.session_factory() as session:
+            users_table = self.model.__table__
+            insert_stmt = (
+                insert(users_table)
+                .values(
+                    [
+                        {
+                            "externalUserId": external_user_id,
+                            "oauth_user_id": oauth_user_id,
+                        }
+                        for external_user_id in external_user_ids
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=[users_table.c.externalUserId])
+            )
+            await session.execute(insert_stmt)
+            await session.commit()
+            stmt = select(self.model).filter(
+                self.model.externalUserId.in_(external_user_ids)
+            )
+            users = (await session.execute(stmt)).scalars().all()
+            return {user.externalUserId: user for user in users}
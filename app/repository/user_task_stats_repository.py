@@ -0,0 +1,338 @@
+import math
+from contextlib import AbstractAsyncContextManager
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.tasks import Tasks
+from app.model.user_points import UserPoints
+from app.model.user_task_stats import UserTaskStats
+from app.repository.base_repository import BaseRepository
+
+STAT_FIELDS = (
+    "awardsCount",
+    "pointsSum",
+    "firstAt",
+    "lastAt",
+    "previousAt",
+    "minutesSum",
+    "minutesCount",
+)
+
+
+def positive_minutes(data) -> Optional[float]:
+    """
+    Return ``data["minutes"]`` as a float when it is a positive number.
+
+    Mirrors the ``data["minutes"] > 0`` filter the minutes averages apply in
+    SQL, so rollups and raw queries agree on which awards count.
+    """
+    if not isinstance(data, dict):
+        return None
+    value = data.get("minutes")
+    if isinstance(value, bool):
+        return None
+    try:
+        minutes = float(value)
+    except (TypeError, ValueError):
+        return None
+    return minutes if minutes > 0 else None
+
+
+class UserTaskStatsRepository(BaseRepository):
+    """
+    Repository for the ``user_task_stats`` rollup.
+
+    Rows are merged by :meth:`record_awards` inside the transaction that
+    writes the awards, recomputed from ``user_points`` by :meth:`rebuild` and
+    audited by :meth:`find_inconsistencies`.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]],
+        model=UserTaskStats,
+    ) -> None:
+        super().__init__(session_factory, model)
+
+    async def record_awards(
+        self,
+        awards: Iterable,
+        session: Optional[AsyncSession] = None,
+        auto_commit: bool = True,
+    ) -> None:
+        """
+        Merge newly written ``user_points`` rows into their rollups.
+
+        Awards are folded per ``(taskId, userId)`` and applied with one
+        multi-row ``INSERT ... ON CONFLICT DO UPDATE``. Counts and sums are
+        added. ``firstAt``, ``lastAt`` and ``previousAt`` are merged so the
+        result is right even if an award is older than the stored
+        ``lastAt``.
+
+        Args:
+            awards (Iterable): ``user_points`` rows (or objects exposing
+                ``taskId``, ``userId``, ``points``, ``created_at`` and
+                ``data``).
+            session (Optional[AsyncSession]): Caller-managed session to reuse.
+            auto_commit (bool): Commit when ``True``; otherwise only flush.
+        """
+        if session is None and not auto_commit:
+            raise ValueError(
+                "auto_commit=False requires an external session managed by the caller."
+            )
+        rollups: dict = {}
+        for award in awards:
+            key = (str(award.taskId), str(award.userId))
+            minutes = positive_minutes(award.data)
+            created_at = award.created_at
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollups[key] = {
+                    "taskId": award.taskId,
+                    "userId": award.userId,
+                    "awardsCount": 1,
+                    "pointsSum": award.points or 0,
+                    "firstAt": created_at,
+                    "lastAt": created_at,
+                    "previousAt": None,
+                    "minutesSum": minutes or 0,
+                    "minutesCount": 1 if minutes else 0,
+                }
+                continue
+            rollup["awardsCount"] += 1
+            rollup["pointsSum"] += award.points or 0
+            rollup["firstAt"] = min(rollup["firstAt"], created_at)
+            if created_at >= rollup["lastAt"]:
+                rollup["previousAt"] = rollup["lastAt"]
+                rollup["lastAt"] = created_at
+            elif rollup["previousAt"] is None or created_at > rollup["previousAt"]:
+                rollup["previousAt"] = created_at
+            if minutes:
+                rollup["minutesSum"] += minutes
+                rollup["minutesCount"] += 1
+        if not rollups:
+            return
+        if session is None:
+            async with self.session_factory() as managed_session:
+                await self._upsert_rollups(list(rollups.values()), managed_session)
+                await managed_session.commit()
+            return
+        await self._upsert_rollups(list(rollups.values()), session)
+        if auto_commit:
+            await session.commit()
+        else:
+            await session.flush()
+
+    async def _upsert_rollups(self, rows: list, session: AsyncSession) -> None:
+        """Apply pre-folded rollups with one multi-row upsert."""
+        table = self.model.__table__
+        insert_stmt = insert(table).values(rows)
+        stored, incoming = table.c, insert_stmt.excluded
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[stored.taskId, stored.userId],
+            set_={
+                "awardsCount": stored.awardsCount + incoming.awardsCount,
+                "pointsSum": stored.pointsSum + incoming.pointsSum,
+                "minutesSum": stored.minutesSum + incoming.minutesSum,
+                "minutesCount": stored.minutesCount + incoming.minutesCount,
+                "firstAt": case(
+                    (incoming.firstAt < stored.firstAt, incoming.firstAt),
+                    else_=stored.firstAt,
+                ),
+                "lastAt": case(
+                    (incoming.lastAt >= stored.lastAt, incoming.lastAt),
+                    else_=stored.lastAt,
+                ),
+                # Second latest of the stored and incoming (last, previous)
+                # pairs; a NULL previousAt never wins the comparison.
+                "previousAt": case(
+                    (
+                        incoming.lastAt >= stored.lastAt,
+                        case(
+                            (incoming.previousAt > stored.lastAt, incoming.previousAt),
+                            else_=stored.lastAt,
+                        ),
+                    ),
+                    else_=case(
+                        (stored.previousAt > incoming.lastAt, stored.previousAt),
+                        else_=incoming.lastAt,
+                    ),
+                ),
+            },
+        )
+        await session.execute(upsert_stmt)
+
+    def _expected_stats_query(self, gameId=None):
+        """
+        Recompute every rollup from ``user_points``, optionally for one game.
+
+        Returns:
+            Select: One row per ``(taskId, userId)`` with a column per
+            :data:`STAT_FIELDS` entry.
+        """
+        minutes = UserPoints.data["minutes"].as_float()
+        ranked = select(
+            UserPoints.taskId,
+            UserPoints.userId,
+            UserPoints.created_at,
+            func.row_number()
+            .over(
+                partition_by=(UserPoints.taskId, UserPoints.userId),
+                order_by=UserPoints.created_at.desc(),
+            )
+            .label("recency"),
+        )
+        totals = select(
+            UserPoints.taskId,
+            UserPoints.userId,
+            func.count().label("awardsCount"),
+            func.coalesce(func.sum(UserPoints.points), 0).label("pointsSum"),
+            func.min(UserPoints.created_at).label("firstAt"),
+            func.max(UserPoints.created_at).label("lastAt"),
+            func.coalesce(func.sum(case((minutes > 0, minutes))), 0).label(
+                "minutesSum"
+            ),
+            func.count(case((minutes > 0, 1))).label("minutesCount"),
+        )
+        if gameId is not None:
+            ranked = ranked.join(Tasks, UserPoints.taskId == Tasks.id).filter(
+                Tasks.gameId == gameId
+            )
+            totals = totals.join(Tasks, UserPoints.taskId == Tasks.id).filter(
+                Tasks.gameId == gameId
+            )
+        ranked = ranked.subquery()
+        previous = (
+            select(
+                ranked.c.taskId,
+                ranked.c.userId,
+                ranked.c.created_at.label("previousAt"),
+            )
+            .filter(ranked.c.recency == 2)
+            .subquery()
+        )
+        totals = totals.group_by(UserPoints.taskId, UserPoints.userId).subquery()
+        return select(
+            totals.c.taskId,
+            totals.c.userId,
+            totals.c.awardsCount,
+            totals.c.pointsSum,
+            totals.c.firstAt,
+            totals.c.lastAt,
+            previous.c.previousAt,
+            totals.c.minutesSum,
+            totals.c.minutesCount,
+        ).outerjoin(
+            previous,
+            (previous.c.taskId == totals.c.taskId)
+            & (previous.c.userId == totals.c.userId),
+        )
+
+    def _scope_filter(self, gameId):
+        """Filter rollup rows to one game's tasks (``None`` for all)."""
+        if gameId is None:
+            return ()
+        return (self.model.taskId.in_(select(Tasks.id).filter(Tasks.gameId == gameId)),)
+
+    async def rebuild(self, gameId=None) -> int:
+        """
+        Recompute rollups from ``user_points`` in one transaction.
+
+        Used to backfill the table after the migration that creates it and
+        to repair drift reported by :meth:`find_inconsistencies`. Existing
+        rows in scope are replaced.
+
+        Args:
+            gameId: Restrict the rebuild to one game's tasks (all when
+                ``None``).
+
+        Returns:
+            int: Number of rollup rows written.
+        """
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(self.model)
+                .where(*self._scope_filter(gameId))
+                .execution_options(synchronize_session=False)
+            )
+            await session.execute(
+                insert(self.model.__table__).from_select(
+                    ["taskId", "userId", *STAT_FIELDS],
+                    self._expected_stats_query(gameId),
+                )
+            )
+            written = (
+                await session.execute(
+                    select(func.count())
+                    .select_from(self.model)
+                    .where(*self._scope_filter(gameId))
+                )
+            ).scalar_one()
+            await session.commit()
+            return written
+
+    async def find_inconsistencies(self, gameId=None, limit: int = 100) -> list:
+        """
+        Compare stored rollups with a fresh recomputation from ``user_points``.
+
+        Args:
+            gameId: Restrict the check to one game's tasks (all when ``None``).
+            limit (int): Maximum number of mismatches to return.
+
+        Returns:
+            list[dict]: One entry per mismatching ``(taskId, userId)`` with
+            the ``expected`` and ``actual`` field values (``None`` when the
+            row is missing on that side).
+        """
+        async with self.session_factory() as session:
+            expected_rows = (
+                await session.execute(self._expected_stats_query(gameId))
+            ).all()
+            actual_rows = (
+                await session.execute(
+                    select(self.model.taskId, self.model.userId)
+                    .add_columns(*[getattr(self.model, field) for field in STAT_FIELDS])
+                    .where(*self._scope_filter(gameId))
+                )
+            ).all()
+
+        def _by_key(rows) -> dict:
+            return {
+                (str(row.taskId), str(row.userId)): {
+                    field: getattr(row, field) for field in STAT_FIELDS
+                }
+                for row in rows
+            }
+
+        expected, actual = _by_key(expected_rows), _by_key(actual_rows)
+        mismatches = []
+        for key in sorted(expected.keys() | actual.keys()):
+            want, have = expected.get(key), actual.get(key)
+            if want is not None and have is not None and _same_stats(want, have):
+                continue
+            mismatches.append(
+                {
+                    "taskId": key[0],
+                    "userId": key[1],
+                    "expected": want,
+                    "actual": have,
+                }
+            )
+            if len(mismatches) >= limit:
+                break
+        return mismatches
+
+
+def _same_stats(expected: dict, actual: dict) -> bool:
+    """Field-wise equality, with a float tolerance for ``minutesSum``."""
+    for field in STAT_FIELDS:
+        want, have = expected[field], actual[field]
+        if field == "minutesSum":
+            if not math.isclose(float(want or 0), float(have or 0), abs_tol=1e-6):
+                return False
+        elif want != have:
+            return False
+    return True
@@ -93,3 +93,77 @@ class WalletRepository(BaseRepository):
         if wallet is None:
             raise NotFoundError(detail=f"Wallet not found by id: {wallet_id}")
         return wallet
+
+    async def upsert_points_balances(
+        self,
+        points_deltas: dict,
+        api_key: Optional[str] = None,
+        session: Optional[AsyncSession] = None,
+        auto_commit: bool = True,
+    ) -> dict:
+        """
+        Batched form of :meth:`upsert_points_balance`.
+
+        Applies one points delta per user in a single multi-row
+        ``INSERT ... ON CONFLICT DO UPDATE`` whose conflict branch adds the
+        row's own ``pointsBalance`` (the delta) to the stored balance. Callers
+        must pre-aggregate deltas so each ``user_id`` appears once;
+        PostgreSQL rejects a statement that touches the same row twice.
+
+        Args:
+            points_deltas (dict): ``{user_id: points_delta}``.
+            api_key (Optional[str]): API key stamped on touched wallets.
+            session (Optional[AsyncSession]): Caller-managed session to reuse.
+            auto_commit (bool): Commit when ``True``; otherwise only flush.
+
+        Returns:
+            dict: ``{str(user_id): wallet_id}`` for every upserted wallet.
+        """
+        if session is None and not auto_commit:
+            raise ValueError(
+                "auto_commit=False requires an external session managed by the caller."
+            )
+        if not points_deltas:
+            return {}
+        if session is None:
+            async with self.session_factory() as managed_session:
+                return await self.upsert_points_balances(
+                    points_deltas=points_deltas,
+                    api_key=api_key,
+                    session=managed_session,
+                    auto_commit=auto_commit,
+                )
+
+        wallet_table = self.model.__table__
+        insert_stmt = insert(wallet_table).values(
+            [
+                {
+                    "userId": user_id,
+                    "coinsBalance": 0.0,
+                    "pointsBalance": points_delta,
+                    "conversionRate": configs.DEFAULT_CONVERTION_RATE_POINTS_TO_COIN,
+                    "apiKey_used": api_key,
+                }
+                for user_id, points_delta in points_deltas.items()
+            ]
+        )
+
+        on_conflict_updates = {
+            "pointsBalance": wallet_table.c.pointsBalance
+            + insert_stmt.excluded.pointsBalance,
+            "updated_at": func.now(),
+        }
+        if api_key is not None:
+            on_conflict_updates["apiKey_used"] = api_key
+
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[wallet_table.c.userId],
+            set_=on_conflict_updates,
+        ).returning(wallet_table.c.userId, wallet_table.c.id)
+
+        rows = (await session.execute(upsert_stmt)).all()
+        if auto_commit:
+            await session.commit()
+        else:
+            await session.flush()
+        return {str(row.userId): row.id for row in rows}
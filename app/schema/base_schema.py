@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import List, Literal, Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
@@ -87,6 +87,10 @@ class FindBase(BaseModel):
         page (Optional[int]): Page number in paginated responses.
         page_size (Optional[Union[int, str]]): Number of items per page, or a
           string sentinel when supported by the endpoint.
+        cursor (Optional[str]): Keyset pagination cursor (``next_cursor`` of
+          the previous page, or empty for the first page); replaces ``page``.
+        count (Optional[str]): How ``total_count`` is computed: ``exact``
+          (default), ``estimate`` or ``none``.
     """
 
     ordering: Optional[str] = Field(
@@ -104,6 +108,23 @@ class FindBase(BaseModel):
         description="Page size for pagination, or endpoint-specific string value.",
         examples=[10],
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "Keyset pagination: the `next_cursor` of the previous page, or an "
+            "empty value for the first page. Pages then cost the same at any "
+            "depth; `page` is ignored."
+        ),
+        examples=[""],
+    )
+    count: Optional[Literal["exact", "estimate", "none"]] = Field(
+        default=None,
+        description=(
+            "How `total_count` is computed: `exact` (default), `estimate` "
+            "(planner row estimate, Postgres only) or `none` (skipped)."
+        ),
+        examples=["exact"],
+    )
 
     @field_validator("page_size", mode="before")
     @classmethod
@@ -132,7 +153,9 @@ class SearchOptions(FindBase):
 
     Attributes:
         total_count (Optional[int]): Total number of records matching the
-          applied filters.
+          applied filters (estimated or ``None`` depending on ``count``).
+        next_cursor (Optional[str]): Cursor for the next keyset page, or
+          ``None`` when this page was not full.
     """
 
     total_count: Optional[int] = Field(
@@ -140,6 +163,11 @@ class SearchOptions(FindBase):
         description="Total number of records available for the current filter set.",
         examples=[125],
     )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Pass as `cursor` to read the next page; null on the last page.",
+        examples=["eyJvIjoiLWlkIiwidiI6bnVsbCwiaWQiOiI0Y2UzMmJlMiJ9"],
+    )
 
 
 class FindResult(BaseModel):
@@ -0,0 +1,66 @@
+from datetime import datetime
+from enum import Enum
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class LeaderboardPeriod(str, Enum):
+    ALL = "all"
+    DAY = "day"
+    WEEK = "week"
+
+
+class LeaderboardEntry(BaseModel):
+    """
+    One ranked user on a leaderboard.
+
+    Attributes:
+        rank (int): Competition rank (tied scores share a rank).
+        externalUserId (str): External identifier of the user.
+        points (int): Points in the leaderboard window.
+    """
+
+    rank: int = Field(..., description="1-based rank; ties share a rank.")
+    externalUserId: str = Field(
+        ..., description="External user identifier.", examples=["user-123"]
+    )
+    points: int = Field(..., description="Points earned in the window.")
+
+
+class Leaderboard(BaseModel):
+    """
+    Top entries of one leaderboard window.
+
+    Attributes:
+        gameId (str): Internal game identifier.
+        period (LeaderboardPeriod): Window granularity.
+        periodStart (datetime): Start of the window (UTC).
+        entries (List[LeaderboardEntry]): Best entries, in rank order.
+    """
+
+    gameId: str = Field(..., description="Internal UUID of the game.")
+    period: LeaderboardPeriod = Field(..., description="Window granularity.")
+    periodStart: datetime = Field(..., description="Start of the window (UTC).")
+    entries: List[LeaderboardEntry] = Field(default_factory=list)
+
+
+class LeaderboardStanding(BaseModel):
+    """
+    A user's position on one leaderboard window and the users around it.
+
+    Attributes:
+        gameId (str): Internal game identifier.
+        period (LeaderboardPeriod): Window granularity.
+        periodStart (datetime): Start of the window (UTC).
+        entry (LeaderboardEntry): The requested user's entry.
+        above (List[LeaderboardEntry]): Entries just ahead of the user.
+        below (List[LeaderboardEntry]): Entries just behind the user.
+    """
+
+    gameId: str = Field(..., description="Internal UUID of the game.")
+    period: LeaderboardPeriod = Field(..., description="Window granularity.")
+    periodStart: datetime = Field(..., description="Start of the window (UTC).")
+    entry: LeaderboardEntry
+    above: List[LeaderboardEntry] = Field(default_factory=list)
+    below: List[LeaderboardEntry] = Field(default_factory=list)
@@ -541,6 +541,127 @@ class AssignedPointsToExternalUserId(BaseModel):
     )
 
 
+class AssignPointsEvent(AsignPointsToExternalUserId):
+    """
+    One scoring event inside a batched points assignment.
+
+    Attributes:
+        externalTaskId (str): External task identifier the event belongs to.
+        externalUserId (str): External user identifier.
+        data (Optional[dict]): Context payload consumed by scoring logic.
+    """
+
+    externalTaskId: str = Field(
+        ...,
+        description="External identifier of the task.",
+        examples=["task-login"],
+    )
+
+
+class AssignPointsBatch(BaseModel):
+    """
+    Request schema for scoring many events of one game in a single call.
+
+    Attributes:
+        events (List[AssignPointsEvent]): Events to score, in order.
+    """
+
+    events: List[AssignPointsEvent] = Field(
+        ...,
+        min_length=1,
+        description="Scoring events; each carries its own task and user.",
+    )
+
+    def example():
+        """Return a sample batched points payload for the OpenAPI docs."""
+        return {
+            "events": [
+                {
+                    "externalTaskId": "task-login",
+                    "externalUserId": "user-123",
+                    "data": {"eventId": "evt-0001"},
+                },
+                {
+                    "externalTaskId": "task-login",
+                    "externalUserId": "user-456",
+                    "data": {"eventId": "evt-0002"},
+                },
+            ]
+        }
+
+
+class AssignedPointsBatchItem(BaseModel):
+    """
+    Outcome of one event of a batched points assignment.
+
+    Attributes:
+        index (int): Position of the event in the request.
+        externalTaskId (str): External task identifier of the event.
+        externalUserId (str): External user identifier of the event.
+        result (Optional[AssignedPointsToExternalUserId]): Assigned points,
+          when the event succeeded.
+        statusCode (Optional[int]): HTTP-equivalent status of a failed event.
+        error (Optional[str]): Failure reason, when the event failed.
+    """
+
+    index: int = Field(
+        ...,
+        description="Zero-based position of the event in the request.",
+        examples=[0],
+    )
+    externalTaskId: str = Field(
+        ...,
+        description="External identifier of the task.",
+        examples=["task-login"],
+    )
+    externalUserId: str = Field(
+        ...,
+        description="External user identifier.",
+        examples=["user-123"],
+    )
+    result: Optional[AssignedPointsToExternalUserId] = Field(
+        default=None,
+        description="Assigned points for a successful event.",
+    )
+    statusCode: Optional[int] = Field(
+        default=None,
+        description="HTTP-equivalent status code for a failed event.",
+        examples=[404],
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="Failure reason for a failed event.",
+        examples=["Task not found with externalTaskId: task-login"],
+    )
+
+
+class AssignedPointsBatch(BaseModel):
+    """
+    Response schema for a batched points assignment.
+
+    Attributes:
+        succeeded (int): Number of events that were scored and persisted.
+        failed (int): Number of events that failed.
+        results (List[AssignedPointsBatchItem]): Per-event outcome, in
+          request order.
+    """
+
+    succeeded: int = Field(
+        ...,
+        description="Number of events scored and persisted.",
+        examples=[1],
+    )
+    failed: int = Field(
+        ...,
+        description="Number of events that failed.",
+        examples=[1],
+    )
+    results: List[AssignedPointsBatchItem] = Field(
+        ...,
+        description="Per-event outcome, in request order.",
+    )
+
+
 class SimulatedTaskPoints(BaseModel):
     """
     Simulated scoring result for a single task/user pair.
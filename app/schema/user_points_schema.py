@@ -555,3 +555,73 @@ class ResponsePointsByExternalUserId(BaseModel):
         ...,
         description="Task-level points breakdown for the user.",
     )
+
+
+class ScoringSnapshot(BaseModel):
+    """
+    History aggregates the pace-based built-in strategies (``default``,
+    ``socio_bee``) read for one ``(game, task, user)``, loaded in a single
+    query. Each field carries the same value, including sentinels, as the
+    ``UserPointsAnalyticsService`` method named after it.
+
+    Attributes:
+        task_measurements_count (int): Awards on the external task.
+        user_task_measurements_count (int): The user's awards on the task.
+        user_avg_time_between_tasks (float): Mean seconds between the user's
+            consecutive awards on the task (``-1`` with fewer than two).
+        all_avg_time_between_tasks (float): Mean seconds between consecutive
+            awards on the task across all users (``-1`` with fewer than two).
+        last_window_time_diff (float): Seconds between the user's two most
+            recent awards on the task (``0`` with fewer than two).
+        new_last_window_time_diff (float): Seconds since the user's most
+            recent award on the task (``0`` with none).
+    """
+
+    task_measurements_count: int = Field(
+        ..., description="Number of awards recorded on the external task."
+    )
+    user_task_measurements_count: int = Field(
+        ..., description="Number of the user's awards on the external task."
+    )
+    user_avg_time_between_tasks: float = Field(
+        ..., description="Mean seconds between the user's consecutive awards."
+    )
+    all_avg_time_between_tasks: float = Field(
+        ..., description="Mean seconds between consecutive awards of all users."
+    )
+    last_window_time_diff: float = Field(
+        ..., description="Seconds between the user's two most recent awards."
+    )
+    new_last_window_time_diff: float = Field(
+        ..., description="Seconds elapsed since the user's most recent award."
+    )
+
+
+class EffortSnapshot(BaseModel):
+    """
+    History aggregates ``greengageStrategy`` reads for one
+    ``(game, task, user)``, loaded in a single query. Each field carries the
+    same value as the matching ``UserPointsAnalyticsService`` method.
+
+    Attributes:
+        has_recent_record (bool): Whether the user earned points on the task
+            within the requested window.
+        personal_records_count (int): The user's awards across the game.
+        global_avg_minutes (float): Mean positive ``data["minutes"]`` across
+            the game (``-1`` when none).
+        personal_avg_minutes (float): Mean positive ``data["minutes"]`` of the
+            user across the game (``-1`` when none).
+    """
+
+    has_recent_record: bool = Field(
+        ..., description="Whether the user has a recent award on the task."
+    )
+    personal_records_count: int = Field(
+        ..., description="Number of the user's awards across the game."
+    )
+    global_avg_minutes: float = Field(
+        ..., description="Mean reported minutes across the game."
+    )
+    personal_avg_minutes: float = Field(
+        ..., description="Mean reported minutes of the user across the game."
+    )
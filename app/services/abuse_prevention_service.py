@@ -1,12 +1,19 @@
 import ipaddress
+import logging
+from collections import Counter
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
 from fastapi import Request
 
 from app.core.config import configs
 from app.core.exceptions import TooManyRequestsError
-from app.services.rate_limit_counter_backend import RateLimitCounterBackend
+from app.services.rate_limit_counter_backend import (
+    RateLimitBucket,
+    RateLimitCounterBackend,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class AbusePreventionService:
@@ -100,8 +107,41 @@ class AbusePreventionService:
     ) -> None:
         """
         Enforces abuse controls for task mutation endpoints (`/points`, `/action`).
+
+        The per-API-key, per-IP and per-external-user short windows and the
+        daily API key quota are counted with one ``increment_many`` call, i.e.
+        a single backend round trip per request.
+        """
+        await self.enforce_task_mutation_batch_limits(
+            api_key=api_key,
+            client_ip=client_ip,
+            external_user_ids=[external_user_id],
+            now=now,
+        )
+
+    async def enforce_task_mutation_batch_limits(
+        self,
+        api_key: Optional[str],
+        client_ip: Optional[str],
+        external_user_ids: Sequence[Optional[str]],
+        now: Optional[datetime] = None,
+    ) -> None:
+        """
+        Enforces the task mutation limits for a batch of events at once.
+
+        Every event is charged as if it had been sent on its own: the API
+        key, IP and daily buckets count the batch size, and each
+        externalUserId's bucket counts that user's events. All buckets are
+        still counted with one ``increment_many`` call.
+
+        Args:
+            api_key (Optional[str]): API key the batch was sent with.
+            client_ip (Optional[str]): Client IP of the request.
+            external_user_ids (Sequence[Optional[str]]): externalUserId of
+                each event in the batch.
+            now (Optional[datetime]): Reference time, defaults to now.
         """
-        if not configs.ABUSE_PREVENTION_ENABLED:
+        if not configs.ABUSE_PREVENTION_ENABLED or not external_user_ids:
             return
 
         now = self._normalize_now(now)
@@ -112,90 +152,110 @@ class AbusePreventionService:
 
         normalized_api_key = self._normalize_scope_value(api_key)
         normalized_ip = self._normalize_scope_value(client_ip)
-        normalized_external_user = self._normalize_scope_value(external_user_id)
-
-        await self._enforce_limit(
-            scope_type="api_key",
-            scope_value=normalized_api_key,
-            window_name=short_window_name,
-            window_start=short_window_start,
-            ttl_seconds=short_ttl,
-            max_allowed=int(configs.ABUSE_RATE_LIMIT_PER_API_KEY),
-            error_detail="API key rate limit exceeded for sensitive task operations.",
-        )
-        await self._enforce_limit(
-            scope_type="ip",
-            scope_value=normalized_ip,
-            window_name=short_window_name,
-            window_start=short_window_start,
-            ttl_seconds=short_ttl,
-            max_allowed=int(configs.ABUSE_RATE_LIMIT_PER_IP),
-            error_detail="IP rate limit exceeded for sensitive task operations.",
-        )
-        await self._enforce_limit(
-            scope_type="external_user",
-            scope_value=normalized_external_user,
-            window_name=short_window_name,
-            window_start=short_window_start,
-            ttl_seconds=short_ttl,
-            max_allowed=int(configs.ABUSE_RATE_LIMIT_PER_EXTERNAL_USER),
-            error_detail="externalUserId rate limit exceeded for sensitive task operations.",
+        events_per_user = Counter(
+            self._normalize_scope_value(external_user_id)
+            for external_user_id in external_user_ids
         )
+        events = len(external_user_ids)
 
         daily_window_name = "task_mutation_daily"
         daily_window_start = self._get_daily_bucket_start(now)
         daily_ttl = self._ttl_for_seconds(86400)
-        await self._enforce_limit(
-            scope_type="api_key",
-            scope_value=normalized_api_key,
-            window_name=daily_window_name,
-            window_start=daily_window_start,
-            ttl_seconds=daily_ttl,
-            max_allowed=int(configs.ABUSE_DAILY_QUOTA_PER_API_KEY),
-            error_detail="Daily API key quota exceeded for sensitive task operations.",
+
+        await self._enforce_limits(
+            [
+                (
+                    RateLimitBucket(
+                        scope_type="api_key",
+                        scope_value=normalized_api_key,
+                        window_name=short_window_name,
+                        window_start=short_window_start,
+                        ttl_seconds=short_ttl,
+                        max_allowed=int(configs.ABUSE_RATE_LIMIT_PER_API_KEY),
+                        amount=events,
+                    ),
+                    "API key rate limit exceeded for sensitive task operations.",
+                ),
+                (
+                    RateLimitBucket(
+                        scope_type="ip",
+                        scope_value=normalized_ip,
+                        window_name=short_window_name,
+                        window_start=short_window_start,
+                        ttl_seconds=short_ttl,
+                        max_allowed=int(configs.ABUSE_RATE_LIMIT_PER_IP),
+                        amount=events,
+                    ),
+                    "IP rate limit exceeded for sensitive task operations.",
+                ),
+                *(
+                    (
+                        RateLimitBucket(
+                            scope_type="external_user",
+                            scope_value=external_user_id,
+                            window_name=short_window_name,
+                            window_start=short_window_start,
+                            ttl_seconds=short_ttl,
+                            max_allowed=int(configs.ABUSE_RATE_LIMIT_PER_EXTERNAL_USER),
+                            amount=count,
+                        ),
+                        "externalUserId rate limit exceeded for sensitive task operations.",
+                    )
+                    for external_user_id, count in events_per_user.items()
+                ),
+                (
+                    RateLimitBucket(
+                        scope_type="api_key",
+                        scope_value=normalized_api_key,
+                        window_name=daily_window_name,
+                        window_start=daily_window_start,
+                        ttl_seconds=daily_ttl,
+                        max_allowed=int(configs.ABUSE_DAILY_QUOTA_PER_API_KEY),
+                        amount=events,
+                    ),
+                    "Daily API key quota exceeded for sensitive task operations.",
+                ),
+            ]
         )
 
-    async def _enforce_limit(
-        self,
-        scope_type: str,
-        scope_value: Optional[str],
-        window_name: str,
-        window_start: datetime,
-        ttl_seconds: int,
-        max_allowed: int,
-        error_detail: str,
-    ) -> None:
+    async def _enforce_limits(self, limits: List[Tuple[RateLimitBucket, str]]) -> None:
         """
-        Increment one rate-limit bucket and raise if it exceeds the cap.
+        Increment every applicable bucket in one backend call, then raise for
+        the first limit (in ``limits`` order) whose counter exceeds its cap.
 
-        No-ops when the scope value is empty or the cap is non-positive.
+        Limits with an empty scope value or a non-positive cap are skipped.
+        A rejected request is not charged: its increments are refunded with
+        ``refund_many`` before raising, so being throttled on a short window
+        does not use up the daily quota. Admitted requests still cost one
+        round trip; only rejections pay a second one.
 
         Args:
-            scope_type (str): Dimension being limited (``api_key``/``ip``/...).
-            scope_value (Optional[str]): Concrete value within ``scope_type``.
-            window_name (str): Name of the time window/bucket.
-            window_start (datetime): Start of the bucket window.
-            ttl_seconds (int): TTL applied to the bucket.
-            max_allowed (int): Maximum requests allowed in the window.
-            error_detail (str): Message used when the limit is exceeded.
+            limits (List[Tuple[RateLimitBucket, str]]): ``(bucket,
+                error_detail)`` pairs; each bucket carries its cap in
+                ``max_allowed``.
 
         Raises:
-            TooManyRequestsError: If the counter exceeds ``max_allowed``.
+            TooManyRequestsError: If a counter exceeds its ``max_allowed``.
         """
-        if not scope_value:
-            return
-        if max_allowed <= 0:
+        applicable = [
+            (bucket, error_detail)
+            for bucket, error_detail in limits
+            if bucket.scope_value and bucket.max_allowed > 0
+        ]
+        if not applicable:
             return
 
-        counter = await self.counter_backend.increment_and_get(
-            scope_type=scope_type,
-            scope_value=scope_value,
-            window_name=window_name,
-            window_start=window_start,
-            ttl_seconds=ttl_seconds,
-        )
-        if counter > max_allowed:
-            raise TooManyRequestsError(detail=error_detail)
+        buckets = [bucket for bucket, _ in applicable]
+        counters = await self.counter_backend.increment_many(buckets)
+        for counter, (bucket, error_detail) in zip(counters, applicable):
+            if counter > bucket.max_allowed:
+                try:
+                    await self.counter_backend.refund_many(buckets, counters)
+                except Exception:
+                    # The request is rejected either way; a failed refund
+                    # only over-counts until the windows roll over.
+                    logger.warning("Rate-limit refund failed", exc_info=True)
+                raise TooManyRequestsError(detail=error_detail)
 
     @staticmethod
     def _normalize_scope_value(value: Optional[str]) -> Optional[str]:
@@ -0,0 +1,194 @@
+"""
+Buffered writer for the ``logs`` audit table.
+
+Every audited request used to ``await`` a single-row ``logs`` insert inline,
+so the write endpoints (which log before and after the real work) paid two
+extra transactions per call. :class:`AuditLogSink` takes those rows off the
+request path: ``submit`` is a non-blocking ``put_nowait`` onto a bounded
+in-process queue, and a background worker flushes the queue with one
+multi-row ``INSERT`` per batch, as soon as ``AUDIT_LOG_BATCH_SIZE`` rows are
+waiting or ``AUDIT_LOG_FLUSH_INTERVAL_MS`` after the first of them arrived.
+
+Like :class:`~app.services.dsl_observability_service.DslExecutionObserver`
+the sink is best-effort: when the queue is full (a slow or unavailable
+database) rows are dropped and counted in ``audit_log_rows_dropped_total``
+instead of blocking the request, and a failed flush is retried row by row so
+one bad row does not take its whole batch down. Call :meth:`aclose` on
+shutdown to flush what is still queued.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import List, Optional
+
+from prometheus_client import Counter
+
+# Imported as a module so the sink sees the live ``configs`` object even when
+# a test reloads ``app.core.config``.
+from app.core import config as _config_module
+from app.repository.logs_repository import LogsRepository
+from app.schema.logs_schema import CreateLogs
+
+logger = logging.getLogger(__name__)
+
+audit_log_rows_written_total = Counter(
+    "audit_log_rows_written_total",
+    "Audit log rows persisted by the buffered writer.",
+)
+audit_log_rows_dropped_total = Counter(
+    "audit_log_rows_dropped_total",
+    "Audit log rows the buffered writer gave up on: 'queue_full' when the "
+    "queue overflowed, 'write_failed' when the row could not be inserted.",
+    labelnames=("reason",),
+)
+
+
+class AuditLogSink:
+    """
+    Process-wide buffered writer for audit log rows.
+
+    One instance per process (a container Singleton). The queue and the
+    worker are created on the first ``submit``, inside the running event
+    loop, so constructing the sink at import time is safe.
+    """
+
+    def __init__(
+        self,
+        logs_repository: LogsRepository,
+        *,
+        queue_maxsize: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval_ms: Optional[int] = None,
+    ) -> None:
+        configs = _config_module.configs
+        if queue_maxsize is None:
+            queue_maxsize = configs.AUDIT_LOG_QUEUE_MAXSIZE
+        if batch_size is None:
+            batch_size = configs.AUDIT_LOG_BATCH_SIZE
+        if flush_interval_ms is None:
+            flush_interval_ms = configs.AUDIT_LOG_FLUSH_INTERVAL_MS
+        self._repository = logs_repository
+        self._queue_maxsize = max(1, queue_maxsize)
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = max(0, flush_interval_ms) / 1000.0
+        self._queue: Optional["asyncio.Queue[CreateLogs]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._closed = False
+        self._overflowing = False
+
+    def submit(self, entry: CreateLogs) -> bool:
+        """
+        Hand an audit row to the background writer without waiting.
+
+        Args:
+            entry (CreateLogs): The row to persist.
+
+        Returns:
+            bool: ``False`` when buffering is disabled or the sink is closed,
+            in which case the caller should write the row itself. ``True``
+            otherwise, including when the row was dropped on a full queue.
+        """
+        if self._closed or not _config_module.configs.AUDIT_LOG_BUFFER_ENABLED:
+            return False
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            audit_log_rows_dropped_total.labels(reason="queue_full").inc()
+            if not self._overflowing:
+                # Once per overflow episode; the counter has the exact tally.
+                logger.warning(
+                    "Audit log queue full (maxsize=%s); dropping rows until "
+                    "the writer catches up",
+                    self._queue_maxsize,
+                )
+            self._overflowing = True
+            return True
+        self._overflowing = False
+        return True
+
+    def _ensure_worker(self) -> None:
+        """Create the queue + flush task on first use, inside the loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._queue_maxsize)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Collect rows into batches and write each batch in one statement."""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0 or self._closed:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write(self, batch: List[CreateLogs]) -> None:
+        """
+        Insert ``batch`` in one statement, falling back to one row at a time.
+
+        Failures are logged and counted, never raised: the worker must keep
+        draining.
+        """
+        try:
+            await self._repository.insert_many(batch)
+            audit_log_rows_written_total.inc(len(batch))
+            return
+        except Exception:
+            logger.warning(
+                "Failed to flush %d audit log rows; retrying one by one",
+                len(batch),
+                exc_info=True,
+            )
+        for entry in batch:
+            try:
+                await self._repository.insert_many([entry])
+                audit_log_rows_written_total.inc()
+            except Exception:
+                audit_log_rows_dropped_total.labels(reason="write_failed").inc()
+                logger.warning(
+                    "Dropped audit log row module=%s message=%s",
+                    entry.module,
+                    entry.message,
+                    exc_info=True,
+                )
+
+    async def flush(self) -> None:
+        """Block until every queued row has been written (or dropped)."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Flush pending rows and stop the worker. Idempotent.
+
+        Wired into the FastAPI lifespan. Rows submitted afterwards are
+        refused (``submit`` returns ``False``) so callers write them inline.
+        """
+        self._closed = True
+        await self.flush()
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._worker = None
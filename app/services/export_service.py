@@ -7,18 +7,39 @@ Design notes:
     hard ``LIMIT`` so memory stays bounded even on the 100k-row cap.
   * Row-level transformation lives in private ``_serialize_*`` helpers so the
     formatter layer (CSV/JSON/XLSX) only sees flat dicts.
-  * The XLSX path imports ``openpyxl`` lazily; if the dependency is not
-    installed the endpoint surfaces a clear 503 instead of a 500.
+  * XLSX is written by a streaming zip writer (``app.util.xlsx_stream``),
+    so it is sent as it is produced instead of being built in memory first.
+  * On Postgres, CSV and JSON skip the per-row Python work entirely: CSV is
+    produced by ``COPY (SELECT ...) TO STDOUT WITH CSV`` through asyncpg and
+    JSON objects are built server-side with ``json_build_object``. Both are
+    coalesced into ~64 KB writes. Other engines (and XLSX) keep the ORM
+    path above.
 """
 
+import asyncio
 import csv
 import io
 import json
 from datetime import datetime, timezone
 from typing import Any, AsyncIterator, Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import (
+    DateTime,
+    Float,
+    Select,
+    Text,
+    Uuid,
+    case,
+    cast,
+    func,
+    literal_column,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
+# Imported as a module so the service sees the live ``configs`` object even
+# when a test reloads ``app.core.config``.
+from app.core import config as _config_module
 from app.core.exceptions import InternalServerError
 from app.model.export_audit_log import ExportAuditLog
 from app.model.games import Games
@@ -38,6 +59,7 @@ from app.schema.export_schema import (
     ExportStatus,
 )
 from app.services.base_service import BaseService
+from app.util.xlsx_stream import StreamingXlsxWriter
 
 # Column order for each dataset. Drives both CSV header row and XLSX columns.
 DATASET_COLUMNS: Dict[str, List[str]] = {
@@ -84,6 +106,19 @@ DATASET_COLUMNS: Dict[str, List[str]] = {
     ],
 }
 
+# Target size of one response write. The CSV/JSON formatters otherwise hand
+# the ASGI server one tiny chunk per row.
+_CHUNK_BYTES = 64 * 1024
+# Rows fetched per round trip from the server-side cursor of the JSON path.
+_JSON_FETCH_ROWS = 1000
+# COPY data buffers waiting for the response; bounds memory when the client
+# reads slower than Postgres writes.
+_COPY_QUEUE_CHUNKS = 16
+# Timestamps rendered in SQL the way ``datetime.isoformat`` renders them for
+# the ORM path: UTC, with microseconds only when they are not zero.
+_PG_ISO_UTC_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"'
+_PG_ISO_UTC_WHOLE_SECONDS_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS"+00:00"'
+
 
 def _isoformat(value: Any) -> Any:
     """Datetime → ISO 8601 string. Pass through otherwise."""
@@ -94,18 +129,73 @@ def _isoformat(value: Any) -> Any:
 
 def _stringify_for_tabular(value: Any) -> Any:
     """
-    CSV/XLSX cells must be scalar. JSON dicts get serialized to a JSON string;
-    None becomes empty string; datetimes become ISO 8601.
+    CSV/XLSX cells must be scalar. JSON dicts get serialized to a JSON string
+    in Postgres' ``jsonb`` text form (``{"k": 1}``, non-ASCII unescaped), the
+    cell the COPY path writes; None becomes empty string; datetimes become
+    ISO 8601.
     """
     if value is None:
         return ""
     if isinstance(value, datetime):
         return value.isoformat()
     if isinstance(value, (dict, list)):
-        return json.dumps(value, separators=(",", ":"), default=str)
+        return json.dumps(value, ensure_ascii=False, default=str)
     return value
 
 
+def _pg_text_columns(stmt: Select) -> List[Any]:
+    """
+    The dataset columns of ``stmt``, rendered in SQL the way the ORM path
+    serializes them in Python: UUIDs as text, timestamps as ISO 8601 UTC,
+    whole floats with a trailing ``.0``. JSON and other scalar columns are
+    left to Postgres' own text output, which the ORM path reproduces. The
+    two only differ on float8 values Python prints in another notation
+    (``1e+15`` vs ``1000000000000000.0``, ``Infinity`` vs ``inf``) and
+    JSON numbers Python parses into floats (``1e20``).
+    """
+    columns = []
+    for name, column in stmt.selected_columns.items():
+        if isinstance(column.type, Uuid):
+            column = cast(column, Text)
+        elif isinstance(column.type, DateTime):
+            utc = func.timezone("UTC", column)
+            column = case(
+                (
+                    func.to_char(utc, "US") == "000000",
+                    func.to_char(utc, _PG_ISO_UTC_WHOLE_SECONDS_FORMAT),
+                ),
+                else_=func.to_char(utc, _PG_ISO_UTC_FORMAT),
+            )
+        elif isinstance(column.type, Float):
+            text_value = cast(column, Text)
+            column = case(
+                (text_value.regexp_match("^-?[0-9]+$"), text_value + ".0"),
+                else_=text_value,
+            )
+        columns.append(column.label(name))
+    return columns
+
+
+async def _coalesce(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Merge small byte chunks into writes of roughly ``_CHUNK_BYTES``."""
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= _CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _copy_row_count(status: str) -> int:
+    """Row count from a ``COPY n`` command tag (0 when it cannot be parsed)."""
+    try:
+        return int(status.rsplit(" ", 1)[-1])
+    except (AttributeError, ValueError):
+        return 0
+
+
 class ExportService(BaseService):
     """
     Streams large datasets out of Postgres without buffering them in memory.
@@ -218,6 +308,90 @@ class ExportService(BaseService):
             stmt = stmt.filter(model.created_at <= filters.dateTo)
         return stmt
 
+    # Dataset queries (shared by the ORM iterators and the bulk paths)
+    def _users_stmt(self, filters: ExportFilters) -> Select:
+        """Select the ``users`` dataset, oldest first, capped at the limit."""
+        stmt = select(
+            Users.id,
+            Users.externalUserId,
+            Users.created_at,
+            Users.updated_at,
+            Users.apiKey_used,
+            Users.oauth_user_id,
+        )
+        stmt = self._apply_date_filters(stmt, Users, filters)
+        return stmt.order_by(Users.created_at).limit(filters.limit)
+
+    def _user_points_stmt(self, filters: ExportFilters) -> Select:
+        """Select the ``user-points`` dataset joined with user/task/game."""
+        stmt = (
+            select(
+                UserPoints.id,
+                UserPoints.created_at,
+                Users.externalUserId.label("externalUserId"),
+                Tasks.externalTaskId.label("externalTaskId"),
+                Games.externalGameId.label("externalGameId"),
+                UserPoints.points,
+                UserPoints.caseName,
+                UserPoints.description,
+                UserPoints.idempotencyKey,
+                UserPoints.data,
+                UserPoints.apiKey_used,
+            )
+            .join(Users, UserPoints.userId == Users.id)
+            .join(Tasks, UserPoints.taskId == Tasks.id)
+            .join(Games, Tasks.gameId == Games.id)
+        )
+        stmt = self._apply_date_filters(stmt, UserPoints, filters)
+        if filters.externalGameId is not None:
+            stmt = stmt.filter(Games.externalGameId == filters.externalGameId)
+        if filters.externalTaskId is not None:
+            stmt = stmt.filter(Tasks.externalTaskId == filters.externalTaskId)
+        return stmt.order_by(UserPoints.created_at).limit(filters.limit)
+
+    def _user_interactions_stmt(self, filters: ExportFilters) -> Select:
+        """Select the ``user-interactions`` dataset from ``useractions``."""
+        # Backed by the ``useractions`` table (model: UserActions). The legacy
+        # ``UserInteractions`` model has no corresponding table, so any query
+        # against it raises UndefinedTableError at runtime.
+        # externalGameId/externalTaskId filters don't apply here: UserActions
+        # has no FK to tasks/games (related IDs, when present, live in the
+        # JSONB ``data`` column). We keep them in the endpoint signature for
+        # uniformity but ignore them on this dataset.
+        stmt = select(
+            UserActions.id,
+            UserActions.created_at,
+            Users.externalUserId.label("externalUserId"),
+            UserActions.typeAction,
+            UserActions.description,
+            UserActions.data,
+            UserActions.apiKey_used,
+        ).outerjoin(Users, UserActions.userId == Users.id)
+        stmt = self._apply_date_filters(stmt, UserActions, filters)
+        return stmt.order_by(UserActions.created_at).limit(filters.limit)
+
+    def _wallet_transactions_stmt(self, filters: ExportFilters) -> Select:
+        """Select the ``wallet-transactions`` dataset joined with its owner."""
+        # gameId/taskId filters don't apply to wallet transactions; we keep the
+        # parameter signature uniform but ignore those filters here.
+        stmt = (
+            select(
+                WalletTransactions.id,
+                WalletTransactions.created_at,
+                Users.externalUserId.label("externalUserId"),
+                WalletTransactions.transactionType,
+                WalletTransactions.points,
+                WalletTransactions.coins,
+                WalletTransactions.appliedConversionRate,
+                WalletTransactions.data,
+                WalletTransactions.apiKey_used,
+            )
+            .join(Wallet, WalletTransactions.walletId == Wallet.id)
+            .join(Users, Wallet.userId == Users.id)
+        )
+        stmt = self._apply_date_filters(stmt, WalletTransactions, filters)
+        return stmt.order_by(WalletTransactions.created_at).limit(filters.limit)
+
     async def _stream_rows(self, stmt) -> AsyncIterator[Any]:
         """Yield ORM rows one by one using SQLAlchemy's async streaming API."""
         session_factory = self.export_audit_log_repository.session_factory
@@ -238,17 +412,7 @@ class ExportService(BaseService):
         Yields:
             Dict[str, Any]: One serializable user record per row.
         """
-        stmt = select(
-            Users.id,
-            Users.externalUserId,
-            Users.created_at,
-            Users.updated_at,
-            Users.apiKey_used,
-            Users.oauth_user_id,
-        )
-        stmt = self._apply_date_filters(stmt, Users, filters)
-        stmt = stmt.order_by(Users.created_at).limit(filters.limit)
-        async for row in self._stream_rows(stmt):
+        async for row in self._stream_rows(self._users_stmt(filters)):
             yield {
                 "id": str(row.id),
                 "externalUserId": row.externalUserId,
@@ -271,31 +435,7 @@ class ExportService(BaseService):
         Yields:
             Dict[str, Any]: One serializable user-point record per row.
         """
-        stmt = (
-            select(
-                UserPoints.id,
-                UserPoints.created_at,
-                Users.externalUserId.label("externalUserId"),
-                Tasks.externalTaskId.label("externalTaskId"),
-                Games.externalGameId.label("externalGameId"),
-                UserPoints.points,
-                UserPoints.caseName,
-                UserPoints.description,
-                UserPoints.idempotencyKey,
-                UserPoints.data,
-                UserPoints.apiKey_used,
-            )
-            .join(Users, UserPoints.userId == Users.id)
-            .join(Tasks, UserPoints.taskId == Tasks.id)
-            .join(Games, Tasks.gameId == Games.id)
-        )
-        stmt = self._apply_date_filters(stmt, UserPoints, filters)
-        if filters.externalGameId is not None:
-            stmt = stmt.filter(Games.externalGameId == filters.externalGameId)
-        if filters.externalTaskId is not None:
-            stmt = stmt.filter(Tasks.externalTaskId == filters.externalTaskId)
-        stmt = stmt.order_by(UserPoints.created_at).limit(filters.limit)
-        async for row in self._stream_rows(stmt):
+        async for row in self._stream_rows(self._user_points_stmt(filters)):
             yield {
                 "id": str(row.id),
                 "created_at": _isoformat(row.created_at),
@@ -325,24 +465,7 @@ class ExportService(BaseService):
         Yields:
             Dict[str, Any]: One serializable interaction record per row.
         """
-        # Backed by the ``useractions`` table (model: UserActions). The legacy
-        # ``UserInteractions`` model has no corresponding table, so any query
-        # against it raises UndefinedTableError at runtime.
-        # externalGameId/externalTaskId filters don't apply here: UserActions
-        # has no FK to tasks/games (related IDs, when present, live in the
-        # JSONB ``data`` column). We keep them in the endpoint signature for
-        # uniformity but ignore them on this dataset.
-        stmt = select(
-            UserActions.id,
-            UserActions.created_at,
-            Users.externalUserId.label("externalUserId"),
-            UserActions.typeAction,
-            UserActions.description,
-            UserActions.data,
-            UserActions.apiKey_used,
-        ).outerjoin(Users, UserActions.userId == Users.id)
-        stmt = self._apply_date_filters(stmt, UserActions, filters)
-        stmt = stmt.order_by(UserActions.created_at).limit(filters.limit)
+        stmt = self._user_interactions_stmt(filters)
         async for row in self._stream_rows(stmt):
             yield {
                 "id": str(row.id),
@@ -367,25 +490,7 @@ class ExportService(BaseService):
         Yields:
             Dict[str, Any]: One serializable transaction record per row.
         """
-        # gameId/taskId filters don't apply to wallet transactions; we keep the
-        # parameter signature uniform but ignore those filters here.
-        stmt = (
-            select(
-                WalletTransactions.id,
-                WalletTransactions.created_at,
-                Users.externalUserId.label("externalUserId"),
-                WalletTransactions.transactionType,
-                WalletTransactions.points,
-                WalletTransactions.coins,
-                WalletTransactions.appliedConversionRate,
-                WalletTransactions.data,
-                WalletTransactions.apiKey_used,
-            )
-            .join(Wallet, WalletTransactions.walletId == Wallet.id)
-            .join(Users, Wallet.userId == Users.id)
-        )
-        stmt = self._apply_date_filters(stmt, WalletTransactions, filters)
-        stmt = stmt.order_by(WalletTransactions.created_at).limit(filters.limit)
+        stmt = self._wallet_transactions_stmt(filters)
         async for row in self._stream_rows(stmt):
             yield {
                 "id": str(row.id),
@@ -470,34 +575,18 @@ class ExportService(BaseService):
         columns: List[str],
     ) -> AsyncIterator[bytes]:
         """
-        Build an XLSX file using openpyxl write-only mode. The library buffers
-        rows internally as it writes them out to a zip stream - for the 100k
-        row cap this stays well below 200MB resident.
-
-        openpyxl is imported lazily so the rest of the export pipeline keeps
-        working if the dependency is missing.
+        Emit an XLSX file while its rows are still arriving. The zip archive
+        is written incrementally by :class:`StreamingXlsxWriter` and drained
+        every ~64 KB, so memory stays flat regardless of the row count and
+        the client receives bytes from the first rows on.
         """
-        try:
-            from openpyxl import Workbook
-        except ImportError as exc:  # pragma: no cover - env w/o openpyxl
-            raise InternalServerError(
-                detail=(
-                    "XLSX export requires 'openpyxl'. Install it "
-                    "(`poetry add openpyxl`) or use format=csv/json."
-                )
-            ) from exc
-
-        workbook = Workbook(write_only=True)
-        sheet = workbook.create_sheet(title="export")
-        sheet.append(columns)
+        writer = StreamingXlsxWriter(sheet_title="export")
+        writer.append(columns)
         async for row in rows:
-            sheet.append([_stringify_for_tabular(row.get(col)) for col in columns])
-        buffer = io.BytesIO()
-        workbook.save(buffer)
-        buffer.seek(0)
-        # Single yield is fine: the file is fully built in memory before the
-        # 100k cap, and StreamingResponse will still iterate to send it.
-        yield buffer.read()
+            writer.append([_stringify_for_tabular(row.get(col)) for col in columns])
+            if writer.pending_bytes >= _CHUNK_BYTES:
+                yield writer.drain()
+        yield writer.close()
 
     # Dispatch wrapper: dataset + format → (media_type, filename, body_iter)
     def format_iterator(
@@ -529,6 +618,166 @@ class ExportService(BaseService):
             return self.format_as_xlsx(rows, columns)
         raise InternalServerError(detail=f"Unknown export format: {export_format}")
 
+    # Response body: bulk path on Postgres, ORM iterators everywhere else
+    async def stream_export(
+        self,
+        dataset_type: str,
+        export_format: str,
+        filters: ExportFilters,
+        row_counter: Dict[str, int],
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream one export as encoded chunks of roughly 64 KB.
+
+        CSV and JSON exports against Postgres are produced by the database
+        (``COPY ... TO STDOUT WITH CSV`` / ``json_build_object``) and never
+        materialize a Python object per row. XLSX, other engines, and
+        ``EXPORT_BULK_COPY_ENABLED=false`` go through the dataset iterators
+        and :meth:`format_iterator`.
+
+        Args:
+            dataset_type (str): Dataset name.
+            export_format (str): One of ``csv``/``json``/``xlsx``.
+            filters (ExportFilters): Date range, row limit and optional
+                game/task filters.
+            row_counter (Dict[str, int]): Its ``"n"`` entry receives the
+                number of rows streamed; final once the iterator is exhausted.
+
+        Yields:
+            bytes: Response body chunks.
+        """
+        bulk_formats = (ExportFormat.CSV.value, ExportFormat.JSON.value)
+        if (
+            export_format in bulk_formats
+            and _config_module.configs.EXPORT_BULK_COPY_ENABLED
+        ):
+            session_factory = self.export_audit_log_repository.session_factory
+            async with session_factory() as session:
+                if session.get_bind().dialect.name == "postgresql":
+                    stmt = self._dataset_stmt(dataset_type, filters)
+                    if export_format == ExportFormat.CSV.value:
+                        connection = await session.connection()
+                        chunks = self._copy_csv(connection, stmt, row_counter)
+                    else:
+                        chunks = self._stream_json(session, stmt, row_counter)
+                    async for chunk in _coalesce(chunks):
+                        yield chunk
+                    return
+
+        async def _counted_rows():
+            """Yield dataset rows while tallying them into ``row_counter``."""
+            async for row in self.iter_dataset(dataset_type, filters):
+                row_counter["n"] += 1
+                yield row
+
+        body = self.format_iterator(dataset_type, export_format, _counted_rows())
+        async for chunk in _coalesce(body):
+            yield chunk
+
+    def _dataset_stmt(self, dataset_type: str, filters: ExportFilters) -> Select:
+        """
+        Return the select behind ``dataset_type``. Raises 500 on an unknown
+        dataset, like :meth:`iter_dataset`.
+        """
+        mapping = {
+            ExportDatasetType.USERS.value: self._users_stmt,
+            ExportDatasetType.USER_POINTS.value: self._user_points_stmt,
+            ExportDatasetType.USER_INTERACTIONS.value: self._user_interactions_stmt,
+            ExportDatasetType.WALLET_TRANSACTIONS.value: (
+                self._wallet_transactions_stmt
+            ),
+        }
+        try:
+            return mapping[dataset_type](filters)
+        except KeyError as exc:
+            raise InternalServerError(
+                detail=f"Unknown dataset type: {dataset_type}"
+            ) from exc
+
+    async def _copy_csv(
+        self,
+        connection: AsyncConnection,
+        stmt: Select,
+        row_counter: Dict[str, int],
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield the raw output of ``COPY (stmt) TO STDOUT WITH CSV HEADER``.
+
+        asyncpg hands COPY data to a callback, so the copy runs in a task
+        feeding a bounded queue that this generator drains. An error the
+        copy ends with is re-raised here; closing the generator early
+        cancels the copy. The row count comes from the ``COPY n`` tag.
+        """
+        stmt = stmt.with_only_columns(
+            *_pg_text_columns(stmt), maintain_column_froms=True
+        )
+        compiled = stmt.compile(dialect=connection.dialect)
+        params = [compiled.params[name] for name in compiled.positiontup or ()]
+        raw_connection = await connection.get_raw_connection()
+        driver = raw_connection.driver_connection
+        queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=_COPY_QUEUE_CHUNKS)
+
+        async def _copy() -> None:
+            """Run the COPY, then enqueue its outcome after the data."""
+            try:
+                status = await driver.copy_from_query(
+                    str(compiled),
+                    *params,
+                    output=queue.put,
+                    format="csv",
+                    header=True,
+                )
+            except Exception as exc:
+                await queue.put(exc)
+            else:
+                row_counter["n"] = _copy_row_count(status)
+                await queue.put(None)
+
+        task = asyncio.ensure_future(_copy())
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+    async def _stream_json(
+        self,
+        session: AsyncSession,
+        stmt: Select,
+        row_counter: Dict[str, int],
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield a JSON array whose objects Postgres builds per row with
+        ``json_build_object`` (keys in ``DATASET_COLUMNS`` order), read
+        through a server-side cursor ``_JSON_FETCH_ROWS`` rows at a time.
+        """
+        pairs: List[Any] = []
+        for column in _pg_text_columns(stmt):
+            pairs.extend((literal_column(f"'{column.name}'"), column.element))
+        stmt = stmt.with_only_columns(
+            cast(func.json_build_object(*pairs), Text), maintain_column_froms=True
+        )
+        result = await session.stream(
+            stmt.execution_options(yield_per=_JSON_FETCH_ROWS)
+        )
+        yield b"["
+        separator = b""
+        async for objects in result.scalars().partitions():
+            row_counter["n"] += len(objects)
+            yield separator + ",".join(objects).encode("utf-8")
+            separator = b","
+        yield b"]"
+
     @staticmethod
     def media_type_for(export_format: str) -> str:
         """
@@ -101,6 +101,7 @@ async def get_authorized_game(
     api_key: str | None = None,
     oauth_user_id: str | None = None,
     is_admin: bool = False,
+    metadata_cache=None,
 ) -> Any:
     """
     Load a game and assert the caller is allowed to access it.
@@ -111,6 +112,8 @@ async def get_authorized_game(
         api_key (str | None): Caller's API key, for ownership scoping.
         oauth_user_id (str | None): Caller's OAuth subject, for scoping.
         is_admin (bool): Whether the caller has the admin role.
+        metadata_cache: Optional :class:`ScoringMetadataCache`; when given
+            the game is read through it (the ownership check still runs).
 
     Returns:
         Any: The authorized game entity.
@@ -119,10 +122,18 @@ async def get_authorized_game(
         NotFoundError: If the game does not exist.
         ForbiddenError: If the caller may not access the game.
     """
-    game = await game_repository.read_by_id(
-        game_id,
-        not_found_raise_exception=False,
-    )
+    if metadata_cache is not None:
+        game = await metadata_cache.get_game(
+            game_id,
+            lambda: game_repository.read_by_id(
+                game_id, not_found_raise_exception=False
+            ),
+        )
+    else:
+        game = await game_repository.read_by_id(
+            game_id,
+            not_found_raise_exception=False,
+        )
     if not game:
         raise NotFoundError(detail=f"Game not found by gameId: {game_id}")
 
@@ -2,7 +2,7 @@ from typing import Any, Optional
 from uuid import UUID
 
 from app.core.exceptions import BadRequestError, ConflictError, NotFoundError
-from app.engine.all_engine_strategies import all_engine_strategies
+from app.engine.all_engine_strategies import engine_strategy
 from app.model.strategy_definition import StrategyDefinitionStatus
 from app.repository.game_params_repository import GameParamsRepository
 from app.repository.game_repository import GameRepository
@@ -22,6 +22,7 @@ from app.schema.task_schema import CreateTask
 from app.schema.tasks_params_schema import InsertTaskParams
 from app.services.base_service import BaseService
 from app.services.game_access import get_authorized_game
+from app.services.metadata_cache import ScoringMetadataCache
 from app.services.strategy_definition_service import StrategyDefinitionService
 from app.services.strategy_service import (
     StrategyService,
@@ -54,6 +55,7 @@ class GameService(BaseService):
         strategy_service: StrategyService,
         strategy_definition_service: Optional[StrategyDefinitionService] = None,
         task_params_repository: Optional[TaskParamsRepository] = None,
+        metadata_cache: Optional[ScoringMetadataCache] = None,
     ) -> None:
         """
         Initializes the GameService with the provided repositories and
@@ -69,6 +71,10 @@ class GameService(BaseService):
         reason; it is only needed by :meth:`duplicate_game` to deep-copy
         each task's params. When omitted, duplication raises a clear error
         instead of silently dropping params.
+
+        ``metadata_cache`` is the scoring hot path's metadata cache; a game
+        (and its tasks) is dropped from it whenever the game is patched or
+        deleted.
         """
         self.game_repository = game_repository
         self.game_params_repository = game_params_repository
@@ -76,6 +82,7 @@ class GameService(BaseService):
         self.task_params_repository = task_params_repository
         self.strategy_service = strategy_service
         self.strategy_definition_service = strategy_definition_service
+        self.metadata_cache = metadata_cache
         super().__init__(game_repository)
 
     async def get_by_gameId(
@@ -156,6 +163,8 @@ class GameService(BaseService):
             raise NotFoundError(detail=f"Game not found by gameId: {gameId}")
 
         if await self.game_repository.delete_game_by_id(gameId):
+            if self.metadata_cache is not None:
+                await self.metadata_cache.invalidate_game(gameId)
             response = BaseGameResult(
                 externalGameId=game.externalGameId,
                 strategyId=game.strategyId,
@@ -254,12 +263,7 @@ class GameService(BaseService):
         if default_strategyId is None:
             default_strategyId = "default"
 
-        strategies = all_engine_strategies()
-        strategy = next(
-            (strategy for strategy in strategies if strategy.id == default_strategyId),
-            None,
-        )
-        if not strategy:
+        if engine_strategy(default_strategyId) is None:
             raise NotFoundError(
                 detail=f"Strategy with id: {default_strategyId} not found"
             )
@@ -415,9 +419,7 @@ class GameService(BaseService):
         not-yet-published customs.
         """
         if not is_custom_strategy_id(strategy_id):
-            strategies = all_engine_strategies()
-            strategy = next((s for s in strategies if s.id == strategy_id), None)
-            if not strategy:
+            if engine_strategy(strategy_id) is None:
                 raise NotFoundError(detail=f"Strategy with id: {strategy_id} not found")
             return
 
@@ -545,6 +547,8 @@ class GameService(BaseService):
                 updated_params.append(param)
 
         game = await self.game_repository.patch_game_by_id(gameId, schema)
+        if self.metadata_cache is not None:
+            await self.metadata_cache.invalidate_game(gameId)
         game_dict = game.model_dump()
         response = ResponsePatchGame(
             externalGameId=game_dict["externalGameId"],
@@ -0,0 +1,409 @@
+"""
+Pluggable read/mirror backends for the per-game leaderboards.
+
+``game_leaderboard`` is the source of truth: its rows are merged in the same
+transaction that writes each award, so the DB backend only reads it. Top-K
+and neighbour reads are index range scans; a rank is one count over the
+scores above the user.
+
+The Redis backend mirrors boards into sorted sets (``ZINCRBY`` after the
+award transaction commits), where the rank of a user is ``ZCOUNT`` over the
+higher scores and top-K / neighbours are ``ZREVRANGE`` slices -- all
+O(log n). Awards only increment boards Redis already holds, so a missing
+board is never recreated from a partial set of awards: boards are loaded by
+``scripts/leaderboard.py rebuild``, and day/week boards are also opened
+empty ahead of their window. Boards whose key is missing (never loaded,
+expired window, flushed Redis, dropped after a failed mirror update) and
+Redis errors fall back to the database.
+
+Ranks use competition ranking ("1224"): tied scores share a rank. Selection
+is driven by ``configs.LEADERBOARD_BACKEND`` ("database" or "redis") and
+wired in ``app/core/container.py``.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Optional, Protocol, runtime_checkable
+
+from app.repository.game_leaderboard_repository import (
+    GameLeaderboardRepository,
+    fold_awards,
+)
+from app.services.rate_limit_counter_backend import build_redis_client_from_url
+
+logger = logging.getLogger(__name__)
+
+_LOAD_BATCH = 10_000
+
+_WINDOWS = {"day": timedelta(days=1), "week": timedelta(weeks=1)}
+
+# Member that keeps an opened board's key alive before its first award. It
+# scores -inf, so it sorts below every user and is filtered out of slices.
+_OPEN_MEMBER = ""
+
+# Increment a board only if Redis holds it: ZINCRBY on a missing key would
+# create a board holding just these awards. KEYS[1] is the board, ARGV[1]
+# its TTL (0 for none) and the rest ``points, userId`` pairs.
+_RECORD_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+for i = 2, #ARGV, 2 do
+    redis.call('ZINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+if tonumber(ARGV[1]) > 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return 1
+"""
+
+
+def rank_entries(rows, first_position: int, first_rank: int) -> list[dict]:
+    """
+    Attach competition ranks to a contiguous slice of a board.
+
+    Args:
+        rows: ``(userId, points)`` pairs in board order (points descending).
+        first_position (int): 0-based board position of ``rows[0]``.
+        first_rank (int): Rank of ``rows[0]`` (one plus the number of higher
+            scores on the board).
+
+    Returns:
+        list[dict]: ``{"userId", "points", "rank"}`` per row; a row tied with
+        its predecessor shares its rank, any other row is ranked by position.
+    """
+    entries: list[dict] = []
+    for offset, (user_id, points) in enumerate(rows):
+        points = int(points)
+        if not entries:
+            rank = first_rank
+        elif points == entries[-1]["points"]:
+            rank = entries[-1]["rank"]
+        else:
+            rank = first_position + offset + 1
+        entries.append({"userId": str(user_id), "points": points, "rank": rank})
+    return entries
+
+
+def _standing(user_id, points, rank, position, above, above_rank, below) -> dict:
+    """Assemble a standing from the user's slot and the slices around it."""
+    return {
+        "entry": {"userId": str(user_id), "points": int(points), "rank": rank},
+        "above": rank_entries(above, position - len(above), above_rank),
+        # Ranked from the user's own slot so a tie with the user shares its rank.
+        "below": rank_entries([(user_id, points), *below], position, rank)[1:],
+    }
+
+
+@runtime_checkable
+class LeaderboardBackend(Protocol):
+    """Serve the ranked reads of the per-game leaderboards."""
+
+    async def record(self, gameId, awards: Iterable) -> None:
+        """Mirror committed awards; called after the award transaction."""
+        ...
+
+    async def discard(self, gameId, awards: Iterable) -> None:
+        """Drop the mirrored boards ``awards`` land on, after ``record`` failed."""
+        ...
+
+    async def top(self, gameId, period: str, start: datetime, limit: int) -> list:
+        """The ``limit`` best entries of a board."""
+        ...
+
+    async def standing(
+        self, gameId, period: str, start: datetime, userId, neighbours: int
+    ) -> Optional[dict]:
+        """A user's entry plus up to ``neighbours`` entries either side."""
+        ...
+
+
+class DatabaseLeaderboardBackend:
+    """
+    Backend that reads ``game_leaderboard`` directly.
+
+    :meth:`record` is a no-op: the rows are already merged inside the award
+    transaction by :meth:`GameLeaderboardRepository.record_awards`.
+    """
+
+    def __init__(self, repository: GameLeaderboardRepository) -> None:
+        self._repository = repository
+
+    async def record(self, gameId, awards: Iterable) -> None:
+        """Nothing to mirror; the award transaction wrote the rows."""
+        del gameId, awards
+
+    async def discard(self, gameId, awards: Iterable) -> None:
+        """Nothing mirrored, so nothing to drop."""
+        del gameId, awards
+
+    async def top(self, gameId, period: str, start: datetime, limit: int) -> list:
+        """
+        Read the best ``limit`` entries of a board.
+
+        Args:
+            gameId: Game of the board.
+            period (str): ``all``, ``day`` or ``week``.
+            start (datetime): Start of the window.
+            limit (int): Number of entries.
+
+        Returns:
+            list: Ranked entries (see :func:`rank_entries`).
+        """
+        rows = await self._repository.read_top(gameId, period, start, limit)
+        return rank_entries(rows, 0, 1)
+
+    async def standing(
+        self, gameId, period: str, start: datetime, userId, neighbours: int
+    ) -> Optional[dict]:
+        """
+        Read a user's rank and the entries around it.
+
+        Args:
+            gameId: Game of the board.
+            period (str): ``all``, ``day`` or ``week``.
+            start (datetime): Start of the window.
+            userId: Internal id of the user.
+            neighbours (int): Entries to return above and below the user.
+
+        Returns:
+            Optional[dict]: ``{"entry", "above", "below"}``, or ``None`` when
+            the user has no score on the board.
+        """
+        standing = await self._repository.read_standing(gameId, period, start, userId)
+        if standing is None:
+            return None
+        above, below = [], []
+        if neighbours:
+            above, below = await self._repository.read_neighbours(
+                gameId, period, start, userId, standing.points, neighbours
+            )
+        above_rank = 1
+        if above:
+            above_rank = 1 + await self._repository.count_higher(
+                gameId, period, start, above[0][1]
+            )
+        return _standing(
+            userId,
+            standing.points,
+            standing.higher + 1,
+            standing.position,
+            above,
+            above_rank,
+            below,
+        )
+
+
+class RedisLeaderboardBackend:
+    """
+    Backend that mirrors every board into a Redis sorted set.
+
+    One key per board (``{prefix}{gameId}:{period}:{epoch}``), members are
+    user ids and scores their points. Day and week keys get a TTL refreshed
+    on every write, so past windows age out of Redis and are then served by
+    the database. ``ZREVRANGE`` lists ties in descending member order, the
+    same order the database uses, so both backends return identical slices.
+
+    A board only takes increments once it is in Redis. While recording
+    awards in the first half of a day or week, the backend also opens the
+    game's next window as an empty board. No award of that window can have
+    been mirrored yet, so the board is complete from its first award on.
+    """
+
+    def __init__(
+        self,
+        client,
+        repository: GameLeaderboardRepository,
+        key_prefix: str = "game:lb:",
+        window_ttl_seconds: int = 2_678_400,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._client = client
+        self._repository = repository
+        self._fallback = DatabaseLeaderboardBackend(repository)
+        self._key_prefix = key_prefix
+        self._window_ttl_seconds = max(1, int(window_ttl_seconds))
+        self._clock = clock
+        self._record_script = client.register_script(_RECORD_SCRIPT)
+
+    def _build_key(self, gameId, period: str, start: datetime) -> str:
+        """Return the sorted-set key of one board."""
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        return f"{self._key_prefix}{gameId}:{period}:{int(start.timestamp())}"
+
+    async def record(self, gameId, awards: Iterable) -> None:
+        """
+        Add committed awards to the sorted sets in one pipelined round-trip.
+
+        Each board is incremented by one script call that leaves boards
+        missing from Redis alone; those keep being read from the database.
+
+        Args:
+            gameId: Game the awards belong to.
+            awards (Iterable): ``user_points`` rows.
+        """
+        deltas = fold_awards(gameId, awards)
+        if not deltas:
+            return
+        boards: dict = {}
+        for (period, start, user_id), delta in deltas.items():
+            boards.setdefault((period, start), []).extend((delta["points"], user_id))
+        now = self._clock()
+        pipe = self._client.pipeline(transaction=False)
+        for (period, start), increments in boards.items():
+            ttl = 0 if period == "all" else self._window_ttl_seconds
+            await self._record_script(
+                keys=[self._build_key(gameId, period, start)],
+                args=[ttl, *increments],
+                client=pipe,
+            )
+            window = _WINDOWS.get(period)
+            if window is not None and now < (start + window / 2).timestamp():
+                following = self._build_key(gameId, period, start + window)
+                pipe.zadd(following, {_OPEN_MEMBER: float("-inf")}, nx=True)
+                pipe.expire(following, self._window_ttl_seconds)
+        await pipe.execute()
+
+    async def discard(self, gameId, awards: Iterable) -> None:
+        """
+        Delete the boards ``awards`` land on, so reads fall back to the
+        database until ``scripts/leaderboard.py rebuild`` reloads them.
+
+        Args:
+            gameId: Game the awards belong to.
+            awards (Iterable): ``user_points`` rows whose mirroring failed.
+        """
+        keys = {
+            self._build_key(gameId, period, start)
+            for period, start, _ in fold_awards(gameId, awards)
+        }
+        if keys:
+            await self._client.delete(*keys)
+
+    async def load(self, gameId, period: str, start: datetime, rows) -> None:
+        """
+        Replace one board's sorted set with ``rows``.
+
+        Args:
+            gameId: Game of the board.
+            period (str): ``all``, ``day`` or ``week``.
+            start (datetime): Start of the window.
+            rows: ``(userId, points)`` pairs, in any order.
+        """
+        key = self._build_key(gameId, period, start)
+        scores = {str(user_id): int(points) for user_id, points in rows}
+        members = list(scores.items())
+        pipe = self._client.pipeline(transaction=True)
+        pipe.delete(key)
+        for offset in range(0, len(members), _LOAD_BATCH):
+            pipe.zadd(key, dict(members[offset : offset + _LOAD_BATCH]))
+        if period != "all" and members:
+            pipe.expire(key, self._window_ttl_seconds)
+        await pipe.execute()
+
+    async def top(self, gameId, period: str, start: datetime, limit: int) -> list:
+        """
+        Read the best ``limit`` entries with one ``ZREVRANGE``.
+
+        Falls back to the database when the board is not in Redis.
+        """
+        key = self._build_key(gameId, period, start)
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            pipe.exists(key)
+            pipe.zrevrange(key, 0, limit - 1, withscores=True)
+            exists, rows = await pipe.execute()
+        except Exception as exc:  # noqa: BLE001 - degrade to the database
+            logger.warning("Leaderboard read from Redis failed: %s", exc)
+            exists = False
+        if not exists:
+            return await self._fallback.top(gameId, period, start, limit)
+        return rank_entries([row for row in rows if row[0] != _OPEN_MEMBER], 0, 1)
+
+    async def standing(
+        self, gameId, period: str, start: datetime, userId, neighbours: int
+    ) -> Optional[dict]:
+        """
+        Read a user's rank (``ZCOUNT`` of higher scores) and neighbours.
+
+        Falls back to the database when the board is not in Redis.
+        """
+        key = self._build_key(gameId, period, start)
+        member = str(userId)
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            pipe.exists(key)
+            pipe.zscore(key, member)
+            pipe.zrevrank(key, member)
+            exists, score, position = await pipe.execute()
+            if exists and score is not None:
+                return await self._standing_from_redis(
+                    key, member, int(score), position, neighbours
+                )
+        except Exception as exc:  # noqa: BLE001 - degrade to the database
+            logger.warning("Leaderboard read from Redis failed: %s", exc)
+            exists = False
+        if not exists:
+            return await self._fallback.standing(
+                gameId, period, start, userId, neighbours
+            )
+        return None
+
+    async def _standing_from_redis(
+        self, key: str, member: str, points: int, position: int, neighbours: int
+    ) -> dict:
+        """Fetch the higher-score count and both neighbour slices."""
+        pipe = self._client.pipeline(transaction=False)
+        pipe.zcount(key, f"({points}", "+inf")
+        # ``ZREVRANGE key 0 -1`` is the whole set, so never ask for an empty
+        # slice above the leader.
+        with_above = neighbours > 0 and position > 0
+        if with_above:
+            pipe.zrevrange(
+                key, max(0, position - neighbours), position - 1, withscores=True
+            )
+        if neighbours > 0:
+            pipe.zrevrange(key, position + 1, position + neighbours, withscores=True)
+        results = await pipe.execute()
+        higher = int(results[0])
+        above = results[1] if with_above else []
+        below = results[-1] if neighbours > 0 else []
+        below = [row for row in below if row[0] != _OPEN_MEMBER]
+        above_rank = 1
+        if above:
+            above_rank += int(await self._client.zcount(key, f"({above[0][1]}", "+inf"))
+        return _standing(member, points, higher + 1, position, above, above_rank, below)
+
+
+def build_leaderboard_backend(
+    repository: GameLeaderboardRepository,
+    backend_name: str,
+    redis_url: Optional[str],
+    redis_key_prefix: str,
+    window_ttl_seconds: int,
+) -> LeaderboardBackend:
+    """
+    Select the configured backend. Falls back to the DB backend with a
+    warning when Redis is requested but ``REDIS_URL`` is missing -- the
+    leaderboards stay correct, just without the sorted-set reads.
+    """
+    normalized = (backend_name or "database").strip().lower()
+    if normalized == "redis":
+        if not redis_url:
+            logger.warning(
+                "LEADERBOARD_BACKEND=redis but REDIS_URL is empty; "
+                "falling back to the database-backed leaderboard."
+            )
+            return DatabaseLeaderboardBackend(repository)
+        client = build_redis_client_from_url(redis_url)
+        return RedisLeaderboardBackend(
+            client,
+            repository,
+            key_prefix=redis_key_prefix,
+            window_ttl_seconds=window_ttl_seconds,
+        )
+    return DatabaseLeaderboardBackend(repository)
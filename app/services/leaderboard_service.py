@@ -0,0 +1,192 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.core.exceptions import NotFoundError
+from app.repository.game_leaderboard_repository import (
+    GameLeaderboardRepository,
+    period_start,
+)
+from app.repository.game_repository import GameRepository
+from app.repository.user_repository import UserRepository
+from app.schema.leaderboard_schema import (
+    Leaderboard,
+    LeaderboardEntry,
+    LeaderboardPeriod,
+    LeaderboardStanding,
+)
+from app.services.game_access import get_authorized_game
+from app.services.leaderboard_backend import (
+    DatabaseLeaderboardBackend,
+    LeaderboardBackend,
+)
+
+
+class LeaderboardService:
+    """
+    Ranked reads over the per-game leaderboards.
+
+    Scores come from the configured :class:`LeaderboardBackend`; this service
+    resolves the window, checks access to the game and maps internal user ids
+    to external ones.
+    """
+
+    def __init__(
+        self,
+        game_repository: GameRepository,
+        user_repository: UserRepository,
+        leaderboard_repository: GameLeaderboardRepository,
+        leaderboard_backend: Optional[LeaderboardBackend] = None,
+    ) -> None:
+        self.game_repository = game_repository
+        self.user_repository = user_repository
+        self.leaderboard_repository = leaderboard_repository
+        self.leaderboard_backend = leaderboard_backend or DatabaseLeaderboardBackend(
+            leaderboard_repository
+        )
+
+    async def _read_game(self, gameId, api_key, oauth_user_id, is_admin, enforce_scope):
+        """Load the game, enforcing the caller's scope when requested."""
+        if enforce_scope:
+            return await get_authorized_game(
+                self.game_repository,
+                gameId,
+                api_key=api_key,
+                oauth_user_id=oauth_user_id,
+                is_admin=is_admin,
+            )
+        game = await self.game_repository.read_by_id(
+            gameId, not_found_raise_exception=False
+        )
+        if not game:
+            raise NotFoundError(detail=f"Game not found by gameId: {gameId}")
+        return game
+
+    async def _to_entries(self, ranked: list) -> list[LeaderboardEntry]:
+        """Replace internal user ids with external ones, keeping the order."""
+        external_ids = await self.leaderboard_repository.read_external_user_ids(
+            [entry["userId"] for entry in ranked]
+        )
+        return [
+            LeaderboardEntry(
+                rank=entry["rank"],
+                externalUserId=external_ids.get(entry["userId"], entry["userId"]),
+                points=entry["points"],
+            )
+            for entry in ranked
+        ]
+
+    async def get_leaderboard(
+        self,
+        gameId,
+        period: LeaderboardPeriod = LeaderboardPeriod.ALL,
+        limit: int = 10,
+        at: Optional[datetime] = None,
+        *,
+        api_key: str = None,
+        oauth_user_id: str = None,
+        is_admin: bool = False,
+        enforce_scope: bool = False,
+    ) -> Leaderboard:
+        """
+        Return the best ``limit`` users of one leaderboard window.
+
+        Args:
+            gameId: Internal game identifier.
+            period (LeaderboardPeriod): ``all``, ``day`` or ``week``.
+            limit (int): Number of entries.
+            at (Optional[datetime]): Any instant in the wanted window;
+                defaults to now.
+            api_key (str): Caller's API key, used when ``enforce_scope``.
+            oauth_user_id (str): Caller's OAuth subject, used when scoping.
+            is_admin (bool): Whether the caller has the admin role.
+            enforce_scope (bool): When ``True``, verify the caller may access
+                the game.
+
+        Returns:
+            Leaderboard: The window and its ranked entries.
+
+        Raises:
+            NotFoundError: If the game does not exist.
+        """
+        game = await self._read_game(
+            gameId, api_key, oauth_user_id, is_admin, enforce_scope
+        )
+        period = LeaderboardPeriod(period)
+        start = period_start(period.value, at or datetime.now(timezone.utc))
+        ranked = await self.leaderboard_backend.top(game.id, period.value, start, limit)
+        return Leaderboard(
+            gameId=str(game.id),
+            period=period,
+            periodStart=start,
+            entries=await self._to_entries(ranked),
+        )
+
+    async def get_user_standing(
+        self,
+        gameId,
+        externalUserId: str,
+        period: LeaderboardPeriod = LeaderboardPeriod.ALL,
+        neighbours: int = 0,
+        at: Optional[datetime] = None,
+        *,
+        api_key: str = None,
+        oauth_user_id: str = None,
+        is_admin: bool = False,
+        enforce_scope: bool = False,
+    ) -> LeaderboardStanding:
+        """
+        Return a user's rank on one leaderboard window and its neighbours.
+
+        Args:
+            gameId: Internal game identifier.
+            externalUserId (str): External identifier of the user.
+            period (LeaderboardPeriod): ``all``, ``day`` or ``week``.
+            neighbours (int): Entries to include above and below the user.
+            at (Optional[datetime]): Any instant in the wanted window;
+                defaults to now.
+            api_key (str): Caller's API key, used when ``enforce_scope``.
+            oauth_user_id (str): Caller's OAuth subject, used when scoping.
+            is_admin (bool): Whether the caller has the admin role.
+            enforce_scope (bool): When ``True``, verify the caller may access
+                the game.
+
+        Returns:
+            LeaderboardStanding: The user's entry and the entries around it.
+
+        Raises:
+            NotFoundError: If the game or user does not exist, or the user
+                has no points in the window.
+        """
+        game = await self._read_game(
+            gameId, api_key, oauth_user_id, is_admin, enforce_scope
+        )
+        user = await self.user_repository.read_by_column(
+            "externalUserId", externalUserId, not_found_raise_exception=False
+        )
+        if not user:
+            raise NotFoundError(detail=f"User not found: {externalUserId}")
+        period = LeaderboardPeriod(period)
+        start = period_start(period.value, at or datetime.now(timezone.utc))
+        standing = await self.leaderboard_backend.standing(
+            game.id, period.value, start, user.id, neighbours
+        )
+        if standing is None:
+            raise NotFoundError(
+                detail=(
+                    f"User {externalUserId} has no points on the {period.value} "
+                    f"leaderboard of game {game.id}"
+                )
+            )
+        # One id lookup for the user and both neighbour slices.
+        entries = await self._to_entries(
+            standing["above"] + [standing["entry"]] + standing["below"]
+        )
+        position = len(standing["above"])
+        return LeaderboardStanding(
+            gameId=str(game.id),
+            period=period,
+            periodStart=start,
+            entry=entries[position],
+            above=entries[:position],
+            below=entries[position + 1 :],
+        )
@@ -1,4 +1,8 @@
+from typing import Optional
+
 from app.repository.logs_repository import LogsRepository
+from app.schema.logs_schema import CreateLogs
+from app.services.audit_log_sink import AuditLogSink
 from app.services.base_service import BaseService
 
 
@@ -8,16 +12,38 @@ class LogsService(BaseService):
 
     Attributes:
         logs_repository (LogsRepository): Repository instance for logs.
+        audit_log_sink (Optional[AuditLogSink]): Buffered writer used by
+          :meth:`record`; ``None`` writes every row inline.
 
     """
 
-    def __init__(self, logs_repository: LogsRepository) -> None:
+    def __init__(
+        self,
+        logs_repository: LogsRepository,
+        audit_log_sink: Optional[AuditLogSink] = None,
+    ) -> None:
         """
         Initializes the LogsService with the provided repositories and
           services.
 
         Args:
             logs_repository: The logs repository instance.
+            audit_log_sink: The process-wide buffered audit log writer.
         """
         self.logs_repository = logs_repository
+        self.audit_log_sink = audit_log_sink
         super().__init__(logs_repository)
+
+    async def record(self, log_entry: CreateLogs) -> None:
+        """
+        Persist an audit log row off the request path when possible.
+
+        The row is handed to the buffered writer; only when there is none
+        (or it is disabled or shut down) is it inserted inline.
+
+        Args:
+            log_entry (CreateLogs): The row to persist.
+        """
+        if self.audit_log_sink is not None and self.audit_log_sink.submit(log_entry):
+            return
+        await self.add(log_entry)
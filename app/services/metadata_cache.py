@@ -0,0 +1,433 @@
+"""
+Read-through cache for the metadata every scoring request resolves.
+
+Awarding points looks up the ``Games`` row by id, the task by
+``(gameId, externalTaskId)`` and, for ``custom:`` strategies, the
+``StrategyDefinition`` by ``(realmId, strategyId)``. Those rows almost never
+change, so :class:`ScoringMetadataCache` keeps a compact, JSON-safe snapshot
+of each and the write paths that mutate them (``GameService``, the task
+mutations and the ``StrategyDefinitionService`` lifecycle) invalidate it
+explicitly. The TTL bounds staleness for anything that bypasses those paths.
+
+Backends mirror ``apikey_cache_backend``: the in-memory backend is a bounded
+per-process LRU (invalidations only reach the worker that performed the
+write; other workers converge within the TTL), the Redis backend shares one
+keyspace so invalidations are seen by every worker on the next request.
+Selection is driven by ``configs.METADATA_CACHE_BACKEND`` and wired in
+``app/core/container.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from time import monotonic
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Optional, Protocol, runtime_checkable
+from uuid import UUID
+
+from app.schema.strategy_definition_schema import StrategyDefinitionRead
+from app.services.rate_limit_counter_backend import build_redis_client_from_url
+
+logger = logging.getLogger(__name__)
+
+_GAME_FIELDS = (
+    "id",
+    "externalGameId",
+    "strategyId",
+    "platform",
+    "apiKey_used",
+    "oauth_user_id",
+)
+_TASK_FIELDS = ("id", "externalTaskId", "gameId", "strategyId", "status")
+
+
+@runtime_checkable
+class MetadataCacheBackend(Protocol):
+    """Store JSON-safe metadata payloads under string keys."""
+
+    async def get(self, key: str) -> Optional[dict]:
+        """Return the payload stored under ``key``, or ``None`` if absent."""
+        ...
+
+    async def set(self, key: str, value: dict, ttl_seconds: int) -> None:
+        """Store ``value`` under ``key`` with a ``ttl_seconds`` lifetime."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove the entry for ``key`` if present."""
+        ...
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """Remove every entry whose key starts with ``prefix``."""
+        ...
+
+    async def clear(self) -> None:
+        """Remove every cached entry."""
+        ...
+
+
+class InMemoryMetadataCacheBackend:
+    """
+    Per-process LRU with monotonic TTL and lazy eviction.
+
+    Holds at most ``max_entries`` payloads; the least recently read entry is
+    dropped first. The asyncio lock is lazy-bound on first use, as in
+    ``InMemoryApiKeyCacheBackend``.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self._store: OrderedDict = OrderedDict()
+        self._max_entries = max(1, int(max_entries))
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """
+        Return the asyncio lock, binding it to the current loop on first use.
+
+        Returns:
+            asyncio.Lock: The lazily-created per-instance lock.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def get(self, key: str) -> Optional[dict]:
+        """
+        Return the cached payload for ``key``, evicting it if expired.
+
+        Args:
+            key (str): The namespaced metadata key.
+
+        Returns:
+            Optional[dict]: The payload, or ``None`` if absent or past its TTL.
+        """
+        now = monotonic()
+        async with self._get_lock():
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                self._store.pop(key, None)
+                return None
+            self._store.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: dict, ttl_seconds: int) -> None:
+        """
+        Cache ``value`` under ``key`` for ``ttl_seconds`` (no-op if ≤ 0).
+
+        Args:
+            key (str): The namespaced metadata key.
+            value (dict): The payload to store.
+            ttl_seconds (int): Lifetime in seconds; values ≤ 0 are ignored.
+        """
+        if ttl_seconds <= 0:
+            return
+        expires_at = monotonic() + ttl_seconds
+        async with self._get_lock():
+            self._store[key] = (expires_at, value)
+            self._store.move_to_end(key)
+            while len(self._store) > self._max_entries:
+                self._store.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """
+        Remove the cached entry for ``key`` if present.
+
+        Args:
+            key (str): The namespaced metadata key.
+        """
+        async with self._get_lock():
+            self._store.pop(key, None)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """
+        Remove every cached entry whose key starts with ``prefix``.
+
+        Args:
+            prefix (str): Key prefix to evict.
+        """
+        async with self._get_lock():
+            for key in [key for key in self._store if key.startswith(prefix)]:
+                self._store.pop(key, None)
+
+    async def clear(self) -> None:
+        """Remove every cached entry (async wrapper over ``sync_clear``)."""
+        self.sync_clear()
+
+    def sync_clear(self) -> None:
+        """Clear the store synchronously and reset the lock for a new loop."""
+        self._store.clear()
+        self._lock = None
+
+
+class RedisMetadataCacheBackend:
+    """
+    Redis-backed cache shared across workers. Payloads are stored as JSON
+    with TTL set via the ``EX`` argument on ``SET`` so Redis handles
+    expiration server-side.
+    """
+
+    def __init__(self, client, key_prefix: str = "game:metadata:") -> None:
+        self._client = client
+        self._key_prefix = key_prefix
+
+    def _build_key(self, key: str) -> str:
+        """
+        Namespace a metadata key with the configured Redis prefix.
+
+        Args:
+            key (str): The bare metadata key.
+
+        Returns:
+            str: The prefixed Redis key.
+        """
+        return f"{self._key_prefix}{key}"
+
+    async def get(self, key: str) -> Optional[dict]:
+        """
+        Read and deserialize a cached payload from Redis.
+
+        Args:
+            key (str): The namespaced metadata key.
+
+        Returns:
+            Optional[dict]: The decoded payload, or ``None`` if absent.
+        """
+        raw = await self._client.get(self._build_key(key))
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    async def set(self, key: str, value: dict, ttl_seconds: int) -> None:
+        """
+        Store ``value`` as JSON in Redis with a server-side TTL (no-op if ≤ 0).
+
+        Args:
+            key (str): The namespaced metadata key.
+            value (dict): The payload to store.
+            ttl_seconds (int): Expiry passed to Redis ``SET ... EX``.
+        """
+        if ttl_seconds <= 0:
+            return
+        await self._client.set(
+            self._build_key(key), json.dumps(value), ex=max(1, int(ttl_seconds))
+        )
+
+    async def delete(self, key: str) -> None:
+        """
+        Delete a single cached entry from Redis.
+
+        Args:
+            key (str): The namespaced metadata key.
+        """
+        await self._client.delete(self._build_key(key))
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """
+        Delete every entry under ``prefix`` via a bounded SCAN + DEL.
+
+        Args:
+            prefix (str): Key prefix to evict.
+        """
+        # Only reached from admin write paths (game/task/strategy edits),
+        # never from the scoring hot path.
+        pattern = f"{self._build_key(prefix)}*"
+        async for key in self._client.scan_iter(match=pattern, count=500):
+            await self._client.delete(key)
+
+    async def clear(self) -> None:
+        """Delete every entry under the key prefix."""
+        await self.delete_prefix("")
+
+
+def build_metadata_cache_backend(
+    backend_name: str,
+    redis_url: Optional[str],
+    redis_key_prefix: str,
+    max_entries: int,
+) -> MetadataCacheBackend:
+    """
+    Select the configured backend. Falls back to the in-memory backend with
+    a warning when Redis is requested but ``REDIS_URL`` is missing, like
+    :func:`app.services.apikey_cache_backend.build_apikey_cache_backend`.
+    """
+    normalized = (backend_name or "memory").strip().lower()
+    if normalized == "redis":
+        if not redis_url:
+            logger.warning(
+                "METADATA_CACHE_BACKEND=redis but REDIS_URL is empty; "
+                "falling back to the in-process metadata cache."
+            )
+            return InMemoryMetadataCacheBackend(max_entries=max_entries)
+        client = build_redis_client_from_url(redis_url)
+        return RedisMetadataCacheBackend(client, key_prefix=redis_key_prefix)
+    return InMemoryMetadataCacheBackend(max_entries=max_entries)
+
+
+def _realm_segment(realm_id: Optional[str]) -> str:
+    """Key segment for a realm (``~`` stands for "no realm")."""
+    return "~" if realm_id is None else str(realm_id)
+
+
+class ScoringMetadataCache:
+    """
+    Read-through cache of game, task and custom strategy metadata.
+
+    Getters take a loader coroutine that reads the row on a miss; rows that
+    do not exist are never cached. Game and task hits are returned as
+    ``SimpleNamespace`` snapshots carrying only the fields the scoring paths
+    read; strategy definitions round-trip as ``StrategyDefinitionRead``.
+
+    Keys:
+        ``game:<gameId>``, ``task:<gameId>:<externalTaskId>`` and
+        ``strategy:<realmId>:<strategyId>``.
+    """
+
+    def __init__(self, backend: MetadataCacheBackend, ttl_seconds: int) -> None:
+        self.backend = backend
+        self.ttl_seconds = int(ttl_seconds)
+
+    async def _get_or_load(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Any]],
+        to_payload: Callable[[Any], dict],
+        from_payload: Callable[[dict], Any],
+    ) -> Any:
+        """
+        Return the cached value for ``key`` or load, cache and return it.
+
+        Args:
+            key (str): The namespaced metadata key.
+            load: Coroutine function reading the row; may return ``None``.
+            to_payload: Converts the loaded row into a JSON-safe dict.
+            from_payload: Rebuilds the returned value from a payload.
+
+        Returns:
+            Any: The rebuilt value, or ``None`` when the row does not exist.
+        """
+        if self.ttl_seconds > 0:
+            payload = await self.backend.get(key)
+            if payload is not None:
+                return from_payload(payload)
+        row = await load()
+        if row is None:
+            return None
+        payload = to_payload(row)
+        await self.backend.set(key, payload, self.ttl_seconds)
+        return from_payload(payload)
+
+    async def get_game(self, game_id, load) -> Optional[SimpleNamespace]:
+        """
+        Return the game ``game_id``, reading it with ``load`` on a miss.
+
+        Args:
+            game_id: Internal identifier of the game.
+            load: Coroutine function returning the ``Games`` row or ``None``.
+
+        Returns:
+            Optional[SimpleNamespace]: The game snapshot, or ``None``.
+        """
+        return await self._get_or_load(
+            f"game:{game_id}",
+            load,
+            lambda game: _snapshot_payload(game, _GAME_FIELDS),
+            lambda payload: SimpleNamespace(**{**payload, "id": UUID(payload["id"])}),
+        )
+
+    async def get_task(
+        self, game_id, external_task_id: str, load
+    ) -> Optional[SimpleNamespace]:
+        """
+        Return the task ``external_task_id`` of ``game_id``, loading on a miss.
+
+        Args:
+            game_id: Internal identifier of the game.
+            external_task_id (str): External identifier of the task.
+            load: Coroutine function returning the ``Tasks`` row or ``None``.
+
+        Returns:
+            Optional[SimpleNamespace]: The task snapshot, or ``None``.
+        """
+        return await self._get_or_load(
+            f"task:{game_id}:{external_task_id}",
+            load,
+            lambda task: _snapshot_payload(task, _TASK_FIELDS),
+            lambda payload: SimpleNamespace(
+                **{
+                    **payload,
+                    "id": UUID(payload["id"]),
+                    "gameId": UUID(payload["gameId"]),
+                }
+            ),
+        )
+
+    async def get_strategy_definition(
+        self, realm_id: Optional[str], strategy_id, load
+    ) -> Optional[StrategyDefinitionRead]:
+        """
+        Return a custom strategy definition, loading it on a miss.
+
+        Args:
+            realm_id (Optional[str]): Realm the definition is scoped to.
+            strategy_id: Identifier of the ``StrategyDefinition`` row.
+            load: Coroutine function returning a ``StrategyDefinitionRead``.
+
+        Returns:
+            Optional[StrategyDefinitionRead]: The definition, or ``None``.
+        """
+        return await self._get_or_load(
+            f"strategy:{_realm_segment(realm_id)}:{strategy_id}",
+            load,
+            lambda definition: definition.model_dump(mode="json"),
+            StrategyDefinitionRead.model_validate,
+        )
+
+    async def invalidate_game(self, game_id) -> None:
+        """Forget a game and every task cached under it."""
+        await self.backend.delete(f"game:{game_id}")
+        await self.backend.delete_prefix(f"task:{game_id}:")
+
+    async def invalidate_task(self, game_id, external_task_id: str) -> None:
+        """Forget one task of a game."""
+        await self.backend.delete(f"task:{game_id}:{external_task_id}")
+
+    async def invalidate_strategies(self, realm_id: Optional[str]) -> None:
+        """Forget every custom strategy definition cached for a realm."""
+        await self.backend.delete_prefix(f"strategy:{_realm_segment(realm_id)}:")
+
+    async def invalidate_strategy_assignments(self) -> None:
+        """Forget every game and task (after a bulk ``strategyId`` rewrite)."""
+        await self.backend.delete_prefix("game:")
+        await self.backend.delete_prefix("task:")
+
+
+def _snapshot_payload(row, fields) -> dict:
+    """JSON-safe dict of ``fields`` read from ``row`` (UUIDs as strings)."""
+    payload = {}
+    for field in fields:
+        value = getattr(row, field, None)
+        payload[field] = str(value) if isinstance(value, UUID) else value
+    return payload
+
+
+def build_scoring_metadata_cache(
+    backend_name: str,
+    redis_url: Optional[str],
+    redis_key_prefix: str,
+    ttl_seconds: int,
+    max_entries: int,
+) -> ScoringMetadataCache:
+    """Build the :class:`ScoringMetadataCache` over the configured backend."""
+    backend = build_metadata_cache_backend(
+        backend_name=backend_name,
+        redis_url=redis_url,
+        redis_key_prefix=redis_key_prefix,
+        max_entries=max_entries,
+    )
+    return ScoringMetadataCache(backend, ttl_seconds=ttl_seconds)
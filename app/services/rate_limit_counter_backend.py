@@ -7,6 +7,13 @@ backend uses ``INCR`` + ``SET NX EX`` which is atomic, ~50 us per request,
 and naturally distributed across API instances -- the cost an ``UPDATE`` on
 a hot row in Postgres does not pay.
 
+Both backends also take a whole batch of buckets through ``increment_many``
+(one multi-row upsert, or one ``MULTI/EXEC`` pipeline), so a request checked
+against several limits pays a single round trip. With
+``ABUSE_RATE_LIMIT_LEASE_SIZE`` above one, ``LeasedRateLimitCounterBackend``
+sits in front and reserves counter values in chunks, so most requests are
+answered in-process.
+
 Selection is driven by ``configs.ABUSE_PREVENTION_BACKEND`` and wired in
 ``app/core/container.py``.
 """
@@ -14,17 +21,51 @@ Selection is driven by ``configs.ABUSE_PREVENTION_BACKEND`` and wired in
 from __future__ import annotations
 
 import logging
+import time
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Optional, Protocol, runtime_checkable
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    runtime_checkable,
+)
 
 from app.repository.abuse_limit_counter_repository import AbuseLimitCounterRepository
 
 logger = logging.getLogger(__name__)
 
+# Leases are only swept for finished windows once this many are held.
+_LEASE_PRUNE_THRESHOLD = 4096
+
+
+class RateLimitBucket(NamedTuple):
+    """
+    One counter bucket of an ``increment_many`` batch.
+
+    ``max_allowed`` is the cap the caller enforces on the bucket (``0`` when
+    unknown); only the leasing pre-filter reads it. ``amount`` is how far to
+    move the counter.
+    """
+
+    scope_type: str
+    scope_value: str
+    window_name: str
+    window_start: datetime
+    ttl_seconds: int
+    max_allowed: int = 0
+    amount: int = 1
+
 
 @runtime_checkable
 class RateLimitCounterBackend(Protocol):
-    """Increment a per-bucket counter and return its new value."""
+    """Increment per-bucket counters and return their new values."""
 
     async def increment_and_get(
         self,
@@ -37,6 +78,16 @@ class RateLimitCounterBackend(Protocol):
         """Increment the bucket's counter and return its new value."""
         ...
 
+    async def increment_many(self, buckets: Sequence[RateLimitBucket]) -> List[int]:
+        """Increment every bucket in one round trip; values in input order."""
+        ...
+
+    async def refund_many(
+        self, buckets: Sequence[RateLimitBucket], values: Sequence[int]
+    ) -> None:
+        """Undo an ``increment_many(buckets)`` call that returned ``values``."""
+        ...
+
 
 class DatabaseRateLimitCounterBackend:
     """
@@ -82,6 +133,56 @@ class DatabaseRateLimitCounterBackend:
             window_start=window_start,
         )
 
+    async def increment_many(self, buckets: Sequence[RateLimitBucket]) -> List[int]:
+        """
+        Increment several DB-backed counters with one upsert statement.
+
+        Args:
+            buckets (Sequence[RateLimitBucket]): Buckets to increment; their
+                ``ttl_seconds`` are ignored by this backend.
+
+        Returns:
+            List[int]: The counter value of each bucket, in input order.
+        """
+        return await self._repository.increment_many(
+            [
+                (
+                    bucket.scope_type,
+                    bucket.scope_value,
+                    bucket.window_name,
+                    bucket.window_start,
+                    bucket.amount,
+                )
+                for bucket in buckets
+            ]
+        )
+
+    async def refund_many(
+        self, buckets: Sequence[RateLimitBucket], values: Sequence[int]
+    ) -> None:
+        """
+        Move DB-backed counters back by their ``amount`` in one upsert.
+
+        Args:
+            buckets (Sequence[RateLimitBucket]): Buckets passed to
+                :meth:`increment_many`.
+            values (Sequence[int]): Unused by this backend.
+        """
+        del values
+        if buckets:
+            await self._repository.increment_many(
+                [
+                    (
+                        bucket.scope_type,
+                        bucket.scope_value,
+                        bucket.window_name,
+                        bucket.window_start,
+                        -bucket.amount,
+                    )
+                    for bucket in buckets
+                ]
+            )
+
 
 class RedisRateLimitCounterBackend:
     """
@@ -176,6 +277,296 @@ class RedisRateLimitCounterBackend:
         results = await pipe.execute()
         return int(results[1])
 
+    async def increment_many(self, buckets: Sequence[RateLimitBucket]) -> List[int]:
+        """
+        Increment several Redis-backed counters in one ``MULTI/EXEC``.
+
+        Queues the same ``SET NX EX`` + ``INCRBY`` pair as
+        :meth:`increment_and_get` for every bucket into a single
+        transactional pipeline, so the batch is one round trip and no key is
+        ever visible without a TTL.
+
+        Args:
+            buckets (Sequence[RateLimitBucket]): Buckets to increment.
+
+        Returns:
+            List[int]: The counter value of each bucket, in input order.
+        """
+        if not buckets:
+            return []
+
+        pipe = self._client.pipeline(transaction=True)
+        for bucket in buckets:
+            key = self._build_key(
+                bucket.scope_type,
+                bucket.scope_value,
+                bucket.window_name,
+                bucket.window_start,
+            )
+            pipe.set(key, 0, ex=max(1, int(bucket.ttl_seconds)), nx=True)
+            pipe.incr(key, bucket.amount)
+        results = await pipe.execute()
+        return [int(value) for value in results[1::2]]
+
+    async def refund_many(
+        self, buckets: Sequence[RateLimitBucket], values: Sequence[int]
+    ) -> None:
+        """
+        Move Redis-backed counters back by their ``amount`` in one
+        ``MULTI/EXEC``.
+
+        The ``SET NX EX`` is queued again so a key that expired in between
+        is recreated with a TTL rather than left without one.
+
+        Args:
+            buckets (Sequence[RateLimitBucket]): Buckets passed to
+                :meth:`increment_many`.
+            values (Sequence[int]): Unused by this backend.
+        """
+        del values
+        if not buckets:
+            return
+        pipe = self._client.pipeline(transaction=True)
+        for bucket in buckets:
+            key = self._build_key(
+                bucket.scope_type,
+                bucket.scope_value,
+                bucket.window_name,
+                bucket.window_start,
+            )
+            pipe.set(key, 0, ex=max(1, int(bucket.ttl_seconds)), nx=True)
+            pipe.incr(key, -bucket.amount)
+        await pipe.execute()
+
+
+class _Lease:
+    """Counter values a worker reserved for one bucket and has not handed out."""
+
+    __slots__ = ("ranges", "seen", "expires_at")
+
+    def __init__(self, expires_at: float) -> None:
+        self.ranges: Deque[List[int]] = deque()
+        self.seen = 0
+        self.expires_at = expires_at
+
+    def take(self) -> Optional[int]:
+        """Hand out the next reserved counter value, if any is left."""
+        while self.ranges:
+            span = self.ranges[0]
+            if span[0] <= span[1]:
+                value = span[0]
+                span[0] += 1
+                return value
+            self.ranges.popleft()
+        return None
+
+
+class LeasedRateLimitCounterBackend:
+    """
+    In-process pre-filter that leases counter values from a shared backend.
+
+    Instead of one ``INCR`` per request, a worker moves a bucket's shared
+    counter by ``lease_size`` at once and hands the reserved values
+    ``total - lease_size + 1 .. total`` out locally. The backend is only
+    consulted again once the lease runs out or the bucket's window (its
+    ``ttl_seconds`` past ``window_start``) is over.
+
+    Every counter value is handed out exactly once across all workers, so the
+    caller's ``counter > max_allowed`` check never admits more than the cap.
+    The price is slack in the other direction: values a worker has reserved
+    but not used yet are counted against the cap, so a cluster of ``N``
+    workers may start rejecting up to ``N * (lease_size - 1)`` requests
+    early. To keep the boundary precise, a lease never reserves more than
+    the bucket's remaining headroom as last seen by this worker, which
+    shrinks leases to single increments right before the cap. Once a
+    worker has seen a bucket's counter reach its cap and its lease is dry,
+    it rejects locally until the window ends: the counter only grows, so
+    asking again cannot change the answer.
+
+    Buckets without a ``max_allowed`` are passed straight through.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitCounterBackend,
+        lease_size: int,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._backend = backend
+        self._lease_size = max(1, int(lease_size))
+        self._clock = clock
+        self._leases: Dict[tuple, _Lease] = {}
+
+    async def increment_and_get(
+        self,
+        scope_type: str,
+        scope_value: str,
+        window_name: str,
+        window_start: datetime,
+        ttl_seconds: int,
+    ) -> int:
+        """
+        Count one hit on a bucket whose cap is unknown.
+
+        Without a cap a lease cannot be sized safely, so this goes straight
+        to the shared backend.
+        """
+        return await self._backend.increment_and_get(
+            scope_type=scope_type,
+            scope_value=scope_value,
+            window_name=window_name,
+            window_start=window_start,
+            ttl_seconds=ttl_seconds,
+        )
+
+    async def increment_many(self, buckets: Sequence[RateLimitBucket]) -> List[int]:
+        """
+        Count ``amount`` hits on every bucket, from local leases where
+        possible.
+
+        Buckets whose lease is empty or expired, and buckets counting more
+        than one hit, are refilled together in a single ``increment_many``
+        call on the shared backend.
+
+        Args:
+            buckets (Sequence[RateLimitBucket]): Buckets to count.
+
+        Returns:
+            List[int]: The counter value of each bucket, in input order.
+        """
+        now = self._clock()
+        values: List[Optional[int]] = [None] * len(buckets)
+        misses: Dict[tuple, List[int]] = {}
+        for index, bucket in enumerate(buckets):
+            key = self._lease_key(bucket)
+            lease = self._leases.get(key)
+            if lease is not None and lease.expires_at <= now:
+                del self._leases[key]
+                lease = None
+            if lease is not None and key not in misses and bucket.amount == 1:
+                value = lease.take()
+                if value is None and lease.seen >= bucket.max_allowed:
+                    # Dry and at the cap: the shared counter only grows.
+                    value = lease.seen + 1
+                if value is not None:
+                    values[index] = value
+                    continue
+            misses.setdefault(key, []).append(index)
+
+        if misses:
+            await self._refill(buckets, misses, values, now)
+        return values
+
+    async def refund_many(
+        self, buckets: Sequence[RateLimitBucket], values: Sequence[int]
+    ) -> None:
+        """
+        Give back the counter values an ``increment_many`` call handed out.
+
+        A value within the cap was reserved on the shared counter, so the
+        shared counter is moved back by it: the cap still bounds the values
+        admitted across workers, since unused ones are no longer counted.
+        A value past the cap was answered locally or from a spent bucket and
+        is not refunded; this worker keeps rejecting the bucket until its
+        window ends, as it would have anyway.
+
+        Args:
+            buckets (Sequence[RateLimitBucket]): Buckets passed to
+                :meth:`increment_many`.
+            values (Sequence[int]): The values it returned.
+        """
+        refunds = [
+            (bucket, value)
+            for bucket, value in zip(buckets, values)
+            if bucket.max_allowed <= 0 or value <= bucket.max_allowed
+        ]
+        if refunds:
+            await self._backend.refund_many(
+                [bucket for bucket, _ in refunds], [value for _, value in refunds]
+            )
+
+    async def _refill(
+        self,
+        buckets: Sequence[RateLimitBucket],
+        misses: Dict[tuple, List[int]],
+        values: List[Optional[int]],
+        now: float,
+    ) -> None:
+        """
+        Lease fresh values for ``misses`` in one backend call and hand them
+        out to the waiting indexes.
+        """
+        requests = []
+        for key, indexes in misses.items():
+            bucket = buckets[indexes[0]]
+            lease = self._leases.get(key)
+            seen = lease.seen if lease is not None else 0
+            size = sum(buckets[index].amount for index in indexes)
+            if bucket.max_allowed > 0:
+                headroom = bucket.max_allowed - seen
+                size = max(size, min(self._lease_size, headroom))
+            requests.append((key, bucket._replace(amount=size)))
+
+        totals = await self._backend.increment_many([bucket for _, bucket in requests])
+
+        if len(self._leases) > _LEASE_PRUNE_THRESHOLD:
+            self._prune(now)
+        for (key, bucket), total in zip(requests, totals):
+            first = int(total) - bucket.amount + 1
+            if bucket.max_allowed <= 0:
+                # No cap to size a lease against: nothing stays reserved.
+                value = first - 1
+                for index in misses[key]:
+                    value += buckets[index].amount
+                    values[index] = value
+                continue
+            lease = self._leases.get(key)
+            if lease is None:
+                lease = _Lease(self._window_end(bucket))
+                self._leases[key] = lease
+            # Values past the cap would only be rejected; don't keep them.
+            lease.ranges.append([first, min(int(total), bucket.max_allowed)])
+            lease.seen = max(lease.seen, int(total))
+            for index in misses[key]:
+                values[index] = self._take(lease, buckets[index].amount)
+
+    @staticmethod
+    def _take(lease: _Lease, amount: int) -> int:
+        """
+        Hand ``amount`` values out of ``lease`` and return the last one, or
+        a value past the cap once the lease runs dry.
+        """
+        value = None
+        for _ in range(amount):
+            value = lease.take()
+            if value is None:
+                return lease.seen + 1
+        return value
+
+    def _prune(self, now: float) -> None:
+        """Drop leases whose window is over."""
+        for key in [
+            key for key, lease in self._leases.items() if lease.expires_at <= now
+        ]:
+            del self._leases[key]
+
+    @staticmethod
+    def _lease_key(bucket: RateLimitBucket) -> tuple:
+        """Identify a bucket the way the shared backends do."""
+        return (
+            bucket.scope_type,
+            bucket.scope_value,
+            bucket.window_name,
+            RedisRateLimitCounterBackend._bucket_epoch(bucket.window_start),
+        )
+
+    @staticmethod
+    def _window_end(bucket: RateLimitBucket) -> float:
+        """Unix time after which the bucket's lease is stale."""
+        return RedisRateLimitCounterBackend._bucket_epoch(bucket.window_start) + max(
+            1, int(bucket.ttl_seconds)
+        )
+
 
 def build_redis_client_from_url(url: str) -> Any:
     """
@@ -202,13 +593,30 @@ def build_rate_limit_counter_backend(
     backend_name: str,
     redis_url: Optional[str],
     redis_key_prefix: str,
+    lease_size: int = 1,
 ) -> RateLimitCounterBackend:
     """
     Select the configured backend. Falls back to the DB backend with a
     warning when Redis is requested but ``REDIS_URL`` is missing -- so a
     misconfigured deploy still rate-limits (just slower) instead of opening
-    the floodgates.
+    the floodgates. A ``lease_size`` above one puts the chosen backend behind
+    a :class:`LeasedRateLimitCounterBackend`.
     """
+    backend = _build_shared_backend(
+        repository, backend_name, redis_url, redis_key_prefix
+    )
+    if lease_size > 1:
+        return LeasedRateLimitCounterBackend(backend, lease_size=lease_size)
+    return backend
+
+
+def _build_shared_backend(
+    repository: AbuseLimitCounterRepository,
+    backend_name: str,
+    redis_url: Optional[str],
+    redis_key_prefix: str,
+) -> RateLimitCounterBackend:
+    """Build the database or Redis backend named by ``backend_name``."""
     normalized = (backend_name or "database").strip().lower()
     if normalized == "redis":
         if not redis_url:
@@ -27,6 +27,7 @@ from app.core.exceptions import (
     DuplicatedError,
     NotFoundError,
 )
+from app.engine.dsl_strategy import invalidate_published_strategies
 from app.engine.dsl_validator import validate_ast
 from app.model.strategy_definition import (
     StrategyDefinition,
@@ -75,6 +76,7 @@ class StrategyDefinitionService(BaseService):
         strategy_definition_repository: StrategyDefinitionRepository,
         game_repository=None,
         task_repository=None,
+        metadata_cache=None,
     ) -> None:
         """
         ``game_repository`` and ``task_repository`` are optional so legacy
@@ -83,12 +85,32 @@ class StrategyDefinitionService(BaseService):
         The rollback flow requires both - when missing,
         :meth:`rollback` raises a precise error rather than silently
         leaving cascade UPDATEs undone.
+
+        ``metadata_cache`` is the scoring hot path's
+        :class:`ScoringMetadataCache`; lifecycle changes drop the realm's
+        cached definitions from it so scoring never runs a stale AST.
         """
         self.strategy_definition_repository = strategy_definition_repository
         self.game_repository = game_repository
         self.task_repository = task_repository
+        self.metadata_cache = metadata_cache
         super().__init__(strategy_definition_repository)
 
+    async def _invalidate_cached_strategies(
+        self, realmId: Optional[str], *, assignments: bool = False
+    ) -> None:
+        """
+        Drop the realm's compiled strategies and cached definitions of
+        ``realmId`` (and, with ``assignments``, every cached game/task
+        ``strategyId``) from the metadata cache.
+        """
+        invalidate_published_strategies(realmId)
+        if self.metadata_cache is None:
+            return
+        await self.metadata_cache.invalidate_strategies(realmId)
+        if assignments:
+            await self.metadata_cache.invalidate_strategy_assignments()
+
     @staticmethod
     def _to_read(row: StrategyDefinition) -> StrategyDefinitionRead:
         """
@@ -349,6 +371,7 @@ class StrategyDefinitionService(BaseService):
                 experimentTag=merged["experimentTag"],
             )
             updated = await self.strategy_definition_repository.update(id, patch)
+            await self._invalidate_cached_strategies(realmId)
             return self._to_read(updated)
 
         # PUBLISHED → fork a new draft with the merged contents.
@@ -424,6 +447,7 @@ class StrategyDefinitionService(BaseService):
             status=StrategyDefinitionStatus.PUBLISHED.value,
             publishedAt=datetime.now(timezone.utc),
         )
+        await self._invalidate_cached_strategies(realmId)
         return await self.get_strategy(id=id, realmId=realmId)
 
     async def archive(
@@ -459,6 +483,7 @@ class StrategyDefinitionService(BaseService):
             id=str(row.id),
             status=StrategyDefinitionStatus.ARCHIVED.value,
         )
+        await self._invalidate_cached_strategies(realmId)
         return await self.get_strategy(id=id, realmId=realmId)
 
     async def list_versions(
@@ -659,6 +684,9 @@ class StrategyDefinitionService(BaseService):
                 old_strategy_id=old_strategy_id,
                 new_strategy_id=new_strategy_id,
             )
+        await self._invalidate_cached_strategies(
+            realmId, assignments=displaced is not None
+        )
 
         promoted = await self.get_strategy(id=str(target.id), realmId=realmId)
         return RollbackResult(
@@ -0,0 +1,201 @@
+"""
+Service that replays a game's recorded scoring events against a candidate
+strategy and reports how the awards would have differed.
+
+The replay itself (in-memory analytics, sharding, diffing) lives in
+:mod:`app.engine.replay`; this service resolves the game and the candidate
+strategy and turns the repositories' chronological streams into replay
+events. Nothing is written back.
+"""
+
+from __future__ import annotations
+
+import heapq
+from concurrent.futures import Executor
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Mapping, Optional
+
+from app.core.exceptions import BadRequestError
+from app.engine.replay import (
+    ACTION,
+    AWARD,
+    DEFAULT_HORIZON_SECONDS,
+    DIRECT,
+    DIRECT_ASSIGNMENT_CASE_NAME,
+    HISTORY,
+    CandidateStrategy,
+    ReplayEvent,
+    run_replay,
+)
+from app.repository.game_repository import GameRepository
+from app.repository.user_actions_repository import UserActionsRepository
+from app.repository.user_points_repository import UserPointsRepository
+from app.services.base_service import BaseService
+from app.services.strategy_service import StrategyService
+
+
+async def _merge_streams(*streams: AsyncIterator[ReplayEvent]):
+    """Merge chronological event streams into one, by ``created_at``."""
+    iterators = [stream.__aiter__() for stream in streams]
+    heap = []
+    for index, iterator in enumerate(iterators):
+        event = await anext(iterator, None)
+        if event is not None:
+            heap.append((event.created_at, index, event))
+    heapq.heapify(heap)
+    while heap:
+        _, index, event = heap[0]
+        yield event
+        following = await anext(iterators[index], None)
+        if following is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (following.created_at, index, following))
+
+
+class StrategyReplayService(BaseService):
+    def __init__(
+        self,
+        game_repository: GameRepository,
+        user_points_repository: UserPointsRepository,
+        user_actions_repository: UserActionsRepository,
+        strategy_service: StrategyService,
+    ) -> None:
+        self.game_repository = game_repository
+        self.user_points_repository = user_points_repository
+        self.user_actions_repository = user_actions_repository
+        self.strategy_service = strategy_service
+        super().__init__(user_points_repository)
+
+    async def _candidate(
+        self,
+        strategyId: str,
+        realmId: Optional[str],
+        variables: Optional[Mapping[str, Any]],
+    ) -> CandidateStrategy:
+        """Resolve ``strategyId`` into a picklable candidate."""
+        resolved = await self.strategy_service.resolve(strategyId, realmId=realmId)
+        if resolved["kind"] == "BUILT_IN":
+            return CandidateStrategy(
+                strategy_id=strategyId, variables=dict(variables or {})
+            )
+        return CandidateStrategy(
+            strategy_id=strategyId,
+            definition=resolved["definition"].model_dump(),
+        )
+
+    async def _points_events(self, gameId, since, until) -> AsyncIterator[ReplayEvent]:
+        """History before ``since`` (timestamps only), then the window."""
+        if since is not None:
+            async for row in self.user_points_repository.stream_game_points(
+                gameId, until=since, with_payload=False
+            ):
+                yield ReplayEvent(
+                    HISTORY, row.created_at, row.externalTaskId, row.externalUserId
+                )
+        async for row in self.user_points_repository.stream_game_points(
+            gameId, since=since, until=until
+        ):
+            kind = DIRECT if row.caseName == DIRECT_ASSIGNMENT_CASE_NAME else AWARD
+            yield ReplayEvent(
+                kind,
+                row.created_at,
+                row.externalTaskId,
+                row.externalUserId,
+                row.points,
+                row.caseName,
+                row.data,
+            )
+
+    async def _action_events(
+        self, externalGameId, since, until
+    ) -> AsyncIterator[ReplayEvent]:
+        async for row in self.user_actions_repository.stream_game_actions(
+            externalGameId, since=since, until=until
+        ):
+            yield ReplayEvent(
+                ACTION,
+                row.created_at,
+                row.externalTaskId,
+                row.externalUserId,
+                data=row.data,
+            )
+
+    async def replay(
+        self,
+        *,
+        gameId,
+        strategyId: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        realmId: Optional[str] = None,
+        variables: Optional[Mapping[str, Any]] = None,
+        include_user_actions: bool = False,
+        shards: int = 1,
+        horizon_seconds: int = DEFAULT_HORIZON_SECONDS,
+        top_users: int = 10,
+        executor: Optional[Executor] = None,
+    ) -> Dict[str, Any]:
+        """
+        Re-score a game's recorded events with a candidate strategy.
+
+        Every strategy award recorded in ``[since, until)`` is scored again
+        with the candidate against the analytics the game had at that
+        instant, and compared with what was awarded. Direct assignments are
+        counted but not re-scored. With ``include_user_actions``, actions
+        tagged with the game (``data.externalGameId``/``externalTaskId``)
+        are scored too, against an actual award of 0.
+
+        Args:
+            gameId: Internal game identifier.
+            strategyId (str): Candidate built-in id or ``custom:<uuid>``.
+            since (Optional[datetime]): Window start; earlier history only
+                seeds the analytics.
+            until (Optional[datetime]): Window end (exclusive).
+            realmId (Optional[str]): Realm scoping custom strategy lookups.
+            variables (Optional[Mapping[str, Any]]): ``variable_*``
+                overrides for a built-in candidate.
+            include_user_actions (bool): Also score the game's user actions.
+            shards (int): Task shards replayed in parallel processes.
+            horizon_seconds (int): Longest look-back window the candidate
+                may query.
+            top_users (int): Users listed with the largest point deltas.
+            executor (Optional[Executor]): Runs the shards instead of a
+                private process pool.
+
+        Returns:
+            dict: The replay report (see ``ReplayDiff.as_dict``) plus the
+            game, strategy and window.
+
+        Raises:
+            NotFoundError: If the game or strategy does not exist.
+            BadRequestError: If the window is empty or the strategy cannot
+                be replayed offline.
+        """
+        if since is not None and until is not None and since >= until:
+            raise BadRequestError(detail="'since' must be earlier than 'until'.")
+        game = await self.game_repository.read_by_id(gameId)
+        candidate = await self._candidate(strategyId, realmId, variables)
+
+        streams = [self._points_events(gameId, since, until)]
+        if include_user_actions:
+            streams.append(self._action_events(game.externalGameId, since, until))
+        try:
+            diff = await run_replay(
+                candidate,
+                game.externalGameId,
+                _merge_streams(*streams),
+                shards=shards,
+                horizon_seconds=horizon_seconds,
+                executor=executor,
+            )
+        except ValueError as exc:
+            raise BadRequestError(detail=str(exc)) from exc
+        return {
+            "gameId": str(gameId),
+            "externalGameId": game.externalGameId,
+            "strategyId": strategyId,
+            "since": since.isoformat() if since else None,
+            "until": until.isoformat() if until else None,
+            **diff.as_dict(top_users),
+        }
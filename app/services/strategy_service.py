@@ -2,11 +2,16 @@ from typing import Any, Optional
 
 from app.core.config import configs
 from app.core.exceptions import InternalServerError, NotFoundError
-from app.engine.all_engine_strategies import all_engine_strategies
+from app.engine.all_engine_strategies import engine_strategy, engine_strategy_metadata
 from app.engine.base_strategy import BaseStrategy
 from app.engine.dsl_interpreter import DslInterpreter
-from app.engine.dsl_strategy import DslStrategy
+from app.engine.dsl_strategy import (
+    DslStrategy,
+    cache_published_strategy,
+    get_cached_published_strategy,
+)
 from app.services.base_service import BaseService
+from app.services.metadata_cache import ScoringMetadataCache
 from app.services.strategy_definition_service import StrategyDefinitionService
 
 # Prefix used to address DB-persisted custom strategies from the existing
@@ -73,6 +78,7 @@ class StrategyService(BaseService):
         dsl_interpreter: Optional[DslInterpreter] = None,
         analytics_service: Optional[Any] = None,
         execution_observer: Optional[Any] = None,
+        metadata_cache: Optional[ScoringMetadataCache] = None,
     ) -> None:
         """
         Initializes the StrategyService.
@@ -90,6 +96,9 @@ class StrategyService(BaseService):
         by ``UserPointsService.__init__`` until the container injection
         lands; when missing, ``get_strategy_instance`` raises a precise
         ``InternalServerError`` instead of crashing with ``AttributeError``.
+
+        ``metadata_cache`` caches ``custom:`` definitions between scoring
+        requests; without it every resolution reads the definition row.
         """
         super().__init__(None)
         self._strategy_definition_service = strategy_definition_service
@@ -99,6 +108,7 @@ class StrategyService(BaseService):
         # so the legacy two-arg construction style in tests still works
         # - metrics + persistence become no-ops in that case.
         self._execution_observer = execution_observer
+        self._metadata_cache = metadata_cache
 
     def list_all_strategies(self) -> list[dict[str, Any]]:
         """
@@ -106,37 +116,30 @@ class StrategyService(BaseService):
 
         Custom DB-stored strategies are returned through the dedicated
         ``/v1/strategies/custom`` endpoints rather than mixed in here, so
-        the legacy contract of this endpoint stays stable.
+        the legacy contract of this endpoint stays stable. The payloads
+        (including ``hash_version``) are precomputed once per registry state.
         """
-        response = []
-        for strategy in all_engine_strategies():
-            hash_version = strategy._generate_hash_of_calculate_points()
-            response.append(
-                {
-                    "id": strategy.id,
-                    "name": strategy.get_strategy_name(),
-                    "description": strategy.get_strategy_description(),
-                    "version": strategy.get_strategy_version(),
-                    "variables": strategy.get_variables(),
-                    "hash_version": hash_version,
-                }
-            )
-        return response
+        return engine_strategy_metadata()
 
     def get_strategy_by_id(self, id) -> dict[str, Any]:
         """
         Retrieves a built-in strategy by its ID.
+
+        A dict lookup in the shared strategy table; the returned payload is
+        a copy the caller may mutate (e.g. to overlay game/task params).
         """
-        for strategy in self.list_all_strategies():
-            if strategy["id"] == id:
-                return strategy
-        raise NotFoundError(detail=f"Strategy not found with id: {id}")
+        strategy = engine_strategy_metadata(id)
+        if strategy is None:
+            raise NotFoundError(detail=f"Strategy not found with id: {id}")
+        return strategy
 
     def get_Class_by_id(self, id) -> Any:
         """
         Retrieves the instance of a built-in strategy by its ID.
 
-        Only handles the registry path; custom DSL strategies need a DB
+        Returns the process-wide shared instance (see
+        :func:`~app.engine.all_engine_strategies.engine_strategy`). Only
+        handles the registry path; custom DSL strategies need a DB
         round-trip and use the async :meth:`resolve` instead.
         """
         if is_custom_strategy_id(id):
@@ -146,10 +149,10 @@ class StrategyService(BaseService):
                     "resolve() method."
                 )
             )
-        for strategy in all_engine_strategies():
-            if strategy.id == id:
-                return strategy
-        raise NotFoundError(detail=f"Strategy not found with id: {id}")
+        strategy = engine_strategy(id)
+        if strategy is None:
+            raise NotFoundError(detail=f"Strategy not found with id: {id}")
+        return strategy
 
     async def resolve(
         self,
@@ -219,8 +222,9 @@ class StrategyService(BaseService):
         """
         Single async entrypoint that returns something with
         ``calculate_points(...)`` - either a built-in registry singleton
-        or a freshly-constructed ``DslStrategy`` wrapping a DB-persisted
-        AST.
+        or a ``DslStrategy`` wrapping a DB-persisted AST (built once per
+        published definition and reused, see
+        :func:`~app.engine.dsl_strategy.get_cached_published_strategy`).
 
         For non-``custom:`` ids this delegates to the sync
         ``get_Class_by_id`` so existing test patches on that method keep
@@ -252,9 +256,23 @@ class StrategyService(BaseService):
             )
 
         uuid_part = parse_custom_strategy_id(strategy_id)
-        definition = await self._strategy_definition_service.get_strategy(
-            id=uuid_part, realmId=realmId
-        )
+        # Published definitions are immutable, so the strategy built for
+        # one is reused for every later event without re-reading the row.
+        cached = get_cached_published_strategy(realmId, uuid_part)
+        if cached is not None:
+            return cached
+        if self._metadata_cache is not None:
+            definition = await self._metadata_cache.get_strategy_definition(
+                realmId,
+                uuid_part,
+                lambda: self._strategy_definition_service.get_strategy(
+                    id=uuid_part, realmId=realmId
+                ),
+            )
+        else:
+            definition = await self._strategy_definition_service.get_strategy(
+                id=uuid_part, realmId=realmId
+            )
 
         # DSL_EXTEND wraps a built-in parent with pre/post
         # rules. Resolve the parent here (sync registry lookup) and
@@ -277,10 +295,12 @@ class StrategyService(BaseService):
                 )
             parent_strategy = self.get_Class_by_id(definition.parentStrategyId)
 
-        return DslStrategy(
+        strategy = DslStrategy(
             definition=definition,
             interpreter=self._dsl_interpreter,
             analytics_service=self._analytics_service,
             parent_strategy=parent_strategy,
             observer=self._execution_observer,
         )
+        cache_published_strategy(realmId, strategy)
+        return strategy
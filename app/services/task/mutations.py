@@ -4,7 +4,7 @@ from typing import Optional
 from uuid import UUID
 
 from app.core.exceptions import BadRequestError, ConflictError, NotFoundError
-from app.engine.all_engine_strategies import all_engine_strategies
+from app.engine.all_engine_strategies import engine_strategy
 from app.model.strategy_definition import StrategyDefinitionStatus
 from app.schema.task_schema import (
     CreateTask,
@@ -48,9 +48,7 @@ class TaskMutationMixin(TaskServiceContext):
         duplication is cheaper than the extra abstraction.
         """
         if not is_custom_strategy_id(strategy_id):
-            strategies = all_engine_strategies()
-            strategy = next((s for s in strategies if s.id == strategy_id), None)
-            if not strategy:
+            if engine_strategy(strategy_id) is None:
                 raise NotFoundError(detail=f"Strategy with id: {strategy_id} not found")
             return
         if self.strategy_definition_service is None:
@@ -159,6 +157,8 @@ class TaskMutationMixin(TaskServiceContext):
 
         if changed_fields:
             task = await self.task_repository.patch_by_id(taskId, changed_fields)
+            if self.metadata_cache is not None:
+                await self.metadata_cache.invalidate_task(gameId, task.externalTaskId)
 
         updated_params = None
         if params_provided:
@@ -306,6 +306,8 @@ class TaskMutationMixin(TaskServiceContext):
             enforce_scope=enforce_scope,
         )
         await self.task_repository.delete_task_by_id(taskId)
+        if self.metadata_cache is not None:
+            await self.metadata_cache.invalidate_task(gameId, task.externalTaskId)
         return ResponseDeleteTask(
             taskId=task.id,
             gameId=gameId,
@@ -53,6 +53,11 @@ class TaskQueryMixin(TaskServiceContext):
         """
         Retrieves a list of tasks associated with a game by its game ID.
 
+        Besides the page of tasks, this reads the game params once and the
+        params of every listed task in one ``taskId IN (...)`` query, and
+        resolves each distinct strategy once, however many tasks the page
+        holds.
+
         Args:
             gameId (UUID): The game ID.
             find_query: The query for finding tasks.
@@ -81,21 +86,38 @@ class TaskQueryMixin(TaskServiceContext):
         )
         all_tasks = await self.task_repository.read_by_gameId(find_task_query)
 
-        strategy_data = self.strategy_service.get_strategy_by_id(game.strategyId)
+        tasks = all_tasks["items"]
         game_params = await self.game_params_repository.read_by_column(
             "gameId", game.id, not_found_raise_exception=False, only_one=False
         )
-        apply_strategy_variable_overrides(game_params, strategy_data)
-        cleaned_tasks = []
-        for task in all_tasks["items"]:
-            strategy_data = self.strategy_service.get_strategy_by_id(task.strategyId)
-            task_params = await self.task_params_repository.read_by_column(
-                "taskId", task.id, not_found_raise_exception=False, only_one=False
-            )
-            apply_strategy_variable_overrides(game_params, strategy_data)
+        params_by_task = await self.task_params_repository.read_by_taskIds(
+            [task.id for task in tasks]
+        )
 
+        # The game's own strategy is resolved first, as before: it validates
+        # game.strategyId and coerces the game param values in place, which
+        # the per-strategy overlays below then see.
+        apply_strategy_variable_overrides(
+            game_params, self.strategy_service.get_strategy_by_id(game.strategyId)
+        )
+        # One descriptor per distinct strategy, with the game params applied;
+        # each task gets its own copy to overlay its params onto.
+        strategies: dict[str, dict[str, Any]] = {}
+        cleaned_tasks = []
+        for task in tasks:
+            base_strategy = strategies.get(task.strategyId)
+            if base_strategy is None:
+                base_strategy = self.strategy_service.get_strategy_by_id(
+                    task.strategyId
+                )
+                apply_strategy_variable_overrides(game_params, base_strategy)
+                strategies[task.strategyId] = base_strategy
+            strategy_data = {
+                **base_strategy,
+                "variables": dict(base_strategy["variables"]),
+            }
+            task_params = params_by_task.get(task.id, [])
             apply_strategy_variable_overrides(task_params, strategy_data)
-            task_params = task_params if task_params else []
             task_cleaned = task.model_dump()
             task_cleaned["strategy"] = strategy_data
             task_cleaned["gameParams"] = game_params
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from app.core.exceptions import GoneError, NotFoundError
 from app.repository.game_repository import GameRepository
 from app.repository.task_repository import TaskRepository
@@ -14,6 +16,7 @@ from app.schema.user_actions_schema import (
 )
 from app.services.base_service import BaseService
 from app.services.game_access import get_authorized_game
+from app.services.metadata_cache import ScoringMetadataCache
 
 
 class UserActionsService(BaseService):
@@ -38,6 +41,7 @@ class UserActionsService(BaseService):
         users_repository: UserRepository,
         game_repository: GameRepository,
         task_repository: TaskRepository,
+        metadata_cache: Optional[ScoringMetadataCache] = None,
     ) -> None:
         """
         Initializes the UserPointsService with the provided repositories and
@@ -48,11 +52,14 @@ class UserActionsService(BaseService):
             users_repository: The user repository instance.
             game_repository: The game repository instance.
             task_repository: The task repository instance.
+            metadata_cache: Optional cache for game/task lookups shared
+                with the scoring hot path.
         """
         self.user_actions_repository = user_actions_repository
         self.users_repository = users_repository
         self.game_repository = game_repository
         self.task_repository = task_repository
+        self.metadata_cache = metadata_cache
         super().__init__(user_actions_repository)
 
     async def user_add_action_in_task(
@@ -89,12 +96,19 @@ class UserActionsService(BaseService):
                 api_key=api_key,
                 oauth_user_id=oauth_user_id,
                 is_admin=is_admin,
+                metadata_cache=self.metadata_cache,
             )
 
-        task = await self.task_repository.read_by_gameId_and_externalTaskId(
-            gameId,
-            externalTaskId,
-        )
+        def load_task():
+            return self.task_repository.read_by_gameId_and_externalTaskId(
+                gameId,
+                externalTaskId,
+            )
+
+        if self.metadata_cache is None:
+            task = await load_task()
+        else:
+            task = await self.metadata_cache.get_task(gameId, externalTaskId, load_task)
         if not task:
             raise NotFoundError(f"Task not found (externalTaskId) : {externalTaskId}")
 
@@ -8,12 +8,14 @@ unchanged constructor and method surface.
 """
 
 from app.services.user_points.assignment import PointsAssignmentMixin
+from app.services.user_points.batch import PointsBatchAssignmentMixin
 from app.services.user_points.persistence import PointsPersistenceMixin
 from app.services.user_points.queries import PointsQueryMixin
 from app.services.user_points.simulation import PointsSimulationMixin
 
 __all__ = [
     "PointsAssignmentMixin",
+    "PointsBatchAssignmentMixin",
     "PointsPersistenceMixin",
     "PointsQueryMixin",
     "PointsSimulationMixin",
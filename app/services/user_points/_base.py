@@ -14,6 +14,8 @@ from app.repository.user_points_repository import UserPointsRepository
 from app.repository.user_repository import UserRepository
 from app.repository.wallet_repository import WalletRepository
 from app.repository.wallet_transaction_repository import WalletTransactionRepository
+from app.services.leaderboard_backend import LeaderboardBackend
+from app.services.metadata_cache import ScoringMetadataCache
 from app.services.strategy_service import StrategyService
 
 # Cap parallel fan-out so a request over a large user/task list cannot
@@ -36,3 +38,5 @@ class UserPointsContext:
     wallet_repository: WalletRepository
     wallet_transaction_repository: WalletTransactionRepository
     strategy_service: StrategyService
+    metadata_cache: ScoringMetadataCache | None
+    leaderboard_backend: LeaderboardBackend | None
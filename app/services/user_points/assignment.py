@@ -22,6 +22,162 @@ logger = logging.getLogger(__name__)
 
 
 class PointsAssignmentMixin(PointsPersistenceMixin):
+    async def _read_scoring_game(
+        self,
+        gameId,
+        *,
+        api_key: str = None,
+        oauth_user_id: str = None,
+        is_admin: bool = False,
+        enforce_scope: bool = False,
+    ):
+        """
+        Resolve the game of a scoring request, through the metadata cache
+        when one is wired.
+
+        Raises:
+            NotFoundError: If the game does not exist.
+            ForbiddenError: If ``enforce_scope`` and the caller may not
+                access the game.
+        """
+        if enforce_scope:
+            return await get_authorized_game(
+                self.game_repository,
+                gameId,
+                api_key=api_key,
+                oauth_user_id=oauth_user_id,
+                is_admin=is_admin,
+                metadata_cache=self.metadata_cache,
+            )
+
+        def load():
+            return self.game_repository.read_by_column(
+                column="id",
+                value=gameId,
+                not_found_message=f"Game with gameId {gameId} not found",
+                only_one=True,
+            )
+
+        if self.metadata_cache is None:
+            return await load()
+        return await self.metadata_cache.get_game(gameId, load)
+
+    async def _read_scoring_task(self, gameId, externalTaskId: str):
+        """
+        Resolve a game's task by external id, through the metadata cache
+        when one is wired.
+
+        Raises:
+            NotFoundError: If the game has no such task.
+        """
+
+        def load():
+            return self.task_repository.read_by_gameId_and_externalTaskId(
+                gameId, externalTaskId
+            )
+
+        if self.metadata_cache is None:
+            task = await load()
+        else:
+            task = await self.metadata_cache.get_task(gameId, externalTaskId, load)
+        if not task:
+            raise NotFoundError(f"Task not found with externalTaskId: {externalTaskId}")
+        return task
+
+    async def _calculate_points_for_event(
+        self,
+        strategy_instance,
+        *,
+        externalGameId,
+        externalTaskId,
+        externalUserId,
+        data_to_add: dict,
+        fallback_case_name: str = None,
+    ) -> tuple[int, str]:
+        """
+        Run a strategy for one scoring event and validate its result.
+
+        Shared by the single-event and batched write paths so both apply the
+        same payload checks and error mapping. ``callbackData`` returned by
+        the strategy is merged into ``data_to_add`` in place.
+
+        Args:
+            strategy_instance: Resolved strategy exposing ``calculate_points``.
+            externalGameId: External identifier of the game.
+            externalTaskId: External identifier of the task.
+            externalUserId: External identifier of the user.
+            data_to_add (dict): Event payload handed to the strategy.
+            fallback_case_name (str, optional): Case name used when the
+                strategy does not return one.
+
+        Returns:
+            tuple[int, str]: The awarded points and the resolved case name.
+
+        Raises:
+            PreconditionFailedError: If the payload is invalid or the strategy
+                rejects the event (``points == -1``).
+            InternalServerError: If scoring crashes or yields no points or
+                case name.
+        """
+        try:
+            result_calculated_points = await strategy_instance.calculate_points(
+                externalGameId=externalGameId,
+                externalTaskId=externalTaskId,
+                externalUserId=externalUserId,
+                data=data_to_add,
+            )
+            points, case_name, callbackData = (result_calculated_points + (None,))[:3]
+            logger.debug(
+                "Calculated points result: points=%s case_name=%s callbackData_present=%s",
+                points,
+                case_name,
+                callbackData is not None,
+            )
+            if callbackData is not None:
+                data_to_add["callbackData"] = callbackData
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning(
+                "Invalid scoring payload for externalTaskId=%s externalUserId=%s: %s",
+                externalTaskId,
+                externalUserId,
+                str(exc),
+                exc_info=True,
+            )
+            raise PreconditionFailedError(
+                detail=(
+                    "Invalid scoring payload for strategy execution. "
+                    "Verify required fields and data types."
+                )
+            )
+        except Exception:
+            logger.exception(
+                "Error calculating points for externalTaskId=%s externalUserId=%s",
+                externalTaskId,
+                externalUserId,
+            )
+            raise InternalServerError(
+                detail=(
+                    f"Error in calculate points for task with externalTaskId: {externalTaskId} and user with externalUserId: {externalUserId}. Please try again later or contact support"  # noqa
+                )
+            )
+        if points == -1:
+            raise PreconditionFailedError(detail=(case_name))
+        if points is None:
+            raise InternalServerError(
+                detail=(
+                    f"Points not calculated for task with externalTaskId: {externalTaskId} and user with externalUserId: {externalUserId}. Beacuse the strategy don't have condition to calculate it or the strategy don't have a case name"  # noqa
+                )
+            )
+        if not case_name:
+            case_name = fallback_case_name
+        if not case_name:
+            raise InternalServerError(
+                detail=(
+                    f"Case name not resolved for task with externalTaskId: {externalTaskId} and user with externalUserId: {externalUserId}"  # noqa
+                )
+            )
+        return points, case_name
+
     async def assign_points_to_user_directly(
         self,
         gameId,
@@ -48,28 +204,16 @@ class PointsAssignmentMixin(PointsPersistenceMixin):
         externalUserId = schema.externalUserId
         is_a_created_user = False
 
-        if enforce_scope:
-            game = await get_authorized_game(
-                self.game_repository,
-                gameId,
-                api_key=api_key,
-                oauth_user_id=oauth_user_id,
-                is_admin=is_admin,
-            )
-        else:
-            game = await self.game_repository.read_by_column(
-                column="id",
-                value=gameId,
-                not_found_message=f"Game with gameId {gameId} not found",
-                only_one=True,
-            )
+        game = await self._read_scoring_game(
+            gameId,
+            api_key=api_key,
+            oauth_user_id=oauth_user_id,
+            is_admin=is_admin,
+            enforce_scope=enforce_scope,
+        )
         externalGameId = game.externalGameId
 
-        task = await self.task_repository.read_by_gameId_and_externalTaskId(
-            game.id, externalTaskId
-        )
-        if not task:
-            raise NotFoundError(f"Task not found with externalTaskId: {externalTaskId}")
+        task = await self._read_scoring_task(game.id, externalTaskId)
 
         strategyId = task.strategyId
         # Same async resolver used by ``assign_points_to_user``. This
@@ -118,6 +262,7 @@ class PointsAssignmentMixin(PointsPersistenceMixin):
             external_user_id=externalUserId,
             external_task_id=externalTaskId,
             idempotency_key=idempotency_key,
+            game_id=game.id,
         )
 
         return AssignedPointsToExternalUserId(
@@ -159,27 +304,15 @@ class PointsAssignmentMixin(PointsPersistenceMixin):
         """
         externalUserId = schema.externalUserId
         is_a_created_user = False
-        if enforce_scope:
-            game = await get_authorized_game(
-                self.game_repository,
-                gameId,
-                api_key=api_key,
-                oauth_user_id=oauth_user_id,
-                is_admin=is_admin,
-            )
-        else:
-            game = await self.game_repository.read_by_column(
-                column="id",
-                value=gameId,
-                not_found_message=(f"Game with gameId {gameId} not found"),
-                only_one=True,
-            )
-        externalGameId = game.externalGameId
-        task = await self.task_repository.read_by_gameId_and_externalTaskId(
-            game.id, externalTaskId
+        game = await self._read_scoring_game(
+            gameId,
+            api_key=api_key,
+            oauth_user_id=oauth_user_id,
+            is_admin=is_admin,
+            enforce_scope=enforce_scope,
         )
-        if not task:
-            raise NotFoundError(f"Task not found with externalTaskId: {externalTaskId}")
+        externalGameId = game.externalGameId
+        task = await self._read_scoring_task(game.id, externalTaskId)
         strategyId = task.strategyId
         # A single async resolver handles both built-in
         # registry ids and ``custom:<uuid>`` DSL strategies (scoped by
@@ -207,65 +340,16 @@ class PointsAssignmentMixin(PointsPersistenceMixin):
             strategyId, realmId=realm_id
         )
         data_to_add = schema.data
-        try:
-            if data_to_add is None:
-                data_to_add = {}
-            result_calculated_points = await strategy_instance.calculate_points(
-                externalGameId=externalGameId,
-                externalTaskId=externalTaskId,
-                externalUserId=externalUserId,
-                data=data_to_add,
-            )
-            points, case_name, callbackData = (result_calculated_points + (None,))[:3]
-            logger.debug(
-                "Calculated points result: points=%s case_name=%s callbackData_present=%s",
-                points,
-                case_name,
-                callbackData is not None,
-            )
-            if callbackData is not None:
-                data_to_add["callbackData"] = callbackData
-        except (KeyError, TypeError, ValueError) as exc:
-            logger.warning(
-                "Invalid scoring payload for externalTaskId=%s externalUserId=%s: %s",
-                externalTaskId,
-                externalUserId,
-                str(exc),
-                exc_info=True,
-            )
-            raise PreconditionFailedError(
-                detail=(
-                    "Invalid scoring payload for strategy execution. "
-                    "Verify required fields and data types."
-                )
-            )
-        except Exception:
-            logger.exception(
-                "Error calculating points for externalTaskId=%s externalUserId=%s",
-                externalTaskId,
-                externalUserId,
-            )
-            raise InternalServerError(
-                detail=(
-                    f"Error in calculate points for task with externalTaskId: {externalTaskId} and user with externalUserId: {externalUserId}. Please try again later or contact support"  # noqa
-                )
-            )
-        if points == -1:
-            raise PreconditionFailedError(detail=(case_name))
-        if points is None:
-            raise InternalServerError(
-                detail=(
-                    f"Points not calculated for task with externalTaskId: {externalTaskId} and user with externalUserId: {externalUserId}. Beacuse the strategy don't have condition to calculate it or the strategy don't have a case name"  # noqa
-                )
-            )
-        if not case_name:
-            case_name = getattr(schema, "caseName", None)
-        if not case_name:
-            raise InternalServerError(
-                detail=(
-                    f"Case name not resolved for task with externalTaskId: {externalTaskId} and user with externalUserId: {externalUserId}"  # noqa
-                )
-            )
+        if data_to_add is None:
+            data_to_add = {}
+        points, case_name = await self._calculate_points_for_event(
+            strategy_instance,
+            externalGameId=externalGameId,
+            externalTaskId=externalTaskId,
+            externalUserId=externalUserId,
+            data_to_add=data_to_add,
+            fallback_case_name=getattr(schema, "caseName", None),
+        )
         idempotency_key = self._extract_idempotency_key(data_to_add)
         user_points, _, _ = await self._persist_points_wallet_and_transaction(
             user_id=user.id,
@@ -278,6 +362,7 @@ class PointsAssignmentMixin(PointsPersistenceMixin):
             external_user_id=externalUserId,
             external_task_id=externalTaskId,
             idempotency_key=idempotency_key,
+            game_id=game.id,
         )
 
         response = AssignedPointsToExternalUserId(
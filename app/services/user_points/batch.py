@@ -0,0 +1,238 @@
+"""Batched points assignment (write path).
+
+Scores many events of one game per call. The game, tasks, users and
+strategies are resolved once for the whole batch, events are scored
+concurrently, and every successful event is written by
+:meth:`PointsPersistenceMixin._persist_points_batch` in a single transaction.
+Failures are reported per event instead of aborting the batch.
+"""
+
+import asyncio
+import logging
+
+from fastapi import HTTPException
+
+from app.core.config import configs
+from app.core.exceptions import NotFoundError, PreconditionFailedError
+from app.schema.task_schema import (
+    AssignedPointsBatch,
+    AssignedPointsBatchItem,
+    AssignedPointsToExternalUserId,
+)
+from app.services.strategy_service import resolve_realm_id
+from app.services.user_points._base import FANOUT_LIMIT
+from app.services.user_points.assignment import PointsAssignmentMixin
+from app.util.is_valid_slug import is_valid_slug
+
+logger = logging.getLogger(__name__)
+
+
+def _describe_event_error(exc: Exception) -> tuple[int, str]:
+    """Map an event failure to ``(statusCode, error)`` for the batch response.
+
+    Domain errors keep their HTTP status and detail; anything unexpected is
+    reported as a generic 500 so internals never leak into the payload.
+    """
+    if isinstance(exc, HTTPException):
+        return exc.status_code, str(exc.detail)
+    return 500, "Internal error while assigning points for this event."
+
+
+def _event_idempotency_key(data, index: int) -> str | None:
+    """Idempotency key of the event at ``index`` in a batch.
+
+    An explicit ``eventId`` or ``idempotencyKey`` is used as is. The
+    ``correlationId`` is shared by every event of the request, so it only
+    identifies an event together with its position: a retried batch maps
+    each event to the same key, while two events of one batch never share
+    one.
+    """
+    if not isinstance(data, dict):
+        return None
+    for key in ("eventId", "idempotencyKey"):
+        value = data.get(key)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    correlation_id = data.get("correlationId")
+    if isinstance(correlation_id, str) and correlation_id.strip():
+        return f"{correlation_id.strip()}:{index}"
+    return None
+
+
+class PointsBatchAssignmentMixin(PointsAssignmentMixin):
+    async def assign_points_to_users_batch(
+        self,
+        gameId,
+        events,
+        api_key: str = None,
+        *,
+        oauth_user_id: str = None,
+        is_admin: bool = False,
+        enforce_scope: bool = False,
+    ) -> AssignedPointsBatch:
+        """
+        Assign points for many ``(externalTaskId, externalUserId, data)``
+        events of one game.
+
+        Semantics per event match :meth:`assign_points_to_user`. Events in the
+        same batch are scored concurrently, so a strategy reading a user's
+        history sees the state before the batch, not earlier events of it.
+
+        Args:
+            gameId (UUID): The game ID.
+            events (list[AssignPointsEvent]): Events to score, in order.
+            api_key (str): The API key used.
+            oauth_user_id (str): Caller's OAuth subject, used when scoping.
+            is_admin (bool): Whether the caller has the admin role.
+            enforce_scope (bool): When ``True``, verify access to the game.
+
+        Returns:
+            AssignedPointsBatch: Per-event outcome, in request order.
+
+        Raises:
+            PreconditionFailedError: If the batch exceeds
+                ``POINTS_BATCH_MAX_EVENTS``.
+            NotFoundError: If the game does not exist.
+        """
+        if len(events) > configs.POINTS_BATCH_MAX_EVENTS:
+            raise PreconditionFailedError(
+                detail=(
+                    f"Batch has {len(events)} events; the maximum is "
+                    f"{configs.POINTS_BATCH_MAX_EVENTS}."
+                )
+            )
+        game = await self._read_scoring_game(
+            gameId,
+            api_key=api_key,
+            oauth_user_id=oauth_user_id,
+            is_admin=is_admin,
+            enforce_scope=enforce_scope,
+        )
+        externalGameId = game.externalGameId
+
+        tasks = await self.task_repository.read_by_gameId_and_externalTaskIds(
+            game.id, [event.externalTaskId for event in events]
+        )
+
+        external_user_ids = list(dict.fromkeys(e.externalUserId for e in events))
+        users = await self.users_repository.read_by_externalUserIds(external_user_ids)
+        missing_user_ids = [
+            external_user_id
+            for external_user_id in external_user_ids
+            if external_user_id not in users and is_valid_slug(external_user_id)
+        ]
+        created_user_ids = set()
+        if missing_user_ids:
+            created = await self.users_repository.create_users_by_externalUserIds(
+                missing_user_ids
+            )
+            users.update(created)
+            created_user_ids = set(created)
+
+        realm_id = resolve_realm_id(api_key=api_key, oauth_user_id=oauth_user_id)
+        strategies = {}
+        for strategy_id in {task.strategyId for task in tasks.values()}:
+            try:
+                strategies[strategy_id] = (
+                    await self.strategy_service.get_strategy_instance(
+                        strategy_id, realmId=realm_id
+                    )
+                )
+            except Exception as exc:
+                strategies[strategy_id] = exc
+
+        semaphore = asyncio.Semaphore(FANOUT_LIMIT)
+
+        async def _score(index: int, event) -> dict:
+            """Score one event under the shared concurrency semaphore."""
+            task = tasks.get(event.externalTaskId)
+            if task is None:
+                raise NotFoundError(
+                    f"Task not found with externalTaskId: {event.externalTaskId}"
+                )
+            user = users.get(event.externalUserId)
+            if user is None:
+                raise PreconditionFailedError(
+                    detail=(
+                        f"Invalid externalUserId: {event.externalUserId}. externalUserId should be a valid (Should have only alphanumeric characters and Underscore . Length should be between 3 and 50)"  # noqa
+                    )
+                )
+            strategy_instance = strategies[task.strategyId]
+            if isinstance(strategy_instance, Exception):
+                raise strategy_instance
+            data_to_add = event.data if event.data is not None else {}
+            async with semaphore:
+                points, case_name = await self._calculate_points_for_event(
+                    strategy_instance,
+                    externalGameId=externalGameId,
+                    externalTaskId=event.externalTaskId,
+                    externalUserId=event.externalUserId,
+                    data_to_add=data_to_add,
+                )
+            return {
+                "user_id": user.id,
+                "task_id": task.id,
+                "points": points,
+                "case_name": case_name,
+                "data_to_add": data_to_add,
+                "idempotency_key": _event_idempotency_key(data_to_add, index),
+            }
+
+        outcomes = await asyncio.gather(
+            *[_score(index, event) for index, event in enumerate(events)],
+            return_exceptions=True,
+        )
+
+        scored_indexes = [
+            index
+            for index, outcome in enumerate(outcomes)
+            if not isinstance(outcome, BaseException)
+        ]
+        try:
+            rows = await self._persist_points_batch(
+                entries=[outcomes[index] for index in scored_indexes],
+                description="Points assigned by GAME",
+                api_key=api_key,
+                game_id=game.id,
+            )
+            for index, row in zip(scored_indexes, rows):
+                outcomes[index]["row"] = row
+        except Exception as exc:
+            logger.exception(
+                "Batched points persistence failed for gameId=%s (%s events)",
+                gameId,
+                len(scored_indexes),
+            )
+            for index in scored_indexes:
+                outcomes[index] = exc
+
+        results = []
+        for index, (event, outcome) in enumerate(zip(events, outcomes)):
+            item = AssignedPointsBatchItem(
+                index=index,
+                externalTaskId=event.externalTaskId,
+                externalUserId=event.externalUserId,
+            )
+            if isinstance(outcome, BaseException):
+                item.statusCode, item.error = _describe_event_error(outcome)
+            else:
+                # A repeated idempotency key is answered with the stored row,
+                # which may differ from what this attempt computed.
+                row = outcome["row"]
+                item.result = AssignedPointsToExternalUserId(
+                    points=row.points,
+                    externalUserId=event.externalUserId,
+                    isACreatedUser=event.externalUserId in created_user_ids,
+                    gameId=gameId,
+                    externalTaskId=event.externalTaskId,
+                    caseName=row.caseName,
+                    created_at=str(row.created_at),
+                )
+            results.append(item)
+
+        succeeded = sum(1 for item in results if item.result is not None)
+        return AssignedPointsBatch(
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            results=results,
+        )
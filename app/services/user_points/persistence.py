@@ -1,9 +1,13 @@
 """Atomic persistence of a points assignment.
 
-Writes the ``user_points`` row, the wallet balance increment and the wallet
+Writes the ``user_points`` row, its ``user_task_stats`` rollup, its
+``game_leaderboard`` scores, the wallet balance increment and the wallet
 transaction inside a single DB transaction, with idempotency-key support.
+Once committed, the awards are mirrored to the configured leaderboard
+backend.
 """
 
+import logging
 from typing import Any
 
 from sqlalchemy.exc import DataError, IntegrityError, ProgrammingError
@@ -13,6 +17,38 @@ from app.schema.user_points_schema import UserPointsAssign
 from app.schema.wallet_transaction_schema import BaseWalletTransaction
 from app.services.user_points._base import UserPointsContext
 
+logger = logging.getLogger(__name__)
+
+
+async def mirror_leaderboard_awards(leaderboard_backend, game_id, awards) -> None:
+    """
+    Forward committed awards to the leaderboard backend.
+
+    ``game_leaderboard`` already holds the awards, so a failure does not
+    fail the write. The boards the awards land on are dropped instead,
+    since they may now lack them, and reads fall back to the table until
+    ``scripts/leaderboard.py rebuild`` reloads them.
+
+    Args:
+        leaderboard_backend: The configured backend; ``None`` skips the update.
+        game_id: Game the awards belong to; ``None`` skips the update.
+        awards (list): Committed ``user_points`` rows.
+    """
+    if game_id is None or leaderboard_backend is None or not awards:
+        return
+    try:
+        await leaderboard_backend.record(game_id, awards)
+    except Exception as exc:  # noqa: BLE001 - the award is committed
+        logger.warning("Leaderboard mirror update failed: %s", exc)
+        try:
+            await leaderboard_backend.discard(game_id, awards)
+        except Exception as discard_exc:  # noqa: BLE001
+            logger.error(
+                "Leaderboard boards could not be dropped after a failed "
+                "mirror update; run scripts/leaderboard.py rebuild: %s",
+                discard_exc,
+            )
+
 
 class PointsPersistenceMixin(UserPointsContext):
     @staticmethod
@@ -53,6 +89,31 @@ class PointsPersistenceMixin(UserPointsContext):
                 return value.strip()
         return None
 
+    async def _record_leaderboard_awards(self, game_id, awards, session) -> None:
+        """
+        Merge awards into the game's leaderboards inside the open transaction.
+
+        Args:
+            game_id: Game the awards belong to; ``None`` skips the update.
+            awards (list): Newly written ``user_points`` rows.
+            session: The transaction's session.
+        """
+        if game_id is None:
+            return
+        await self.user_points_repository.leaderboard_repository.record_awards(
+            game_id,
+            awards,
+            session=session,
+            auto_commit=False,
+        )
+
+    async def _mirror_leaderboard_awards(self, game_id, awards) -> None:
+        """Forward committed awards to the leaderboard backend.
+
+        See :func:`mirror_leaderboard_awards`.
+        """
+        await mirror_leaderboard_awards(self.leaderboard_backend, game_id, awards)
+
     async def _persist_points_wallet_and_transaction(
         self,
         *,
@@ -66,10 +127,12 @@ class PointsPersistenceMixin(UserPointsContext):
         external_user_id: str,
         external_task_id: str,
         idempotency_key: str = None,
+        game_id=None,
     ) -> tuple[Any, Any, Any]:
         """
-        Persists points assignment, wallet increment and wallet transaction in
-        one database transaction.
+        Persists points assignment, its ``user_task_stats`` rollup, its
+        leaderboard scores (when ``game_id`` is given), wallet increment and
+        wallet transaction in one database transaction.
         """
         async with self.user_points_repository.session_factory() as session:
             try:
@@ -98,6 +161,12 @@ class PointsPersistenceMixin(UserPointsContext):
                     session=session,
                     auto_commit=False,
                 )
+                await self.user_points_repository.task_stats_repository.record_awards(
+                    [user_points],
+                    session=session,
+                    auto_commit=False,
+                )
+                await self._record_leaderboard_awards(game_id, [user_points], session)
 
                 wallet = await self.wallet_repository.upsert_points_balance(
                     user_id=user_id,
@@ -130,10 +199,141 @@ class PointsPersistenceMixin(UserPointsContext):
                     )
 
                 await session.commit()
-                return user_points, wallet, transaction
             except (IntegrityError, DataError, ProgrammingError):
                 await session.rollback()
                 raise
             except Exception:
                 await session.rollback()
                 raise
+        await self._mirror_leaderboard_awards(game_id, [user_points])
+        return user_points, wallet, transaction
+
+    async def _persist_points_batch(
+        self,
+        *,
+        entries: list[dict],
+        description: str,
+        api_key: str,
+        game_id=None,
+    ) -> list[Any]:
+        """
+        Persists many scored events in one database transaction.
+
+        Batched counterpart of :meth:`_persist_points_wallet_and_transaction`:
+        idempotency keys are checked with one query, ``user_points`` and wallet
+        transactions are written as multi-row inserts, their
+        ``user_task_stats`` rollups are merged with one upsert, and wallet
+        balances are incremented with a single multi-row upsert (deltas
+        pre-aggregated per user). Entries repeating an idempotency key already
+        persisted, or seen earlier in the same batch, reuse that row and are
+        not re-applied.
+
+        Args:
+            entries (list[dict]): One dict per event with ``user_id``,
+                ``task_id``, ``points``, ``case_name``, ``data_to_add`` and
+                ``idempotency_key``.
+            description (str): Description stored on every ``user_points`` row.
+            api_key (str): API key recorded on every written row.
+            game_id: Game of the batch; its leaderboards are updated in the
+                same transaction when given.
+
+        Returns:
+            list: The ``user_points`` row for each entry, in input order.
+        """
+        if not entries:
+            return []
+        async with self.user_points_repository.session_factory() as session:
+            try:
+                existing = await self.user_points_repository.read_by_idempotency_keys(
+                    [
+                        (entry["user_id"], entry["task_id"], entry["idempotency_key"])
+                        for entry in entries
+                    ],
+                    session=session,
+                )
+                results: list[Any] = [None] * len(entries)
+                first_index_by_key: dict[tuple, int] = {}
+                duplicates: dict[int, int] = {}
+                new_indexes: list[int] = []
+                for index, entry in enumerate(entries):
+                    key = (
+                        str(entry["user_id"]),
+                        str(entry["task_id"]),
+                        entry["idempotency_key"],
+                    )
+                    if entry["idempotency_key"]:
+                        if key in existing:
+                            results[index] = existing[key]
+                            continue
+                        if key in first_index_by_key:
+                            duplicates[index] = first_index_by_key[key]
+                            continue
+                        first_index_by_key[key] = index
+                    new_indexes.append(index)
+
+                user_points_rows = await self.user_points_repository.create_many(
+                    [
+                        UserPointsAssign(
+                            userId=str(entries[index]["user_id"]),
+                            taskId=str(entries[index]["task_id"]),
+                            points=entries[index]["points"],
+                            caseName=entries[index]["case_name"],
+                            data=entries[index]["data_to_add"],
+                            description=description,
+                            apiKey_used=api_key,
+                            idempotencyKey=entries[index]["idempotency_key"],
+                        )
+                        for index in new_indexes
+                    ],
+                    session=session,
+                    auto_commit=False,
+                )
+                for index, row in zip(new_indexes, user_points_rows):
+                    results[index] = row
+                await self.user_points_repository.task_stats_repository.record_awards(
+                    user_points_rows,
+                    session=session,
+                    auto_commit=False,
+                )
+                await self._record_leaderboard_awards(
+                    game_id, user_points_rows, session
+                )
+                for index, first_index in duplicates.items():
+                    results[index] = results[first_index]
+
+                points_deltas: dict = {}
+                for index in new_indexes:
+                    user_id = entries[index]["user_id"]
+                    points_deltas[user_id] = (
+                        points_deltas.get(user_id, 0) + entries[index]["points"]
+                    )
+                wallet_ids = await self.wallet_repository.upsert_points_balances(
+                    points_deltas=points_deltas,
+                    api_key=api_key,
+                    session=session,
+                    auto_commit=False,
+                )
+
+                await self.wallet_transaction_repository.create_many(
+                    [
+                        BaseWalletTransaction(
+                            transactionType="AssignPoints",
+                            points=entries[index]["points"],
+                            coins=0,
+                            data=entries[index]["data_to_add"],
+                            appliedConversionRate=0,
+                            walletId=str(wallet_ids[str(entries[index]["user_id"])]),
+                            apiKey_used=api_key,
+                        )
+                        for index in new_indexes
+                    ],
+                    session=session,
+                    auto_commit=False,
+                )
+
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+        await self._mirror_leaderboard_awards(game_id, user_points_rows)
+        return results
@@ -6,10 +6,10 @@ These methods never mutate state; the write path lives in
 """
 
 import asyncio
-from typing import Any
+from typing import Any, Optional
 from uuid import UUID
 
-from app.core.exceptions import NotFoundError
+from app.core.exceptions import ForbiddenError, NotFoundError
 from app.schema.games_schema import ListTasksWithUsers
 from app.schema.task_schema import BaseUserFirstAction, TasksWithUsers
 from app.schema.user_points_schema import (
@@ -24,7 +24,11 @@ from app.schema.user_points_schema import (
     TaskPointsByGame,
     UserGamePoints,
 )
-from app.services.game_access import get_authorized_game, get_authorized_user
+from app.services.game_access import (
+    can_access_game,
+    get_authorized_game,
+    get_authorized_user,
+)
 from app.services.user_points._base import FANOUT_LIMIT, UserPointsContext
 
 
@@ -41,6 +45,23 @@ def _group_points_by_task(rows):
     return grouped
 
 
+def _check_game_access(rows, *, api_key, oauth_user_id, is_admin):
+    """Apply the game access check to every game in per-user point rows.
+
+    ``get_user_points_by_game_and_task`` rows carry each game's ownership
+    columns, so the caller is checked against every game the user scored in
+    without reloading the games, with the same error
+    ``get_authorized_game`` raises.
+    """
+    for row in rows:
+        if not can_access_game(
+            row, api_key=api_key, oauth_user_id=oauth_user_id, is_admin=is_admin
+        ):
+            raise ForbiddenError(
+                detail="You do not have permission to access this game"
+            )
+
+
 class PointsQueryMixin(UserPointsContext):
     async def query_user_points(self, schema) -> Any:
         """
@@ -58,6 +79,8 @@ class PointsQueryMixin(UserPointsContext):
         self,
         gameId,
         *,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
         api_key: str = None,
         oauth_user_id: str = None,
         is_admin: bool = False,
@@ -67,10 +90,18 @@ class PointsQueryMixin(UserPointsContext):
         List a game's tasks and, per task, the users who earned points.
 
         For each user the response includes their first action timestamp on
-        that task.
+        that task. Every task's users come from one set-based query
+        (``get_first_actions_by_taskIds``), so the cost no longer grows with
+        tasks x users round-trips. Tasks are ordered by ``externalTaskId``;
+        pass ``page_size`` to return one page of tasks at a time on very
+        large games.
 
         Args:
             gameId: Internal game identifier.
+            page (Optional[int]): 1-based page of tasks; defaults to the first
+                page when ``page_size`` is set.
+            page_size (Optional[int]): Tasks per page. ``None`` returns every
+                task.
             api_key (str): Caller's API key, used when ``enforce_scope``.
             oauth_user_id (str): Caller's OAuth subject, used when scoping.
             is_admin (bool): Whether the caller has the admin role.
@@ -103,38 +134,30 @@ class PointsQueryMixin(UserPointsContext):
         )
         if not tasks:
             raise NotFoundError(detail=f"Tasks not found by gameId: {game.id}")
-        response = []
-        all_tasks = []
-        for task in tasks:
-            all_externalUserId = []
-            points = await self.user_points_repository.get_points_and_users_by_taskId(
-                task.id
-            )
+        tasks = sorted(tasks, key=lambda task: task.externalTaskId)
+        if page_size is not None:
+            offset = (max(page or 1, 1) - 1) * page_size
+            tasks = tasks[offset : offset + page_size]
 
-            externalTaskId = task.externalTaskId
-            if points:
-                for point in points:
-
-                    externalUserId = point.externalUserId
-                    user = await self.users_repository.read_by_column(
-                        "externalUserId", externalUserId, not_found_raise_exception=True
-                    )
-                    if not user:
-                        raise NotFoundError(
-                            detail=f"User not found by userId: {point.userId}. Please try again later or contact support"  # noqa
-                        )
-                    first_user_point = await self.user_points_repository.get_first_user_points_in_external_task_id_by_user_id(
-                        externalTaskId, externalUserId
-                    )
-                    all_externalUserId.append(
-                        BaseUserFirstAction(
-                            externalUserId=user.externalUserId,
-                            created_at=str(user.created_at),
-                            firstAction=str(first_user_point.created_at),
-                        )
+        first_actions = _group_points_by_task(
+            await self.user_points_repository.get_first_actions_by_taskIds(
+                [task.id for task in tasks]
+            )
+        )
+        response = [
+            TasksWithUsers(
+                externalTaskId=task.externalTaskId,
+                users=[
+                    BaseUserFirstAction(
+                        externalUserId=row.externalUserId,
+                        created_at=str(row.userCreatedAt),
+                        firstAction=str(row.firstAction),
                     )
-            all_tasks = {"externalTaskId": externalTaskId, "users": all_externalUserId}
-            response.append(TasksWithUsers(**all_tasks))
+                    for row in first_actions.get(str(task.id), [])
+                ],
+            )
+            for task in tasks
+        ]
         return ListTasksWithUsers(gameId=gameId, tasks=response)
 
     async def get_points_by_user_list(
@@ -189,8 +212,8 @@ class PointsQueryMixin(UserPointsContext):
         """
         Return a user's points across every game they participate in.
 
-        Resolves the user, finds the games behind their points rows, and
-        aggregates each game's detailed points concurrently.
+        Resolves the user and aggregates only their own points per (game,
+        task) in one query; other users' rows are never read.
 
         Args:
             externalUserId: External identifier of the user.
@@ -200,10 +223,13 @@ class PointsQueryMixin(UserPointsContext):
             enforce_scope (bool): When ``True``, verify access to the user.
 
         Returns:
-            list[AllPointsByGame]: Detailed points grouped per game.
+            list[AllPointsByGame]: One entry per (game, task) the user scored
+            on, carrying only the user's points.
 
         Raises:
             NotFoundError: If the user does not exist.
+            ForbiddenError: If ``enforce_scope`` and the caller may not
+                access one of the user's games.
         """
         if enforce_scope:
             user = await get_authorized_user(
@@ -222,55 +248,36 @@ class PointsQueryMixin(UserPointsContext):
                 detail=f"User not found by externalUserId: {externalUserId}"
             )
 
-        tasks_of_users = await self.user_points_repository.get_task_by_externalUserId(
+        rows = await self.user_points_repository.get_user_points_by_game_and_task(
             externalUserId
         )
-
-        semaphore = asyncio.Semaphore(FANOUT_LIMIT)
-
-        async def _fetch(task) -> AllPointsByGame:
-            """Resolve a task's game and fetch its detailed points, bounded."""
-            async with semaphore:
-                game = await self.game_repository.read_by_column(
-                    "id", task.gameId, not_found_raise_exception=True
-                )
-                return await self.get_points_by_gameId_with_details(
-                    game.id,
-                    api_key=api_key,
-                    oauth_user_id=oauth_user_id,
-                    is_admin=is_admin,
-                    enforce_scope=enforce_scope,
-                )
-
-        response = list(
-            await asyncio.gather(*[_fetch(task) for task in tasks_of_users])
-        )
-
-        new_response = []
-        for game in response:
-            for task in game.task:
-                for point in task.points:
-                    if point.externalUserId == externalUserId:
-                        new_response.append(
-                            AllPointsByGame(
-                                externalGameId=game.externalGameId,
-                                created_at=game.created_at,
-                                task=[
-                                    TaskPointsByGame(
-                                        externalTaskId=task.externalTaskId,
-                                        points=[
-                                            PointsAssignedToUser(
-                                                externalUserId=point.externalUserId,
-                                                points=point.points,
-                                                timesAwarded=point.timesAwarded,
-                                                pointsData=point.pointsData,
-                                            )
-                                        ],
-                                    )
-                                ],
+        if enforce_scope:
+            _check_game_access(
+                rows,
+                api_key=api_key,
+                oauth_user_id=oauth_user_id,
+                is_admin=is_admin,
+            )
+        return [
+            AllPointsByGame(
+                externalGameId=row.externalGameId,
+                created_at=str(row.gameCreatedAt),
+                task=[
+                    TaskPointsByGame(
+                        externalTaskId=row.externalTaskId,
+                        points=[
+                            PointsAssignedToUser(
+                                externalUserId=externalUserId,
+                                points=row.points,
+                                timesAwarded=row.timesAwarded,
+                                pointsData=row.pointsData,
                             )
-                        )
-        return new_response
+                        ],
+                    )
+                ],
+            )
+            for row in rows
+        ]
 
     async def get_points_by_gameId(
         self,
@@ -634,6 +641,10 @@ class PointsQueryMixin(UserPointsContext):
         """
         Return one user's points aggregated across all their games.
 
+        Reads only the user's own awards, grouped per (game, task) in a
+        single query; each task with a positive total becomes one
+        ``GameDetail``.
+
         Args:
             externalUserId: External identifier of the user.
             api_key (str): Caller's API key, used when ``enforce_scope``.
@@ -645,7 +656,9 @@ class PointsQueryMixin(UserPointsContext):
             UserGamePoints: The user's points grouped by game.
 
         Raises:
-            NotFoundError: If the user does not exist.
+            NotFoundError: If ``enforce_scope`` and the user does not exist.
+            ForbiddenError: If ``enforce_scope`` and the caller may not access
+                the user or one of their games.
         """
         if enforce_scope:
             user_data = await get_authorized_user(
@@ -673,59 +686,36 @@ class PointsQueryMixin(UserPointsContext):
                 userExists=False,
             )
 
-        tasks = await self.user_points_repository.get_task_by_externalUserId(
+        rows = await self.user_points_repository.get_user_points_by_game_and_task(
             externalUserId
         )
-
-        response = []
-        for task in tasks:
-            game = await self.game_repository.read_by_column(
-                "id", task.gameId, not_found_raise_exception=True
-            )
-            response.append(
-                await self.get_points_by_gameId_with_details(
-                    game.id,
-                    api_key=api_key,
-                    oauth_user_id=oauth_user_id,
-                    is_admin=is_admin,
-                    enforce_scope=enforce_scope,
-                )
+        if enforce_scope:
+            _check_game_access(
+                rows,
+                api_key=api_key,
+                oauth_user_id=oauth_user_id,
+                is_admin=is_admin,
             )
 
-        total_points = 0
-        total_times_awarded = 0
-        games = []
-        for game in response:
-            for task in game.task:
-                task_points = 0
-                task_times_awarded = 0
-                task_details = []
-                for point in task.points:
-                    if point.externalUserId == externalUserId:
-                        task_points += point.points
-                        task_times_awarded += point.timesAwarded
-                        if point.points > 0:
-                            task_details.append(
-                                TaskDetail(
-                                    externalTaskId=task.externalTaskId,
-                                    pointsData=point.pointsData,
-                                )
-                            )
-                total_points += task_points
-                total_times_awarded += task_times_awarded
-                if task_points > 0 and len(task_details) > 0:
-                    games.append(
-                        GameDetail(
-                            externalGameId=game.externalGameId,
-                            points=task_points,
-                            timesAwarded=task_times_awarded,
-                            tasks=task_details,
-                        )
+        games = [
+            GameDetail(
+                externalGameId=row.externalGameId,
+                points=row.points,
+                timesAwarded=row.timesAwarded,
+                tasks=[
+                    TaskDetail(
+                        externalTaskId=row.externalTaskId,
+                        pointsData=row.pointsData,
                     )
+                ],
+            )
+            for row in rows
+            if row.points > 0
+        ]
         return UserGamePoints(
             externalUserId=externalUserId,
-            points=total_points,
-            timesAwarded=total_times_awarded,
+            points=sum(row.points for row in rows),
+            timesAwarded=sum(row.timesAwarded for row in rows),
             games=games,
         )
 
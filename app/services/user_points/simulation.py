@@ -1,8 +1,10 @@
 """Points simulation (non-persisting).
 
 Runs built-in strategies' ``simulate_strategy`` for a user across a game's
-tasks without writing anything. Custom DSL strategies are skipped here; they
-have their own dedicated simulate endpoint.
+tasks without writing anything. A strategy that also implements the async
+``simulate_tasks`` hook simulates all of its tasks in one call, so it can
+load the game's points records once instead of once per task. Custom DSL
+strategies are skipped here; they have their own dedicated simulate endpoint.
 """
 
 import logging
@@ -159,6 +161,26 @@ class PointsSimulationMixin(UserPointsContext):
                 raise NotFoundError(
                     f"Strategy with id: {strategy_id_applied} don't have simulate_strategy method"
                 )
+            simulate_tasks = getattr(strategy_instance, "simulate_tasks", None)
+            if simulate_tasks is not None:
+                try:
+                    response.extend(
+                        await simulate_tasks(
+                            tasks,
+                            externalUserId,
+                            user,
+                            userGroup=userGroup,
+                            user_last_task=user_last_task,
+                        )
+                    )
+                except Exception:
+                    logger.exception(
+                        "Error simulating strategy=%s for gameId=%s externalUserId=%s",
+                        strategy_id_applied,
+                        gameId,
+                        externalUserId,
+                    )
+                continue
             for task in tasks:
                 data_to_simulate = {
                     "task": task,
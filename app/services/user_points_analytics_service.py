@@ -7,12 +7,15 @@ have separate, focused services.
 
 These methods are thin pass-throughs over ``UserPointsRepository`` analytics
 queries; they are consumed primarily by strategy engines (``app/engine``) to
-compute rewards based on historical user behaviour.
+compute rewards based on historical user behaviour. The ``*_snapshot``
+methods bundle the aggregates one built-in strategy needs into a single query
+so a scoring call costs one round trip instead of one per aggregate.
 """
 
 from typing import Any
 
 from app.repository.user_points_repository import UserPointsRepository
+from app.schema.user_points_schema import EffortSnapshot, ScoringSnapshot
 from app.services.base_service import BaseService
 
 
@@ -114,3 +117,20 @@ class UserPointsAnalyticsService(BaseService):
         return await self.user_points_repository.get_personal_avg_by_external_game_id(
             external_game_id, externalUserId
         )
+
+    async def get_scoring_snapshot(
+        self, externalGameId, externalTaskId, externalUserId
+    ) -> ScoringSnapshot:
+        """Load the pace aggregates of a user on a task in one query."""
+        return await self.user_points_repository.get_scoring_snapshot(
+            externalGameId, externalTaskId, externalUserId
+        )
+
+    async def get_effort_snapshot(
+        self, externalGameId, externalTaskId, externalUserId, minutes
+    ) -> EffortSnapshot:
+        """Load the reported-minutes aggregates of a user in a game in one
+        query."""
+        return await self.user_points_repository.get_effort_snapshot(
+            externalGameId, externalTaskId, externalUserId, minutes
+        )
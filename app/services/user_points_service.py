@@ -1,6 +1,6 @@
 """Public entry point for user-points operations.
 
-``UserPointsService`` composes four focused mixins (see
+``UserPointsService`` composes focused mixins (see
 :mod:`app.services.user_points`) so its read, write, simulation and
 persistence concerns live in separate modules without changing the single
 DI-injected class that endpoints and strategy engines depend on:
@@ -8,6 +8,8 @@ DI-injected class that endpoints and strategy engines depend on:
 * :class:`PointsQueryMixin` - read-only aggregations and lookups.
 * :class:`PointsAssignmentMixin` - the scoring/write path (also brings the
   persistence helpers it builds on).
+* :class:`PointsBatchAssignmentMixin` - many events of one game scored and
+  persisted per call.
 * :class:`PointsSimulationMixin` - non-persisting simulation of built-ins.
 * :class:`PointsPersistenceMixin` - the atomic points/wallet/transaction write.
 """
@@ -22,9 +24,12 @@ from app.repository.user_repository import UserRepository
 from app.repository.wallet_repository import WalletRepository
 from app.repository.wallet_transaction_repository import WalletTransactionRepository
 from app.services.base_service import BaseService
+from app.services.leaderboard_backend import LeaderboardBackend
+from app.services.metadata_cache import ScoringMetadataCache
 from app.services.strategy_service import StrategyService
 from app.services.user_points import (
     PointsAssignmentMixin,
+    PointsBatchAssignmentMixin,
     PointsQueryMixin,
     PointsSimulationMixin,
 )
@@ -35,6 +40,7 @@ logger = logging.getLogger(__name__)
 class UserPointsService(
     BaseService,
     PointsQueryMixin,
+    PointsBatchAssignmentMixin,
     PointsAssignmentMixin,
     PointsSimulationMixin,
 ):
@@ -48,6 +54,8 @@ class UserPointsService(
         wallet_repository: WalletRepository,
         wallet_transaction_repository: WalletTransactionRepository,
         strategy_service: "StrategyService | None" = None,
+        metadata_cache: ScoringMetadataCache | None = None,
+        leaderboard_backend: LeaderboardBackend | None = None,
     ) -> None:
         self.user_points_repository = user_points_repository
         self.users_repository = users_repository
@@ -62,4 +70,10 @@ class UserPointsService(
         # preserves the legacy behaviour for tests that build this
         # service positionally and monkey-patch ``self.strategy_service``.
         self.strategy_service = strategy_service or StrategyService()
+        # Optional so positional/test construction keeps reading games and
+        # tasks straight from the repositories.
+        self.metadata_cache = metadata_cache
+        # Mirror fed after each award commit; ``None`` leaves the
+        # leaderboards to the ``game_leaderboard`` rows alone.
+        self.leaderboard_backend = leaderboard_backend
         super().__init__(user_points_repository)
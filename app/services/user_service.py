@@ -22,6 +22,8 @@ from app.schema.wallet_schema import CreateWallet
 from app.schema.wallet_transaction_schema import BaseWalletTransaction
 from app.services.base_service import BaseService
 from app.services.game_access import get_authorized_user
+from app.services.leaderboard_backend import LeaderboardBackend
+from app.services.user_points.persistence import mirror_leaderboard_awards
 from app.util.serialize_wallet import serialize_wallet
 
 
@@ -37,6 +39,8 @@ class UserService(BaseService):
         wallet_repository (WalletRepository): Repository instance for wallets.
         wallet_transaction_repository (WalletTransactionRepository):
           Repository instance for wallet transactions.
+        leaderboard_backend (LeaderboardBackend | None): Backend the
+          committed awards are mirrored to, if any.
     """
 
     def __init__(
@@ -46,6 +50,7 @@ class UserService(BaseService):
         task_repository: TaskRepository,
         wallet_repository: WalletRepository,
         wallet_transaction_repository: WalletTransactionRepository,
+        leaderboard_backend: LeaderboardBackend | None = None,
     ) -> None:
         """
         Initializes the UserService with the provided repositories.
@@ -59,12 +64,16 @@ class UserService(BaseService):
               instance.
             wallet_transaction_repository (WalletTransactionRepository): The
               wallet transaction repository instance.
+            leaderboard_backend (LeaderboardBackend | None): The leaderboard
+              backend instance, or ``None`` to keep the boards in the
+              database only.
         """
         self.user_repository = user_repository
         self.user_points_repository = user_points_repository
         self.task_repository = task_repository
         self.wallet_repository = wallet_repository
         self.wallet_transaction_repository = wallet_transaction_repository
+        self.leaderboard_backend = leaderboard_backend
         super().__init__(user_repository)
 
     async def basic_engagement_points(self) -> int:
@@ -291,8 +300,32 @@ class UserService(BaseService):
             data=schema.data,
             description=schema.description,
         )
+        task = await self.task_repository.read_by_id(
+            schema.taskId,
+            not_found_message=f"Task not found with taskId: {schema.taskId}",
+        )
 
-        user_points = await self.user_points_repository.create(user_points_schema)
+        async with self.user_points_repository.session_factory() as session:
+            try:
+                user_points = await self.user_points_repository.create(
+                    user_points_schema, session=session, auto_commit=False
+                )
+                # Keep the user_task_stats rollup and the game's boards in
+                # step with the award, in the same transaction, as the points
+                # service does.
+                await self.user_points_repository.task_stats_repository.record_awards(
+                    [user_points], session=session, auto_commit=False
+                )
+                await self.user_points_repository.leaderboard_repository.record_awards(
+                    task.gameId, [user_points], session=session, auto_commit=False
+                )
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+        await mirror_leaderboard_awards(
+            self.leaderboard_backend, task.gameId, [user_points]
+        )
 
         wallet = await self.wallet_repository.read_by_column(
             "userId", str(user.id), not_found_raise_exception=False
@@ -1,8 +1,6 @@
 import logging
 
-from app.core.container import Container
 from app.schema.logs_schema import CreateLogs
-from app.schema.oauth_users_schema import CreateOAuthUser
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +11,11 @@ async def add_log(
     """
     Helper to add a log entry with apiKey or oauth_user_id if available.
 
+    The entry goes through ``LogsService.record``, which queues it for the
+    buffered audit writer, so callers normally do not wait on the database.
+    A failed write is logged and swallowed: audit logging never fails the
+    request it describes.
+
     Args:
         log_level (str): The log level of the log entry.
         message (str): The message of the log entry.
@@ -29,30 +32,9 @@ async def add_log(
         apiKey_used=api_key,
         oauth_user_id=oauth_user_id,
     )
-    if api_key:
-        log_entry.apiKey_used = api_key
-    if oauth_user_id:
-        log_entry.oauth_user_id = oauth_user_id
     try:
-        await service_log.add(log_entry)
+        await service_log.record(log_entry)
     except Exception as e:
         # Do NOT route this through service_log -- this IS the audit-log
         # writer; recursing would risk a tight failure loop.
         logger.warning("Failed to write audit log entry: %s", e, exc_info=True)
-        oauthusers_service = Container.oauth_users_service()
-        create_user = CreateOAuthUser(
-            provider="keycloak",
-            provider_user_id=oauth_user_id,
-            status="active",
-        )
-        await oauthusers_service.add(create_user)
-
-        return add_log(
-            module,
-            log_level,
-            message,
-            details,
-            service_log,
-            api_key=api_key,
-            oauth_user_id=oauth_user_id,
-        )
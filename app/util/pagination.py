@@ -0,0 +1,147 @@
+"""
+Keyset (cursor) pagination helpers for list queries.
+
+``LIMIT/OFFSET`` makes the database produce and discard every row before the
+requested page, so deep pages get linearly slower. A keyset page instead
+starts right after the last row of the previous one: rows are ordered by the
+requested column plus ``id`` as a tiebreaker, and the cursor carries that
+pair for the last row returned. The next query filters on it with a
+predicate the ``(column, id)`` order can seek to.
+
+Cursors are opaque to clients: URL-safe base64 of a small JSON document
+holding the ordering they were issued for, so a cursor cannot be replayed
+against a different sort.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, or_
+
+from app.core.exceptions import BadRequestError
+
+
+def _to_json_value(value: Any) -> Any:
+    """Encode a column value for the cursor document."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _from_json_value(column, value: Any) -> Any:
+    """Decode a cursor value back to ``column``'s Python type."""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    if python_type in (int, float, str, bool):
+        return python_type(value)
+    return value
+
+
+def encode_cursor(ordering: str, value: Any, id_value: Any) -> str:
+    """
+    Build the opaque cursor pointing just past a row.
+
+    Args:
+        ordering (str): The ``ordering`` the page was read with.
+        value: The row's value of the ordering column.
+        id_value: The row's ``id``.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    document = {
+        "o": ordering,
+        "v": _to_json_value(value),
+        "id": _to_json_value(id_value),
+    }
+    raw = json.dumps(document, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, ordering: str, column, id_column) -> Tuple[Any, Any]:
+    """
+    Decode a cursor issued for ``ordering``.
+
+    Args:
+        cursor (str): Value returned as ``next_cursor`` by a previous page.
+        ordering (str): The ``ordering`` of the current request.
+        column: The ordering column.
+        id_column: The model's ``id`` column.
+
+    Returns:
+        tuple: ``(value, id)`` of the row the next page starts after.
+
+    Raises:
+        BadRequestError: If the cursor is malformed or was issued for a
+            different ordering.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        document = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if document["o"] != ordering:
+            raise BadRequestError(
+                detail="Cursor was issued for a different ordering; "
+                "restart pagination without a cursor."
+            )
+        return (
+            _from_json_value(column, document["v"]),
+            _from_json_value(id_column, document["id"]),
+        )
+    except BadRequestError:
+        raise
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise BadRequestError(detail="Invalid pagination cursor.") from exc
+
+
+def keyset_order_by(column, id_column, descending: bool) -> list:
+    """
+    ``ORDER BY`` terms for a keyset page: the column (nulls placed the way
+    Postgres does by default, so its indexes still serve the sort) then
+    ``id`` in the same direction.
+    """
+    if descending:
+        terms = [column.desc().nulls_first()]
+        if column is not id_column:
+            terms.append(id_column.desc())
+    else:
+        terms = [column.asc().nulls_last()]
+        if column is not id_column:
+            terms.append(id_column.asc())
+    return terms
+
+
+def keyset_condition(
+    column, id_column, descending: bool, value: Any, id_value: Any
+) -> Any:
+    """
+    Predicate selecting the rows after ``(value, id_value)`` in the order
+    produced by :func:`keyset_order_by`.
+    """
+    if column is id_column:
+        return id_column < id_value if descending else id_column > id_value
+    after_id = id_column < id_value if descending else id_column > id_value
+    if value is None:
+        # Nulls come first in descending order (every non-null row is still
+        # ahead) and last in ascending order (only nulls remain).
+        if descending:
+            return or_(column.is_not(None), and_(column.is_(None), after_id))
+        return and_(column.is_(None), after_id)
+    if descending:
+        return or_(column < value, and_(column == value, after_id))
+    return or_(column > value, and_(column == value, after_id), column.is_(None))
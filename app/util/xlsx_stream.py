@@ -0,0 +1,175 @@
+"""
+Streaming writer for single-sheet XLSX files.
+
+An XLSX file is a zip archive of XML parts. :class:`StreamingXlsxWriter`
+writes the archive to an in-memory sink that the caller drains as it goes:
+the worksheet entry is deflated row by row, and since the sink cannot seek,
+``zipfile`` sizes each entry with a trailing data descriptor instead of
+patching the local header afterwards. Peak memory is the compressor state
+plus whatever has not been drained yet, however many rows are written.
+
+Cells are written as inline strings (no shared-strings table to keep in
+memory), numbers and booleans; there is no styling.
+"""
+
+import math
+import re
+import zipfile
+from decimal import Decimal
+from typing import Any, Iterable, List
+from xml.sax.saxutils import escape
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_CONTENT_TYPES = (
+    _XML_DECLARATION
+    + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    "</Types>"
+)
+_ROOT_RELS = (
+    _XML_DECLARATION + f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_WORKBOOK_RELS = (
+    _XML_DECLARATION + f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+    "</Relationships>"
+)
+_STYLES = (
+    _XML_DECLARATION + f'<styleSheet xmlns="{_MAIN_NS}">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border/></borders>'
+    '<cellStyleXfs count="1"><xf/></cellStyleXfs>'
+    '<cellXfs count="1"><xf xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/>'
+    "</cellStyles></styleSheet>"
+)
+_SHEET_HEADER = _XML_DECLARATION + f'<worksheet xmlns="{_MAIN_NS}"><sheetData>'
+_SHEET_FOOTER = "</sheetData></worksheet>"
+
+# Control characters XML 1.0 cannot represent, even escaped.
+_ILLEGAL_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
+def _column_letter(index: int) -> str:
+    """0-based column index → spreadsheet letters (0 → A, 26 → AA)."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+class _DrainableSink:
+    """Write-only, non-seekable byte buffer the writer empties on demand."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self.buffer += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+class StreamingXlsxWriter:
+    """
+    Incremental XLSX writer: ``append`` rows, ``drain`` bytes as they become
+    available, then ``close`` for the tail of the archive.
+
+    Args:
+        sheet_title (str): Name of the single worksheet.
+    """
+
+    def __init__(self, sheet_title: str = "Sheet1") -> None:
+        self._sink = _DrainableSink()
+        self._zip = zipfile.ZipFile(self._sink, "w", compression=zipfile.ZIP_DEFLATED)
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", _ROOT_RELS)
+        self._zip.writestr(
+            "xl/workbook.xml",
+            _XML_DECLARATION + f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+            f'<sheets><sheet name="{escape(sheet_title, {chr(34): "&quot;"})}" '
+            'sheetId="1" r:id="rId1"/></sheets></workbook>',
+        )
+        self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        self._zip.writestr("xl/styles.xml", _STYLES)
+        # force_zip64: the sheet's size is unknown up front, and without it
+        # zipfile refuses to finish an entry that grows past 2 GiB.
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self._sheet.write(_SHEET_HEADER.encode("utf-8"))
+        self._columns: List[str] = []
+        self._rows = 0
+        self._closed = False
+
+    @property
+    def pending_bytes(self) -> int:
+        """Bytes written to the archive but not drained yet."""
+        return len(self._sink.buffer)
+
+    def append(self, values: Iterable[Any]) -> None:
+        """
+        Write one row. ``None`` and ``""`` leave the cell empty; bools,
+        ints, floats and Decimals become numeric cells; anything else is
+        written as text.
+        """
+        self._rows += 1
+        cells = []
+        for index, value in enumerate(values):
+            if value is None or value == "":
+                continue
+            while index >= len(self._columns):
+                self._columns.append(_column_letter(len(self._columns)))
+            cells.append(self._cell(f"{self._columns[index]}{self._rows}", value))
+        self._sheet.write(f'<row r="{self._rows}">{"".join(cells)}</row>'.encode())
+
+    @staticmethod
+    def _cell(ref: str, value: Any) -> str:
+        """Render one ``<c>`` element."""
+        if isinstance(value, bool):
+            return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+        if isinstance(value, int) or (
+            isinstance(value, (float, Decimal)) and math.isfinite(value)
+        ):
+            return f'<c r="{ref}"><v>{value}</v></c>'
+        text = escape(_ILLEGAL_XML_CHARS.sub("", str(value)))
+        return (
+            f'<c r="{ref}" t="inlineStr"><is>'
+            f'<t xml:space="preserve">{text}</t></is></c>'
+        )
+
+    def drain(self) -> bytes:
+        """Return (and forget) the archive bytes produced so far."""
+        data = bytes(self._sink.buffer)
+        self._sink.buffer.clear()
+        return data
+
+    def close(self) -> bytes:
+        """Finish the sheet and the archive; returns the remaining bytes."""
+        if not self._closed:
+            self._closed = True
+            self._sheet.write(_SHEET_FOOTER.encode("utf-8"))
+            self._sheet.close()
+            self._zip.close()
+        return self.drain()
@@ -0,0 +1 @@
+"""In-process micro-benchmarks for GAME hot paths."""
@@ -0,0 +1,94 @@
+"""
+Database bootstrap shared by the benchmarks.
+
+Benchmarks run the real repositories against an in-memory aiosqlite engine
+by default, with the same Postgres -> SQLite shim for ``UUID``/``JSONB``
+columns the repository tests use, so the production models are created
+untouched. Pass a ``postgresql+asyncpg://`` URL to measure a real Postgres
+instead; point it at a scratch database, because the schema is created (and
+rows are inserted) in it.
+"""
+
+import importlib
+import pkgutil
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import JSONB as PG_JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlmodel import SQLModel
+
+import app.model
+
+# Register every table on the metadata so service-level benchmarks (wallets,
+# strategy definitions, logs, rollups) find their tables too.
+for _module in pkgutil.iter_modules(app.model.__path__):
+    importlib.import_module(f"app.model.{_module.name}")
+
+SQLITE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@compiles(PG_UUID, "sqlite")
+def _compile_uuid_for_sqlite(_type, _compiler, **_kw):
+    return "CHAR(36)"
+
+
+@compiles(PG_JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(_type, _compiler, **_kw):
+    return "JSON"
+
+
+_uuid_bind_processor = PG_UUID.bind_processor
+
+
+def _bind_uuid_for_sqlite(self, dialect):
+    # Services pass ids around as strings, which asyncpg accepts for UUID
+    # columns; the character-based UUID emulation used on SQLite needs
+    # ``uuid.UUID`` objects, so parse strings first.
+    process = _uuid_bind_processor(self, dialect)
+    if process is None or dialect.name != "sqlite":
+        return process
+
+    def _process(value):
+        if isinstance(value, str):
+            value = UUID(value)
+        return process(value)
+
+    return _process
+
+
+PG_UUID.bind_processor = _bind_uuid_for_sqlite
+
+
+async def create_engine_with_schema(database_url: str = SQLITE_URL):
+    """Create an async engine and every model table on it."""
+    engine = create_async_engine(database_url, future=True)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    return engine
+
+
+def make_session_factory(engine):
+    """Build the ``session_factory`` callable repositories expect."""
+    sessionmaker = async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
+    @asynccontextmanager
+    async def _factory() -> AsyncIterator[AsyncSession]:
+        session: AsyncSession = sessionmaker()
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    return _factory
@@ -0,0 +1,218 @@
+"""
+Synthetic load generator shared by the benchmarks.
+
+``seed_synthetic_load`` fills a database with a deterministic, realistically
+shaped dataset through bulk inserts: one game per strategy under test (each
+with ``tasks_per_game`` tasks on that strategy), a user pool, and a history
+of ``user_points`` rows spread over the last ``days`` days with a long-tail
+activity distribution (a few heavy users, many occasional ones). DSL
+strategies are seeded as published ``strategydefinition`` rows in the
+benchmark realm and referenced as ``custom:<uuid>``. The ``user_task_stats``
+rollup is rebuilt afterwards, so either analytics read path sees the same
+history.
+"""
+
+import json
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Sequence
+from uuid import uuid4
+
+from sqlalchemy import insert
+
+from app.model.games import Games
+from app.model.strategy_definition import StrategyDefinition
+from app.model.tasks import Tasks
+from app.model.user_points import UserPoints
+from app.model.users import Users
+from app.repository.user_task_stats_repository import UserTaskStatsRepository
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "app" / "engine" / "dsl_templates"
+
+# Built-in strategies that score an event from its payload and history.
+# ``greencrowdStrategy`` needs a client-held simulation hash per event and
+# ``getis_ord_gi_star`` scores grids rather than events, so both are left out.
+BUILTIN_STRATEGIES = (
+    "default",
+    "socio_bee",
+    "constantEffortStrategy",
+    "greengageStrategy",
+)
+
+# Benchmark label -> (definition type, template file) for the DSL cases.
+DSL_STRATEGIES = {
+    "dsl_full": ("DSL_FULL", TEMPLATES_DIR / "default_v0_0_2.json"),
+    "dsl_extend": (
+        "DSL_EXTEND",
+        TEMPLATES_DIR / "user" / "bonus_extiende_default.json",
+    ),
+}
+
+_INSERT_BATCH = 5_000
+
+
+@dataclass(frozen=True)
+class SyntheticLoad:
+    """
+    Shape of the seeded dataset.
+
+    Attributes:
+        strategies (Sequence[str]): Built-in ids and/or ``DSL_STRATEGIES``
+            labels; one game is seeded per entry.
+        tasks_per_game (int): Tasks per game.
+        users (int): Size of the user pool shared by every game.
+        points_per_user (int): Mean awards per user across all games.
+        days (int): Window the award timestamps are spread over.
+        realm (str): API key / realm the games and DSL definitions belong to.
+        seed (int): Random seed; the same load always yields the same rows.
+    """
+
+    strategies: Sequence[str] = BUILTIN_STRATEGIES + tuple(DSL_STRATEGIES)
+    tasks_per_game: int = 20
+    users: int = 200
+    points_per_user: int = 25
+    days: int = 30
+    realm: str = "bench-realm"
+    seed: int = 0
+
+
+@dataclass
+class SeededGame:
+    """Identifiers of one seeded game."""
+
+    strategy: str
+    strategyId: str
+    gameId: object
+    externalGameId: str
+    externalTaskIds: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SeededData:
+    """What :func:`seed_synthetic_load` inserted."""
+
+    load: SyntheticLoad
+    games: Dict[str, SeededGame]
+    externalUserIds: List[str]
+    user_points: int
+
+
+def _dsl_definition_row(label: str, realm: str) -> dict:
+    """A published ``strategydefinition`` row for a ``DSL_STRATEGIES`` label."""
+    definition_type, path = DSL_STRATEGIES[label]
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    ast = payload["astJson"] if "astJson" in payload else payload
+    return {
+        "id": uuid4(),
+        "realmId": realm,
+        "name": f"bench-{label}",
+        "type": definition_type,
+        "parentStrategyId": payload.get("parentStrategyId"),
+        "astJson": ast,
+        "version": 1,
+        "status": "PUBLISHED",
+        "publishedAt": datetime.now(timezone.utc),
+    }
+
+
+async def _insert(session, model, rows: List[dict]) -> None:
+    """Bulk-insert ``rows`` in batches."""
+    for start in range(0, len(rows), _INSERT_BATCH):
+        await session.execute(insert(model), rows[start : start + _INSERT_BATCH])
+
+
+async def seed_synthetic_load(session_factory, load: SyntheticLoad) -> SeededData:
+    """
+    Insert the dataset described by ``load``.
+
+    Args:
+        session_factory: Repository-style session factory.
+        load (SyntheticLoad): Dataset shape.
+
+    Returns:
+        SeededData: Identifiers of the seeded games and users.
+    """
+    rng = random.Random(load.seed)
+    now = datetime.now(timezone.utc)
+
+    definitions, games, tasks, seeded = [], [], [], {}
+    for label in load.strategies:
+        if label in DSL_STRATEGIES:
+            definition = _dsl_definition_row(label, load.realm)
+            definitions.append(definition)
+            strategy_id = f"custom:{definition['id']}"
+        else:
+            strategy_id = label
+        game = SeededGame(
+            strategy=label,
+            strategyId=strategy_id,
+            gameId=uuid4(),
+            externalGameId=f"bench-game-{label}",
+        )
+        games.append(
+            {
+                "id": game.gameId,
+                "externalGameId": game.externalGameId,
+                "platform": "bench",
+                "strategyId": strategy_id,
+                "apiKey_used": load.realm,
+            }
+        )
+        for index in range(load.tasks_per_game):
+            external_task_id = f"bench_poi{index % 7}_{label}_{index}"
+            game.externalTaskIds.append(external_task_id)
+            tasks.append(
+                {
+                    "id": uuid4(),
+                    "externalTaskId": external_task_id,
+                    "gameId": game.gameId,
+                    "strategyId": strategy_id,
+                    "status": "open",
+                    "apiKey_used": load.realm,
+                }
+            )
+        seeded[label] = game
+
+    users = [
+        {"id": uuid4(), "externalUserId": f"bench_user_{index}"}
+        for index in range(load.users)
+    ]
+    # Long-tail activity: a user's share of the awards follows 1 / rank.
+    weights = [1 / (rank + 1) for rank in range(load.users)]
+    total_awards = load.users * load.points_per_user
+    window = timedelta(days=load.days).total_seconds()
+    user_points = [
+        {
+            "id": uuid4(),
+            "userId": user["id"],
+            "taskId": task["id"],
+            "points": rng.randint(1, 20),
+            "caseName": "BenchSeed",
+            "data": {"minutes": rng.randint(1, 90)},
+            "apiKey_used": load.realm,
+            "created_at": now - timedelta(seconds=rng.random() * window),
+        }
+        for user, task in zip(
+            rng.choices(users, weights=weights, k=total_awards),
+            rng.choices(tasks, k=total_awards),
+        )
+    ]
+
+    async with session_factory() as session:
+        if definitions:
+            await _insert(session, StrategyDefinition, definitions)
+        await _insert(session, Games, games)
+        await _insert(session, Tasks, tasks)
+        await _insert(session, Users, users)
+        await _insert(session, UserPoints, user_points)
+        await session.commit()
+    await UserTaskStatsRepository(session_factory).rebuild()
+
+    return SeededData(
+        load=load,
+        games=seeded,
+        externalUserIds=[user["externalUserId"] for user in users],
+        user_points=len(user_points),
+    )
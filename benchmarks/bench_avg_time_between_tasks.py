@@ -0,0 +1,174 @@
+"""
+Benchmark the average inter-award gap queries as ``user_points`` grows.
+
+Seeds one game/task with a growing number of awards spread over a pool of
+users, then times ``get_avg_time_between_tasks_by_user_and_game_task`` and
+``get_avg_time_between_tasks_for_all_users``. For contrast it also times the
+previous implementation, which loaded every timestamp of the task into
+Python. Results are printed as JSON.
+
+Usage::
+
+    python -m benchmarks.bench_avg_time_between_tasks
+    python -m benchmarks.bench_avg_time_between_tasks --sizes 1000 100000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import insert, select
+
+from app.model.games import Games
+from app.model.tasks import Tasks
+from app.model.user_points import UserPoints
+from app.model.users import Users
+from app.repository.user_points_repository import UserPointsRepository
+from benchmarks._db import SQLITE_URL, create_engine_with_schema, make_session_factory
+
+GAME = "bench-game"
+TASK = "bench-task"
+USER = "bench-user-0"
+
+
+async def _seed(session_factory, rows: int, users: int) -> None:
+    """Insert ``rows`` awards on one task, round-robin over ``users`` users."""
+    game_id, task_id = uuid4(), uuid4()
+    user_ids = [uuid4() for _ in range(users)]
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    async with session_factory() as session:
+        await session.execute(
+            insert(Games),
+            [
+                {
+                    "id": game_id,
+                    "externalGameId": GAME,
+                    "platform": "bench",
+                    "strategyId": "default",
+                }
+            ],
+        )
+        await session.execute(
+            insert(Tasks),
+            [
+                {
+                    "id": task_id,
+                    "externalTaskId": TASK,
+                    "gameId": game_id,
+                    "strategyId": "default",
+                }
+            ],
+        )
+        await session.execute(
+            insert(Users),
+            [
+                {"id": user_id, "externalUserId": f"bench-user-{index}"}
+                for index, user_id in enumerate(user_ids)
+            ],
+        )
+        await session.execute(
+            insert(UserPoints),
+            [
+                {
+                    "id": uuid4(),
+                    "userId": user_ids[index % users],
+                    "taskId": task_id,
+                    "points": 1,
+                    "created_at": start + timedelta(seconds=index * 7),
+                }
+                for index in range(rows)
+            ],
+        )
+        await session.commit()
+
+
+async def _legacy_avg_for_all_users(session_factory) -> float:
+    """The pre-aggregate implementation: load and diff every timestamp."""
+    async with session_factory() as session:
+        stmt = (
+            select(UserPoints.created_at)
+            .join(Tasks, UserPoints.taskId == Tasks.id)
+            .join(Games, Tasks.gameId == Games.id)
+            .filter(Tasks.externalTaskId == TASK)
+            .filter(Games.externalGameId == GAME)
+            .order_by(UserPoints.created_at)
+        )
+        timestamps = (await session.execute(stmt)).all()
+    if len(timestamps) < 2:
+        return -1
+    diffs = [
+        (timestamps[i + 1][0] - timestamps[i][0]).total_seconds()
+        for i in range(len(timestamps) - 1)
+    ]
+    return sum(diffs) / len(diffs)
+
+
+async def _median_ms(call, repeat: int) -> float:
+    """Median wall time of ``repeat`` awaited calls, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+async def run(sizes, users: int, repeat: int, database_url: str) -> dict:
+    """Seed each size into a fresh database and time the gap queries."""
+    results = []
+    for rows in sizes:
+        engine = await create_engine_with_schema(database_url)
+        try:
+            session_factory = make_session_factory(engine)
+            await _seed(session_factory, rows, users)
+            repository = UserPointsRepository(session_factory=session_factory)
+            results.append(
+                {
+                    "rows": rows,
+                    "per_user_ms": await _median_ms(
+                        lambda: repository.get_avg_time_between_tasks_by_user_and_game_task(  # noqa
+                            GAME, TASK, USER
+                        ),
+                        repeat,
+                    ),
+                    "all_users_ms": await _median_ms(
+                        lambda: repository.get_avg_time_between_tasks_for_all_users(
+                            GAME, TASK
+                        ),
+                        repeat,
+                    ),
+                    "legacy_all_users_ms": await _median_ms(
+                        lambda: _legacy_avg_for_all_users(session_factory), repeat
+                    ),
+                }
+            )
+        finally:
+            await engine.dispose()
+    return {
+        "benchmark": "avg_time_between_tasks",
+        "database": engine.dialect.name,
+        "users": users,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default=SQLITE_URL)
+    args = parser.parse_args()
+    report = asyncio.run(run(args.sizes, args.users, args.repeat, args.database_url))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
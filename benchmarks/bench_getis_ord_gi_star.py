@@ -0,0 +1,92 @@
+"""
+Benchmark the stencil Getis-Ord Gi* implementation against the dense one.
+
+Times ``compute_getis_ord_gi_star`` on square Poisson-count grids. On the
+small sizes it also times the previous implementation, which built a dense
+``n x n`` rook weights matrix and scored cells in a Python loop, and reports
+the largest absolute difference between the two. Results are printed as
+JSON.
+
+Usage::
+
+    python -m benchmarks.bench_getis_ord_gi_star
+    python -m benchmarks.bench_getis_ord_gi_star --sizes 10 50 --large 1000 2000
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+import numpy as np
+
+from app.engine.getis_ord_gi_star import compute_getis_ord_gi_star
+
+
+def _legacy_gi_star(grid: np.ndarray) -> np.ndarray:
+    """The dense-weights implementation the stencil version replaced."""
+    rows, cols = grid.shape
+    x = grid.reshape(-1)
+    n = x.size
+    weights = np.zeros((n, n), dtype=float)
+    for r in range(rows):
+        for c in range(cols):
+            i = r * cols + c
+            weights[i, i] = 1.0
+            for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if 0 <= nr < rows and 0 <= nc < cols:
+                    weights[i, nr * cols + nc] = 1.0
+    mean_x = np.mean(x)
+    std_x = np.sqrt((np.sum(x * x) / n) - (mean_x**2))
+    scores = np.zeros(n, dtype=float)
+    for i in range(n):
+        w_i = weights[i]
+        sum_w = np.sum(w_i)
+        sum_w_sq = np.sum(w_i * w_i)
+        numerator = np.sum(w_i * x) - (mean_x * sum_w)
+        denom_term = ((n * sum_w_sq) - (sum_w**2)) / (n - 1)
+        denominator = std_x * np.sqrt(max(denom_term, 0.0))
+        scores[i] = 0.0 if denominator == 0 else numerator / denominator
+    return scores.reshape(rows, cols)
+
+
+def _median_ms(call, repeat: int) -> float:
+    """Median wall time of ``repeat`` calls, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def run(sizes, large, repeat: int) -> dict:
+    """Time both implementations on ``sizes`` and the stencil on ``large``."""
+    rng = np.random.default_rng(0)
+    results = []
+    for side in list(sizes) + list(large):
+        grid = rng.poisson(4.0, size=(side, side)).astype(float)
+        entry = {
+            "grid": f"{side}x{side}",
+            "stencil_ms": _median_ms(lambda: compute_getis_ord_gi_star(grid), repeat),
+        }
+        if side in sizes:
+            entry["legacy_ms"] = _median_ms(lambda: _legacy_gi_star(grid), repeat)
+            entry["max_abs_diff"] = float(
+                np.max(np.abs(compute_getis_ord_gi_star(grid) - _legacy_gi_star(grid)))
+            )
+        results.append(entry)
+    return {"benchmark": "getis_ord_gi_star", "repeat": repeat, "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 30, 60])
+    parser.add_argument("--large", type=int, nargs="*", default=[200, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(args.sizes, args.large, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Benchmark the scoring and read hot paths end to end, in-process.
+
+Seeds a synthetic dataset (see ``benchmarks/_generator.py``) and drives the
+production service graph from ``Container`` against it, with only the
+database swapped for the benchmark engine. Times:
+
+* ``assign_points_to_user`` for each built-in strategy and for a published
+  ``DSL_FULL`` and ``DSL_EXTEND`` strategy,
+* ``get_points_by_gameId_with_details`` and ``get_users_by_gameId``,
+* ``get_all_points_by_externalUserId`` for the most active user,
+* the ``user-points`` export rendered as CSV and as JSON,
+* the dashboard summaries.
+
+The detailed point reads (``array_agg``/``json_build_object``) and the
+dashboard summaries (``date_trunc``) only run on PostgreSQL and are reported
+as skipped on the default SQLite engine.
+
+Every path reports median and p95 latency in milliseconds; a path that
+raises is reported with its error instead of aborting the run. The report,
+including the git commit and the dataset shape, is printed as JSON so runs
+can be diffed across commits.
+
+Usage::
+
+    python -m benchmarks.bench_hot_paths
+    python -m benchmarks.bench_hot_paths --users 2000 --points-per-user 50
+    python -m benchmarks.bench_hot_paths --database-url postgresql+asyncpg://...
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import subprocess
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import cycle
+from types import SimpleNamespace
+
+from dependency_injector import providers
+
+from app.core.container import Container
+from app.schema.export_schema import ExportDatasetType, ExportFilters
+from app.schema.task_schema import AsignPointsToExternalUserId
+from benchmarks._db import SQLITE_URL, create_engine_with_schema, make_session_factory
+from benchmarks._generator import (
+    BUILTIN_STRATEGIES,
+    DSL_STRATEGIES,
+    SyntheticLoad,
+    seed_synthetic_load,
+)
+
+
+def _git_commit() -> str:
+    """Current commit hash, or ``"unknown"`` outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def _measure(call, repeat: int) -> dict:
+    """Median/p95 wall time of ``repeat`` awaited calls, in milliseconds."""
+    samples = []
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await call()
+            samples.append((time.perf_counter() - started) * 1000)
+    except Exception as exc:  # noqa: BLE001 - reported, not swallowed
+        return {"error": f"{type(exc).__name__}: {exc}"}
+    ordered = sorted(samples)
+    return {
+        "calls": repeat,
+        "median_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+    }
+
+
+async def _drain(chunks) -> int:
+    """Consume an async byte stream, returning its size."""
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+    return size
+
+
+async def _scoring_paths(seeded, events: int) -> dict:
+    """Time ``assign_points_to_user`` once per event on each seeded game."""
+    service = Container.user_points_service()
+    realm = seeded.load.realm
+    results = {}
+    for label, game in seeded.games.items():
+        targets = cycle(
+            (task, user)
+            for user in seeded.externalUserIds[:50]
+            for task in game.externalTaskIds
+        )
+
+        async def assign(game=game, targets=targets):
+            external_task_id, external_user_id = next(targets)
+            await service.assign_points_to_user(
+                game.gameId,
+                external_task_id,
+                AsignPointsToExternalUserId(
+                    externalUserId=external_user_id,
+                    data={"minutes": 15},
+                ),
+                api_key=realm,
+            )
+
+        results[label] = await _measure(assign, events)
+    return results
+
+
+async def _read_paths(seeded, repeat: int, dialect: str) -> dict:
+    """Time the game read, export and dashboard paths."""
+    points = Container.user_points_service()
+    exports = Container.export_service()
+    dashboard = Container.dashboard_service()
+    game = next(iter(seeded.games.values()))
+    dataset = ExportDatasetType.USER_POINTS.value
+    filters = ExportFilters(limit=min(seeded.user_points, 100_000))
+    end = datetime.now(timezone.utc)
+    start = end - timedelta(days=seeded.load.days)
+
+    postgres_only = {
+        "get_points_by_gameId_with_details": lambda: (
+            points.get_points_by_gameId_with_details(game.gameId)
+        ),
+        "get_all_points_by_externalUserId": lambda: (
+            points.get_all_points_by_externalUserId(seeded.externalUserIds[0])
+        ),
+        "get_dashboard_summary": lambda: dashboard.get_dashboard_summary(
+            start, end, "day"
+        ),
+        "get_dashboard_summary_logs": lambda: dashboard.get_dashboard_summary_logs(
+            start, end, "day"
+        ),
+    }
+    results = {
+        "get_users_by_gameId": await _measure(
+            lambda: points.get_users_by_gameId(game.gameId), repeat
+        ),
+    }
+    for name, call in postgres_only.items():
+        if dialect != "postgresql":
+            results[name] = {"skipped": "requires postgresql"}
+        else:
+            results[name] = await _measure(call, repeat)
+    for export_format in ("csv", "json"):
+        results[f"export_user_points_{export_format}"] = await _measure(
+            lambda export_format=export_format: _drain(
+                exports.format_iterator(
+                    dataset, export_format, exports.iter_dataset(dataset, filters)
+                )
+            ),
+            repeat,
+        )
+    return results
+
+
+async def run(load: SyntheticLoad, events: int, repeat: int, database_url: str) -> dict:
+    """Seed ``load`` into a fresh database and time every hot path."""
+    engine = await create_engine_with_schema(database_url)
+    session_factory = make_session_factory(engine)
+    Container.db.override(providers.Object(SimpleNamespace(session=session_factory)))
+    try:
+        seeded = await seed_synthetic_load(session_factory, load)
+        report = {
+            "benchmark": "hot_paths",
+            "commit": _git_commit(),
+            "database": engine.dialect.name,
+            "dataset": {
+                "games": len(seeded.games),
+                "tasks_per_game": load.tasks_per_game,
+                "users": load.users,
+                "user_points": seeded.user_points,
+                "seed": load.seed,
+            },
+            "events": events,
+            "repeat": repeat,
+            "assign_points_to_user": await _scoring_paths(seeded, events),
+            "reads": await _read_paths(seeded, repeat, engine.dialect.name),
+        }
+    finally:
+        Container.db.reset_override()
+        await engine.dispose()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--strategies",
+        nargs="+",
+        default=list(BUILTIN_STRATEGIES) + list(DSL_STRATEGIES),
+        help="Built-in strategy ids and/or DSL labels (dsl_full, dsl_extend).",
+    )
+    parser.add_argument("--tasks-per-game", type=int, default=20)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--points-per-user", type=int, default=25)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default=SQLITE_URL)
+    args = parser.parse_args()
+    # Audit/info logs from the services would drown the JSON report.
+    logging.disable(logging.INFO)
+    load = SyntheticLoad(
+        strategies=tuple(args.strategies),
+        tasks_per_game=args.tasks_per_game,
+        users=args.users,
+        points_per_user=args.points_per_user,
+        days=args.days,
+        seed=args.seed,
+    )
+    report = asyncio.run(run(load, args.events, args.repeat, args.database_url))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
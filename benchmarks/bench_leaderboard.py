@@ -0,0 +1,245 @@
+"""
+Benchmark the per-game leaderboards at a million awards.
+
+Seeds one game with ``--awards`` ``user_points`` rows (long-tail activity
+over ``--users`` users and ``--days`` days), rebuilds ``game_leaderboard``
+from them, then times:
+
+* ``rebuild`` of the game's boards,
+* ``record_awards`` of one award (the per-award write-path cost),
+* top-K of the all-time, daily and weekly boards,
+* a user's standing (rank plus neighbours) for the leader, a median user
+  and the last-ranked user,
+* for contrast, the same top-K computed by aggregating ``user_points``.
+
+Each read is timed on the database backend and, with ``--redis-url``, on the
+Redis sorted-set backend after loading the boards. Results are printed as
+JSON.
+
+Usage::
+
+    python -m benchmarks.bench_leaderboard
+    python -m benchmarks.bench_leaderboard --awards 100000 --repeat 20
+    python -m benchmarks.bench_leaderboard --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import cycle
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy import func, insert, select
+
+from app.model.games import Games
+from app.model.tasks import Tasks
+from app.model.user_points import UserPoints
+from app.model.users import Users
+from app.repository.game_leaderboard_repository import (
+    GameLeaderboardRepository,
+    period_start,
+)
+from app.services.leaderboard_backend import (
+    DatabaseLeaderboardBackend,
+    RedisLeaderboardBackend,
+)
+from app.services.rate_limit_counter_backend import build_redis_client_from_url
+from benchmarks._db import SQLITE_URL, create_engine_with_schema, make_session_factory
+
+_INSERT_BATCH = 10_000
+
+
+async def _measure(call, repeat: int) -> dict:
+    """Median/p95 wall time of ``repeat`` awaited calls, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1000)
+    ordered = sorted(samples)
+    return {
+        "calls": repeat,
+        "median_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+    }
+
+
+async def _seed(session_factory, awards: int, users: int, days: int, seed: int):
+    """Insert one game, its task, the users and ``awards`` awards."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    game_id, task_id = uuid4(), uuid4()
+    user_ids = [uuid4() for _ in range(users)]
+    weights = [1 / (rank + 1) for rank in range(users)]
+    window = timedelta(days=days).total_seconds()
+    async with session_factory() as session:
+        await session.execute(
+            insert(Games),
+            [
+                {
+                    "id": game_id,
+                    "externalGameId": "bench-leaderboard",
+                    "platform": "bench",
+                    "strategyId": "default",
+                }
+            ],
+        )
+        await session.execute(
+            insert(Tasks),
+            [
+                {
+                    "id": task_id,
+                    "externalTaskId": "bench-task",
+                    "gameId": game_id,
+                    "strategyId": "default",
+                    "status": "open",
+                }
+            ],
+        )
+        for start in range(0, users, _INSERT_BATCH):
+            await session.execute(
+                insert(Users),
+                [
+                    {"id": user_id, "externalUserId": f"bench_user_{start + offset}"}
+                    for offset, user_id in enumerate(
+                        user_ids[start : start + _INSERT_BATCH]
+                    )
+                ],
+            )
+        for start in range(0, awards, _INSERT_BATCH):
+            count = min(_INSERT_BATCH, awards - start)
+            await session.execute(
+                insert(UserPoints),
+                [
+                    {
+                        "id": uuid4(),
+                        "userId": user_id,
+                        "taskId": task_id,
+                        "points": rng.randint(1, 20),
+                        "caseName": "BenchSeed",
+                        "created_at": now - timedelta(seconds=rng.random() * window),
+                    }
+                    for user_id in rng.choices(user_ids, weights=weights, k=count)
+                ],
+            )
+        await session.commit()
+    return game_id, task_id, user_ids, now
+
+
+async def _aggregate_top(session_factory, task_id, limit: int):
+    """The pre-leaderboard way: sum ``user_points`` per user and sort."""
+    async with session_factory() as session:
+        total = func.sum(UserPoints.points)
+        stmt = (
+            select(UserPoints.userId, total.label("points"))
+            .where(UserPoints.taskId == task_id)
+            .group_by(UserPoints.userId)
+            .order_by(total.desc())
+            .limit(limit)
+        )
+        return (await session.execute(stmt)).all()
+
+
+async def _reads(backend, game_id, user_ids, now, args) -> dict:
+    """Time top-K and standings on every window of one backend."""
+    results = {}
+    for period in ("all", "day", "week"):
+        start = period_start(period, now)
+        results[f"top_{period}"] = await _measure(
+            lambda start=start, period=period: backend.top(
+                game_id, period, start, args.limit
+            ),
+            args.repeat,
+        )
+    start = period_start("all", now)
+    board = await backend.top(game_id, "all", start, len(user_ids))
+    by_id = {str(user_id): user_id for user_id in user_ids}
+    positions = {"leader": 0, "median": len(board) // 2, "last": len(board) - 1}
+    for label, position in positions.items():
+        user_id = by_id[board[position]["userId"]]
+        results[f"standing_{label}"] = await _measure(
+            lambda user_id=user_id: backend.standing(
+                game_id, "all", start, user_id, args.neighbours
+            ),
+            args.repeat,
+        )
+    return results
+
+
+async def run(args) -> dict:
+    """Seed the awards into a fresh database and time every path."""
+    engine = await create_engine_with_schema(args.database_url)
+    session_factory = make_session_factory(engine)
+    repository = GameLeaderboardRepository(session_factory)
+    try:
+        game_id, task_id, user_ids, now = await _seed(
+            session_factory, args.awards, args.users, args.days, args.seed
+        )
+        started = time.perf_counter()
+        rows = await repository.rebuild(gameId=game_id)
+        rebuild_ms = (time.perf_counter() - started) * 1000
+
+        next_user = cycle(user_ids)
+        record = await _measure(
+            lambda: repository.record_awards(
+                game_id,
+                [SimpleNamespace(userId=next(next_user), points=1, created_at=now)],
+            ),
+            args.repeat,
+        )
+        report = {
+            "benchmark": "leaderboard",
+            "database": engine.dialect.name,
+            "dataset": {
+                "awards": args.awards,
+                "users": args.users,
+                "days": args.days,
+                "seed": args.seed,
+                "leaderboard_rows": rows,
+            },
+            "rebuild_ms": round(rebuild_ms, 3),
+            "record_awards_one": record,
+            "aggregate_top_from_user_points": await _measure(
+                lambda: _aggregate_top(session_factory, task_id, args.limit),
+                args.repeat,
+            ),
+            "database_backend": await _reads(
+                DatabaseLeaderboardBackend(repository), game_id, user_ids, now, args
+            ),
+        }
+        if args.redis_url:
+            redis = RedisLeaderboardBackend(
+                build_redis_client_from_url(args.redis_url),
+                repository,
+                key_prefix="bench:lb:",
+            )
+            for board in await repository.read_boards(gameId=game_id):
+                await redis.load(*board, await repository.read_board(*board))
+            report["redis_backend"] = await _reads(redis, game_id, user_ids, now, args)
+    finally:
+        await engine.dispose()
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--awards", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--neighbours", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--database-url", default=SQLITE_URL)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
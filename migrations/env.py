@@ -14,6 +14,8 @@ from app.core.database import _to_async_url
 from app.model.abuse_limit_counter import AbuseLimitCounter  # noqa: F401
 from app.model.api_key import ApiKey  # noqa: F401
 from app.model.api_requests import ApiRequests  # noqa: F401
+from app.model.dashboard_daily_rollup import DashboardDailyRollup  # noqa: F401
+from app.model.game_leaderboard import GameLeaderboard  # noqa: F401
 from app.model.game_params import GamesParams  # noqa: F401
 from app.model.games import Games  # noqa: F401
 from app.model.kpi_metrics import KpiMetrics  # noqa: F401
@@ -26,6 +28,7 @@ from app.model.uptime_logs import UptimeLogs  # noqa: F401
 from app.model.user_actions import UserActions  # noqa: F401
 from app.model.user_game_config import UserGameConfig  # noqa: F401
 from app.model.user_points import UserPoints  # noqa: F401
+from app.model.user_task_stats import UserTaskStats  # noqa: F401
 from app.model.users import Users  # noqa: F401
 from app.model.wallet import Wallet  # noqa: F401
 from app.model.wallet_transactions import WalletTransactions  # noqa: F401
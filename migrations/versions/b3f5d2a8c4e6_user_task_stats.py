@@ -0,0 +1,49 @@
+"""user_task_stats rollup table added
+
+Revision ID: b3f5d2a8c4e6
+Revises: f9d3a8c5b2e1
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "b3f5d2a8c4e6"
+down_revision = "f9d3a8c5b2e1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Created empty: populate it with ``scripts/user_task_stats.py rebuild``
+    # before enabling USER_TASK_STATS_READS_ENABLED.
+    op.create_table(
+        "user_task_stats",
+        sa.Column("taskId", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("userId", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            "awardsCount", sa.Integer(), nullable=False, server_default=sa.text("0")
+        ),
+        sa.Column(
+            "pointsSum", sa.Integer(), nullable=False, server_default=sa.text("0")
+        ),
+        sa.Column("firstAt", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("lastAt", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("previousAt", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "minutesSum", sa.Float(), nullable=False, server_default=sa.text("0")
+        ),
+        sa.Column(
+            "minutesCount", sa.Integer(), nullable=False, server_default=sa.text("0")
+        ),
+        sa.ForeignKeyConstraint(["taskId"], ["tasks.id"]),
+        sa.ForeignKeyConstraint(["userId"], ["users.id"]),
+        sa.PrimaryKeyConstraint("taskId", "userId"),
+    )
+
+
+def downgrade():
+    op.drop_table("user_task_stats")
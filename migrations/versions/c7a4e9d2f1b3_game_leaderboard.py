@@ -0,0 +1,46 @@
+"""game_leaderboard table added
+
+Revision ID: c7a4e9d2f1b3
+Revises: b3f5d2a8c4e6
+Create Date: 2026-10-17 06:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "c7a4e9d2f1b3"
+down_revision = "b3f5d2a8c4e6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Created empty: populate it with ``scripts/leaderboard.py rebuild``
+    # before pointing clients at the leaderboard endpoints.
+    op.create_table(
+        "game_leaderboard",
+        sa.Column("gameId", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("period", sa.String(length=8), nullable=False),
+        sa.Column("periodStart", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("userId", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("points", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column(
+            "awardsCount", sa.Integer(), nullable=False, server_default=sa.text("0")
+        ),
+        sa.ForeignKeyConstraint(["gameId"], ["games.id"]),
+        sa.ForeignKeyConstraint(["userId"], ["users.id"]),
+        sa.PrimaryKeyConstraint("gameId", "period", "periodStart", "userId"),
+    )
+    op.create_index(
+        "ix_game_leaderboard_rank",
+        "game_leaderboard",
+        ["gameId", "period", "periodStart", "points", "userId"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_game_leaderboard_rank", table_name="game_leaderboard")
+    op.drop_table("game_leaderboard")
@@ -0,0 +1,51 @@
+"""dashboard_daily_rollup table and created_at indexes
+
+Revision ID: d2b8f6a1c4e7
+Revises: c7a4e9d2f1b3
+Create Date: 2026-10-17 07:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d2b8f6a1c4e7"
+down_revision = "c7a4e9d2f1b3"
+branch_labels = None
+depends_on = None
+
+# The dashboard reads the open day (and the edges of a range) from the raw
+# tables; without these every summary was a sequential scan.
+_CREATED_AT_INDEXES = {
+    "ix_users_created_at": "users",
+    "ix_games_created_at": "games",
+    "ix_userpoints_created_at": "userpoints",
+    "ix_useractions_created_at": "useractions",
+    "ix_logs_created_at": "logs",
+}
+
+
+def upgrade():
+    # Created empty: backfill it with ``scripts/dashboard_rollup.py refresh``.
+    # Until then the summaries aggregate the raw tables, as before.
+    op.create_table(
+        "dashboard_daily_rollup",
+        sa.Column("metric", sa.String(length=32), nullable=False),
+        sa.Column("day", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "rowsCount", sa.BigInteger(), nullable=False, server_default=sa.text("0")
+        ),
+        sa.Column(
+            "value", sa.BigInteger(), nullable=False, server_default=sa.text("0")
+        ),
+        sa.PrimaryKeyConstraint("metric", "day"),
+    )
+    for name, table in _CREATED_AT_INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} (created_at)")
+
+
+def downgrade():
+    for name in _CREATED_AT_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.drop_table("dashboard_daily_rollup")
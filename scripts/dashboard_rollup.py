@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Backfill the dashboard's daily rollup.
+
+``dashboard_daily_rollup`` holds one row per (metric, closed UTC day) with the
+day's new users, games opened, points earned, actions performed and log
+counts per level. The dashboard summaries read closed days from it and only
+aggregate the raw tables for the partial days at the edges of the requested
+range; once the table is backfilled they also roll up each newly closed day
+on the first request after midnight. They never fill an empty table, so run
+``refresh`` once after ``alembic upgrade head``.
+
+``refresh`` rolls up the days after the last rolled-up one (every day since
+the oldest row on an empty table). ``--since`` recomputes every closed day
+from that date on, e.g. after importing rows into past days.
+
+Run with::
+
+    poetry run python scripts/dashboard_rollup.py refresh
+    poetry run python scripts/dashboard_rollup.py refresh --since 2026-01-01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from datetime import date
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Run from anywhere: make the ``app`` package importable (when invoked as a
+# file, sys.path[0] is scripts/, not the repo root).
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+async def _run(since: date | None) -> int:
+    from app.core.config import configs
+    from app.core.database import Database
+    from app.repository.dashboard_repository import DashboardRepository
+
+    database = Database(configs.DATABASE_URI)
+    repository = DashboardRepository(session_factory=database.session)
+    try:
+        written = await repository.refresh_daily_rollup(since=since)
+        print(f"dashboard_daily_rollup: wrote {written} row(s).")
+        return 0
+    finally:
+        await database.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    refresh = subcommands.add_parser("refresh", help="Roll up closed days.")
+    refresh.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        help="Recompute every closed day from this date (YYYY-MM-DD) on.",
+    )
+    args = parser.parse_args()
+    return asyncio.run(_run(args.since))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Backfill the per-game leaderboards.
+
+``game_leaderboard`` holds one row per (game, window, user) with the user's
+points on the all-time, daily and weekly boards. Every points write keeps it
+current in the same transaction, but awards written before the table existed
+(or by anything that bypasses the points service) have to be backfilled.
+
+``rebuild`` recomputes the rows from ``user_points`` (all games, or one with
+``--game-id``) in a single transaction against ``DATABASE_URI``. With
+``LEADERBOARD_BACKEND=redis`` it then reloads the sorted sets: the all-time
+boards plus the daily/weekly boards still inside
+``LEADERBOARD_WINDOW_TTL_SECONDS``; older windows are served from the table.
+
+Run with::
+
+    poetry run python scripts/leaderboard.py rebuild
+    poetry run python scripts/leaderboard.py rebuild --game-id <uuid>
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import UUID
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Run from anywhere: make the ``app`` package importable (when invoked as a
+# file, sys.path[0] is scripts/, not the repo root).
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+async def _run(game_id: UUID | None) -> int:
+    from app.core.config import configs
+    from app.core.database import Database
+    from app.repository.game_leaderboard_repository import GameLeaderboardRepository
+    from app.services.leaderboard_backend import (
+        RedisLeaderboardBackend,
+        build_leaderboard_backend,
+    )
+
+    database = Database(configs.DATABASE_URI)
+    repository = GameLeaderboardRepository(session_factory=database.session)
+    try:
+        written = await repository.rebuild(gameId=game_id)
+        print(f"game_leaderboard: rebuilt {written} row(s).")
+
+        backend = build_leaderboard_backend(
+            repository,
+            backend_name=configs.LEADERBOARD_BACKEND,
+            redis_url=configs.REDIS_URL,
+            redis_key_prefix=configs.LEADERBOARD_REDIS_KEY_PREFIX,
+            window_ttl_seconds=configs.LEADERBOARD_WINDOW_TTL_SECONDS,
+        )
+        if not isinstance(backend, RedisLeaderboardBackend):
+            return 0
+        since = datetime.now(timezone.utc) - timedelta(
+            seconds=configs.LEADERBOARD_WINDOW_TTL_SECONDS
+        )
+        boards = await repository.read_boards(gameId=game_id, since=since)
+        for board in boards:
+            rows = await repository.read_board(*board)
+            await backend.load(*board, rows)
+        print(f"game_leaderboard: loaded {len(boards)} board(s) into Redis.")
+        return 0
+    finally:
+        await database.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    rebuild = subcommands.add_parser("rebuild", help="Recompute the leaderboards.")
+    rebuild.add_argument("--game-id", type=UUID, help="Only rebuild this game.")
+    args = parser.parse_args()
+    return asyncio.run(_run(args.game_id))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Backfill and audit the ``user_task_stats`` rollup.
+
+``user_task_stats`` holds one row per (task, user) with the award count, points
+sum, first/last/previous award times and the ``data["minutes"]`` totals. Every
+points write keeps it current in the same transaction, but rows written before
+the table existed (or by anything that bypasses the points service) have to be
+backfilled before ``USER_TASK_STATS_READS_ENABLED`` is switched on.
+
+Two subcommands, both against ``DATABASE_URI``:
+
+* ``rebuild`` recomputes the rollups from ``user_points`` (all games, or one
+  with ``--game-id``) in a single transaction.
+* ``check`` recomputes them without writing and prints every row that differs
+  from the stored one; exits ``1`` when any does.
+
+Run with::
+
+    poetry run python scripts/user_task_stats.py rebuild
+    poetry run python scripts/user_task_stats.py check --game-id <uuid>
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from uuid import UUID
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Run from anywhere: make the ``app`` package importable (when invoked as a
+# file, sys.path[0] is scripts/, not the repo root).
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+async def _run(command: str, game_id: UUID | None, limit: int) -> int:
+    from app.core.config import configs
+    from app.core.database import Database
+    from app.repository.user_task_stats_repository import UserTaskStatsRepository
+
+    database = Database(configs.DATABASE_URI)
+    repository = UserTaskStatsRepository(session_factory=database.session)
+    try:
+        if command == "rebuild":
+            written = await repository.rebuild(gameId=game_id)
+            print(f"user_task_stats: rebuilt {written} row(s).")
+            return 0
+
+        mismatches = await repository.find_inconsistencies(gameId=game_id, limit=limit)
+        for mismatch in mismatches:
+            print(json.dumps(mismatch, default=str))
+        if mismatches:
+            print(
+                f"user_task_stats: {len(mismatches)} inconsistent row(s) "
+                "(run `rebuild` to repair).",
+                file=sys.stderr,
+            )
+            return 1
+        print("user_task_stats: consistent with user_points.")
+        return 0
+    finally:
+        await database.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    rebuild = subcommands.add_parser("rebuild", help="Recompute the rollups.")
+    rebuild.add_argument("--game-id", type=UUID, help="Only rebuild this game's tasks.")
+    check = subcommands.add_parser("check", help="Report drifted rollups.")
+    check.add_argument("--game-id", type=UUID, help="Only check this game's tasks.")
+    check.add_argument(
+        "--limit", type=int, default=100, help="Maximum mismatches to report."
+    )
+    args = parser.parse_args()
+    return asyncio.run(_run(args.command, args.game_id, getattr(args, "limit", 100)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,36 +14,36 @@ def test_client():
     return TestClient(app)
 
 
-async def _aiter(items):
-    for it in items:
-        yield it
-
-
 def _make_mock_service(rows):
     """
-    Build a mock ExportService whose iter_dataset returns the given rows.
+    Build a mock ExportService whose stream_export formats the given rows.
 
-    We can't reuse `ExportService.format_iterator` directly because it
+    We can't reuse `ExportService.stream_export` directly because it
     dispatches through ``self.format_as_csv`` etc., and ``self`` is an
     AsyncMock - every attribute access yields an AsyncMock that returns a
     coroutine, breaking ``async for``. So we route to the underlying
-    staticmethods explicitly.
+    staticmethods explicitly (the ORM path; no database is involved).
     """
     from app.services.export_service import DATASET_COLUMNS, ExportService
 
     service = AsyncMock()
     service.audit_start = AsyncMock(return_value=SimpleNamespace(id="audit-1"))
     service.audit_finish = AsyncMock()
-    service.iter_dataset = lambda dataset_type, filters: _aiter(rows)
 
-    def _format_iterator(dt, fmt, it):
+    async def _counted_rows(row_counter):
+        for row in rows:
+            row_counter["n"] += 1
+            yield row
+
+    def _stream_export(dt, fmt, filters, row_counter):
+        it = _counted_rows(row_counter)
         if fmt == "csv":
             return ExportService.format_as_csv(it, DATASET_COLUMNS[dt])
         if fmt == "json":
             return ExportService.format_as_json(it)
         return ExportService.format_as_xlsx(it, DATASET_COLUMNS[dt])
 
-    service.format_iterator = _format_iterator
+    service.stream_export = _stream_export
     service.media_type_for = ExportService.media_type_for
     service.filename_for = ExportService.filename_for
     return service
@@ -21,9 +21,11 @@ from app.schema.games_schema import (
     PostCreateGame,
     PostFindGame,
 )
+from app.schema.leaderboard_schema import LeaderboardPeriod
 from app.schema.task_schema import (
     AddActionDidByUserInTask,
     AsignPointsToExternalUserId,
+    AssignPointsBatch,
     CreateTaskPost,
     CreateTasksPost,
     DuplicateTask,
@@ -47,6 +49,7 @@ _GAMES_SUBMODULES = (
     "app.api.v1.endpoints.games_tasks",
     "app.api.v1.endpoints.games_points",
     "app.api.v1.endpoints.games_users",
+    "app.api.v1.endpoints.games_leaderboard",
 )
 
 
@@ -157,6 +160,9 @@ class TestGamesEndpoints(unittest.IsolatedAsyncioTestCase):
         service.enforce_task_mutation_limits = AsyncMock(
             side_effect=enforce_side_effect
         )
+        service.enforce_task_mutation_batch_limits = AsyncMock(
+            side_effect=enforce_side_effect
+        )
         return service
 
     async def test_get_games_list_without_token_uses_api_key_filter(self):
@@ -902,6 +908,92 @@ class TestGamesEndpoints(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(exc_info.exception.status_code, 409)
 
+    async def test_assign_points_to_users_batch_charges_limits_per_event(self):
+        game_id = uuid4()
+        schema = AssignPointsBatch(
+            events=[
+                {"externalTaskId": "task-1", "externalUserId": "u1"},
+                {"externalTaskId": "task-2", "externalUserId": "u1", "data": {}},
+                {"externalTaskId": "task-1", "externalUserId": "u2"},
+            ]
+        )
+        abuse_service = self._abuse_service()
+        service = AsyncMock()
+        service.assign_points_to_users_batch = AsyncMock(return_value={"failed": 0})
+
+        result = await games.assign_points_to_users_batch(
+            gameId=game_id,
+            schema=schema,
+            request=self._request(),
+            service=service,
+            abuse_prevention_service=abuse_service,
+            audit=self._audit(api_key="api-key-1", oauth_user_id=None),
+        )
+
+        self.assertEqual(result, {"failed": 0})
+        abuse_service.enforce_task_mutation_batch_limits.assert_awaited_once_with(
+            api_key="api-key-1",
+            client_ip="198.51.100.1",
+            external_user_ids=["u1", "u1", "u2"],
+        )
+        self.assertTrue(all("correlationId" in e.data for e in schema.events))
+        service.assign_points_to_users_batch.assert_awaited_once_with(
+            game_id,
+            schema.events,
+            "api-key-1",
+            oauth_user_id=None,
+            is_admin=False,
+            enforce_scope=True,
+        )
+
+    async def test_assign_points_to_users_batch_maps_precondition_failed_to_422(self):
+        schema = AssignPointsBatch(
+            events=[{"externalTaskId": "task-1", "externalUserId": "u1"}]
+        )
+        service = AsyncMock()
+        service.assign_points_to_users_batch = AsyncMock(
+            side_effect=PreconditionFailedError(detail="batch too large")
+        )
+
+        with self.assertRaises(HTTPException) as exc_info:
+            await games.assign_points_to_users_batch(
+                gameId=uuid4(),
+                schema=schema,
+                request=self._request(),
+                service=service,
+                abuse_prevention_service=self._abuse_service(),
+                audit=self._audit(api_key="api-key-1", oauth_user_id=None),
+            )
+
+        self.assertEqual(exc_info.exception.status_code, 422)
+
+    async def test_assign_points_to_users_batch_rejects_oversized_batches_first(
+        self,
+    ):
+        schema = AssignPointsBatch(
+            events=[
+                {"externalTaskId": "task-1", "externalUserId": f"u{index}"}
+                for index in range(3)
+            ]
+        )
+        abuse_service = self._abuse_service()
+        service = AsyncMock()
+
+        with patch.object(games.configs, "POINTS_BATCH_MAX_EVENTS", 2):
+            with self.assertRaises(HTTPException) as exc_info:
+                await games.assign_points_to_users_batch(
+                    gameId=uuid4(),
+                    schema=schema,
+                    request=self._request(),
+                    service=service,
+                    abuse_prevention_service=abuse_service,
+                    audit=self._audit(api_key="api-key-1", oauth_user_id=None),
+                )
+
+        self.assertEqual(exc_info.exception.status_code, 422)
+        abuse_service.enforce_task_mutation_batch_limits.assert_not_awaited()
+        service.assign_points_to_users_batch.assert_not_awaited()
+
     async def test_get_points_by_task_id(self):
         service = AsyncMock()
         service.get_points_by_task_id.return_value = [{"externalUserId": "u1"}]
@@ -955,11 +1047,55 @@ class TestGamesEndpoints(unittest.IsolatedAsyncioTestCase):
 
         result = await games.get_users_by_gameId(
             gameId=game_id,
+            page=2,
+            page_size=50,
             service=service,
             audit=self._audit(api_key="api-key-1", oauth_user_id="oauth-user-1"),
         )
 
         self.assertIn("tasks", result)
+        _, kwargs = service.get_users_by_gameId.call_args
+        self.assertEqual((kwargs["page"], kwargs["page_size"]), (2, 50))
+
+    async def test_get_leaderboard_forwards_window_and_scope(self):
+        service = AsyncMock()
+        service.get_leaderboard.return_value = {"entries": []}
+        game_id = uuid4()
+
+        result = await games.get_leaderboard(
+            gameId=game_id,
+            period=LeaderboardPeriod.WEEK,
+            limit=25,
+            date=None,
+            service=service,
+            audit=self._audit(api_key="api-key-1", oauth_user_id="oauth-user-1"),
+        )
+
+        self.assertEqual(result, {"entries": []})
+        args, kwargs = service.get_leaderboard.call_args
+        self.assertEqual(args, (game_id, LeaderboardPeriod.WEEK, 25, None))
+        self.assertEqual(kwargs["api_key"], "api-key-1")
+        self.assertTrue(kwargs["enforce_scope"])
+
+    async def test_get_leaderboard_user_forwards_neighbours(self):
+        service = AsyncMock()
+        service.get_user_standing.return_value = {"entry": {"rank": 3}}
+        game_id = uuid4()
+
+        result = await games.get_leaderboard_user(
+            gameId=game_id,
+            externalUserId="user-1",
+            period=LeaderboardPeriod.ALL,
+            neighbours=2,
+            date=None,
+            service=service,
+            audit=self._audit(api_key="api-key-1", oauth_user_id=None),
+        )
+
+        self.assertEqual(result["entry"]["rank"], 3)
+        args, kwargs = service.get_user_standing.call_args
+        self.assertEqual(args, (game_id, "user-1", LeaderboardPeriod.ALL, 2, None))
+        self.assertTrue(kwargs["enforce_scope"])
 
     async def test_token_absent_paths_cover_non_oauth_branches(self):
         game_id = uuid4()
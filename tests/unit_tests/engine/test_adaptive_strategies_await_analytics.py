@@ -18,8 +18,18 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from app.schema.user_points_schema import EffortSnapshot, ScoringSnapshot
 from app.services.user_points_analytics_service import UserPointsAnalyticsService
 
+_FRESH_TASK = ScoringSnapshot(
+    task_measurements_count=1,
+    user_task_measurements_count=0,
+    user_avg_time_between_tasks=-1,
+    all_avg_time_between_tasks=-1,
+    last_window_time_diff=0,
+    new_last_window_time_diff=0,
+)
+
 
 def _real_analytics(**returns) -> UserPointsAnalyticsService:
     """A real ``UserPointsAnalyticsService`` over an ``AsyncMock`` repository.
@@ -40,7 +50,7 @@ async def test_default_awaits_analytics_basic_engagement():
     strategy = EnhancedGamificationStrategy()
     strategy.debug = False
     strategy.user_points_analytics_service = _real_analytics(
-        count_measurements_by_external_task_id=1
+        get_scoring_snapshot=_FRESH_TASK
     )
 
     assert await strategy.calculate_points("g", "t", "u") == (1, "BasicEngagement")
@@ -53,7 +63,7 @@ async def test_socio_bee_awaits_analytics_basic_engagement():
     strategy = SocioBeeStrategy()
     strategy.debug = False
     strategy.user_points_analytics_service = _real_analytics(
-        count_measurements_by_external_task_id=1
+        get_scoring_snapshot=_FRESH_TASK
     )
 
     assert await strategy.calculate_points("g", "t", "u") == (1, "BasicEngagement")
@@ -82,7 +92,12 @@ async def test_greengage_awaits_analytics_and_task_params():
     strategy.task_service = AsyncMock()
     strategy.task_service.get_task_params_by_externalTaskId.return_value = []
     strategy.user_points_analytics_service = _real_analytics(
-        user_has_record_before_in_externalTaskId_last_min=False
+        get_effort_snapshot=EffortSnapshot(
+            has_recent_record=False,
+            personal_records_count=0,
+            global_avg_minutes=-1,
+            personal_avg_minutes=-1,
+        )
     )
 
     assert await strategy.calculate_points("g", "t", "u", data={"minutes": 0}) == (
@@ -151,5 +151,121 @@ class TestAllEngineStrategies(unittest.TestCase):
             all_engine_strategies_module._discover_strategy_modules()
 
 
+class _FakeStrategy:
+    """Minimal strategy counting how often it is instantiated."""
+
+    created = 0
+
+    def __init__(self):
+        type(self).created += 1
+        self.hash_version = f"hash-{type(self).__name__}"
+        self.variable_points = {"basic": 1}
+
+    def get_strategy_name(self):
+        return type(self).__name__
+
+    def get_strategy_description(self):
+        return "fake"
+
+    def get_strategy_version(self):
+        return "1.0.0"
+
+    def get_variables(self):
+        return {"variable_points": self.variable_points}
+
+
+def _make_fake_strategy_class(name: str):
+    return type(name, (_FakeStrategy,), {"created": 0})
+
+
+class TestEngineStrategyTable(unittest.TestCase):
+    def setUp(self):
+        self._registry = _RegistryReset().__enter__()
+        # Force a rebuild against this test's registry, and again afterwards.
+        all_engine_strategies_module._table_generation = None
+        patchers = [
+            patch.object(
+                all_engine_strategies_module,
+                "check_class_methods_and_variables",
+                return_value=True,
+            ),
+            patch.object(all_engine_strategies_module, "_discover_strategy_modules"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._registry.__exit__(None, None, None)
+        all_engine_strategies_module._table_generation = None
+
+    def test_lookup_reuses_one_instance_per_id(self):
+        Alpha = _make_fake_strategy_class("Alpha")
+        strategy_registry.register_strategy(id="alpha")(Alpha)
+
+        first = all_engine_strategies_module.engine_strategy("alpha")
+        second = all_engine_strategies_module.engine_strategy("alpha")
+
+        self.assertIsInstance(first, Alpha)
+        self.assertIs(first, second)
+        self.assertEqual(first.id, "alpha")
+        self.assertEqual(Alpha.created, 1)
+        self.assertIsNone(all_engine_strategies_module.engine_strategy("missing"))
+
+    def test_late_registration_rebuilds_the_table(self):
+        strategy_registry.register_strategy(id="alpha")(
+            _make_fake_strategy_class("Alpha")
+        )
+        self.assertIsNone(all_engine_strategies_module.engine_strategy("beta"))
+
+        Beta = _make_fake_strategy_class("Beta")
+        strategy_registry.register_strategy(id="beta")(Beta)
+
+        self.assertIsInstance(
+            all_engine_strategies_module.engine_strategy("beta"), Beta
+        )
+
+    def test_refresh_builds_new_instances(self):
+        Alpha = _make_fake_strategy_class("Alpha")
+        strategy_registry.register_strategy(id="alpha")(Alpha)
+        before = all_engine_strategies_module.engine_strategy("alpha")
+
+        table = all_engine_strategies_module.refresh_engine_strategies()
+
+        self.assertIsNot(table["alpha"], before)
+        self.assertIs(
+            all_engine_strategies_module.engine_strategy("alpha"), table["alpha"]
+        )
+        self.assertEqual(Alpha.created, 2)
+
+    def test_metadata_is_precomputed_and_returned_as_copies(self):
+        Alpha = _make_fake_strategy_class("Alpha")
+        strategy_registry.register_strategy(id="alpha")(Alpha)
+        strategy_registry.register_strategy(id="beta")(
+            _make_fake_strategy_class("Beta")
+        )
+
+        listed = all_engine_strategies_module.engine_strategy_metadata()
+        entry = all_engine_strategies_module.engine_strategy_metadata("alpha")
+        entry["variables"]["variable_points"]["basic"] = 99
+
+        self.assertEqual([item["id"] for item in listed], ["alpha", "beta"])
+        self.assertEqual(
+            all_engine_strategies_module.engine_strategy_metadata("alpha"),
+            {
+                "id": "alpha",
+                "name": "Alpha",
+                "description": "fake",
+                "version": "1.0.0",
+                "variables": {"variable_points": {"basic": 1}},
+                "hash_version": "hash-Alpha",
+            },
+        )
+        self.assertIsNone(
+            all_engine_strategies_module.engine_strategy_metadata("missing")
+        )
+        self.assertEqual(Alpha.created, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from app.engine.default import EnhancedGamificationStrategy
+from app.schema.user_points_schema import ScoringSnapshot
 
 
 @pytest.fixture
@@ -16,34 +17,59 @@ def strategy():
     return instance
 
 
-def _set_shared_values(strategy, *, task_count=3, user_count=3, user_avg=10, all_avg=5):
+def _set_snapshot(
+    strategy,
+    *,
+    task_count=3,
+    user_count=3,
+    user_avg=10,
+    all_avg=5,
+    last_window=0,
+    new_last_window=0,
+):
+    strategy.user_points_analytics_service.get_scoring_snapshot.return_value = (
+        ScoringSnapshot(
+            task_measurements_count=task_count,
+            user_task_measurements_count=user_count,
+            user_avg_time_between_tasks=user_avg,
+            all_avg_time_between_tasks=all_avg,
+            last_window_time_diff=last_window,
+            new_last_window_time_diff=new_last_window,
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_calculate_points_reads_history_from_one_snapshot(strategy):
+    _set_snapshot(strategy, user_avg=10, all_avg=5, last_window=5, new_last_window=5)
+
+    await strategy.calculate_points("game_id", "task_id", "user_id")
+
     service = strategy.user_points_analytics_service
-    service.count_measurements_by_external_task_id.return_value = task_count
-    service.get_user_task_measurements_count.return_value = user_count
-    service.get_avg_time_between_tasks_by_user_and_game_task.return_value = user_avg
-    service.get_avg_time_between_tasks_for_all_users.return_value = all_avg
+    service.get_scoring_snapshot.assert_awaited_once_with(
+        "game_id", "task_id", "user_id"
+    )
+    service.count_measurements_by_external_task_id.assert_not_called()
+    service.get_avg_time_between_tasks_for_all_users.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_calculate_points_returns_basic_engagement_when_task_count_is_less_than_two(
     strategy,
 ):
-    strategy.user_points_analytics_service.count_measurements_by_external_task_id.return_value = (
-        1
-    )
+    _set_snapshot(strategy, task_count=1)
 
     points, status = await strategy.calculate_points("game_id", "task_id", "user_id")
 
     assert points == strategy.variable_basic_points
     assert status == "BasicEngagement"
-    strategy.user_points_analytics_service.get_user_task_measurements_count.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_calculate_points_returns_default_when_user_measurements_are_two_or_less(
     strategy,
 ):
-    _set_shared_values(strategy, task_count=3, user_count=2)
+    _set_snapshot(strategy, task_count=3, user_count=2)
 
     points, status = await strategy.calculate_points("game_id", "task_id", "user_id")
 
@@ -55,22 +81,17 @@ async def test_calculate_points_returns_default_when_user_measurements_are_two_o
 async def test_calculate_points_returns_performance_bonus_when_user_avg_is_better(
     strategy,
 ):
-    _set_shared_values(strategy, user_avg=5, all_avg=10)
+    _set_snapshot(strategy, user_avg=5, all_avg=10)
 
     points, status = await strategy.calculate_points("game_id", "task_id", "user_id")
 
     assert points == strategy.variable_basic_points + strategy.variable_bonus_points
     assert status == "PerformanceBonus"
-    strategy.user_points_analytics_service.get_last_window_time_diff.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_calculate_points_returns_individual_over_global(strategy):
-    _set_shared_values(strategy, user_avg=10, all_avg=5)
-    strategy.user_points_analytics_service.get_last_window_time_diff.return_value = 3
-    strategy.user_points_analytics_service.get_new_last_window_time_diff.return_value = (
-        5
-    )
+    _set_snapshot(strategy, user_avg=10, all_avg=5, last_window=3, new_last_window=5)
 
     points, status = await strategy.calculate_points("game_id", "task_id", "user_id")
 
@@ -80,11 +101,7 @@ async def test_calculate_points_returns_individual_over_global(strategy):
 
 @pytest.mark.asyncio
 async def test_calculate_points_returns_peak_performer_bonus(strategy):
-    _set_shared_values(strategy, user_avg=10, all_avg=5)
-    strategy.user_points_analytics_service.get_last_window_time_diff.return_value = 2
-    strategy.user_points_analytics_service.get_new_last_window_time_diff.return_value = (
-        9
-    )
+    _set_snapshot(strategy, user_avg=10, all_avg=5, last_window=2, new_last_window=9)
 
     points, status = await strategy.calculate_points("game_id", "task_id", "user_id")
 
@@ -94,11 +111,7 @@ async def test_calculate_points_returns_peak_performer_bonus(strategy):
 
 @pytest.mark.asyncio
 async def test_calculate_points_returns_global_advantage_adjustment(strategy):
-    _set_shared_values(strategy, user_avg=10, all_avg=7)
-    strategy.user_points_analytics_service.get_last_window_time_diff.return_value = 1
-    strategy.user_points_analytics_service.get_new_last_window_time_diff.return_value = (
-        13
-    )
+    _set_snapshot(strategy, user_avg=10, all_avg=7, last_window=1, new_last_window=13)
 
     points, status = await strategy.calculate_points("game_id", "task_id", "user_id")
 
@@ -110,11 +123,7 @@ async def test_calculate_points_returns_global_advantage_adjustment(strategy):
 async def test_calculate_points_returns_individual_adjustment_for_negative_diff(
     strategy,
 ):
-    _set_shared_values(strategy, user_avg=10, all_avg=5)
-    strategy.user_points_analytics_service.get_last_window_time_diff.return_value = 5
-    strategy.user_points_analytics_service.get_new_last_window_time_diff.return_value = (
-        3
-    )
+    _set_snapshot(strategy, user_avg=10, all_avg=5, last_window=5, new_last_window=3)
 
     points, status = await strategy.calculate_points("game_id", "task_id", "user_id")
 
@@ -124,11 +133,7 @@ async def test_calculate_points_returns_individual_adjustment_for_negative_diff(
 
 @pytest.mark.asyncio
 async def test_calculate_points_returns_default_when_diff_is_zero(strategy):
-    _set_shared_values(strategy, user_avg=10, all_avg=5)
-    strategy.user_points_analytics_service.get_last_window_time_diff.return_value = 5
-    strategy.user_points_analytics_service.get_new_last_window_time_diff.return_value = (
-        5
-    )
+    _set_snapshot(strategy, user_avg=10, all_avg=5, last_window=5, new_last_window=5)
 
     points, status = await strategy.calculate_points("game_id", "task_id", "user_id")
 
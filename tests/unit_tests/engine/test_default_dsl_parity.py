@@ -12,13 +12,12 @@ Every scenario must agree on ``(points, case_name)`` - if even one
 diverges, ``test_default.py`` and the parity test cannot both be true and
 S6 is blocked by the roadmap's control gate.
 
-One async mock shape for both.  Both implementations now ``await`` the
-analytics calls - ``EnhancedGamificationStrategy`` awaits them directly, and
-``DslStrategy`` runs them through ``ExecutionContext.build_for_ast`` which
-awaits each one - so an ``AsyncMock`` analytics service satisfies both.
-``_build_analytics_mocks`` keeps the two in lockstep by reading the same
-scenario dict and producing an ``AsyncMock`` per analytics method for each
-strategy.
+One scenario shape for both.  ``EnhancedGamificationStrategy`` awaits one
+``get_scoring_snapshot`` call, and so does ``DslStrategy`` once
+``ExecutionContext.build_for_ast`` coalesces the template's snapshot-covered
+fields. ``_build_analytics_mocks`` keeps the two in lockstep by reading the
+same scenario dict and producing the snapshot plus an ``AsyncMock`` per
+analytics method (used when coalescing is disabled) for each strategy.
 
 Defaulting unspecified analytics to ``0``: the rule ordering in the AST
 short-circuits long before unused paths matter (scenario 1 matches rule
@@ -40,6 +39,7 @@ from app.engine.default import EnhancedGamificationStrategy
 from app.engine.dsl_interpreter import DslInterpreter
 from app.engine.dsl_strategy import DslStrategy
 from app.schema.strategy_definition_schema import StrategyDefinitionRead
+from app.schema.user_points_schema import ScoringSnapshot
 
 _AST_PATH = (
     Path(__file__).resolve().parents[3]
@@ -51,29 +51,38 @@ _AST_PATH = (
 _AST: Dict = json.loads(_AST_PATH.read_text(encoding="utf-8"))
 
 
-_ANALYTICS_METHODS = (
-    "count_measurements_by_external_task_id",
-    "get_user_task_measurements_count",
-    "get_avg_time_between_tasks_by_user_and_game_task",
-    "get_avg_time_between_tasks_for_all_users",
-    "get_last_window_time_diff",
-    "get_new_last_window_time_diff",
-)
+# Analytics method -> the ``ScoringSnapshot`` field ``default.py`` reads in
+# its place, so one scenario dict feeds both implementations.
+_ANALYTICS_METHODS = {
+    "count_measurements_by_external_task_id": "task_measurements_count",
+    "get_user_task_measurements_count": "user_task_measurements_count",
+    "get_avg_time_between_tasks_by_user_and_game_task": "user_avg_time_between_tasks",
+    "get_avg_time_between_tasks_for_all_users": "all_avg_time_between_tasks",
+    "get_last_window_time_diff": "last_window_time_diff",
+    "get_new_last_window_time_diff": "new_last_window_time_diff",
+}
 
 
 def _build_analytics_mocks(returns: Dict[str, float]):
     """
     Build two ``AsyncMock`` analytics services that resolve every analytic to
     the same value - one for the Python strategy, one for the DSL strategy.
-    Both paths ``await`` the analytics calls, so both mocks are async.
-    Unspecified methods default to 0.
+    Both await a single ``get_scoring_snapshot`` built from the scenario; the
+    DSL mock also answers each method. Unspecified methods default to 0.
     """
     py_mock = MagicMock()
     dsl_mock = MagicMock()
     for method in _ANALYTICS_METHODS:
         value = returns.get(method, 0)
-        setattr(py_mock, method, AsyncMock(return_value=value))
         setattr(dsl_mock, method, AsyncMock(return_value=value))
+    snapshot = ScoringSnapshot(
+        **{
+            field: returns.get(method, 0)
+            for method, field in _ANALYTICS_METHODS.items()
+        }
+    )
+    py_mock.get_scoring_snapshot = AsyncMock(return_value=snapshot)
+    dsl_mock.get_scoring_snapshot = AsyncMock(return_value=snapshot)
     return py_mock, dsl_mock
 
 
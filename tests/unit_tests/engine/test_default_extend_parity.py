@@ -37,30 +37,39 @@ from app.engine.dsl_interpreter import DslInterpreter
 from app.engine.dsl_strategy import DslStrategy
 from app.engine.dsl_validator import validate_ast
 from app.schema.strategy_definition_schema import StrategyDefinitionRead
+from app.schema.user_points_schema import ScoringSnapshot
 
 # Mirror of the analytics method set used by ``default.py``. Each
 # scenario specifies the subset of methods it cares about; defaults of
 # 0 keep the DSL's AsyncMock path from returning unawaitable values.
-_ANALYTICS_METHODS = (
-    "count_measurements_by_external_task_id",
-    "get_user_task_measurements_count",
-    "get_avg_time_between_tasks_by_user_and_game_task",
-    "get_avg_time_between_tasks_for_all_users",
-    "get_last_window_time_diff",
-    "get_new_last_window_time_diff",
-)
+# Analytics method -> the ``ScoringSnapshot`` field ``default.py`` reads in
+# its place, so one scenario dict feeds both implementations.
+_ANALYTICS_METHODS = {
+    "count_measurements_by_external_task_id": "task_measurements_count",
+    "get_user_task_measurements_count": "user_task_measurements_count",
+    "get_avg_time_between_tasks_by_user_and_game_task": "user_avg_time_between_tasks",
+    "get_avg_time_between_tasks_for_all_users": "all_avg_time_between_tasks",
+    "get_last_window_time_diff": "last_window_time_diff",
+    "get_new_last_window_time_diff": "new_last_window_time_diff",
+}
 
 
 def _build_analytics_mocks(returns: Dict[str, int]):
     """Same factory shape used by ``test_default_dsl_parity`` - an AsyncMock
-    for the Python parent (which awaits its analytics calls) and one for the
-    DSL ExecutionContext.precompute calls."""
+    snapshot for the Python parent and one AsyncMock per method for the DSL
+    ExecutionContext.precompute calls."""
     py_mock = MagicMock()
     dsl_mock = MagicMock()
     for method in _ANALYTICS_METHODS:
         value = returns.get(method, 0)
-        setattr(py_mock, method, AsyncMock(return_value=value))
         setattr(dsl_mock, method, AsyncMock(return_value=value))
+    snapshot = ScoringSnapshot(
+        **{
+            field: returns.get(method, 0)
+            for method, field in _ANALYTICS_METHODS.items()
+        }
+    )
+    py_mock.get_scoring_snapshot = AsyncMock(return_value=snapshot)
     return py_mock, dsl_mock
 
 
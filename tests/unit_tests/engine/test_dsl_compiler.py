@@ -0,0 +1,325 @@
+"""
+Parity tests for the closure compiler (``app/engine/dsl_compiler.py``).
+
+Every program is run through both the walker (``DslInterpreter.execute``)
+and its compiled form with identical contexts; the full result - points,
+case name, callback data, working data, veto flag and the trace - must be
+identical, and so must any error (type, code, node id, message). Inputs are
+the shipped ``dsl_templates`` programs under many seeded field values, plus
+small hand-written programs for each node type and guard.
+"""
+
+import json
+import random
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.engine.dsl_ast import enumerate_field_paths
+from app.engine.dsl_execution_context import ExecutionContext
+from app.engine.dsl_interpreter import DslInterpreter
+from app.engine.dsl_validator import validate_ast
+
+TEMPLATES_DIR = Path(__file__).resolve().parents[3] / "app" / "engine" / "dsl_templates"
+FIELD_VALUES = [0, 1, 2, 3, 5, 10, 25, 100, 0.5, 1.5, -1, None, True, "x"]
+
+
+def _template_programs():
+    programs = []
+    for path in sorted(TEMPLATES_DIR.glob("*.json")):
+        programs.append((path.stem, json.loads(path.read_text())))
+    for path in sorted((TEMPLATES_DIR / "user").glob("*.json")):
+        programs.append((path.stem, json.loads(path.read_text())["astJson"]))
+    return programs
+
+
+def _modes(ast):
+    if ast.get("pre_rules") or ast.get("post_rules"):
+        return ["pre", "post"]
+    return ["full"]
+
+
+async def _ctx(ast, mock_state, data=None):
+    return await ExecutionContext.build_for_ast(
+        ast,
+        externalGameId="g",
+        externalTaskId="t",
+        externalUserId="u",
+        data=data,
+        analytics_service=MagicMock(),
+        mock_state=mock_state,
+    )
+
+
+async def _outcome(run):
+    try:
+        return ("ok", await run)
+    except Exception as exc:  # noqa: BLE001 - compared, not swallowed
+        return (
+            "error",
+            type(exc).__name__,
+            getattr(exc, "code", None),
+            getattr(exc, "headers", None),
+            str(exc),
+        )
+
+
+async def _assert_parity(ast, mock_state, *, mode="full", interpreter=None, **kw):
+    interpreter = interpreter or DslInterpreter(max_nodes=1000, max_depth=32)
+    compiled = interpreter.compile(ast)
+    assert compiled is not None
+    ctx = await _ctx(ast, mock_state)
+    walked = await _outcome(interpreter.execute(ast, ctx, mode=mode, **kw))
+    ran = await _outcome(compiled.execute(ctx, mode=mode, **kw))
+    assert ran == walked
+    return walked
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "name, ast", _template_programs(), ids=[n for n, _ in _template_programs()]
+)
+async def test_templates_match_the_walker_across_inputs(name, ast):
+    validate_ast(ast)
+    paths = sorted(enumerate_field_paths(ast))
+    rng = random.Random(name)
+    for _ in range(60):
+        mock_state = {path: rng.choice(FIELD_VALUES) for path in paths}
+        for mode in _modes(ast):
+            parent = (
+                {"points": rng.choice([0, 3, 8]), "case_name": "P", "callback_data": {}}
+                if mode == "post"
+                else None
+            )
+            await _assert_parity(
+                ast,
+                mock_state,
+                mode=mode,
+                initial_data={"points": 2} if mode == "pre" else None,
+                parent_result=parent,
+            )
+
+
+def _lit(node_id, value):
+    return {"type": "literal", "id": node_id, "value": value}
+
+
+def _field(node_id, path):
+    return {"type": "field", "id": node_id, "path": path}
+
+
+def _program(rules, **extra):
+    return {"type": "program", "id": "p", "rules": rules, **extra}
+
+
+def _cascade_program():
+    """if / else-if / else with and, or, not, arith and func_call."""
+    count = _field("fc", "user.measurements_count")
+    return _program(
+        [
+            {
+                "type": "rule",
+                "id": "r1",
+                "when": {
+                    "type": "and",
+                    "id": "and1",
+                    "args": [
+                        {
+                            "type": "compare",
+                            "id": "c1",
+                            "op": ">=",
+                            "left": count,
+                            "right": _lit("l1", 5),
+                        },
+                        {"type": "not", "id": "n1", "arg": _field("fd", "data.flag")},
+                    ],
+                },
+                "then": [
+                    {
+                        "type": "set_callback_data",
+                        "id": "cb1",
+                        "key": "k",
+                        "value": {
+                            "type": "func_call",
+                            "id": "fn1",
+                            "name": "clamp",
+                            "args": [count, _lit("lo", 0), _lit("hi", 7)],
+                        },
+                    },
+                    {
+                        "type": "assign_points",
+                        "id": "a1",
+                        "value": {
+                            "type": "arith",
+                            "id": "ar1",
+                            "op": "/",
+                            "left": _lit("l10", 10),
+                            "right": count,
+                        },
+                        "case_name": "High",
+                    },
+                ],
+                "else_if": [
+                    {
+                        "id": "ei1",
+                        "when": {
+                            "type": "or",
+                            "id": "or1",
+                            "args": [_field("fd2", "data.flag"), _lit("f", False)],
+                        },
+                        "then": [{"type": "return", "id": "ret"}],
+                    }
+                ],
+                "else": [
+                    {
+                        "type": "set_callback_data",
+                        "id": "cb2",
+                        "key": "else",
+                        "value": {
+                            "type": "func_call",
+                            "id": "fn2",
+                            "name": "int",
+                            "args": [_lit("l25", 2.5)],
+                        },
+                    }
+                ],
+            }
+        ],
+        default={
+            "type": "assign_points",
+            "id": "d1",
+            "value": _lit("ld", 1),
+            "case_name": "Default",
+        },
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mock_state",
+    [
+        {"user.measurements_count": 6, "data.flag": False},
+        {"user.measurements_count": 6, "data.flag": True},
+        {"user.measurements_count": 0, "data.flag": False},
+        {"user.measurements_count": "many", "data.flag": False},
+        {"user.measurements_count": 1, "data.flag": None},
+    ],
+)
+async def test_cascade_program_matches_the_walker(mock_state):
+    await _assert_parity(_cascade_program(), mock_state)
+
+
+@pytest.mark.asyncio
+async def test_division_by_zero_raises_the_same_error():
+    ast = _cascade_program()
+    ast["rules"][0]["when"] = _lit("t", True)
+    outcome = await _assert_parity(ast, {"user.measurements_count": 0})
+    assert outcome[0] == "error" and outcome[2] == "DSL_ARITH_DIV_BY_ZERO"
+
+
+@pytest.mark.asyncio
+async def test_extend_statements_match_the_walker():
+    ast = {
+        "type": "program",
+        "id": "p",
+        "pre_rules": [
+            {
+                "type": "rule",
+                "id": "pr",
+                "when": _field("fp", "data.points"),
+                "then": [
+                    {
+                        "type": "set_data",
+                        "id": "sd",
+                        "key": "points",
+                        "value": {
+                            "type": "arith",
+                            "id": "x2",
+                            "op": "*",
+                            "left": _field("fp2", "data.points"),
+                            "right": _lit("two", 2),
+                        },
+                    },
+                    {"type": "veto", "id": "v", "case_name": "Vetoed"},
+                ],
+            }
+        ],
+        "post_rules": [
+            {
+                "type": "rule",
+                "id": "po",
+                "when": _lit("yes", True),
+                "then": [
+                    {
+                        "type": "set_points",
+                        "id": "sp",
+                        "value": {
+                            "type": "arith",
+                            "id": "max",
+                            "op": "max",
+                            "left": _field("pp", "parent.points"),
+                            "right": _lit("floor", 5),
+                        },
+                    },
+                    {"type": "set_case_name", "id": "sc", "value": _lit("cn", "Boost")},
+                ],
+            }
+        ],
+    }
+    for points in (0, 4):
+        await _assert_parity(
+            ast, {"data.points": points}, mode="pre", initial_data={"points": points}
+        )
+    await _assert_parity(
+        ast,
+        {"parent.points": 3, "parent.case_name": "P"},
+        mode="post",
+        parent_result={"points": 3, "case_name": "P", "callback_data": {"a": 1}},
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_nodes", [1, 3, 6, 9, 12])
+async def test_node_budget_trips_at_the_same_node(max_nodes):
+    await _assert_parity(
+        _cascade_program(),
+        {"user.measurements_count": 6, "data.flag": False},
+        interpreter=DslInterpreter(max_nodes=max_nodes, max_depth=32),
+    )
+
+
+def test_programs_the_walker_must_report_on_are_not_compiled():
+    too_deep = _cascade_program()
+    interpreter = DslInterpreter(max_nodes=1000, max_depth=3)
+    assert interpreter.compile(too_deep) is None
+
+    bad_op = _cascade_program()
+    bad_op["rules"][0]["when"]["args"][0]["op"] = "<>"
+    assert DslInterpreter(max_nodes=1000, max_depth=32).compile(bad_op) is None
+
+
+@pytest.mark.asyncio
+async def test_compiled_run_yields_to_the_event_loop(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("app.engine.dsl_compiler.asyncio.sleep", fake_sleep)
+    skip = {
+        "type": "rule",
+        "id": "r",
+        "when": _lit("no", False),
+        "then": [],
+    }
+    ast = _program([dict(skip, id=f"r{i}") for i in range(20)])
+    interpreter = DslInterpreter(max_nodes=1000, max_depth=32, yield_every=4)
+
+    result = await interpreter.compile(ast).execute(await _ctx(ast, {}))
+
+    assert result["points"] == 0
+    # 1 program node, then 3 per skipped rule (the rule, and its bare
+    # literal counted as condition and expression): rule ``i`` starts at
+    # node 1 + 3i, so a 4-node gap opens before every second rule.
+    assert len(sleeps) == 10
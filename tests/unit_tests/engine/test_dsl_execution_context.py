@@ -7,11 +7,13 @@ These tests pin that contract: only referenced fields hit the analytics
 service, and ``mock_state`` short-circuits the analytics call entirely.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.engine.dsl_execution_context import ExecutionContext
+from app.schema.user_points_schema import ScoringSnapshot
 
 
 def _ast_referencing(*paths):
@@ -42,9 +44,32 @@ def _analytics_stub():
     svc.get_avg_time_between_tasks_for_all_users = AsyncMock(return_value=2.0)
     svc.get_last_window_time_diff = AsyncMock(return_value=3.0)
     svc.get_new_last_window_time_diff = AsyncMock(return_value=4.0)
+    svc.get_user_task_measurements_count_the_last_seconds = AsyncMock(return_value=5)
+    svc.get_scoring_snapshot = AsyncMock(
+        return_value=ScoringSnapshot(
+            task_measurements_count=42,
+            user_task_measurements_count=7,
+            user_avg_time_between_tasks=1.5,
+            all_avg_time_between_tasks=2.0,
+            last_window_time_diff=3.0,
+            new_last_window_time_diff=4.0,
+        )
+    )
     return svc
 
 
+async def _build(ast, svc, **kwargs):
+    return await ExecutionContext.build_for_ast(
+        ast,
+        externalGameId="g",
+        externalTaskId="t",
+        externalUserId="u",
+        data=None,
+        analytics_service=svc,
+        **kwargs,
+    )
+
+
 @pytest.mark.asyncio
 async def test_only_referenced_paths_trigger_analytics_calls():
     svc = _analytics_stub()
@@ -193,3 +218,104 @@ async def test_static_paths_resolve_without_analytics():
     assert ctx.resolved_fields["externalUserId"] == "u-1"
     # No analytic method should have been called for static paths.
     svc.get_user_task_measurements_count.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_covered_paths_share_one_query():
+    svc = _analytics_stub()
+    ast = _ast_referencing(
+        "user.measurements_count",
+        "all.avg_time",
+        "user.new_last_window_diff",
+        "user.recent_measurements_count",
+    )
+
+    ctx = await _build(ast, svc, coalesce=True)
+
+    svc.get_scoring_snapshot.assert_awaited_once_with("g", "t", "u")
+    svc.get_user_task_measurements_count.assert_not_called()
+    svc.get_avg_time_between_tasks_for_all_users.assert_not_called()
+    # Not carried by the snapshot, so it keeps its own query.
+    svc.get_user_task_measurements_count_the_last_seconds.assert_awaited_once_with(
+        "t", "u", 300
+    )
+    assert dict(ctx.resolved_fields) == {
+        "user.measurements_count": 7,
+        "all.avg_time": 2.0,
+        "user.new_last_window_diff": 4.0,
+        "user.recent_measurements_count": 5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_coalescing_disabled_fetches_each_path():
+    svc = _analytics_stub()
+    ast = _ast_referencing("user.measurements_count", "all.avg_time")
+
+    ctx = await _build(ast, svc, coalesce=False)
+
+    svc.get_scoring_snapshot.assert_not_called()
+    svc.get_user_task_measurements_count.assert_awaited_once_with("t", "u")
+    svc.get_avg_time_between_tasks_for_all_users.assert_awaited_once_with("g", "t")
+    assert ctx.resolved_fields["all.avg_time"] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_analytics_calls_overlap_up_to_the_cap():
+    in_flight = 0
+    peak = 0
+
+    async def slow(*args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 1
+
+    svc = MagicMock()
+    for method in (
+        "get_user_task_measurements_count",
+        "get_user_task_measurements_count_the_last_seconds",
+        "count_measurements_by_external_task_id",
+        "get_avg_time_between_tasks_for_all_users",
+        "get_last_window_time_diff",
+    ):
+        setattr(svc, method, AsyncMock(side_effect=slow))
+    ast = _ast_referencing(
+        "user.measurements_count",
+        "user.recent_measurements_count",
+        "task.measurements_count",
+        "all.avg_time",
+        "user.last_window_diff",
+    )
+
+    ctx = await _build(ast, svc, coalesce=False, max_concurrency=2)
+
+    assert peak == 2
+    assert set(ctx.resolved_fields.values()) == {1}
+
+
+@pytest.mark.asyncio
+async def test_failed_analytics_call_cancels_the_rest():
+    cancelled = asyncio.Event()
+
+    async def hang(*args):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    svc = MagicMock()
+    svc.get_user_task_measurements_count = AsyncMock(side_effect=hang)
+    svc.count_measurements_by_external_task_id = AsyncMock(
+        side_effect=RuntimeError("db down")
+    )
+    ast = _ast_referencing("user.measurements_count", "task.measurements_count")
+
+    with pytest.raises(RuntimeError, match="db down"):
+        await _build(ast, svc, coalesce=False, max_concurrency=4)
+    await asyncio.sleep(0)
+
+    assert cancelled.is_set()
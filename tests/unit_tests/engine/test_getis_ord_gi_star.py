@@ -124,3 +124,51 @@ async def test_getis_ord_strategy_behaviour_and_metadata(caplog):
     strategy.debug = True
     strategy.debug_print("debug-line")
     assert "debug-line" in caplog.text
+
+
+def _dense_gi_star(grid):
+    """The original dense-weights formulation, kept as a parity oracle."""
+    rows, cols = grid.shape
+    n = grid.size
+    x = grid.reshape(-1)
+    weights = np.zeros((n, n))
+    for r in range(rows):
+        for c in range(cols):
+            i = r * cols + c
+            weights[i, i] = 1.0
+            for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                if 0 <= nr < rows and 0 <= nc < cols:
+                    weights[i, nr * cols + nc] = 1.0
+    mean_x = np.mean(x)
+    std_x = np.sqrt((np.sum(x * x) / n) - mean_x**2)
+    sum_w = weights.sum(axis=1)
+    scores = np.zeros(n)
+    for i in range(n):
+        numerator = weights[i] @ x - mean_x * sum_w[i]
+        denominator = std_x * np.sqrt(max((n * sum_w[i] - sum_w[i] ** 2) / (n - 1), 0))
+        scores[i] = 0.0 if denominator == 0 else numerator / denominator
+    return scores.reshape(rows, cols)
+
+
+@pytest.mark.parametrize("shape", [(1, 2), (2, 1), (2, 2), (1, 7), (6, 1), (5, 9)])
+def test_compute_getis_ord_matches_dense_weights_formulation(shape):
+    rng = np.random.default_rng(sum(shape))
+    grid = rng.poisson(4.0, size=shape).astype(float)
+    grid[0, 0] += 1.0  # never constant
+
+    scores = compute_getis_ord_gi_star(grid)
+
+    assert scores.shape == shape
+    assert np.allclose(scores, _dense_gi_star(grid), rtol=1e-12, atol=1e-12)
+
+
+def test_compute_getis_ord_handles_large_grids_without_dense_weights():
+    grid = np.zeros((1000, 1000))
+    grid[500, 500] = 1.0
+
+    scores = compute_getis_ord_gi_star(grid)
+
+    assert scores.shape == (1000, 1000)
+    # The spike and its four rook neighbours share the top score.
+    assert scores.max() == scores[500, 500] == scores[499, 500] == scores[500, 501]
+    assert scores[500, 500] > scores[0, 0]
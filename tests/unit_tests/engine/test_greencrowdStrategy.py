@@ -503,3 +503,89 @@ async def test_calculate_points_handles_expired_simulation():
     assert points == 15
     assert case_name == "Valid Simulation - Origin: Expired simulation"
     assert callback_data == [renewed_task]
+
+
+def _game_records(now_utc):
+    return [
+        SimpleNamespace(
+            taskId=task_id,
+            userId=user_id,
+            created_at=now_utc - datetime.timedelta(hours=hours),
+            data={"tasks": [{"dimensions": [{"DIM_BP": hours}, {"DIM_S": 2}]}]},
+        )
+        for task_id, user_id, hours in [
+            ("task-1", "user-1", 50),
+            ("task-1", "user-1", 26),
+            ("task-1", "user-2", 7),
+            ("task-2", "user-1", 3),
+            ("task-3", "user-2", 1),
+        ]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_simulate_tasks_loads_once_and_matches_per_task_dynamic_values():
+    strategy = _build_strategy_with_mocked_container()
+    now_utc = datetime.datetime.now(datetime.timezone.utc)
+    records = _game_records(now_utc)
+    strategy.user_points_service.get_all_point_of_tasks_list = AsyncMock(
+        return_value=records
+    )
+    tasks = [
+        SimpleNamespace(id="task-1", externalTaskId="t_poiA_1"),
+        SimpleNamespace(id="task-2", externalTaskId="t_poiA_2"),
+        SimpleNamespace(id="task-3", externalTaskId="t_poiB_1"),
+        SimpleNamespace(id="task-4", externalTaskId="t_poiC_1"),
+    ]
+    user = SimpleNamespace(id="user-1")
+
+    results = await strategy.simulate_tasks(
+        tasks, "user-1", user, userGroup="dynamic_calculation"
+    )
+
+    strategy.user_points_service.get_all_point_of_tasks_list.assert_awaited_once_with(
+        ["task-1", "task-2", "task-3", "task-4"], withData=True
+    )
+    list_ids_tasks = [{"id": t.id, "externalTaskId": t.externalTaskId} for t in tasks]
+    for task, result in zip(tasks, results):
+        expected = get_dynamic_values_from_tasks(
+            task, list_ids_tasks, QueryRecords(records), user, 10, 0.5
+        )
+        assert result.externalTaskId == task.externalTaskId
+        assert result.userGroup == "dynamic_calculation"
+        assert result.dimensions == [{dim: value} for dim, value in expected.items()]
+        assert result.totalSimulatedPoints == sum(expected.values())
+
+
+@pytest.mark.asyncio
+async def test_simulate_tasks_zeroes_only_the_stale_last_task():
+    strategy = _build_strategy_with_mocked_container()
+    now_utc = datetime.datetime.now(datetime.timezone.utc)
+    strategy.user_points_service.get_all_point_of_tasks_list = AsyncMock(
+        return_value=_game_records(now_utc)
+    )
+    tasks = [
+        SimpleNamespace(id="task-1", externalTaskId="t_poiA_1"),
+        SimpleNamespace(id="task-2", externalTaskId="t_poiA_2"),
+    ]
+    last_task = SimpleNamespace(
+        taskId="task-1", created_at=now_utc - datetime.timedelta(seconds=400)
+    )
+
+    results = await strategy.simulate_tasks(
+        tasks,
+        "user-1",
+        SimpleNamespace(id="user-1"),
+        userGroup="average_score",
+        user_last_task=last_task,
+    )
+
+    assert results[0].totalSimulatedPoints == 0
+    # Averages over every record: DIM_BP mean 17.4 -> 17, DIM_S 2, others 5.
+    assert results[1].dimensions == [
+        {"DIM_BP": 17},
+        {"DIM_LBE": 5},
+        {"DIM_TD": 5},
+        {"DIM_PP": 5},
+        {"DIM_S": 2},
+    ]
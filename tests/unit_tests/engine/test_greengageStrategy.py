@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from app.engine.greengageStrategy import GREENGAGEGamificationStrategy
+from app.schema.user_points_schema import EffortSnapshot
 
 
 @pytest.fixture
@@ -28,6 +29,22 @@ def strategy_bundle():
     return strategy, task_service, user_points_service, user_points_analytics_service
 
 
+def _set_snapshot(
+    user_points_analytics_service,
+    *,
+    recent=False,
+    records=0,
+    global_avg=-1,
+    personal_avg=-1,
+):
+    user_points_analytics_service.get_effort_snapshot.return_value = EffortSnapshot(
+        has_recent_record=recent,
+        personal_records_count=records,
+        global_avg_minutes=global_avg,
+        personal_avg_minutes=personal_avg,
+    )
+
+
 def test_init_sets_expected_configuration(strategy_bundle):
     strategy, task_service, user_points_service, user_points_analytics_service = (
         strategy_bundle
@@ -108,9 +125,7 @@ async def test_calculate_points_case_1_1_and_maps_task_params(strategy_bundle):
         SimpleNamespace(key="management", value=30),
         SimpleNamespace(key="ignored", value=99),
     ]
-    user_points_analytics_service.user_has_record_before_in_externalTaskId_last_min.return_value = (
-        False
-    )
+    _set_snapshot(user_points_analytics_service, recent=False)
 
     result = await strategy.calculate_points(
         "game-1", "task-1", "user-1", data={"minutes": 0}
@@ -122,7 +137,9 @@ async def test_calculate_points_case_1_1_and_maps_task_params(strategy_bundle):
         "exploitation": 20,
         "management": 30,
     }
-    user_points_analytics_service.count_personal_records_by_external_game_id.assert_not_called()
+    user_points_analytics_service.get_effort_snapshot.assert_awaited_once_with(
+        "game-1", "task-1", "user-1", strategy.variable_minutes_to_check
+    )
 
 
 @pytest.mark.asyncio
@@ -133,9 +150,7 @@ async def test_calculate_points_case_1_2_when_user_has_previous_recent_record(
         strategy_bundle
     )
     task_service.get_task_params_by_externalTaskId.return_value = []
-    user_points_analytics_service.user_has_record_before_in_externalTaskId_last_min.return_value = (
-        True
-    )
+    _set_snapshot(user_points_analytics_service, recent=True)
 
     result = await strategy.calculate_points(
         "game-1", "task-1", "user-1", data={"minutes": 0}
@@ -157,12 +172,7 @@ async def test_calculate_points_case_2_when_personal_records_are_less_than_two(
         "exploitation": 99,
         "management": 99,
     }
-    user_points_analytics_service.user_has_record_before_in_externalTaskId_last_min.return_value = (
-        False
-    )
-    user_points_analytics_service.count_personal_records_by_external_game_id.return_value = (
-        1
-    )
+    _set_snapshot(user_points_analytics_service, records=1)
 
     result = await strategy.calculate_points(
         "game-1", "task-1", "user-1", data={"minutes": 5}
@@ -184,20 +194,13 @@ async def test_calculate_points_case_3_when_minutes_are_above_global_average(
         strategy_bundle
     )
     task_service.get_task_params_by_externalTaskId.return_value = []
-    user_points_analytics_service.user_has_record_before_in_externalTaskId_last_min.return_value = (
-        False
-    )
-    user_points_analytics_service.count_personal_records_by_external_game_id.return_value = (
-        2
-    )
-    user_points_analytics_service.get_global_avg_by_external_game_id.return_value = 10
+    _set_snapshot(user_points_analytics_service, records=2, global_avg=10)
 
     result = await strategy.calculate_points(
         "game-1", "task-1", "user-1", data={"minutes": 11}
     )
 
     assert result == (15.0, "Case 3 (BP)")
-    user_points_analytics_service.get_personal_avg_by_external_game_id.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -208,14 +211,9 @@ async def test_calculate_points_case_4_1_when_minutes_are_above_personal_average
         strategy_bundle
     )
     task_service.get_task_params_by_externalTaskId.return_value = []
-    user_points_analytics_service.user_has_record_before_in_externalTaskId_last_min.return_value = (
-        False
-    )
-    user_points_analytics_service.count_personal_records_by_external_game_id.return_value = (
-        2
+    _set_snapshot(
+        user_points_analytics_service, records=2, global_avg=20, personal_avg=15
     )
-    user_points_analytics_service.get_global_avg_by_external_game_id.return_value = 20
-    user_points_analytics_service.get_personal_avg_by_external_game_id.return_value = 15
 
     result = await strategy.calculate_points(
         "game-1", "task-1", "user-1", data={"minutes": 16}
@@ -232,14 +230,9 @@ async def test_calculate_points_case_4_2_when_minutes_are_not_above_personal_ave
         strategy_bundle
     )
     task_service.get_task_params_by_externalTaskId.return_value = []
-    user_points_analytics_service.user_has_record_before_in_externalTaskId_last_min.return_value = (
-        False
-    )
-    user_points_analytics_service.count_personal_records_by_external_game_id.return_value = (
-        2
+    _set_snapshot(
+        user_points_analytics_service, records=2, global_avg=20, personal_avg=16
     )
-    user_points_analytics_service.get_global_avg_by_external_game_id.return_value = 20
-    user_points_analytics_service.get_personal_avg_by_external_game_id.return_value = 16
 
     result = await strategy.calculate_points(
         "game-1", "task-1", "user-1", data={"minutes": 16}
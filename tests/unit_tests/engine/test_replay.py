@@ -0,0 +1,345 @@
+"""
+Tests for the offline strategy replay: the in-memory analytics state, the
+diff aggregation, and that sharded replays match in-process ones.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.engine.replay import (
+    ACTION,
+    AWARD,
+    DIRECT,
+    HISTORY,
+    CandidateStrategy,
+    ReplayAnalyticsState,
+    ReplayDiff,
+    ReplayEvent,
+    ReplayHorizonError,
+    run_replay,
+    shard_of,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _at(seconds):
+    return START + timedelta(seconds=seconds)
+
+
+def _event(kind, seconds, task="t-1", user="u-1", points=None, case=None, data=None):
+    return ReplayEvent(kind, _at(seconds), task, user, points, case, data)
+
+
+async def _stream(events):
+    for event in events:
+        yield event
+
+
+def _count_program():
+    """1 point ("Early") for a user's first two awards, 3 ("Regular") after."""
+
+    def rule(rule_id, op, points, case_name):
+        return {
+            "type": "rule",
+            "id": rule_id,
+            "when": {
+                "type": "compare",
+                "id": f"{rule_id}-c",
+                "op": op,
+                "left": {
+                    "type": "field",
+                    "id": f"{rule_id}-f",
+                    "path": "user.measurements_count",
+                },
+                "right": {"type": "literal", "id": f"{rule_id}-l", "value": 2},
+            },
+            "then": [
+                {
+                    "type": "assign_points",
+                    "id": f"{rule_id}-a",
+                    "value": {"type": "literal", "id": f"{rule_id}-p", "value": points},
+                    "case_name": case_name,
+                }
+            ],
+        }
+
+    return {
+        "type": "program",
+        "id": "p",
+        "rules": [rule("early", "<", 1, "Early"), rule("regular", ">=", 3, "Regular")],
+    }
+
+
+def _dsl_candidate(ast=None):
+    return CandidateStrategy(
+        strategy_id="custom:replay",
+        definition={
+            "id": "replay",
+            "name": "replay_test",
+            "type": "DSL_FULL",
+            "astJson": ast or _count_program(),
+            "version": 1,
+            "status": "PUBLISHED",
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_state_answers_like_the_points_queries():
+    state = ReplayAnalyticsState(horizon_seconds=600)
+    for seconds, user in ((0, "u-1"), (30, "u-2"), (60, "u-1"), (100, "u-1")):
+        state.record(_event(HISTORY, seconds, user=user))
+    state.now = _at(160)
+
+    snapshot = await state.get_scoring_snapshot("g", "t-1", "u-1")
+
+    assert snapshot.task_measurements_count == 4
+    assert snapshot.user_task_measurements_count == 3
+    assert snapshot.user_avg_time_between_tasks == 50
+    assert snapshot.all_avg_time_between_tasks == pytest.approx(100 / 3)
+    assert snapshot.last_window_time_diff == 40
+    assert snapshot.new_last_window_time_diff == 60
+    assert (
+        await state.get_user_task_measurements_count_the_last_seconds("t-1", "u-1", 100)
+        == 1
+    )
+    assert (
+        await state.user_has_record_before_in_externalTaskId_last_min("t-1", "u-2", 2)
+        is False
+    )
+
+
+@pytest.mark.asyncio
+async def test_state_returns_sentinels_without_history():
+    state = ReplayAnalyticsState()
+    state.now = START
+
+    snapshot = await state.get_scoring_snapshot("g", "t-1", "u-1")
+
+    assert snapshot.model_dump() == {
+        "task_measurements_count": 0,
+        "user_task_measurements_count": 0,
+        "user_avg_time_between_tasks": -1,
+        "all_avg_time_between_tasks": -1,
+        "last_window_time_diff": 0,
+        "new_last_window_time_diff": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_state_keeps_only_the_horizon_and_rejects_longer_windows():
+    state = ReplayAnalyticsState(horizon_seconds=60)
+    for seconds in (0, 50, 100, 130):
+        state.record(_event(HISTORY, seconds))
+    state.now = _at(140)
+
+    assert len(state._user("t-1", "u-1").recent) == 2
+    assert (
+        await state.get_user_task_measurements_count_the_last_seconds("t-1", "u-1", 60)
+        == 2
+    )
+    with pytest.raises(ReplayHorizonError):
+        await state.get_user_task_measurements_count_the_last_seconds("t-1", "u-1", 61)
+
+
+@pytest.mark.asyncio
+async def test_replay_scores_the_window_against_recorded_history():
+    events = [
+        _event(HISTORY, 0),
+        _event(AWARD, 10, points=1, case="Early"),
+        _event(AWARD, 20, points=1, case="Early", data={"callbackData": {"x": 1}}),
+        _event(DIRECT, 25, points=50, case="External_points_assigned"),
+        _event(AWARD, 30, points=1, case="Early"),
+        _event(ACTION, 35),
+        _event(AWARD, 40, user="u-2", points=1, case="Early"),
+    ]
+
+    diff = await run_replay(_dsl_candidate(), "g", _stream(events))
+
+    # u-1 had 1, 2 and then 4 awards (the direct one included) before the
+    # window events; the action is scored but does not add to the history.
+    assert (diff.events, diff.changed, diff.skipped) == (5, 3, 1)
+    assert diff.actual_points == 4
+    assert diff.candidate_points == 1 + 3 + 3 + 3 + 1
+    assert diff.cases == {
+        ("Early", "Early"): 2,
+        ("Early", "Regular"): 2,
+        (None, "Regular"): 1,
+    }
+    assert diff.tasks == {"t-1": [5, 4, 11]}
+    assert diff.users == {"u-1": [3, 10], "u-2": [1, 1]}
+    assert diff.errors == {}
+
+
+@pytest.mark.asyncio
+async def test_replay_counts_rejections_and_failures_as_errors():
+    reject = {
+        "type": "program",
+        "id": "p",
+        "rules": [
+            {
+                "type": "rule",
+                "id": "r",
+                "when": {"type": "literal", "id": "l", "value": True},
+                "then": [
+                    {
+                        "type": "assign_points",
+                        "id": "a",
+                        "value": {"type": "literal", "id": "v", "value": -1},
+                        "case_name": "Rejected",
+                    }
+                ],
+            }
+        ],
+    }
+
+    diff = await run_replay(
+        _dsl_candidate(reject),
+        "g",
+        _stream([_event(AWARD, 0, points=2, case="Early")]),
+    )
+
+    assert diff.errors == {"rejected": 1}
+    assert (diff.events, diff.candidate_points, diff.changed) == (1, 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_sharded_replay_matches_in_process_replay():
+    events = []
+    for index in range(60):
+        kind = HISTORY if index < 12 else AWARD
+        events.append(
+            _event(
+                kind,
+                index * 7,
+                task=f"t-{index % 5}",
+                user=f"u-{index % 4}",
+                points=1,
+                case="Early",
+            )
+        )
+
+    single = await run_replay(_dsl_candidate(), "g", _stream(events))
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        sharded = await run_replay(
+            _dsl_candidate(), "g", _stream(events), shards=3, executor=executor
+        )
+
+    assert len({shard_of(f"t-{index}", 3) for index in range(5)}) > 1
+    assert sharded.as_dict() == single.as_dict()
+    assert single.events == 48
+
+
+@pytest.mark.asyncio
+async def test_sharded_replay_holds_back_the_stream_for_slow_workers():
+    read = []
+
+    async def stream():
+        for index in range(40):
+            read.append(index)
+            yield _event(AWARD, index, task=f"t-{index % 2}", points=1, case="Early")
+
+    single = await run_replay(_dsl_candidate(), "g", stream())
+    read.clear()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sharded = await run_replay(
+            _dsl_candidate(),
+            "g",
+            stream(),
+            shards=2,
+            executor=executor,
+            chunk_events=3,
+            queued_chunks=1,
+        )
+
+    assert sharded.as_dict() == single.as_dict()
+    assert read == list(range(40))
+
+
+@pytest.mark.asyncio
+async def test_sharded_replay_stops_on_a_worker_error():
+    events = [
+        _event(AWARD, index, task=f"t-{index % 3}", points=1, case="Early")
+        for index in range(30)
+    ]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        with pytest.raises(ReplayHorizonError):
+            await run_replay(
+                CandidateStrategy("constantEffortStrategy"),
+                "g",
+                _stream(events),
+                shards=3,
+                horizon_seconds=1,
+                executor=executor,
+                chunk_events=2,
+                queued_chunks=1,
+            )
+
+
+@pytest.mark.asyncio
+async def test_replay_runs_builtin_candidates_on_the_state():
+    events = [
+        _event(AWARD, seconds, points=1, case="default") for seconds in (0, 40, 90, 100)
+    ]
+
+    diff = await run_replay(CandidateStrategy("default"), "g", _stream(events))
+    boosted = await run_replay(
+        CandidateStrategy("default", variables={"variable_basic_points": 10}),
+        "g",
+        _stream(events),
+    )
+
+    assert diff.events == 4
+    assert diff.errors == {}
+    assert boosted.candidate_points > diff.candidate_points
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "candidate",
+    [
+        CandidateStrategy("greencrowdStrategy"),
+        CandidateStrategy("missing"),
+        CandidateStrategy(
+            "custom:extend",
+            definition={
+                **_dsl_candidate().definition,
+                "type": "DSL_EXTEND",
+                "parentStrategyId": "greengageStrategy",
+            },
+        ),
+    ],
+)
+async def test_replay_rejects_strategies_it_cannot_model(candidate):
+    with pytest.raises(ValueError):
+        await run_replay(candidate, "g", _stream([_event(AWARD, 0, points=1)]))
+
+
+def test_diff_merge_adds_partial_diffs():
+    left = ReplayDiff()
+    left.add(_event(AWARD, 0, points=1, case="A"), 2, "B")
+    right = ReplayDiff()
+    right.add(_event(AWARD, 1, user="u-2", points=3, case="A"), 5, "A")
+    right.add_error(_event(AWARD, 2, points=1, case="A"), "rejected")
+    right.skipped = 1
+
+    merged = left.merge(right).as_dict(top_users=1)
+
+    assert merged["events"] == 3
+    assert merged["changedEvents"] == 3
+    assert merged["skippedDirectAssignments"] == 1
+    assert merged["pointsDelta"] == 2
+    assert merged["errors"] == {"rejected": 1}
+    assert merged["caseTransitions"] == [
+        {"actual": "A", "candidate": "A", "count": 1},
+        {"actual": "A", "candidate": "B", "count": 1},
+        {"actual": "A", "candidate": None, "count": 1},
+    ]
+    assert merged["tasks"] == {"t-1": {"events": 3, "actual": 5, "candidate": 7}}
+    assert merged["largestUserDeltas"] == [
+        {"externalUserId": "u-2", "actual": 3, "candidate": 5, "delta": 2}
+    ]
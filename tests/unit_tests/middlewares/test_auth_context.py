@@ -3,9 +3,18 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+import app.middlewares.auth_context as auth_context_module
 from app.middlewares.auth_context import AuditLogger, get_auth_context
 
 
+@pytest.fixture(autouse=True)
+def _reset_known_oauth_subs():
+    """Each test starts without remembered OAuth subjects."""
+    auth_context_module._reset_known_oauth_subs_for_tests()
+    yield
+    auth_context_module._reset_known_oauth_subs_for_tests()
+
+
 def _api_key_header(api_key="api-key-1"):
     return SimpleNamespace(data=SimpleNamespace(apiKey=api_key))
 
@@ -74,6 +83,67 @@ async def test_get_auth_context_skips_bootstrap_when_user_exists():
     mock_add_log.assert_not_called()
 
 
+async def _resolve_twice(service_oauth, sub="oauth-user-1"):
+    token_response = SimpleNamespace(error=None, data={"sub": sub})
+    with patch(
+        "app.middlewares.auth_context.valid_access_token",
+        new=AsyncMock(return_value=token_response),
+    ), patch("app.middlewares.auth_context.check_role", return_value=False), patch(
+        "app.middlewares.auth_context.add_log", new=AsyncMock()
+    ) as mock_add_log:
+        for _ in range(2):
+            await get_auth_context(
+                request=MagicMock(),
+                token="Bearer token",
+                api_key_header=_api_key_header("k-1"),
+                service_oauth=service_oauth,
+                service_log=MagicMock(),
+            )
+    return mock_add_log
+
+
+@pytest.mark.asyncio
+async def test_get_auth_context_looks_up_known_subject_once():
+    service_oauth = MagicMock()
+    service_oauth.get_user_by_sub = AsyncMock(
+        return_value=SimpleNamespace(id="existing")
+    )
+    service_oauth.add = AsyncMock()
+
+    await _resolve_twice(service_oauth)
+
+    service_oauth.get_user_by_sub.assert_awaited_once_with("oauth-user-1")
+    service_oauth.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_auth_context_bootstraps_subject_only_once():
+    service_oauth = MagicMock()
+    service_oauth.get_user_by_sub = AsyncMock(return_value=None)
+    service_oauth.add = AsyncMock()
+
+    mock_add_log = await _resolve_twice(service_oauth)
+
+    service_oauth.get_user_by_sub.assert_awaited_once()
+    service_oauth.add.assert_awaited_once()
+    mock_add_log.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_auth_context_does_not_remember_subjects_when_cache_off(
+    monkeypatch,
+):
+    monkeypatch.setattr(auth_context_module.configs, "JWT_CLAIMS_CACHE_MAX_ENTRIES", 0)
+    service_oauth = MagicMock()
+    service_oauth.get_user_by_sub = AsyncMock(
+        return_value=SimpleNamespace(id="existing")
+    )
+
+    await _resolve_twice(service_oauth)
+
+    assert service_oauth.get_user_by_sub.await_count == 2
+
+
 @pytest.mark.asyncio
 async def test_get_auth_context_api_key_only_skips_token_path():
     service_oauth = MagicMock()
@@ -1,3 +1,5 @@
+import asyncio
+import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
@@ -58,7 +60,14 @@ async def test_custom_oauth2_bearer_returns_false_on_http_exception(monkeypatch)
     assert result is False
 
 
-def _mock_jwks_client(monkeypatch, signing_key="public-key", side_effect=None):
+def _mock_jwks_client(
+    monkeypatch, signing_key="public-key", side_effect=None, kid="kid-1"
+):
+    monkeypatch.setattr(
+        access_token_middleware.jwt,
+        "get_unverified_header",
+        MagicMock(return_value={"kid": kid}),
+    )
     jwks_client = MagicMock()
     if side_effect is not None:
         jwks_client.get_signing_key_from_jwt.side_effect = side_effect
@@ -201,6 +210,167 @@ async def test_valid_access_token_returns_fail_response_for_generic_pyjwt_error(
     assert "Invalid token: generic jwt error" == result.error.detail
 
 
+def _future_exp(seconds=600):
+    return int(time.time()) + seconds
+
+
+@pytest.mark.asyncio
+async def test_valid_access_token_serves_repeat_token_from_claims_cache(monkeypatch):
+    jwks_client = _mock_jwks_client(monkeypatch)
+    claims = {"sub": "user-1", "exp": _future_exp()}
+    decode_mock = MagicMock(return_value=claims)
+    monkeypatch.setattr(access_token_middleware.jwt, "decode", decode_mock)
+
+    first = await access_token_middleware.valid_access_token("cached-token")
+    first.data["mutated"] = True
+    second = await access_token_middleware.valid_access_token("cached-token")
+
+    assert second.sucess is True
+    assert second.data == claims
+    decode_mock.assert_called_once()
+    jwks_client.get_signing_key_from_jwt.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_valid_access_token_reverifies_token_past_exp(monkeypatch):
+    _mock_jwks_client(monkeypatch)
+    decode_mock = MagicMock(return_value={"sub": "user-1", "exp": _future_exp(-1)})
+    monkeypatch.setattr(access_token_middleware.jwt, "decode", decode_mock)
+
+    await access_token_middleware.valid_access_token("stale-token")
+    await access_token_middleware.valid_access_token("stale-token")
+
+    assert decode_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_valid_access_token_does_not_cache_failures_or_missing_exp(
+    monkeypatch,
+):
+    _mock_jwks_client(monkeypatch)
+    decode_mock = MagicMock(
+        side_effect=[
+            exceptions.InvalidSignatureError("bad signature"),
+            {"sub": "user-1"},
+            {"sub": "user-1"},
+        ]
+    )
+    monkeypatch.setattr(access_token_middleware.jwt, "decode", decode_mock)
+
+    for _ in range(3):
+        await access_token_middleware.valid_access_token("token")
+
+    assert decode_mock.call_count == 3
+    assert len(access_token_middleware._VERIFIED_CLAIMS) == 0
+
+
+@pytest.mark.asyncio
+async def test_valid_access_token_claims_cache_is_bounded(monkeypatch):
+    _mock_jwks_client(monkeypatch)
+    monkeypatch.setattr(
+        access_token_middleware.configs, "JWT_CLAIMS_CACHE_MAX_ENTRIES", 2
+    )
+    decode_mock = MagicMock(return_value={"sub": "user-1", "exp": _future_exp()})
+    monkeypatch.setattr(access_token_middleware.jwt, "decode", decode_mock)
+
+    for token in ("token-a", "token-b", "token-a", "token-c", "token-a"):
+        await access_token_middleware.valid_access_token(token)
+
+    # token-a stayed most recently used, so token-b was the one evicted.
+    assert decode_mock.call_count == 3
+    assert len(access_token_middleware._VERIFIED_CLAIMS) == 2
+
+
+@pytest.mark.asyncio
+async def test_valid_access_token_claims_cache_disabled_with_zero(monkeypatch):
+    _mock_jwks_client(monkeypatch)
+    monkeypatch.setattr(
+        access_token_middleware.configs, "JWT_CLAIMS_CACHE_MAX_ENTRIES", 0
+    )
+    decode_mock = MagicMock(return_value={"sub": "user-1", "exp": _future_exp()})
+    monkeypatch.setattr(access_token_middleware.jwt, "decode", decode_mock)
+
+    await access_token_middleware.valid_access_token("token")
+    await access_token_middleware.valid_access_token("token")
+
+    assert decode_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_valid_access_token_reuses_signing_key_by_kid(monkeypatch):
+    jwks_client = _mock_jwks_client(monkeypatch)
+    monkeypatch.setattr(
+        access_token_middleware.configs, "JWT_CLAIMS_CACHE_MAX_ENTRIES", 0
+    )
+    decode_mock = MagicMock(return_value={"sub": "user-1"})
+    monkeypatch.setattr(access_token_middleware.jwt, "decode", decode_mock)
+
+    await access_token_middleware.valid_access_token("token-a")
+    await access_token_middleware.valid_access_token("token-b")
+
+    jwks_client.get_signing_key_from_jwt.assert_called_once_with("token-a")
+    assert decode_mock.call_args.kwargs["key"] == "public-key"
+
+
+@pytest.mark.asyncio
+async def test_refresh_signing_keys_replaces_the_key_set(monkeypatch):
+    jwks_client = _mock_jwks_client(monkeypatch, kid="new")
+    access_token_middleware._SIGNING_KEYS["old"] = SimpleNamespace(key="old-key")
+    jwks_client.get_signing_keys.return_value = [
+        SimpleNamespace(key_id="new", key="new-key"),
+        SimpleNamespace(key_id=None, key="unnamed-key"),
+    ]
+    decode_mock = MagicMock(return_value={"sub": "user-1"})
+    monkeypatch.setattr(access_token_middleware.jwt, "decode", decode_mock)
+
+    await access_token_middleware.refresh_signing_keys()
+    await access_token_middleware.valid_access_token("token")
+
+    jwks_client.get_signing_keys.assert_called_once_with(refresh=True)
+    assert set(access_token_middleware._SIGNING_KEYS) == {"new"}
+    jwks_client.get_signing_key_from_jwt.assert_not_called()
+    assert decode_mock.call_args.kwargs["key"] == "new-key"
+
+
+@pytest.mark.asyncio
+async def test_jwks_refresher_refreshes_in_use_keys_and_survives_errors(
+    monkeypatch,
+):
+    refresh_mock = AsyncMock(side_effect=[RuntimeError("jwks down"), None, None])
+    monkeypatch.setattr(access_token_middleware, "refresh_signing_keys", refresh_mock)
+    monkeypatch.setattr(
+        access_token_middleware.configs, "JWKS_REFRESH_INTERVAL_SECONDS", 1
+    )
+    real_sleep = asyncio.sleep
+    monkeypatch.setattr(
+        access_token_middleware.asyncio, "sleep", lambda _seconds: real_sleep(0)
+    )
+
+    access_token_middleware.start_jwks_refresh()
+    await real_sleep(0.01)
+    # Idle until a token has needed a key.
+    refresh_mock.assert_not_called()
+    access_token_middleware._SIGNING_KEYS["kid-1"] = SimpleNamespace(key="k")
+    for _ in range(10):
+        await real_sleep(0)
+    await access_token_middleware.stop_jwks_refresh()
+
+    assert refresh_mock.await_count >= 2
+    assert access_token_middleware._JWKS_REFRESH_TASK is None
+
+
+@pytest.mark.asyncio
+async def test_start_jwks_refresh_is_off_with_zero_interval(monkeypatch):
+    monkeypatch.setattr(
+        access_token_middleware.configs, "JWKS_REFRESH_INTERVAL_SECONDS", 0
+    )
+
+    access_token_middleware.start_jwks_refresh()
+
+    assert access_token_middleware._JWKS_REFRESH_TASK is None
+    await access_token_middleware.stop_jwks_refresh()
+
+
 class _FakeAsyncClient:
     """Replacement for ``httpx.AsyncClient`` used by refresh_access_token tests."""
 
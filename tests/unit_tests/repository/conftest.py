@@ -24,6 +24,8 @@ from sqlmodel import SQLModel
 import app.model.abuse_limit_counter  # noqa: F401
 import app.model.api_key  # noqa: F401
 import app.model.api_requests  # noqa: F401
+import app.model.dashboard_daily_rollup  # noqa: F401
+import app.model.game_leaderboard  # noqa: F401
 import app.model.game_params  # noqa: F401
 import app.model.games  # noqa: F401
 import app.model.kpi_metrics  # noqa: F401
@@ -36,6 +38,7 @@ import app.model.user_actions  # noqa: F401
 import app.model.user_game_config  # noqa: F401
 import app.model.user_interactions  # noqa: F401
 import app.model.user_points  # noqa: F401
+import app.model.user_task_stats  # noqa: F401
 import app.model.users  # noqa: F401
 import app.model.wallet  # noqa: F401
 import app.model.wallet_transactions  # noqa: F401
@@ -109,3 +109,42 @@ async def test_increment_distinct_scopes_keep_independent_counters(repository):
 
     assert a == 1
     assert b == 1
+
+
+@pytest.mark.asyncio
+async def test_increment_many_upserts_every_bucket_in_input_order(repository):
+    window = _window()
+    await repository.increment_and_get(
+        scope_type="api_key",
+        scope_value="k-5",
+        window_name="task_mutation_short_60s",
+        window_start=window,
+    )
+
+    values = await repository.increment_many(
+        [
+            ("api_key", "k-5", "task_mutation_short_60s", window, 1),
+            ("ip", "203.0.113.20", "task_mutation_short_60s", window, 1),
+            ("api_key", "k-5", "task_mutation_daily", window.replace(hour=0), 10),
+        ]
+    )
+
+    assert values == [2, 1, 10]
+
+
+@pytest.mark.asyncio
+async def test_increment_many_counts_repeated_buckets_and_naive_windows(repository):
+    """
+    A bucket listed twice is bumped by both amounts, and a naive
+    ``window_start`` lands on the same row as its UTC-aware twin.
+    """
+    key = ("external_user", "user_5", "task_mutation_short_60s")
+
+    values = await repository.increment_many(
+        [(*key, _window(), 1), (*key, datetime(2026, 2, 10, 12, 0, 0), 2)]
+    )
+    again = await repository.increment_and_get(*key, window_start=_window())
+
+    assert values == [3, 3]
+    assert again == 4
+    assert await repository.increment_many([]) == []
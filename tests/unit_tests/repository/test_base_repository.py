@@ -7,6 +7,7 @@ targeted the sync ``session.query()`` API which no longer exists.
 
 from contextlib import asynccontextmanager
 from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
@@ -16,7 +17,7 @@ from sqlalchemy import Column, Integer, String
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
-from app.core.exceptions import DuplicatedError, NotFoundError
+from app.core.exceptions import BadRequestError, DuplicatedError, NotFoundError
 from app.repository.base_repository import BaseRepository
 
 _Base = declarative_base()
@@ -53,6 +54,13 @@ class _OrderingSchema(PydBaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class _CursorSchema(_OrderingSchema):
+    """``_OrderingSchema`` plus the keyset/count options."""
+
+    cursor: Optional[str] = None
+    count: Optional[str] = None
+
+
 @pytest_asyncio.fixture
 async def base_repo_session_factory():
     engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
@@ -121,6 +129,23 @@ async def test_create_with_external_session_and_auto_commit_false_flushes_only(
         await base_repo.read_by_column("name", "external-tx")
 
 
+@pytest.mark.asyncio
+async def test_create_many_persists_all_entities_in_order(base_repo):
+    created = await base_repo.create_many(
+        [_Schema(name="many-1"), _Schema(name="many-2", value="v")]
+    )
+
+    assert [entity.name for entity in created] == ["many-1", "many-2"]
+    assert all(entity.id is not None for entity in created)
+    assert await base_repo.create_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_create_many_raises_duplicated_error_on_unique_violation(base_repo):
+    with pytest.raises(DuplicatedError):
+        await base_repo.create_many([_Schema(name="same"), _Schema(name="same")])
+
+
 @pytest.mark.asyncio
 async def test_read_by_id_returns_existing_entity(base_repo):
     created = await base_repo.create(_Schema(name="findme"))
@@ -256,3 +281,146 @@ async def test_read_by_options_returns_all_when_page_size_all(base_repo):
     assert len(result["items"]) == 3
     # Descending ordering by name
     assert [item.name for item in result["items"]] == ["all-2", "all-1", "all-0"]
+
+
+async def _walk_cursor_pages(base_repo, ordering, page_size=2):
+    """Follow ``next_cursor`` from the first page to the last."""
+    names, cursor, pages = [], "", 0
+    while cursor is not None:
+        result = await base_repo.read_by_options(
+            _CursorSchema(page_size=page_size, ordering=ordering, cursor=cursor)
+        )
+        names += [item.name for item in result["items"]]
+        cursor = result["search_options"]["next_cursor"]
+        pages += 1
+    return names, pages
+
+
+@pytest.mark.asyncio
+async def test_read_by_options_cursor_pages_through_every_row_once(base_repo):
+    # Duplicate and missing ``value``s exercise the id tiebreaker and nulls.
+    values = ["b", "a", None, "b", "c", None, "a"]
+    for i, value in enumerate(values):
+        await base_repo.create(_Schema(name=f"row-{i}", value=value))
+
+    ascending, pages = await _walk_cursor_pages(base_repo, "value")
+    descending, _ = await _walk_cursor_pages(base_repo, "-value")
+
+    assert ascending == [
+        "row-1",
+        "row-6",
+        "row-0",
+        "row-3",
+        "row-4",
+        "row-2",
+        "row-5",
+    ]
+    assert descending == list(reversed(ascending))
+    # Three full pages, then the short last one.
+    assert pages == 4
+
+
+@pytest.mark.asyncio
+async def test_read_by_options_offset_page_cursor_continues_with_next_page(
+    base_repo,
+):
+    for i in range(5):
+        await base_repo.create(_Schema(name=f"page-{i}"))
+
+    first = await base_repo.read_by_options(
+        _CursorSchema(page=1, page_size=2, ordering="name")
+    )
+    following = await base_repo.read_by_options(
+        _CursorSchema(
+            page_size=2,
+            ordering="name",
+            cursor=first["search_options"]["next_cursor"],
+        )
+    )
+
+    assert [item.name for item in following["items"]] == ["page-2", "page-3"]
+    assert following["search_options"]["total_count"] == 5
+    assert following["search_options"]["count"] == "exact"
+
+
+@pytest.mark.asyncio
+async def test_read_by_options_rejects_cursor_from_another_ordering(base_repo):
+    for i in range(3):
+        await base_repo.create(_Schema(name=f"c-{i}"))
+    first = await base_repo.read_by_options(
+        _CursorSchema(page_size=2, ordering="name", cursor="")
+    )
+
+    with pytest.raises(BadRequestError):
+        await base_repo.read_by_options(
+            _CursorSchema(
+                page_size=2,
+                ordering="-name",
+                cursor=first["search_options"]["next_cursor"],
+            )
+        )
+    with pytest.raises(BadRequestError):
+        await base_repo.read_by_options(
+            _CursorSchema(page_size=2, ordering="name", cursor="not-a-cursor")
+        )
+
+
+@pytest.mark.asyncio
+async def test_read_by_options_count_modes(base_repo):
+    for i in range(3):
+        await base_repo.create(_Schema(name=f"n-{i}"))
+
+    skipped = await base_repo.read_by_options(_CursorSchema(count="none"))
+    # No planner estimate on SQLite: the rows are counted.
+    estimated = await base_repo.read_by_options(_CursorSchema(count="estimate"))
+
+    assert skipped["search_options"]["total_count"] is None
+    assert len(skipped["items"]) == 3
+    assert estimated["search_options"]["total_count"] == 3
+    with pytest.raises(BadRequestError):
+        await base_repo.read_by_options(_CursorSchema(count="approximately"))
+
+
+def _explain_session(plan_rows: int):
+    from sqlalchemy.dialects import postgresql
+
+    session = MagicMock()
+    session.get_bind.return_value.dialect = postgresql.dialect()
+    result = MagicMock()
+    result.scalar_one.return_value = [{"Plan": {"Plan Rows": plan_rows}}]
+    connection = MagicMock()
+
+    async def exec_driver_sql(sql):
+        connection.sql = sql
+        return result
+
+    connection.exec_driver_sql = exec_driver_sql
+    session.connection = AsyncMock(return_value=connection)
+    return session, connection
+
+
+@pytest.mark.asyncio
+async def test_count_rows_estimate_reads_the_postgres_plan():
+    from sqlalchemy import select
+
+    session, connection = _explain_session(1234)
+    query = select(_BaseRepoModel).filter(_BaseRepoModel.name == "x")
+
+    total = await BaseRepository._count_rows(session, query, "estimate")
+
+    assert total == 1234
+    assert connection.sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "test_base_repo_model.name = 'x'" in connection.sql
+
+
+@pytest.mark.asyncio
+async def test_count_rows_estimate_keeps_colons_in_filter_values():
+    from sqlalchemy import select
+
+    session, connection = _explain_session(7)
+    query = select(_BaseRepoModel).filter(_BaseRepoModel.name == "a :b")
+
+    total = await BaseRepository._count_rows(session, query, "estimate")
+
+    assert total == 7
+    assert "test_base_repo_model.name = 'a :b'" in connection.sql
@@ -4,17 +4,28 @@ Tests for ``DashboardRepository``.
 The repository's aggregation queries rely on Postgres-specific functions
 (``date_trunc``, ``concat``, ``extract``, ``lpad``) that aiosqlite cannot
 execute, so the high-level orchestration is exercised by mocking the
-``_execute_query`` boundary. The dispatcher (`_get_group_by_column`) and the
+``_aggregate_raw`` / ``_aggregate_rollup`` / ``_rollup_coverage``
+boundaries and the SQL is checked by compiling it for Postgres. The
+dispatcher (`_get_group_by_column`), the rollup window arithmetic and the
 constructor wiring run on the real classes.
 """
 
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.core.exceptions import BadRequestError
-from app.repository.dashboard_repository import DashboardRepository
+from app.repository.dashboard_repository import (
+    DashboardRepository,
+    _floor_day,
+    _merge_buckets,
+)
+
+UTC = timezone.utc
 
 
 @pytest.fixture
@@ -23,6 +34,7 @@ def repository(session_factory):
 
 
 def test_constructor_wires_default_models(repository):
+    from app.model.dashboard_daily_rollup import DashboardDailyRollup
     from app.model.games import Games
     from app.model.logs import Logs
     from app.model.tasks import Tasks
@@ -36,6 +48,7 @@ def test_constructor_wires_default_models(repository):
     assert repository.model_logs is Logs
     assert repository.model_user_points is UserPoints
     assert repository.model_user_actions is UserActions
+    assert repository.model_rollup is DashboardDailyRollup
 
 
 def test_get_group_by_column_raises_bad_request_for_unknown_value(repository):
@@ -57,14 +70,23 @@ def test_get_group_by_column_returns_labeled_expressions(repository):
     assert month_expr.key == "month"
 
 
+def _raw(metric_counts):
+    """``_aggregate_raw`` result with one 2026-02-09 bucket per metric."""
+    return {
+        metric: [{"label": "2026-02-09", "count": count}]
+        for metric, count in metric_counts.items()
+    }
+
+
 @pytest.mark.asyncio
 async def test_get_dashboard_summary_returns_aggregated_metrics(repository):
-    repository._execute_query = AsyncMock(
+    repository._rollup_coverage = AsyncMock(return_value=None)
+    repository._aggregate_raw = AsyncMock(
         side_effect=[
-            [{"label": "2026-02-09", "count": 2}],
-            [{"label": "2026-02-09", "count": 1}],
-            [{"label": "2026-02-09", "count": 100}],
-            [{"label": "2026-02-09", "count": 5}],
+            _raw({"new_users": 2}),
+            _raw({"games_opened": 1}),
+            _raw({"points_earned": 100}),
+            _raw({"actions_performed": 5}),
         ]
     )
 
@@ -74,17 +96,31 @@ async def test_get_dashboard_summary_returns_aggregated_metrics(repository):
     assert result["games_opened"][0]["count"] == 1
     assert result["points_earned"][0]["count"] == 100
     assert result["actions_performed"][0]["count"] == 5
-    assert repository._execute_query.call_count == 4
+    assert repository._aggregate_raw.call_count == 4
+    repository._rollup_coverage.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_get_dashboard_summary_logs_returns_per_level_aggregates(repository):
-    repository._execute_query = AsyncMock(
-        side_effect=[
-            [{"label": "2026-02-09", "count": 12}],
-            [{"label": "2026-02-09", "count": 7}],
-            [{"label": "2026-02-09", "count": 1}],
-        ]
+async def test_get_dashboard_summary_rejects_unknown_group_by_before_querying(
+    repository,
+):
+    repository._rollup_coverage = AsyncMock(return_value=None)
+    repository._aggregate_raw = AsyncMock()
+
+    with pytest.raises(BadRequestError):
+        await repository.get_dashboard_summary(None, None, "year")
+
+    repository._rollup_coverage.assert_not_awaited()
+    repository._aggregate_raw.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_summary_logs_counts_every_level_in_one_pass(
+    repository,
+):
+    repository._rollup_coverage = AsyncMock(return_value=None)
+    repository._aggregate_raw = AsyncMock(
+        return_value=_raw({"logs_info": 12, "logs_success": 7, "logs_error": 1})
     )
 
     result = await repository.get_dashboard_summary_logs(
@@ -94,7 +130,248 @@ async def test_get_dashboard_summary_logs_returns_per_level_aggregates(repositor
     assert result["info"][0]["count"] == 12
     assert result["success"][0]["count"] == 7
     assert result["error"][0]["count"] == 1
-    assert repository._execute_query.call_count == 3
+    repository._aggregate_raw.assert_awaited_once()
+    aggregates = repository._aggregate_raw.await_args.args[2]
+    assert list(aggregates) == ["logs_info", "logs_success", "logs_error"]
+
+
+def test_log_aggregates_compile_to_conditional_counts(repository):
+    """The three levels are filtered counts over a single scan of ``logs``."""
+    compiled = str(
+        repository._log_aggregates()["logs_error"].compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    assert "count(CASE WHEN (logs.log_level = 'ERROR') THEN 1 END)" == compiled
+
+
+@pytest.mark.asyncio
+async def test_summarize_merges_raw_head_rollup_and_raw_tail(repository):
+    coverage = (datetime(2026, 2, 1, tzinfo=UTC), datetime(2026, 2, 28, tzinfo=UTC))
+    repository._aggregate_raw = AsyncMock(
+        side_effect=[
+            {"new_users": [{"label": "02", "count": 1}]},
+            {"new_users": [{"label": "03", "count": 4}]},
+        ]
+    )
+    repository._aggregate_rollup = AsyncMock(
+        return_value={"new_users": [{"label": "02", "count": 10}]}
+    )
+    start = datetime(2026, 2, 9, 12, tzinfo=UTC)
+    end = datetime(2026, 3, 2, tzinfo=UTC)
+
+    result = await repository._summarize(
+        repository.model_users,
+        "bucket",
+        {"new_users": "agg"},
+        start,
+        end,
+        "month",
+        coverage,
+    )
+
+    assert result == {
+        "new_users": [{"label": "02", "count": 11}, {"label": "03", "count": 4}]
+    }
+    head, tail = repository._aggregate_raw.await_args_list
+    assert head.args[3:5] == (start, None)
+    assert head.kwargs == {"before": datetime(2026, 2, 10, tzinfo=UTC)}
+    assert tail.args[3:5] == (datetime(2026, 3, 1, tzinfo=UTC), end)
+    repository._aggregate_rollup.assert_awaited_once_with(
+        ["new_users"],
+        datetime(2026, 2, 10, tzinfo=UTC),
+        datetime(2026, 3, 1, tzinfo=UTC),
+        "month",
+    )
+
+
+@pytest.mark.asyncio
+async def test_summarize_reads_raw_rows_only_without_rollup(repository):
+    repository._aggregate_raw = AsyncMock(return_value={"new_users": []})
+    repository._aggregate_rollup = AsyncMock()
+
+    await repository._summarize(
+        repository.model_users,
+        "bucket",
+        {"new_users": "agg"},
+        None,
+        None,
+        "day",
+        None,
+    )
+
+    repository._aggregate_raw.assert_awaited_once()
+    repository._aggregate_rollup.assert_not_awaited()
+
+
+def test_rollup_window_clips_to_whole_days_inside_coverage():
+    coverage = (datetime(2026, 2, 1, tzinfo=UTC), datetime(2026, 2, 28, tzinfo=UTC))
+    window = DashboardRepository._rollup_window
+
+    assert window(None, None, coverage) == (
+        datetime(2026, 2, 1, tzinfo=UTC),
+        datetime(2026, 3, 1, tzinfo=UTC),
+    )
+    # A start at midnight keeps its day; a later start skips to the next one.
+    # Naive datetimes are UTC.
+    assert window(datetime(2026, 2, 5), datetime(2026, 2, 10, 8), coverage) == (
+        datetime(2026, 2, 5, tzinfo=UTC),
+        datetime(2026, 2, 10, tzinfo=UTC),
+    )
+    assert window(datetime(2026, 2, 5, 1), None, coverage)[0] == datetime(
+        2026, 2, 6, tzinfo=UTC
+    )
+    # No whole rolled-up day in range, or no rollup at all.
+    assert window(datetime(2026, 2, 5, 1), datetime(2026, 2, 6, 3), coverage) is None
+    assert window(datetime(2026, 3, 5), None, coverage) is None
+    assert window(None, None, None) is None
+
+
+def test_merge_buckets_adds_shared_labels_in_first_seen_order():
+    merged = _merge_buckets(
+        [{"label": "b", "count": 1}],
+        [{"label": "a", "count": 2}, {"label": "b", "count": None}],
+        [{"label": "a", "count": 3}],
+    )
+
+    assert merged == [{"label": "b", "count": 1}, {"label": "a", "count": 5}]
+
+
+@pytest.mark.asyncio
+async def test_rollup_coverage_is_none_when_disabled(repository, monkeypatch):
+    from app.core import config as config_module
+
+    monkeypatch.setattr(config_module.configs, "DASHBOARD_ROLLUP_ENABLED", False)
+    repository._read_rollup_coverage = AsyncMock()
+
+    assert await repository._rollup_coverage() is None
+    repository._read_rollup_coverage.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rollup_coverage_is_none_until_backfilled(repository):
+    """The empty rollup table on the test database is never auto-filled."""
+    repository.refresh_daily_rollup = AsyncMock()
+
+    assert await repository._rollup_coverage() is None
+    repository.refresh_daily_rollup.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_rollup_coverage_refreshes_when_a_closed_day_is_missing(repository):
+    today = _floor_day(datetime.now(UTC))
+    stale = (today - timedelta(days=10), today - timedelta(days=3))
+    fresh = (stale[0], today - timedelta(days=1))
+    repository._read_rollup_coverage = AsyncMock(side_effect=[stale, fresh])
+    repository.refresh_daily_rollup = AsyncMock(return_value=14)
+
+    assert await repository._rollup_coverage() == fresh
+    repository.refresh_daily_rollup.assert_awaited_once_with()
+
+
+class _RollupSession:
+    """Fake session answering the refresh's per-table ``date_trunc`` reads
+    and recording the upserts it issues."""
+
+    def __init__(self, rows_by_table):
+        self.rows_by_table = rows_by_table
+        self.upserts = []
+        self.commit = AsyncMock()
+
+    async def execute(self, stmt):
+        if stmt.is_insert:
+            self.upserts.append(stmt)
+            return MagicMock()
+        table = stmt.get_final_froms()[0].name
+        result = MagicMock()
+        result.all.return_value = self.rows_by_table.get(table, [])
+        return result
+
+
+@pytest.mark.asyncio
+async def test_refresh_daily_rollup_writes_every_metric_for_every_closed_day():
+    today = _floor_day(datetime.now(UTC))
+    two_days_ago = today - timedelta(days=2)
+    users_row = SimpleNamespace(
+        day=two_days_ago.replace(tzinfo=None),
+        rowsCount=3,
+        _mapping={"new_users": 3},
+    )
+    session = _RollupSession({"users": [users_row]})
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    repository = DashboardRepository(session_factory=session_factory)
+
+    written = await repository.refresh_daily_rollup(since=two_days_ago)
+
+    # Two closed days x (four entity metrics + three log levels).
+    assert written == 14
+    session.commit.assert_awaited_once()
+    (upsert,) = session.upserts
+    compiled = upsert.compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT (metric, day) DO UPDATE" in str(compiled)
+    params = compiled.params
+    assert (params["metric_m0"], params["day_m0"]) == ("new_users", two_days_ago)
+    assert (params["rowsCount_m0"], params["value_m0"]) == (3, 3)
+    assert (params["metric_m1"], params["rowsCount_m1"]) == ("new_users", 0)
+
+
+@pytest.mark.asyncio
+async def test_refresh_daily_rollup_is_a_no_op_when_up_to_date(repository):
+    today = _floor_day(datetime.now(UTC))
+    repository._read_rollup_coverage = AsyncMock(
+        return_value=(today - timedelta(days=5), today - timedelta(days=1))
+    )
+
+    assert await repository.refresh_daily_rollup() == 0
+
+
+@pytest.mark.asyncio
+async def test_recompute_rollup_days_rewrites_only_covered_days():
+    today = _floor_day(datetime.now(UTC))
+    session = _RollupSession({})
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    repository = DashboardRepository(session_factory=session_factory)
+    repository._read_rollup_coverage = AsyncMock(
+        return_value=(today - timedelta(days=3), today - timedelta(days=2))
+    )
+
+    # Deleted rows spanning a day before the backfill up to today.
+    written = await repository.recompute_rollup_days(
+        today - timedelta(days=10, hours=-5), today + timedelta(hours=2)
+    )
+
+    # The two rolled-up days x seven metrics, now without the deleted rows.
+    assert written == 14
+    session.commit.assert_awaited_once()
+    params = session.upserts[0].compile(dialect=postgresql.dialect()).params
+    assert params["day_m0"] == today - timedelta(days=3)
+    assert (params["rowsCount_m0"], params["value_m0"]) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_recompute_rollup_days_is_a_no_op_without_rollup(repository):
+    repository._read_rollup_coverage = AsyncMock(return_value=None)
+    session = MagicMock()
+    session.flush = AsyncMock()
+
+    written = await repository.recompute_rollup_days(
+        datetime(2026, 1, 1, tzinfo=UTC),
+        datetime(2026, 1, 2, tzinfo=UTC),
+        session=session,
+        auto_commit=False,
+    )
+
+    assert written == 0
+    session.flush.assert_awaited_once()
 
 
 def test_process_query_applies_date_filters_and_group_by():
@@ -0,0 +1,274 @@
+"""
+Integration tests for ``GameLeaderboardRepository`` and the leaderboard
+backends reading it.
+
+Awards are seeded into ``user_points`` directly and replayed through
+:meth:`record_awards`; the stored boards must match what :meth:`rebuild`
+recomputes, and both backends must rank them identically.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.model.game_leaderboard import GameLeaderboard
+from app.model.games import Games
+from app.model.tasks import Tasks
+from app.model.user_points import UserPoints
+from app.model.users import Users
+from app.repository.game_leaderboard_repository import (
+    ALL_TIME_START,
+    GameLeaderboardRepository,
+    period_start,
+)
+from app.services.leaderboard_backend import (
+    DatabaseLeaderboardBackend,
+    RedisLeaderboardBackend,
+)
+
+# A Wednesday.
+START = datetime(2024, 1, 3, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def repository(session_factory):
+    return GameLeaderboardRepository(session_factory=session_factory)
+
+
+async def _seed_game(db_session, user_count):
+    game = Games(externalGameId="g-1", platform="web", strategyId="default")
+    users = [Users(externalUserId=f"u{index}") for index in range(user_count)]
+    db_session.add_all([game, *users])
+    await db_session.commit()
+    task = Tasks(externalTaskId="t-1", gameId=game.id, strategyId="default")
+    db_session.add(task)
+    await db_session.commit()
+    return game, task, users
+
+
+async def _seed_awards(db_session, task, awards):
+    """``awards`` is a list of ``(user, points, days_after_START)``."""
+    rows = [
+        UserPoints(
+            userId=user.id,
+            taskId=task.id,
+            points=points,
+            created_at=START + timedelta(days=days),
+        )
+        for user, points, days in awards
+    ]
+    db_session.add_all(rows)
+    await db_session.commit()
+    return rows
+
+
+async def _boards(db_session):
+    rows = (
+        await db_session.execute(
+            select(GameLeaderboard).execution_options(populate_existing=True)
+        )
+    ).scalars()
+    return {
+        (row.period, row.periodStart.replace(tzinfo=None), str(row.userId)): (
+            row.points,
+            row.awardsCount,
+        )
+        for row in rows
+    }
+
+
+def test_period_start_buckets_days_and_iso_weeks():
+    assert period_start("all", START) == ALL_TIME_START
+    assert period_start("day", START) == datetime(2024, 1, 3, tzinfo=timezone.utc)
+    assert period_start("week", START) == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert period_start("day", START.replace(tzinfo=None)) == period_start("day", START)
+    with pytest.raises(ValueError):
+        period_start("month", START)
+
+
+@pytest.mark.asyncio
+async def test_record_awards_matches_rebuild(repository, db_session):
+    game, task, users = await _seed_game(db_session, 3)
+    awards = await _seed_awards(
+        db_session,
+        task,
+        [
+            (users[0], 5, 0),
+            (users[1], 3, 0),
+            (users[0], 2, 1),
+            (users[2], 7, 6),
+        ],
+    )
+
+    await repository.record_awards(game.id, awards[2:])
+    await repository.record_awards(game.id, awards[:2])
+    incremental = await _boards(db_session)
+
+    assert await repository.rebuild(gameId=game.id) == len(incremental)
+    assert await _boards(db_session) == incremental
+    all_time = {
+        user: value
+        for (period, _, user), value in incremental.items()
+        if period == "all"
+    }
+    assert all_time[str(users[0].id)] == (7, 2)
+    # Day 6 is the following Tuesday: a new week window.
+    weeks = {start for (period, start, _) in incremental if period == "week"}
+    assert len(weeks) == 2
+
+
+@pytest.mark.asyncio
+async def test_record_awards_requires_session_without_auto_commit(repository):
+    with pytest.raises(ValueError):
+        await repository.record_awards(None, [], auto_commit=False)
+
+
+async def _seed_ranked_board(repository, db_session):
+    """Scores 40, 30, 30, 30, 20, 10 on the all-time board."""
+    game, task, users = await _seed_game(db_session, 6)
+    awards = await _seed_awards(
+        db_session,
+        task,
+        [(user, points, 0) for user, points in zip(users, [40, 30, 30, 30, 20, 10])],
+    )
+    await repository.record_awards(game.id, awards)
+    return game, users
+
+
+@pytest.mark.asyncio
+async def test_database_backend_ranks_ties_competitively(repository, db_session):
+    game, users = await _seed_ranked_board(repository, db_session)
+    backend = DatabaseLeaderboardBackend(repository)
+
+    top = await backend.top(game.id, "all", ALL_TIME_START, 5)
+
+    assert [entry["rank"] for entry in top] == [1, 2, 2, 2, 5]
+    assert [entry["points"] for entry in top] == [40, 30, 30, 30, 20]
+    assert top[0]["userId"] == str(users[0].id)
+
+
+@pytest.mark.asyncio
+async def test_database_backend_standing_includes_neighbours(repository, db_session):
+    game, users = await _seed_ranked_board(repository, db_session)
+    backend = DatabaseLeaderboardBackend(repository)
+    board = await backend.top(game.id, "all", ALL_TIME_START, 10)
+    middle = board[2]
+    user = next(user for user in users if str(user.id) == middle["userId"])
+
+    standing = await backend.standing(game.id, "all", ALL_TIME_START, user.id, 2)
+
+    assert standing["entry"] == middle
+    assert standing["above"] == board[0:2]
+    assert standing["below"] == board[3:5]
+    assert await backend.standing(game.id, "day", START, users[0].id, 1) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_matches_database_backend(repository, db_session):
+    fakeredis = pytest.importorskip("fakeredis")
+    game, users = await _seed_ranked_board(repository, db_session)
+    database = DatabaseLeaderboardBackend(repository)
+    redis = RedisLeaderboardBackend(
+        fakeredis.aioredis.FakeRedis(decode_responses=True), repository
+    )
+    await redis.load(
+        game.id,
+        "all",
+        ALL_TIME_START,
+        await repository.read_board(game.id, "all", ALL_TIME_START),
+    )
+
+    assert await redis.top(game.id, "all", ALL_TIME_START, 6) == await database.top(
+        game.id, "all", ALL_TIME_START, 6
+    )
+    for user in users:
+        assert await redis.standing(
+            game.id, "all", ALL_TIME_START, user.id, 2
+        ) == await database.standing(game.id, "all", ALL_TIME_START, user.id, 2)
+    # A board missing from Redis is read from the table.
+    assert await redis.top(game.id, "day", START, 3) == await database.top(
+        game.id, "day", START, 3
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_record_only_increments_boards_it_holds(
+    repository, db_session
+):
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    game, task, users = await _seed_game(db_session, 2)
+    awards = await _seed_awards(
+        db_session, task, [(users[0], 5, 0), (users[1], 9, 0), (users[0], 6, 0)]
+    )
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    redis = RedisLeaderboardBackend(client, repository, window_ttl_seconds=60)
+    day = period_start("day", START)
+    await redis.load(game.id, "day", day, [(users[1].id, 1)])
+
+    await redis.record(game.id, awards)
+
+    top = await redis.top(game.id, "day", day, 2)
+    assert [(entry["userId"], entry["points"]) for entry in top] == [
+        (str(users[0].id), 11),
+        (str(users[1].id), 10),
+    ]
+    # The all-time and week boards were never loaded: no partial board.
+    keys = await client.keys("game:lb:*")
+    assert keys == [redis._build_key(game.id, "day", day)]
+    assert await client.ttl(keys[0]) > 0
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_opens_the_next_window_ahead_of_time(
+    repository, db_session
+):
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    game, task, users = await _seed_game(db_session, 1)
+    # START is noon: past the middle of its day, not of its week.
+    awards = await _seed_awards(db_session, task, [(users[0], 5, 0)])
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    redis = RedisLeaderboardBackend(
+        client, repository, window_ttl_seconds=60, clock=START.timestamp
+    )
+    next_week = period_start("week", START) + timedelta(weeks=1)
+
+    await redis.record(game.id, awards)
+    assert await client.keys("game:lb:*") == [
+        redis._build_key(game.id, "week", next_week)
+    ]
+    assert await redis.top(game.id, "week", next_week, 3) == []
+
+    later = await _seed_awards(db_session, task, [(users[0], 4, 5)])
+    await redis.record(game.id, later)
+    standing = await redis.standing(game.id, "week", next_week, users[0].id, 2)
+    assert standing == {
+        "entry": {"userId": str(users[0].id), "points": 4, "rank": 1},
+        "above": [],
+        "below": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_discard_drops_the_award_boards(repository, db_session):
+    fakeredis = pytest.importorskip("fakeredis")
+    game, task, users = await _seed_game(db_session, 1)
+    awards = await _seed_awards(db_session, task, [(users[0], 5, 0)])
+    await repository.record_awards(game.id, awards)
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    redis = RedisLeaderboardBackend(client, repository)
+    yesterday = period_start("day", START) - timedelta(days=1)
+    for period in ("all", "day", "week"):
+        await redis.load(
+            game.id, period, period_start(period, START), [(users[0].id, 1)]
+        )
+    await redis.load(game.id, "day", yesterday, [(users[0].id, 1)])
+
+    await redis.discard(game.id, awards)
+
+    assert await client.keys("game:lb:*") == [
+        redis._build_key(game.id, "day", yesterday)
+    ]
+    assert (await redis.top(game.id, "all", ALL_TIME_START, 1))[0]["points"] == 5
@@ -6,7 +6,9 @@ chain. Each test seeds the database via the shared ``db_session`` fixture and
 then drives the repository's async API directly.
 """
 
-from uuid import UUID
+from datetime import datetime
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -14,6 +16,7 @@ from app.core.exceptions import DuplicatedError, NotFoundError
 from app.model.game_params import GamesParams
 from app.model.games import Games
 from app.model.tasks import Tasks
+from app.model.user_points import UserPoints
 from app.repository.game_repository import GameRepository
 from app.schema.games_schema import PatchGame, PostFindGame
 
@@ -120,6 +123,38 @@ async def test_delete_game_by_id_cascades_params_and_tasks(repository, db_sessio
         await repository.get_game_by_id(game.id)
 
 
+@pytest.mark.asyncio
+async def test_delete_game_by_id_recomputes_rollup_days_of_game_and_points(
+    repository, db_session
+):
+    game = await _seed_game(db_session, external_id="ext-rollup")
+    game.created_at = datetime(2026, 2, 10, 8, 0)
+    task = Tasks(externalTaskId="t-rollup", gameId=game.id, strategyId="default")
+    db_session.add(task)
+    await db_session.commit()
+    db_session.add(
+        UserPoints(
+            points=5,
+            userId=uuid4(),
+            taskId=task.id,
+            created_at=datetime(2026, 2, 20, 12, 0),
+        )
+    )
+    await db_session.commit()
+    repository.dashboard_repository.recompute_rollup_days = AsyncMock(return_value=0)
+
+    assert await repository.delete_game_by_id(game.id) is True
+
+    recompute = repository.dashboard_repository.recompute_rollup_days
+    recompute.assert_awaited_once()
+    start, stop = recompute.await_args.args
+    assert (start.replace(tzinfo=None), stop.replace(tzinfo=None)) == (
+        datetime(2026, 2, 10, 8, 0),
+        datetime(2026, 2, 20, 12, 0),
+    )
+    assert recompute.await_args.kwargs["auto_commit"] is False
+
+
 @pytest.mark.asyncio
 async def test_delete_game_by_id_raises_not_found_when_missing(repository):
     with pytest.raises(NotFoundError):
@@ -0,0 +1,32 @@
+"""
+Integration tests for ``LogsRepository.insert_many`` against aiosqlite.
+"""
+
+import pytest
+from sqlalchemy import select
+
+from app.model.logs import Logs
+from app.repository.logs_repository import LogsRepository
+from app.schema.logs_schema import CreateLogs
+
+
+@pytest.mark.asyncio
+async def test_insert_many_writes_every_entry(session_factory, db_session):
+    repository = LogsRepository(session_factory=session_factory)
+    entries = [
+        CreateLogs(
+            log_level="INFO",
+            message=f"event {index}",
+            module="games",
+            details={"index": index},
+        )
+        for index in range(3)
+    ]
+
+    assert await repository.insert_many(entries) == 3
+    assert await repository.insert_many([]) == 0
+
+    rows = (await db_session.execute(select(Logs))).scalars().all()
+    assert sorted(row.message for row in rows) == ["event 0", "event 1", "event 2"]
+    assert len({row.id for row in rows}) == 3
+    assert all(row.created_at is not None for row in rows)
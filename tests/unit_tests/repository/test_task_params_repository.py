@@ -0,0 +1,70 @@
+"""
+Integration tests for ``TaskParamsRepository``.
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from app.model.games import Games
+from app.model.task_params import TasksParams
+from app.model.tasks import Tasks
+from app.repository import task_params_repository as task_params_module
+from app.repository.task_params_repository import TaskParamsRepository
+
+
+@pytest.fixture
+def repository(session_factory):
+    return TaskParamsRepository(session_factory=session_factory)
+
+
+async def _seed_tasks(db_session, count):
+    game = Games(externalGameId="g-1", platform="web", strategyId="default")
+    db_session.add(game)
+    await db_session.commit()
+    await db_session.refresh(game)
+    tasks = [
+        Tasks(
+            externalTaskId=f"t-{index}",
+            gameId=game.id,
+            strategyId="default",
+            status="open",
+        )
+        for index in range(count)
+    ]
+    db_session.add_all(tasks)
+    await db_session.commit()
+    return [task.id for task in tasks]
+
+
+@pytest.mark.asyncio
+async def test_read_by_task_ids_groups_params_per_task(
+    repository, db_session, monkeypatch
+):
+    monkeypatch.setattr(task_params_module, "_TASK_IDS_PER_QUERY", 2)
+    first, second, third = await _seed_tasks(db_session, 3)
+    db_session.add_all(
+        [
+            TasksParams(taskId=first, key="development", value="10"),
+            TasksParams(taskId=first, key="management", value="30"),
+            TasksParams(taskId=third, key="development", value="5"),
+        ]
+    )
+    await db_session.commit()
+
+    result = await repository.read_by_taskIds([first, second, third, first])
+
+    assert set(result) == {first, third}
+    assert sorted(param.key for param in result[first]) == [
+        "development",
+        "management",
+    ]
+    assert [(param.key, param.value) for param in result[third]] == [
+        ("development", "5")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_by_task_ids_without_ids_skips_the_query(repository):
+    assert await repository.read_by_taskIds([]) == {}
+    assert await repository.read_by_taskIds([uuid4()]) == {}
@@ -2,6 +2,8 @@
 Integration tests for ``TaskRepository`` against aiosqlite.
 """
 
+from datetime import datetime
+from unittest.mock import AsyncMock
 from uuid import UUID, uuid4
 
 import pytest
@@ -106,6 +108,24 @@ async def test_read_by_game_id_and_external_task_id_returns_none_when_missing(
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_read_by_game_id_and_external_task_ids_returns_mapping(
+    repository, db_session
+):
+    game = await _seed_game(db_session, "g-batch")
+    other_game = await _seed_game(db_session, "g-batch-other")
+    await _seed_task(db_session, game.id, "t-b-1")
+    await _seed_task(db_session, game.id, "t-b-2")
+    await _seed_task(db_session, other_game.id, "t-b-3")
+
+    result = await repository.read_by_gameId_and_externalTaskIds(
+        game.id, ["t-b-1", "t-b-2", "t-b-3", "t-b-1"]
+    )
+
+    assert set(result) == {"t-b-1", "t-b-2"}
+    assert await repository.read_by_gameId_and_externalTaskIds(game.id, []) == {}
+
+
 @pytest.mark.asyncio
 async def test_get_points_and_users_by_task_id_returns_task(repository, db_session):
     game = await _seed_game(db_session, "game-pt")
@@ -206,6 +226,44 @@ async def test_delete_task_by_id_cascades_params_and_points(repository, db_sessi
     assert len(sibling_params) == 1
 
 
+@pytest.mark.asyncio
+async def test_delete_task_by_id_recomputes_rollup_days_of_removed_points(
+    repository, db_session
+):
+    game = await _seed_game(db_session, "game-rollup")
+    task = await _seed_task(db_session, game.id, "t-rollup")
+    first = await _seed_user_points(db_session, task.id, points=3)
+    first.created_at = datetime(2026, 3, 1, 9, 0)
+    last = await _seed_user_points(db_session, task.id, points=4)
+    last.created_at = datetime(2026, 3, 4, 18, 0)
+    await db_session.commit()
+    repository.dashboard_repository.recompute_rollup_days = AsyncMock(return_value=0)
+
+    assert await repository.delete_task_by_id(task.id) is True
+
+    recompute = repository.dashboard_repository.recompute_rollup_days
+    recompute.assert_awaited_once()
+    start, stop = recompute.await_args.args
+    assert (start.replace(tzinfo=None), stop.replace(tzinfo=None)) == (
+        datetime(2026, 3, 1, 9, 0),
+        datetime(2026, 3, 4, 18, 0),
+    )
+    assert recompute.await_args.kwargs["auto_commit"] is False
+
+
+@pytest.mark.asyncio
+async def test_delete_task_by_id_without_points_leaves_rollup_alone(
+    repository, db_session
+):
+    game = await _seed_game(db_session, "game-no-points")
+    task = await _seed_task(db_session, game.id, "t-no-points")
+    repository.dashboard_repository.recompute_rollup_days = AsyncMock()
+
+    assert await repository.delete_task_by_id(task.id) is True
+
+    repository.dashboard_repository.recompute_rollup_days.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_delete_task_by_id_raises_not_found_when_missing(repository):
     missing = UUID("00000000-0000-0000-0000-000000000000")
@@ -44,3 +44,44 @@ async def test_add_action_in_task_persists_action(repository, db_session):
     assert result.data == {"steps": 10}
     assert result.description == "user sent measurement"
     assert str(result.userId) == str(user.id)
+
+
+@pytest.mark.asyncio
+async def test_stream_game_actions_matches_game_tagged_actions(repository, db_session):
+    from datetime import datetime, timedelta, timezone
+
+    user = Users(externalUserId="ext-ua-stream")
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for offset, data in (
+        (20, {"externalGameId": "g-ua", "externalTaskId": "t-2"}),
+        (0, {"externalGameId": "g-ua", "externalTaskId": "t-1"}),
+        (10, {"externalGameId": "g-ua"}),
+        (5, {"externalGameId": "g-other", "externalTaskId": "t-1"}),
+        (15, None),
+    ):
+        db_session.add(
+            UserActions(
+                typeAction="measurement",
+                data=data,
+                userId=user.id,
+                created_at=start + timedelta(seconds=offset),
+            )
+        )
+    await db_session.commit()
+
+    rows = [row async for row in repository.stream_game_actions("g-ua")]
+    later = [
+        row
+        async for row in repository.stream_game_actions(
+            "g-ua", since=start + timedelta(seconds=1)
+        )
+    ]
+
+    assert [(row.externalTaskId, row.externalUserId) for row in rows] == [
+        ("t-1", "ext-ua-stream"),
+        ("t-2", "ext-ua-stream"),
+    ]
+    assert [row.externalTaskId for row in later] == ["t-2"]
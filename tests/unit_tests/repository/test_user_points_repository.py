@@ -7,11 +7,14 @@ The repository contains a wide range of read paths. Postgres-only methods
 module covers the rest end-to-end against an in-memory aiosqlite engine.
 """
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 from app.model.games import Games
 from app.model.tasks import Tasks
 from app.model.user_points import UserPoints
+from app.model.user_task_stats import UserTaskStats
 from app.model.users import Users
 from app.repository.user_points_repository import UserPointsRepository
 
@@ -68,6 +71,7 @@ async def _seed_points(
 def test_repository_exposes_helper_repositories(repository):
     assert repository.task_repository.model is Tasks
     assert repository.user_repository.model is Users
+    assert repository.task_stats_repository.model is UserTaskStats
 
 
 @pytest.mark.asyncio
@@ -95,6 +99,44 @@ async def test_get_first_user_points_returns_none_when_missing(repository):
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_get_first_actions_by_task_ids_groups_per_task_and_user(
+    repository, db_session
+):
+    alice = await _seed_user(db_session, "ext-fa-alice")
+    bob = await _seed_user(db_session, "ext-fa-bob")
+    game = await _seed_game(db_session, "g-fa")
+    task_a = await _seed_task(db_session, game.id, "task-fa-a")
+    task_b = await _seed_task(db_session, game.id, "task-fa-b")
+    first = await _seed_points(db_session, alice.id, task_a.id, points=1)
+    await _seed_points(db_session, alice.id, task_a.id, points=2)
+    await _seed_points(db_session, bob.id, task_a.id, points=3)
+    await _seed_points(db_session, alice.id, task_b.id, points=4)
+
+    rows = await repository.get_first_actions_by_taskIds([task_a.id, task_b.id])
+
+    pairs = sorted((str(row.taskId), row.externalUserId) for row in rows)
+    assert pairs == sorted(
+        [
+            (str(task_a.id), "ext-fa-alice"),
+            (str(task_a.id), "ext-fa-bob"),
+            (str(task_b.id), "ext-fa-alice"),
+        ]
+    )
+    alice_on_a = next(
+        row
+        for row in rows
+        if row.taskId == task_a.id and row.externalUserId == "ext-fa-alice"
+    )
+    assert alice_on_a.firstAction == first.created_at.replace(tzinfo=None)
+    assert alice_on_a.userCreatedAt is not None
+
+
+@pytest.mark.asyncio
+async def test_get_first_actions_by_task_ids_short_circuits_on_empty(repository):
+    assert await repository.get_first_actions_by_taskIds([]) == []
+
+
 @pytest.mark.asyncio
 async def test_read_by_user_task_and_idempotency_returns_match(repository, db_session):
     user = await _seed_user(db_session, "ext-idem")
@@ -381,3 +423,337 @@ async def test_get_all_point_of_tasks_list_with_data_returns_full_objects(
 
     assert len(results) == 1
     assert results[0].data == {"meta": "abc"}
+
+
+@pytest.mark.asyncio
+async def test_read_by_idempotency_keys_matches_exact_triples(repository, db_session):
+    user = await _seed_user(db_session, "ext-idem-batch")
+    other = await _seed_user(db_session, "ext-idem-batch-2")
+    game = await _seed_game(db_session, "g-idem-batch")
+    task = await _seed_task(db_session, game.id, "task-idem-batch")
+    await _seed_points(db_session, user.id, task.id, points=1, idempotency_key="k1")
+    await _seed_points(db_session, other.id, task.id, points=1, idempotency_key="k2")
+
+    found = await repository.read_by_idempotency_keys(
+        [
+            (user.id, task.id, "k1"),
+            (user.id, task.id, "k2"),
+            (other.id, task.id, None),
+        ]
+    )
+
+    assert list(found) == [(str(user.id), str(task.id), "k1")]
+
+
+async def _seed_timed_points(db_session, user_id, task_id, created_at, data=None):
+    point = UserPoints(
+        userId=user_id,
+        taskId=task_id,
+        points=1,
+        data=data,
+        created_at=created_at,
+    )
+    db_session.add(point)
+    await db_session.commit()
+    return point
+
+
+@pytest.mark.asyncio
+async def test_get_scoring_snapshot_matches_individual_queries(repository, db_session):
+    user = await _seed_user(db_session, "ext-snap")
+    other = await _seed_user(db_session, "ext-snap-2")
+    game = await _seed_game(db_session, "g-snap")
+    other_game = await _seed_game(db_session, "g-snap-other")
+    task = await _seed_task(db_session, game.id, "task-snap")
+    same_ext_task = await _seed_task(db_session, other_game.id, "task-snap")
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for offset in (0, 30, 90, 100):
+        await _seed_timed_points(
+            db_session, user.id, task.id, start + timedelta(seconds=offset)
+        )
+    await _seed_timed_points(
+        db_session, other.id, task.id, start + timedelta(seconds=400)
+    )
+    # Same externalTaskId in another game: counted by the task-wide aggregates
+    # only, exactly like the individual queries.
+    await _seed_timed_points(
+        db_session, user.id, same_ext_task.id, start + timedelta(seconds=130)
+    )
+
+    snapshot = await repository.get_scoring_snapshot("g-snap", "task-snap", "ext-snap")
+
+    assert snapshot.task_measurements_count == (
+        await repository.count_measurements_by_external_task_id("task-snap")
+    )
+    assert snapshot.user_task_measurements_count == (
+        await repository.get_user_task_measurements_count("task-snap", "ext-snap")
+    )
+    assert snapshot.user_avg_time_between_tasks == pytest.approx(
+        await repository.get_avg_time_between_tasks_by_user_and_game_task(
+            "g-snap", "task-snap", "ext-snap"
+        )
+    )
+    assert snapshot.all_avg_time_between_tasks == pytest.approx(
+        await repository.get_avg_time_between_tasks_for_all_users("g-snap", "task-snap")
+    )
+    assert snapshot.last_window_time_diff == (
+        await repository.get_last_window_time_diff("task-snap", "ext-snap")
+    )
+    assert snapshot.new_last_window_time_diff == pytest.approx(
+        await repository.get_new_last_window_time_diff(
+            "task-snap", "ext-snap", "g-snap"
+        ),
+        abs=5,
+    )
+    assert (snapshot.task_measurements_count, snapshot.last_window_time_diff) == (
+        6,
+        30,
+    )
+    assert snapshot.user_avg_time_between_tasks == pytest.approx(100 / 3)
+
+
+@pytest.mark.asyncio
+async def test_get_scoring_snapshot_returns_sentinels_without_history(repository):
+    snapshot = await repository.get_scoring_snapshot("g-none", "task-none", "ext")
+
+    assert snapshot.task_measurements_count == 0
+    assert snapshot.user_task_measurements_count == 0
+    assert snapshot.user_avg_time_between_tasks == -1
+    assert snapshot.all_avg_time_between_tasks == -1
+    assert snapshot.last_window_time_diff == 0
+    assert snapshot.new_last_window_time_diff == 0
+
+
+@pytest.mark.asyncio
+async def test_get_effort_snapshot_matches_individual_queries(repository, db_session):
+    user = await _seed_user(db_session, "ext-effort")
+    other = await _seed_user(db_session, "ext-effort-2")
+    game = await _seed_game(db_session, "g-effort")
+    task = await _seed_task(db_session, game.id, "task-effort")
+    now = datetime.now(timezone.utc)
+    await _seed_timed_points(
+        db_session, user.id, task.id, now - timedelta(hours=2), {"minutes": 10}
+    )
+    await _seed_timed_points(db_session, user.id, task.id, now, {"minutes": 0})
+    await _seed_timed_points(db_session, other.id, task.id, now, {"minutes": 40})
+
+    snapshot = await repository.get_effort_snapshot(
+        "g-effort", "task-effort", "ext-effort", 60
+    )
+
+    assert snapshot.has_recent_record is (
+        await repository.user_has_record_before_in_externalTaskId_last_min(
+            "task-effort", "ext-effort", 60
+        )
+    )
+    assert snapshot.personal_records_count == (
+        await repository.count_personal_records_by_external_game_id(
+            "g-effort", "ext-effort"
+        )
+    )
+    assert snapshot.global_avg_minutes == (
+        await repository.get_global_avg_by_external_game_id("g-effort")
+    )
+    assert snapshot.personal_avg_minutes == (
+        await repository.get_personal_avg_by_external_game_id("g-effort", "ext-effort")
+    )
+    assert (snapshot.personal_records_count, snapshot.global_avg_minutes) == (2, 25)
+
+
+@pytest.mark.asyncio
+async def test_get_avg_time_between_tasks_equals_mean_of_consecutive_gaps(
+    repository, db_session
+):
+    user = await _seed_user(db_session, "ext-gap")
+    other = await _seed_user(db_session, "ext-gap-2")
+    game = await _seed_game(db_session, "g-gap")
+    task = await _seed_task(db_session, game.id, "task-gap")
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    user_offsets = [0, 10, 70, 75]
+    for offset in user_offsets:
+        await _seed_timed_points(
+            db_session, user.id, task.id, start + timedelta(seconds=offset)
+        )
+    await _seed_timed_points(
+        db_session, other.id, task.id, start + timedelta(seconds=35)
+    )
+
+    per_user = await repository.get_avg_time_between_tasks_by_user_and_game_task(
+        "g-gap", "task-gap", "ext-gap"
+    )
+    all_users = await repository.get_avg_time_between_tasks_for_all_users(
+        "g-gap", "task-gap"
+    )
+
+    gaps = [b - a for a, b in zip(user_offsets, user_offsets[1:])]
+    assert per_user == pytest.approx(sum(gaps) / len(gaps))
+    assert all_users == pytest.approx(75 / 4)
+
+
+@pytest.mark.asyncio
+async def test_task_stats_reads_match_user_points_reads(
+    repository, db_session, monkeypatch
+):
+    user = await _seed_user(db_session, "ext-stats")
+    other = await _seed_user(db_session, "ext-stats-2")
+    game = await _seed_game(db_session, "g-stats")
+    other_game = await _seed_game(db_session, "g-stats-other")
+    task = await _seed_task(db_session, game.id, "task-stats")
+    second_task = await _seed_task(db_session, game.id, "task-stats-2")
+    same_ext_task = await _seed_task(db_session, other_game.id, "task-stats")
+    now = datetime.now(timezone.utc)
+    for offset, minutes in ((-7200, 10), (-600, 0), (-90, 20), (-30, None)):
+        await _seed_timed_points(
+            db_session,
+            user.id,
+            task.id,
+            now + timedelta(seconds=offset),
+            {"minutes": minutes} if minutes is not None else None,
+        )
+    await _seed_timed_points(
+        db_session, other.id, task.id, now - timedelta(seconds=300), {"minutes": 40}
+    )
+    await _seed_timed_points(
+        db_session, user.id, second_task.id, now - timedelta(seconds=50)
+    )
+    # Latest award of the user on "task-stats" lives in another game, so the
+    # last-window diff has to combine two rollup rows.
+    await _seed_timed_points(
+        db_session, user.id, same_ext_task.id, now - timedelta(seconds=10)
+    )
+    await repository.task_stats_repository.rebuild()
+
+    async def read_all():
+        return {
+            "task_count": await repository.count_measurements_by_external_task_id(
+                "task-stats"
+            ),
+            "user_count": await repository.get_user_task_measurements_count(
+                "task-stats", "ext-stats"
+            ),
+            "user_avg": await repository.get_avg_time_between_tasks_by_user_and_game_task(  # noqa
+                "g-stats", "task-stats", "ext-stats"
+            ),
+            "all_avg": await repository.get_avg_time_between_tasks_for_all_users(
+                "g-stats", "task-stats"
+            ),
+            "last_window": await repository.get_last_window_time_diff(
+                "task-stats", "ext-stats"
+            ),
+            "new_last_window": await repository.get_new_last_window_time_diff(
+                "task-stats", "ext-stats", "g-stats"
+            ),
+            "personal_count": await repository.count_personal_records_by_external_game_id(  # noqa
+                "g-stats", "ext-stats"
+            ),
+            "recent": await repository.user_has_record_before_in_externalTaskId_last_min(  # noqa
+                "task-stats", "ext-stats", 5
+            ),
+            "global_minutes": await repository.get_global_avg_by_external_game_id(
+                "g-stats"
+            ),
+            "personal_minutes": await repository.get_personal_avg_by_external_game_id(
+                "g-stats", "ext-stats"
+            ),
+            "scoring": (
+                await repository.get_scoring_snapshot(
+                    "g-stats", "task-stats", "ext-stats"
+                )
+            ).model_dump(),
+            "effort": (
+                await repository.get_effort_snapshot(
+                    "g-stats", "task-stats", "ext-stats", 5
+                )
+            ).model_dump(),
+        }
+
+    from_points = await read_all()
+    monkeypatch.setattr(
+        "app.repository.user_points_repository.configs.USER_TASK_STATS_READS_ENABLED",
+        True,
+    )
+    from_stats = await read_all()
+
+    # Seconds since the last award move with the clock between the two reads.
+    assert from_stats.pop("new_last_window") == pytest.approx(
+        from_points.pop("new_last_window"), abs=5
+    )
+    assert from_stats["scoring"].pop("new_last_window_time_diff") == pytest.approx(
+        from_points["scoring"].pop("new_last_window_time_diff"), abs=5
+    )
+    for snapshot in ("scoring", "effort"):
+        assert from_stats.pop(snapshot) == pytest.approx(from_points.pop(snapshot))
+    assert from_stats == pytest.approx(from_points)
+    assert (from_stats["user_count"], from_stats["last_window"]) == (5, 20)
+
+
+@pytest.mark.asyncio
+async def test_stream_game_points_is_chronological_and_bounded(repository, db_session):
+    user = await _seed_user(db_session, "ext-stream")
+    game = await _seed_game(db_session, "g-stream")
+    other_game = await _seed_game(db_session, "g-stream-other")
+    task = await _seed_task(db_session, game.id, "task-stream")
+    other_task = await _seed_task(db_session, other_game.id, "task-stream")
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for offset in (20, 0, 10, 30):
+        await _seed_timed_points(
+            db_session,
+            user.id,
+            task.id,
+            start + timedelta(seconds=offset),
+            {"offset": offset},
+        )
+    await _seed_timed_points(db_session, user.id, other_task.id, start)
+
+    rows = [row async for row in repository.stream_game_points(game.id)]
+    window = [
+        row
+        async for row in repository.stream_game_points(
+            game.id,
+            since=start + timedelta(seconds=10),
+            until=start + timedelta(seconds=30),
+        )
+    ]
+    light = [
+        row async for row in repository.stream_game_points(game.id, with_payload=False)
+    ]
+
+    assert [row.data["offset"] for row in rows] == [0, 10, 20, 30]
+    assert {(row.externalTaskId, row.externalUserId) for row in rows} == {
+        ("task-stream", "ext-stream")
+    }
+    assert [row.data["offset"] for row in window] == [10, 20]
+    assert len(light) == 4
+    assert len(light[0]) == 3
+
+
+@pytest.mark.asyncio
+async def test_replay_state_matches_repository_reads(repository, db_session):
+    from app.engine.replay import HISTORY, ReplayAnalyticsState, ReplayEvent
+
+    alice = await _seed_user(db_session, "ext-replay")
+    bob = await _seed_user(db_session, "ext-replay-2")
+    game = await _seed_game(db_session, "g-replay")
+    task = await _seed_task(db_session, game.id, "task-replay")
+    start = datetime.now(timezone.utc) - timedelta(minutes=20)
+    for user, offset in ((alice, 0), (bob, 45), (alice, 60), (alice, 600)):
+        await _seed_timed_points(
+            db_session, user.id, task.id, start + timedelta(seconds=offset)
+        )
+
+    state = ReplayAnalyticsState(horizon_seconds=3600)
+    async for row in repository.stream_game_points(game.id, with_payload=False):
+        state.record(ReplayEvent(HISTORY, *row))
+    state.now = datetime.now(timezone.utc)
+
+    for user in ("ext-replay", "ext-replay-2", "ext-absent"):
+        expected = await repository.get_scoring_snapshot(
+            "g-replay", "task-replay", user
+        )
+        replayed = await state.get_scoring_snapshot("g-replay", "task-replay", user)
+        assert replayed.model_dump(
+            exclude={"new_last_window_time_diff"}
+        ) == pytest.approx(expected.model_dump(exclude={"new_last_window_time_diff"}))
+        assert replayed.new_last_window_time_diff == pytest.approx(
+            expected.new_last_window_time_diff, abs=5
+        )
@@ -127,3 +127,24 @@ async def test_get_or_create_with_external_session_flushes_only(
     # A new transaction must not see the rolled-back row.
     with pytest.raises(NotFoundError):
         await repository.read_by_column("externalUserId", "flush-only")
+
+
+@pytest.mark.asyncio
+async def test_read_by_external_user_ids_returns_only_existing(repository):
+    await repository.create_user_by_externalUserId("batch-read-1")
+
+    found = await repository.read_by_externalUserIds(["batch-read-1", "absent"])
+
+    assert list(found) == ["batch-read-1"]
+
+
+@pytest.mark.asyncio
+async def test_create_users_by_external_user_ids_skips_existing_rows(repository):
+    existing = await repository.create_user_by_externalUserId("batch-new-1")
+
+    created = await repository.create_users_by_externalUserIds(
+        ["batch-new-1", "batch-new-2", "batch-new-2"]
+    )
+
+    assert set(created) == {"batch-new-1", "batch-new-2"}
+    assert str(created["batch-new-1"].id) == str(existing.id)
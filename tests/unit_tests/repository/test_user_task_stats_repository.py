@@ -0,0 +1,158 @@
+"""
+Integration tests for ``UserTaskStatsRepository``.
+
+Awards are seeded into ``user_points`` directly and replayed through
+:meth:`record_awards` in different batchings; the stored rollups must always
+match what :meth:`rebuild` recomputes from ``user_points``.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, update
+
+from app.model.games import Games
+from app.model.tasks import Tasks
+from app.model.user_points import UserPoints
+from app.model.user_task_stats import UserTaskStats
+from app.model.users import Users
+from app.repository.user_task_stats_repository import (
+    UserTaskStatsRepository,
+    positive_minutes,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def repository(session_factory):
+    return UserTaskStatsRepository(session_factory=session_factory)
+
+
+async def _seed_task_and_user(db_session, external_game_id="g-1", external_user_id="u"):
+    game = Games(externalGameId=external_game_id, platform="web", strategyId="default")
+    user = Users(externalUserId=external_user_id)
+    db_session.add_all([game, user])
+    await db_session.commit()
+    task = Tasks(externalTaskId="t-1", gameId=game.id, strategyId="default")
+    db_session.add(task)
+    await db_session.commit()
+    return game, task, user
+
+
+async def _seed_awards(db_session, task, user, offsets, minutes=None):
+    awards = [
+        UserPoints(
+            userId=user.id,
+            taskId=task.id,
+            points=index + 1,
+            data={"minutes": minutes[index]} if minutes else None,
+            created_at=START + timedelta(seconds=offset),
+        )
+        for index, offset in enumerate(offsets)
+    ]
+    db_session.add_all(awards)
+    await db_session.commit()
+    return awards
+
+
+async def _stored(db_session, task, user):
+    return (
+        await db_session.execute(
+            select(UserTaskStats)
+            .filter(UserTaskStats.taskId == task.id)
+            .filter(UserTaskStats.userId == user.id)
+            .execution_options(populate_existing=True)
+        )
+    ).scalar_one()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(12, 12.0), ("2.5", 2.5), (0, None), (-3, None), (True, None), ("x", None)],
+)
+def test_positive_minutes(value, expected):
+    assert positive_minutes({"minutes": value}) == expected
+    assert positive_minutes(None) is None
+
+
+@pytest.mark.asyncio
+async def test_record_awards_merges_out_of_order_batches(repository, db_session):
+    _, task, user = await _seed_task_and_user(db_session)
+    awards = await _seed_awards(
+        db_session, task, user, [50, 10, 90, 30, 70], minutes=[5, 0, 15, None, 10]
+    )
+
+    # Latest award first, then an older batch, then one in between.
+    await repository.record_awards([awards[2]])
+    await repository.record_awards([awards[0], awards[1]])
+    await repository.record_awards(awards[3:])
+
+    stats = await _stored(db_session, task, user)
+    assert stats.awardsCount == 5
+    assert stats.pointsSum == 15
+    assert stats.firstAt.replace(tzinfo=timezone.utc) == START + timedelta(seconds=10)
+    assert stats.lastAt.replace(tzinfo=timezone.utc) == START + timedelta(seconds=90)
+    assert stats.previousAt.replace(tzinfo=timezone.utc) == START + timedelta(
+        seconds=70
+    )
+    assert (stats.minutesSum, stats.minutesCount) == (30, 3)
+    assert await repository.find_inconsistencies() == []
+
+
+@pytest.mark.asyncio
+async def test_record_awards_requires_session_without_auto_commit(repository):
+    with pytest.raises(ValueError):
+        await repository.record_awards([], auto_commit=False)
+
+
+@pytest.mark.asyncio
+async def test_rebuild_recomputes_rollups_for_one_game(repository, db_session):
+    game, task, user = await _seed_task_and_user(db_session)
+    other_game, other_task, other_user = await _seed_task_and_user(
+        db_session, "g-2", "u-2"
+    )
+    await _seed_awards(db_session, task, user, [0, 20, 60], minutes=[4, 6, 0])
+    other_awards = await _seed_awards(db_session, other_task, other_user, [5])
+    await repository.record_awards(other_awards)
+
+    assert await repository.rebuild(gameId=game.id) == 1
+
+    stats = await _stored(db_session, task, user)
+    assert (stats.awardsCount, stats.pointsSum) == (3, 6)
+    assert stats.previousAt.replace(tzinfo=timezone.utc) == START + timedelta(
+        seconds=20
+    )
+    assert (stats.minutesSum, stats.minutesCount) == (10, 2)
+    assert (await _stored(db_session, other_task, other_user)).awardsCount == 1
+    assert await repository.find_inconsistencies() == []
+
+
+@pytest.mark.asyncio
+async def test_find_inconsistencies_reports_drifted_and_missing_rows(
+    repository, db_session
+):
+    _, task, user = await _seed_task_and_user(db_session)
+    await _seed_awards(db_session, task, user, [0, 30])
+    await repository.rebuild()
+    await db_session.execute(
+        update(UserTaskStats).values(awardsCount=UserTaskStats.awardsCount + 1)
+    )
+    await db_session.commit()
+    _, late_task, late_user = await _seed_task_and_user(db_session, "g-late", "u-late")
+    await _seed_awards(db_session, late_task, late_user, [10])
+
+    mismatches = await repository.find_inconsistencies()
+
+    assert len(mismatches) == 2
+    by_task = {mismatch["taskId"]: mismatch for mismatch in mismatches}
+    drifted = by_task[str(task.id)]
+    assert (drifted["expected"]["awardsCount"], drifted["actual"]["awardsCount"]) == (
+        2,
+        3,
+    )
+    assert by_task[str(late_task.id)]["actual"] is None
+    assert len(await repository.find_inconsistencies(limit=1)) == 1
+
+    await repository.rebuild()
+    assert await repository.find_inconsistencies() == []
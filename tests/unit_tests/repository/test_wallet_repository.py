@@ -91,3 +91,25 @@ async def test_upsert_with_external_session_flushes_only(
     # because the previous transaction rolled back.
     fresh = await repository.upsert_points_balance(user_id=user.id, points_delta=4)
     assert fresh.pointsBalance == 4
+
+
+@pytest.mark.asyncio
+async def test_upsert_points_balances_creates_and_increments_in_one_statement(
+    repository, db_session
+):
+    existing = await _seed_user(db_session, "ext-w-batch-1")
+    fresh = await _seed_user(db_session, "ext-w-batch-2")
+    await repository.upsert_points_balance(user_id=existing.id, points_delta=3)
+
+    wallet_ids = await repository.upsert_points_balances({existing.id: 4, fresh.id: 6})
+
+    assert set(wallet_ids) == {str(existing.id), str(fresh.id)}
+    existing_wallet = await repository.read_by_id(wallet_ids[str(existing.id)])
+    fresh_wallet = await repository.read_by_id(wallet_ids[str(fresh.id)])
+    assert existing_wallet.pointsBalance == 7
+    assert fresh_wallet.pointsBalance == 6
+
+
+@pytest.mark.asyncio
+async def test_upsert_points_balances_returns_empty_for_no_deltas(repository):
+    assert await repository.upsert_points_balances({}) == {}
@@ -20,6 +20,7 @@ class InMemoryRateLimitCounterBackend:
         self._lock = threading.Lock()
         self.counters = {}
         self.ttl_seconds_seen = {}
+        self.batches = []
 
     async def increment_and_get(
         self,
@@ -35,6 +36,20 @@ class InMemoryRateLimitCounterBackend:
             self.ttl_seconds_seen[key] = ttl_seconds
             return self.counters[key]
 
+    async def increment_many(self, buckets) -> list:
+        self.batches.append(list(buckets))
+        values = []
+        for bucket in buckets:
+            for _ in range(bucket.amount):
+                value = await self.increment_and_get(*bucket[:5])
+            values.append(value)
+        return values
+
+    async def refund_many(self, buckets, values) -> None:
+        with self._lock:
+            for bucket in buckets:
+                self.counters[tuple(bucket[:4])] -= bucket.amount
+
 
 def _set_default_limits(monkeypatch):
     monkeypatch.setattr(configs, "ABUSE_PREVENTION_ENABLED", True)
@@ -224,6 +239,77 @@ async def test_enforce_limits_raises_when_daily_quota_is_exceeded(monkeypatch):
         )
 
 
+@pytest.mark.asyncio
+async def test_rejected_requests_are_not_charged(monkeypatch):
+    _set_default_limits(monkeypatch)
+    monkeypatch.setattr(configs, "ABUSE_RATE_LIMIT_PER_EXTERNAL_USER", 1)
+    backend = InMemoryRateLimitCounterBackend()
+    service = AbusePreventionService(backend)
+    now = datetime(2026, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
+
+    for attempt in range(5):
+        try:
+            await service.enforce_task_mutation_limits(
+                api_key="k-1",
+                client_ip="203.0.113.9",
+                external_user_id="user_throttled",
+                now=now,
+            )
+        except TooManyRequestsError:
+            assert attempt > 0
+
+    daily_bucket = datetime(2026, 2, 10, 0, 0, 0, tzinfo=timezone.utc)
+    short_bucket = datetime(2026, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
+    assert (
+        backend.counters[("api_key", "k-1", "task_mutation_daily", daily_bucket)] == 1
+    )
+    assert (
+        backend.counters[("ip", "203.0.113.9", "task_mutation_short_60s", short_bucket)]
+        == 1
+    )
+    assert (
+        backend.counters[
+            ("external_user", "user_throttled", "task_mutation_short_60s", short_bucket)
+        ]
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_limits_charge_every_event(monkeypatch):
+    _set_default_limits(monkeypatch)
+    monkeypatch.setattr(configs, "ABUSE_RATE_LIMIT_PER_EXTERNAL_USER", 2)
+    backend = InMemoryRateLimitCounterBackend()
+    service = AbusePreventionService(backend)
+    now = datetime(2026, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
+
+    await service.enforce_task_mutation_batch_limits(
+        api_key="k-1",
+        client_ip="203.0.113.9",
+        external_user_ids=["u-1", "u-1", "u-2"],
+        now=now,
+    )
+    with pytest.raises(TooManyRequestsError, match="externalUserId"):
+        await service.enforce_task_mutation_batch_limits(
+            api_key="k-1",
+            client_ip="203.0.113.9",
+            external_user_ids=["u-1", "u-2"],
+            now=now,
+        )
+
+    assert len(backend.batches) == 2
+    daily_bucket = datetime(2026, 2, 10, 0, 0, 0, tzinfo=timezone.utc)
+    assert (
+        backend.counters[("api_key", "k-1", "task_mutation_daily", daily_bucket)] == 3
+    )
+    assert (
+        backend.counters[("external_user", "u-1", "task_mutation_short_60s", now)] == 2
+    )
+    assert (
+        backend.counters[("external_user", "u-2", "task_mutation_short_60s", now)] == 1
+    )
+
+
 @pytest.mark.asyncio
 async def test_enforce_limits_is_stable_under_concurrency(monkeypatch):
     _set_default_limits(monkeypatch)
@@ -287,3 +373,45 @@ async def test_enforce_limits_passes_window_aware_ttl_to_backend(monkeypatch):
         backend.ttl_seconds_seen[("api_key", "k-1", daily_window_name, daily_bucket)]
         == 86405
     )
+
+
+@pytest.mark.asyncio
+async def test_enforce_limits_counts_all_buckets_in_one_backend_call(monkeypatch):
+    _set_default_limits(monkeypatch)
+    monkeypatch.setattr(configs, "ABUSE_RATE_LIMIT_PER_IP", 0)
+    backend = InMemoryRateLimitCounterBackend()
+    service = AbusePreventionService(backend)
+
+    await service.enforce_task_mutation_limits(
+        api_key="k-1",
+        client_ip="203.0.113.7",
+        external_user_id="user_4",
+        now=datetime(2026, 2, 10, 12, 0, 0, tzinfo=timezone.utc),
+    )
+
+    # The disabled IP limit is left out of the single batch.
+    assert len(backend.batches) == 1
+    assert [
+        (bucket.scope_type, bucket.window_name) for bucket in backend.batches[0]
+    ] == [
+        ("api_key", "task_mutation_short_60s"),
+        ("external_user", "task_mutation_short_60s"),
+        ("api_key", "task_mutation_daily"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_enforce_limits_reports_first_exceeded_limit(monkeypatch):
+    _set_default_limits(monkeypatch)
+    monkeypatch.setattr(configs, "ABUSE_RATE_LIMIT_PER_EXTERNAL_USER", 1)
+    monkeypatch.setattr(configs, "ABUSE_DAILY_QUOTA_PER_API_KEY", 1)
+    backend = InMemoryRateLimitCounterBackend()
+    service = AbusePreventionService(backend)
+    now = datetime(2026, 2, 10, 12, 0, 0, tzinfo=timezone.utc)
+    kwargs = {"api_key": "k-1", "client_ip": None, "external_user_id": "user_5"}
+
+    await service.enforce_task_mutation_limits(now=now, **kwargs)
+    with pytest.raises(TooManyRequestsError) as exc_info:
+        await service.enforce_task_mutation_limits(now=now, **kwargs)
+
+    assert "externalUserId" in exc_info.value.detail
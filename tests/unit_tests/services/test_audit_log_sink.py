@@ -0,0 +1,150 @@
+"""
+Buffered audit-log writer: batching by size and time, overflow drops,
+row-by-row fallback on a failed flush, and the shutdown flush.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from prometheus_client import REGISTRY
+
+from app.core import config as config_module
+from app.schema.logs_schema import CreateLogs
+from app.services.audit_log_sink import AuditLogSink
+from app.services.logs_service import LogsService
+
+
+def _entry(message="event"):
+    return CreateLogs(log_level="INFO", message=message, module="games", details={})
+
+
+def _dropped(reason):
+    return (
+        REGISTRY.get_sample_value("audit_log_rows_dropped_total", {"reason": reason})
+        or 0
+    )
+
+
+class _RecordingRepo:
+    def __init__(self, fail_messages=()):
+        self.batches = []
+        self.fail_messages = set(fail_messages)
+
+    async def insert_many(self, entries):
+        if any(entry.message in self.fail_messages for entry in entries):
+            raise RuntimeError("insert failed")
+        self.batches.append([entry.message for entry in entries])
+        return len(entries)
+
+
+class TestAuditLogSink(unittest.IsolatedAsyncioTestCase):
+    async def test_submit_does_not_wait_for_the_database(self):
+        repo = _RecordingRepo()
+        sink = AuditLogSink(repo, flush_interval_ms=0)
+
+        self.assertTrue(sink.submit(_entry()))
+        self.assertEqual(repo.batches, [])
+
+        await sink.flush()
+        self.assertEqual(repo.batches, [["event"]])
+        await sink.aclose()
+
+    async def test_rows_queued_together_are_written_in_one_batch(self):
+        repo = _RecordingRepo()
+        sink = AuditLogSink(repo, batch_size=3, flush_interval_ms=50)
+
+        for index in range(7):
+            sink.submit(_entry(f"e{index}"))
+        await sink.flush()
+
+        self.assertEqual(repo.batches, [["e0", "e1", "e2"], ["e3", "e4", "e5"], ["e6"]])
+        await sink.aclose()
+
+    async def test_batch_waits_for_late_rows_within_the_interval(self):
+        repo = _RecordingRepo()
+        sink = AuditLogSink(repo, batch_size=10, flush_interval_ms=200)
+
+        sink.submit(_entry("first"))
+        await asyncio.sleep(0.01)
+        sink.submit(_entry("second"))
+        await sink.flush()
+
+        self.assertEqual(repo.batches, [["first", "second"]])
+        await sink.aclose()
+
+    async def test_full_queue_drops_and_counts(self):
+        before = _dropped("queue_full")
+        repo = _RecordingRepo()
+        sink = AuditLogSink(repo, queue_maxsize=1, flush_interval_ms=0)
+
+        # No await between the submits: the worker never runs, so the
+        # second row finds the queue full.
+        self.assertTrue(sink.submit(_entry("keep")))
+        with self.assertLogs("app.services.audit_log_sink", level="WARNING"):
+            self.assertTrue(sink.submit(_entry("dropped")))
+        await sink.flush()
+
+        self.assertEqual(_dropped("queue_full") - before, 1)
+        self.assertEqual(repo.batches, [["keep"]])
+        await sink.aclose()
+
+    async def test_failed_batch_is_retried_row_by_row(self):
+        before = _dropped("write_failed")
+        repo = _RecordingRepo(fail_messages={"bad"})
+        sink = AuditLogSink(repo, flush_interval_ms=0)
+
+        with self.assertLogs("app.services.audit_log_sink", level="WARNING"):
+            for message in ("a", "bad", "b"):
+                sink.submit(_entry(message))
+            await sink.flush()
+
+        self.assertEqual(repo.batches, [["a"], ["b"]])
+        self.assertEqual(_dropped("write_failed") - before, 1)
+        await sink.aclose()
+
+    async def test_aclose_flushes_and_refuses_later_rows(self):
+        repo = _RecordingRepo()
+        sink = AuditLogSink(repo, flush_interval_ms=0)
+        sink.submit(_entry())
+
+        await sink.aclose()
+        await sink.aclose()
+
+        self.assertEqual(repo.batches, [["event"]])
+        self.assertFalse(sink.submit(_entry("late")))
+
+    async def test_disabled_buffer_refuses_rows(self):
+        sink = AuditLogSink(_RecordingRepo())
+
+        # The sink reads the live module attribute (tests may reload it).
+        with patch.object(config_module.configs, "AUDIT_LOG_BUFFER_ENABLED", False):
+            self.assertFalse(sink.submit(_entry()))
+
+
+class TestLogsServiceRecord(unittest.IsolatedAsyncioTestCase):
+    async def test_record_hands_rows_to_the_sink(self):
+        repository = MagicMock()
+        repository.create = AsyncMock()
+        sink = MagicMock()
+        sink.submit.return_value = True
+        service = LogsService(repository, audit_log_sink=sink)
+
+        await service.record(_entry())
+
+        sink.submit.assert_called_once()
+        repository.create.assert_not_awaited()
+
+    async def test_record_writes_inline_when_the_sink_refuses(self):
+        repository = MagicMock()
+        repository.create = AsyncMock()
+        sink = MagicMock()
+        sink.submit.return_value = False
+        entry = _entry()
+
+        await LogsService(repository, audit_log_sink=sink).record(entry)
+        await LogsService(repository).record(entry)
+
+        self.assertEqual(repository.create.await_count, 2)
@@ -1,9 +1,18 @@
+import io
 import json
 import unittest
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core import config as config_module
+from app.model.user_points import UserPoints
+from app.model.wallet_transactions import WalletTransactions
 from app.repository.export_audit_log_repository import ExportAuditLogRepository
 from app.schema.export_schema import (
     ExportDatasetType,
@@ -11,7 +20,12 @@ from app.schema.export_schema import (
     ExportFormat,
     ExportStatus,
 )
-from app.services.export_service import DATASET_COLUMNS, ExportService
+from app.services.export_service import (
+    DATASET_COLUMNS,
+    ExportService,
+    _pg_text_columns,
+    _stringify_for_tabular,
+)
 
 
 async def _collect(async_iter):
@@ -172,8 +186,8 @@ class TestExportServiceFormatters(unittest.IsolatedAsyncioTestCase):
         rows = [{"id": "x", "data": {"k": 1, "v": "abc"}}]
         chunks = await _collect(ExportService.format_as_csv(_aiter(rows), columns))
         body = b"".join(chunks).decode("utf-8")
-        # The data cell is a JSON-encoded dict, quoted by csv module.
-        self.assertIn('"{""k"":1,""v"":""abc""}"', body)
+        # The data cell is the jsonb text of the dict, quoted by csv module.
+        self.assertIn('"{""k"": 1, ""v"": ""abc""}"', body)
 
     async def test_json_emits_valid_array(self):
         rows = [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}]
@@ -187,6 +201,23 @@ class TestExportServiceFormatters(unittest.IsolatedAsyncioTestCase):
         body = b"".join(chunks).decode("utf-8")
         self.assertEqual(json.loads(body), [])
 
+    async def test_xlsx_streams_the_workbook_in_chunks(self):
+        openpyxl = pytest.importorskip("openpyxl")
+        columns = ["id", "data"]
+        rows = [
+            {"id": f"r{index}", "data": {"k": uuid4().hex}} for index in range(5000)
+        ]
+
+        chunks = await _collect(ExportService.format_as_xlsx(_aiter(rows), columns))
+
+        # Bytes leave before the last row is encoded, not as one final blob.
+        self.assertGreater(len(chunks), 1)
+        sheet = openpyxl.load_workbook(io.BytesIO(b"".join(chunks)))["export"]
+        values = list(sheet.iter_rows(values_only=True))
+        self.assertEqual(values[0], ("id", "data"))
+        self.assertEqual(values[-1], ("r4999", json.dumps(rows[-1]["data"])))
+        self.assertEqual(len(values), 5001)
+
     async def test_format_iterator_routes_to_csv_for_csv_format(self):
         rows = [{"id": "u1", "externalUserId": "x"}]
         gen = self.service.format_iterator(
@@ -224,6 +255,38 @@ class TestExportServiceFormatters(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(name.startswith("user-points_"))
         self.assertTrue(name.endswith(".csv"))
 
+    def test_copy_timestamps_drop_zero_microseconds_like_isoformat(self):
+        (column,) = _pg_text_columns(select(UserPoints.created_at))
+        sql = str(
+            column.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+
+        self.assertIn("CASE WHEN", sql)
+        self.assertIn("""'YYYY-MM-DD"T"HH24:MI:SS"+00:00"'""", sql)
+        self.assertIn("""'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"'""", sql)
+
+    def test_copy_whole_floats_keep_a_decimal_like_str(self):
+        (column,) = _pg_text_columns(select(WalletTransactions.coins))
+        sql = str(
+            column.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+
+        self.assertIn("CAST(wallettransactions.coins AS TEXT) ~ '^-?[0-9]+$'", sql)
+        self.assertIn("|| '.0'", sql)
+
+    def test_tabular_json_cells_match_postgres_jsonb_text(self):
+        # What ``jsonb::text`` (and so the COPY path) writes for this value.
+        self.assertEqual(
+            _stringify_for_tabular({"k": 1, "v": ["é", 1.5], "n": None}),
+            '{"k": 1, "v": ["é", 1.5], "n": null}',
+        )
+
 
 class TestExportServiceIterators(unittest.IsolatedAsyncioTestCase):
     """
@@ -349,5 +412,206 @@ class TestExportServiceIterators(unittest.IsolatedAsyncioTestCase):
         )
 
 
+class TestExportServiceStreamExport(unittest.IsolatedAsyncioTestCase):
+    """
+    ``stream_export`` picks the bulk path on Postgres and the ORM iterators
+    everywhere else. The database side is mocked: the session reports its
+    dialect, and the asyncpg connection/cursor results are fakes.
+    """
+
+    def setUp(self):
+        from sqlalchemy.dialects.postgresql.asyncpg import dialect
+
+        self.dialect = dialect()
+        self.session = MagicMock()
+        self.session.get_bind.return_value = SimpleNamespace(
+            dialect=SimpleNamespace(name="postgresql")
+        )
+        self.repo = MagicMock(spec=ExportAuditLogRepository)
+        self.repo.session_factory = MagicMock(
+            return_value=self._session_context(self.session)
+        )
+        self.service = ExportService(export_audit_log_repository=self.repo)
+        self.filters = ExportFilters(externalGameId="g-1", limit=10)
+
+    @staticmethod
+    def _session_context(session):
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=session)
+        context.__aexit__ = AsyncMock(return_value=False)
+        return context
+
+    def _fake_copy_connection(self, chunks, status="COPY 3", error=None):
+        calls = {}
+
+        async def copy_from_query(query, *args, output, **options):
+            calls.update(query=query, args=args, options=options)
+            for chunk in chunks:
+                await output(chunk)
+            if error is not None:
+                raise error
+            return status
+
+        driver = SimpleNamespace(copy_from_query=copy_from_query)
+        connection = MagicMock()
+        connection.dialect = self.dialect
+        connection.get_raw_connection = AsyncMock(
+            return_value=SimpleNamespace(driver_connection=driver)
+        )
+        self.session.connection = AsyncMock(return_value=connection)
+        return calls
+
+    async def test_csv_on_postgres_streams_copy_output(self):
+        calls = self._fake_copy_connection(
+            [b"id,created_at\r\n", b"a,2026-01-01\r\n", b"b,2026-01-02\r\n"]
+        )
+        counter = {"n": 0}
+
+        chunks = await _collect(
+            self.service.stream_export(
+                ExportDatasetType.USER_POINTS.value,
+                ExportFormat.CSV.value,
+                self.filters,
+                counter,
+            )
+        )
+
+        # Small COPY messages are coalesced into one write.
+        self.assertEqual(chunks, [b"id,created_at\r\na,2026-01-01\r\nb,2026-01-02\r\n"])
+        self.assertEqual(counter["n"], 3)
+        self.assertEqual(calls["options"], {"format": "csv", "header": True})
+        sql = calls["query"].lower()
+        self.assertIn("cast(userpoints.id as text) as id", sql)
+        self.assertIn("to_char(timezone(", sql)
+        self.assertIn("order by userpoints.created_at", sql)
+        self.assertIn("g-1", calls["args"])
+        self.assertIn(10, calls["args"])
+
+    async def test_csv_on_postgres_reraises_copy_errors(self):
+        self._fake_copy_connection([b"id\r\n"], error=RuntimeError("copy failed"))
+
+        with self.assertRaises(RuntimeError):
+            await _collect(
+                self.service.stream_export(
+                    ExportDatasetType.USERS.value,
+                    ExportFormat.CSV.value,
+                    self.filters,
+                    {"n": 0},
+                )
+            )
+
+    async def test_json_on_postgres_joins_server_built_objects(self):
+        captured = {}
+        partitions = [
+            ['{"id" : "a", "data" : {"k": 1}}', '{"id" : "b", "data" : null}'],
+            ['{"id" : "c", "data" : {}}'],
+        ]
+
+        async def _partitions():
+            for partition in partitions:
+                yield partition
+
+        async def _stream(stmt):
+            captured["stmt"] = stmt
+            result = MagicMock()
+            result.scalars.return_value.partitions = _partitions
+            return result
+
+        self.session.stream = _stream
+        counter = {"n": 0}
+
+        chunks = await _collect(
+            self.service.stream_export(
+                ExportDatasetType.USER_INTERACTIONS.value,
+                ExportFormat.JSON.value,
+                self.filters,
+                counter,
+            )
+        )
+
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(
+            json.loads(chunks[0]),
+            [
+                {"id": "a", "data": {"k": 1}},
+                {"id": "b", "data": None},
+                {"id": "c", "data": {}},
+            ],
+        )
+        self.assertEqual(counter["n"], 3)
+        sql = str(captured["stmt"].compile(dialect=self.dialect)).lower()
+        self.assertIn("json_build_object('id', cast(useractions.id as text)", sql)
+        self.assertEqual(captured["stmt"].get_execution_options()["yield_per"], 1000)
+
+    async def test_other_engines_use_the_orm_formatters(self):
+        self.session.get_bind.return_value = SimpleNamespace(
+            dialect=SimpleNamespace(name="sqlite")
+        )
+        rows = [{"id": "u1", "externalUserId": "x"}, {"id": "u2"}]
+        counter = {"n": 0}
+
+        with patch.object(
+            ExportService, "iter_dataset", lambda _self, dt, f: _aiter(rows)
+        ):
+            chunks = await _collect(
+                self.service.stream_export(
+                    ExportDatasetType.USERS.value,
+                    ExportFormat.JSON.value,
+                    self.filters,
+                    counter,
+                )
+            )
+
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(json.loads(chunks[0]), rows)
+        self.assertEqual(counter["n"], 2)
+
+    async def test_disabled_switch_skips_the_database_check(self):
+        rows = [{"id": "u1"}]
+        counter = {"n": 0}
+
+        with patch.object(
+            config_module.configs, "EXPORT_BULK_COPY_ENABLED", False
+        ), patch.object(
+            ExportService, "iter_dataset", lambda _self, dt, f: _aiter(rows)
+        ):
+            body = b"".join(
+                await _collect(
+                    self.service.stream_export(
+                        ExportDatasetType.USERS.value,
+                        ExportFormat.CSV.value,
+                        self.filters,
+                        counter,
+                    )
+                )
+            )
+
+        self.repo.session_factory.assert_not_called()
+        self.assertIn(b"u1", body)
+        self.assertEqual(counter["n"], 1)
+
+    async def test_large_bodies_are_split_into_64kb_writes(self):
+        self.session.get_bind.return_value = SimpleNamespace(
+            dialect=SimpleNamespace(name="sqlite")
+        )
+        rows = [{"id": f"{index:08d}", "pad": "x" * 1000} for index in range(200)]
+
+        with patch.object(
+            ExportService, "iter_dataset", lambda _self, dt, f: _aiter(rows)
+        ):
+            chunks = await _collect(
+                self.service.stream_export(
+                    ExportDatasetType.USERS.value,
+                    ExportFormat.JSON.value,
+                    self.filters,
+                    {"n": 0},
+                )
+            )
+
+        self.assertEqual(len(chunks), 4)
+        self.assertTrue(all(len(chunk) >= 64 * 1024 for chunk in chunks[:-1]))
+        self.assertEqual(json.loads(b"".join(chunks)), rows)
+
+
 if __name__ == "__main__":
     unittest.main()
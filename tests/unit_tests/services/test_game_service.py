@@ -102,6 +102,16 @@ class TestGameService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.strategyId, "strategy-1")
         self.assertEqual(result.params, [])
 
+    async def test_delete_game_by_id_invalidates_metadata_cache(self):
+        game_id = uuid4()
+        self.service.metadata_cache = SimpleNamespace(invalidate_game=AsyncMock())
+        self.game_repository.read_by_id.return_value = self._build_game(game_id)
+        self.game_repository.delete_game_by_id.return_value = True
+
+        await self.service.delete_game_by_id(game_id)
+
+        self.service.metadata_cache.invalidate_game.assert_awaited_once_with(game_id)
+
     async def test_delete_game_by_id_returns_not_deleted_message(self):
         game_id = uuid4()
         self.game_repository.read_by_id.return_value = self._build_game(game_id)
@@ -168,7 +178,7 @@ class TestGameService(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(ConflictError):
             await self.service.create(schema)
 
-    @patch("app.services.game_service.all_engine_strategies", return_value=[])
+    @patch("app.services.game_service.engine_strategy", return_value=None)
     async def test_create_raises_not_found_when_strategy_does_not_exist(
         self, _mock_strategies
     ):
@@ -186,8 +196,8 @@ class TestGameService(unittest.IsolatedAsyncioTestCase):
             await self.service.create(schema)
 
     @patch(
-        "app.services.game_service.all_engine_strategies",
-        return_value=[SimpleNamespace(id="default")],
+        "app.services.game_service.engine_strategy",
+        return_value=SimpleNamespace(id="default"),
     )
     async def test_create_sets_default_strategy_and_creates_game_without_params(
         self, _mock_strategies
@@ -217,8 +227,8 @@ class TestGameService(unittest.IsolatedAsyncioTestCase):
         self.game_repository.create.assert_awaited_once_with(schema)
 
     @patch(
-        "app.services.game_service.all_engine_strategies",
-        return_value=[SimpleNamespace(id="default")],
+        "app.services.game_service.engine_strategy",
+        return_value=SimpleNamespace(id="default"),
     )
     async def test_create_with_params_creates_game_params_with_context(
         self, _mock_strategies
@@ -365,7 +375,7 @@ class TestGameService(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(ConflictError):
             await self.service.patch_game_by_id(game_id, schema)
 
-    @patch("app.services.game_service.all_engine_strategies", return_value=[])
+    @patch("app.services.game_service.engine_strategy", return_value=None)
     async def test_patch_game_by_id_raises_when_strategy_not_found(
         self, _mock_strategies
     ):
@@ -384,8 +394,8 @@ class TestGameService(unittest.IsolatedAsyncioTestCase):
             await self.service.patch_game_by_id(game_id, schema)
 
     @patch(
-        "app.services.game_service.all_engine_strategies",
-        return_value=[SimpleNamespace(id="default")],
+        "app.services.game_service.engine_strategy",
+        return_value=SimpleNamespace(id="default"),
     )
     async def test_patch_game_by_id_uses_default_when_strategy_missing_in_schema_and_game(
         self, _mock_strategies
@@ -0,0 +1,102 @@
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.core.exceptions import NotFoundError
+from app.schema.leaderboard_schema import LeaderboardPeriod
+from app.services.leaderboard_service import LeaderboardService
+
+GAME = SimpleNamespace(id="game-1", apiKey_used="api-key", oauth_user_id=None)
+AT = datetime(2024, 1, 3, 12, tzinfo=timezone.utc)
+
+
+def _entry(user_id, points, rank):
+    return {"userId": user_id, "points": points, "rank": rank}
+
+
+class TestLeaderboardService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.game_repository = AsyncMock()
+        self.game_repository.read_by_id.return_value = GAME
+        self.user_repository = AsyncMock()
+        self.leaderboard_repository = AsyncMock()
+        self.leaderboard_repository.read_external_user_ids.side_effect = (
+            lambda user_ids: {user_id: f"ext-{user_id}" for user_id in user_ids}
+        )
+        self.backend = AsyncMock()
+        self.service = LeaderboardService(
+            game_repository=self.game_repository,
+            user_repository=self.user_repository,
+            leaderboard_repository=self.leaderboard_repository,
+            leaderboard_backend=self.backend,
+        )
+
+    async def test_get_leaderboard_reads_the_window_containing_at(self):
+        self.backend.top.return_value = [_entry("u1", 9, 1), _entry("u2", 9, 1)]
+
+        result = await self.service.get_leaderboard(
+            "game-1", LeaderboardPeriod.WEEK, 5, AT
+        )
+
+        self.backend.top.assert_awaited_once_with(
+            "game-1", "week", datetime(2024, 1, 1, tzinfo=timezone.utc), 5
+        )
+        self.assertEqual(result.periodStart, datetime(2024, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(
+            [(entry.rank, entry.externalUserId) for entry in result.entries],
+            [(1, "ext-u1"), (1, "ext-u2")],
+        )
+        self.leaderboard_repository.read_external_user_ids.assert_awaited_once_with(
+            ["u1", "u2"]
+        )
+
+    async def test_get_leaderboard_enforces_game_scope(self):
+        with patch(
+            "app.services.leaderboard_service.get_authorized_game",
+            AsyncMock(return_value=GAME),
+        ) as authorize:
+            self.backend.top.return_value = []
+            await self.service.get_leaderboard(
+                "game-1", api_key="api-key", enforce_scope=True
+            )
+
+        authorize.assert_awaited_once()
+        self.assertEqual(authorize.await_args.kwargs["api_key"], "api-key")
+
+    async def test_get_leaderboard_raises_when_game_missing(self):
+        self.game_repository.read_by_id.return_value = None
+
+        with self.assertRaises(NotFoundError):
+            await self.service.get_leaderboard("missing")
+
+    async def test_get_user_standing_splits_neighbours(self):
+        self.user_repository.read_by_column.return_value = SimpleNamespace(id="u2")
+        self.backend.standing.return_value = {
+            "entry": _entry("u2", 7, 2),
+            "above": [_entry("u1", 9, 1)],
+            "below": [_entry("u3", 7, 2), _entry("u4", 1, 4)],
+        }
+
+        result = await self.service.get_user_standing(
+            "game-1", "ext-u2", LeaderboardPeriod.ALL, 2
+        )
+
+        self.assertEqual(result.entry.externalUserId, "ext-u2")
+        self.assertEqual([entry.rank for entry in result.above], [1])
+        self.assertEqual([entry.rank for entry in result.below], [2, 4])
+        self.leaderboard_repository.read_external_user_ids.assert_awaited_once()
+
+    async def test_get_user_standing_raises_when_user_unranked(self):
+        self.user_repository.read_by_column.return_value = SimpleNamespace(id="u9")
+        self.backend.standing.return_value = None
+
+        with self.assertRaises(NotFoundError):
+            await self.service.get_user_standing("game-1", "ext-u9")
+
+    async def test_get_user_standing_raises_when_user_missing(self):
+        self.user_repository.read_by_column.return_value = None
+
+        with self.assertRaises(NotFoundError):
+            await self.service.get_user_standing("game-1", "nobody")
+        self.backend.standing.assert_not_awaited()
@@ -0,0 +1,225 @@
+"""
+Tests for the scoring metadata cache.
+
+- ``InMemoryMetadataCacheBackend`` is verified directly (LRU bound, TTL via a
+  patched ``monotonic``, prefix deletes).
+- ``RedisMetadataCacheBackend`` is exercised against ``fakeredis``.
+- ``ScoringMetadataCache`` is checked for read-through, miss and
+  invalidation semantics with plain ``AsyncMock`` loaders.
+"""
+
+import logging
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.schema.strategy_definition_schema import StrategyDefinitionRead
+from app.services.metadata_cache import (
+    InMemoryMetadataCacheBackend,
+    RedisMetadataCacheBackend,
+    ScoringMetadataCache,
+    build_metadata_cache_backend,
+    build_scoring_metadata_cache,
+)
+
+
+def _game(**overrides):
+    values = {
+        "id": uuid4(),
+        "externalGameId": "game-1",
+        "strategyId": "default",
+        "platform": "web",
+        "apiKey_used": "key",
+        "oauth_user_id": None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _task(game_id, **overrides):
+    values = {
+        "id": uuid4(),
+        "externalTaskId": "task-1",
+        "gameId": game_id,
+        "strategyId": "default",
+        "status": "open",
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.mark.asyncio
+async def test_inmemory_evicts_least_recently_read_entry():
+    backend = InMemoryMetadataCacheBackend(max_entries=2)
+    await backend.set("a", {"v": 1}, ttl_seconds=30)
+    await backend.set("b", {"v": 2}, ttl_seconds=30)
+    assert await backend.get("a") == {"v": 1}
+
+    await backend.set("c", {"v": 3}, ttl_seconds=30)
+
+    assert await backend.get("b") is None
+    assert await backend.get("a") == {"v": 1}
+    assert await backend.get("c") == {"v": 3}
+
+
+@pytest.mark.asyncio
+async def test_inmemory_expires_entry_after_ttl():
+    backend = InMemoryMetadataCacheBackend()
+
+    with patch("app.services.metadata_cache.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 1000.0
+        await backend.set("a", {"v": 1}, ttl_seconds=5)
+
+        mock_monotonic.return_value = 1004.0
+        assert await backend.get("a") == {"v": 1}
+
+        mock_monotonic.return_value = 1006.0
+        assert await backend.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_inmemory_delete_prefix_keeps_other_keys():
+    backend = InMemoryMetadataCacheBackend()
+    await backend.set("task:g1:a", {"v": 1}, ttl_seconds=30)
+    await backend.set("task:g1:b", {"v": 2}, ttl_seconds=30)
+    await backend.set("task:g2:a", {"v": 3}, ttl_seconds=30)
+
+    await backend.delete_prefix("task:g1:")
+
+    assert await backend.get("task:g1:a") is None
+    assert await backend.get("task:g1:b") is None
+    assert await backend.get("task:g2:a") == {"v": 3}
+
+
+@pytest.fixture
+def fake_redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.mark.asyncio
+async def test_redis_roundtrips_json_payload_with_ttl(fake_redis_client):
+    backend = RedisMetadataCacheBackend(fake_redis_client, key_prefix="test:meta:")
+
+    await backend.set("game:1", {"id": "1", "platform": "web"}, ttl_seconds=30)
+
+    assert await backend.get("game:1") == {"id": "1", "platform": "web"}
+    assert 1 <= await fake_redis_client.ttl("test:meta:game:1") <= 30
+
+
+@pytest.mark.asyncio
+async def test_redis_delete_prefix_only_deletes_matching_keys(fake_redis_client):
+    backend = RedisMetadataCacheBackend(fake_redis_client, key_prefix="test:meta:")
+    await backend.set("task:g1:a", {"v": 1}, ttl_seconds=30)
+    await backend.set("task:g2:a", {"v": 2}, ttl_seconds=30)
+    await fake_redis_client.set("other:key", "untouched")
+
+    await backend.delete_prefix("task:g1:")
+
+    assert await backend.get("task:g1:a") is None
+    assert await backend.get("task:g2:a") == {"v": 2}
+    assert await fake_redis_client.get("other:key") == "untouched"
+
+
+def test_build_backend_falls_back_to_memory_when_redis_url_missing(caplog):
+    with caplog.at_level(logging.WARNING, logger="app.services.metadata_cache"):
+        backend = build_metadata_cache_backend(
+            backend_name="redis",
+            redis_url=None,
+            redis_key_prefix="game:metadata:",
+            max_entries=10,
+        )
+
+    assert isinstance(backend, InMemoryMetadataCacheBackend)
+    assert any(
+        "METADATA_CACHE_BACKEND=redis but REDIS_URL is empty" in record.message
+        for record in caplog.records
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_game_loads_once_then_serves_snapshot():
+    cache = build_scoring_metadata_cache("memory", None, "game:metadata:", 30, 100)
+    game = _game()
+    load = AsyncMock(return_value=game)
+
+    first = await cache.get_game(game.id, load)
+    second = await cache.get_game(game.id, load)
+
+    load.assert_awaited_once()
+    assert second.id == game.id
+    assert (second.strategyId, second.apiKey_used) == ("default", "key")
+    assert first.__dict__ == second.__dict__
+
+
+@pytest.mark.asyncio
+async def test_missing_rows_are_not_cached():
+    cache = ScoringMetadataCache(InMemoryMetadataCacheBackend(), ttl_seconds=30)
+    load = AsyncMock(return_value=None)
+
+    assert await cache.get_task("g", "t", load) is None
+    assert await cache.get_task("g", "t", load) is None
+
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_always_reads_through():
+    cache = ScoringMetadataCache(InMemoryMetadataCacheBackend(), ttl_seconds=0)
+    game = _game()
+    load = AsyncMock(return_value=game)
+
+    await cache.get_game(game.id, load)
+    await cache.get_game(game.id, load)
+
+    assert load.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_game_drops_its_tasks_only():
+    cache = ScoringMetadataCache(InMemoryMetadataCacheBackend(), ttl_seconds=30)
+    game, other_game = _game(), _game()
+    task, other_task = _task(game.id), _task(other_game.id)
+    load_task = AsyncMock(return_value=task)
+    load_other = AsyncMock(return_value=other_task)
+    await cache.get_task(game.id, "task-1", load_task)
+    await cache.get_task(other_game.id, "task-1", load_other)
+
+    await cache.invalidate_game(game.id)
+    cached = await cache.get_task(game.id, "task-1", load_task)
+    await cache.get_task(other_game.id, "task-1", load_other)
+
+    assert load_task.await_count == 2
+    assert load_other.await_count == 1
+    assert cached.gameId == game.id
+    assert cached.status == "open"
+
+
+@pytest.mark.asyncio
+async def test_strategy_definition_roundtrips_and_is_scoped_by_realm():
+    cache = ScoringMetadataCache(InMemoryMetadataCacheBackend(), ttl_seconds=30)
+    definition = StrategyDefinitionRead(
+        id=str(uuid4()),
+        realmId="realm-a",
+        name="custom",
+        type="DSL",
+        astJson={"rules": []},
+        version=2,
+        status="PUBLISHED",
+        publishedAt=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    )
+    load = AsyncMock(return_value=definition)
+
+    await cache.get_strategy_definition("realm-a", definition.id, load)
+    cached = await cache.get_strategy_definition("realm-a", definition.id, load)
+    await cache.get_strategy_definition("realm-b", definition.id, load)
+
+    assert cached == definition
+    assert load.await_count == 2
+
+    await cache.invalidate_strategies("realm-a")
+    await cache.get_strategy_definition("realm-a", definition.id, load)
+    assert load.await_count == 3
@@ -6,10 +6,13 @@ Tests for the rate-limit counter backends.
   integration tests against aiosqlite).
 - ``RedisRateLimitCounterBackend`` is verified against ``fakeredis`` so the
   INCR + EXPIRE semantics are exercised without standing up Redis.
+- ``LeasedRateLimitCounterBackend`` is verified against an in-memory shared
+  counter, with several leasing workers standing in for API instances.
 """
 
 import asyncio
 import logging
+import random
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
@@ -18,6 +21,8 @@ import pytest
 from app.repository.abuse_limit_counter_repository import AbuseLimitCounterRepository
 from app.services.rate_limit_counter_backend import (
     DatabaseRateLimitCounterBackend,
+    LeasedRateLimitCounterBackend,
+    RateLimitBucket,
     RedisRateLimitCounterBackend,
     build_rate_limit_counter_backend,
 )
@@ -50,6 +55,44 @@ async def test_database_backend_delegates_to_repository_and_ignores_ttl():
     )
 
 
+@pytest.mark.asyncio
+async def test_database_backend_increment_many_drops_ttl():
+    repository = MagicMock(spec=AbuseLimitCounterRepository)
+    repository.increment_many = AsyncMock(return_value=[3, 1])
+    backend = DatabaseRateLimitCounterBackend(repository)
+
+    values = await backend.increment_many(
+        [
+            RateLimitBucket("api_key", "k-1", "short", _window(), 65),
+            RateLimitBucket("ip", "203.0.113.1", "short", _window(), 65),
+        ]
+    )
+
+    assert values == [3, 1]
+    repository.increment_many.assert_awaited_once_with(
+        [
+            ("api_key", "k-1", "short", _window(), 1),
+            ("ip", "203.0.113.1", "short", _window(), 1),
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_database_backend_refund_many_moves_counters_back():
+    repository = MagicMock(spec=AbuseLimitCounterRepository)
+    repository.increment_many = AsyncMock(return_value=[2])
+    backend = DatabaseRateLimitCounterBackend(repository)
+
+    await backend.refund_many(
+        [RateLimitBucket("api_key", "k-1", "short", _window(), 65)], [3]
+    )
+    await backend.refund_many([], [])
+
+    repository.increment_many.assert_awaited_once_with(
+        [("api_key", "k-1", "short", _window(), -1)]
+    )
+
+
 @pytest.fixture
 def fake_redis_client():
     fakeredis = pytest.importorskip("fakeredis")
@@ -161,6 +204,46 @@ async def test_redis_backend_isolates_scopes_and_buckets(fake_redis_client):
     assert c == 1
 
 
+@pytest.mark.asyncio
+async def test_redis_backend_increment_many_uses_one_transaction(fake_redis_client):
+    backend = RedisRateLimitCounterBackend(fake_redis_client, key_prefix="test:rl:")
+    daily = datetime(2026, 2, 10, tzinfo=timezone.utc)
+    buckets = [
+        RateLimitBucket("api_key", "k-1", "task_mutation_short_60s", _window(), 65),
+        RateLimitBucket("ip", "203.0.113.1", "task_mutation_short_60s", _window(), 65),
+        RateLimitBucket("api_key", "k-1", "task_mutation_daily", daily, 86405),
+    ]
+    await backend.increment_and_get(*buckets[0][:5])
+    pipeline = MagicMock(wraps=fake_redis_client.pipeline)
+    fake_redis_client.pipeline = pipeline
+
+    values = await backend.increment_many(buckets)
+
+    assert values == [2, 1, 1]
+    pipeline.assert_called_once_with(transaction=True)
+    daily_key = backend._build_key("api_key", "k-1", "task_mutation_daily", daily)
+    assert 65 < await fake_redis_client.ttl(daily_key) <= 86405
+    assert await backend.increment_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_refund_many_keeps_the_ttl(fake_redis_client):
+    backend = RedisRateLimitCounterBackend(fake_redis_client, key_prefix="test:rl:")
+    buckets = [
+        RateLimitBucket("api_key", "k-1", "task_mutation_short_60s", _window(), 65),
+        RateLimitBucket("ip", "203.0.113.1", "task_mutation_short_60s", _window(), 65),
+    ]
+    await backend.increment_many(buckets)
+    values = await backend.increment_many(buckets)
+
+    await backend.refund_many(buckets, values)
+
+    key = backend._build_key("api_key", "k-1", "task_mutation_short_60s", _window())
+    assert await fake_redis_client.get(key) == "1"
+    assert 1 <= await fake_redis_client.ttl(key) <= 65
+    assert await backend.increment_many(buckets) == [2, 2]
+
+
 def test_build_backend_returns_database_backend_by_default():
     repository = MagicMock(spec=AbuseLimitCounterRepository)
 
@@ -206,3 +289,164 @@ def test_build_backend_returns_redis_backend_when_configured():
     )
 
     assert isinstance(backend, RedisRateLimitCounterBackend)
+
+
+class _SharedCounter:
+    """In-memory stand-in for the shared backend, counting round trips."""
+
+    def __init__(self):
+        self.counters = {}
+        self.calls = 0
+
+    async def increment_many(self, buckets):
+        self.calls += 1
+        values = []
+        for bucket in buckets:
+            key = bucket[:4]
+            self.counters[key] = self.counters.get(key, 0) + bucket.amount
+            values.append(self.counters[key])
+        return values
+
+    async def refund_many(self, buckets, values):
+        self.calls += 1
+        for bucket in buckets:
+            self.counters[bucket[:4]] -= bucket.amount
+
+
+def _bucket(max_allowed, scope_value="k-1", window_start=None):
+    return RateLimitBucket(
+        "api_key",
+        scope_value,
+        "task_mutation_short_60s",
+        window_start or _window(),
+        65,
+        max_allowed=max_allowed,
+    )
+
+
+def _clock_at(window_start):
+    return lambda: window_start.timestamp() + 1
+
+
+@pytest.mark.asyncio
+async def test_leased_backend_answers_from_the_lease_and_counts_exactly():
+    shared = _SharedCounter()
+    backend = LeasedRateLimitCounterBackend(
+        shared, lease_size=10, clock=_clock_at(_window())
+    )
+
+    values = [(await backend.increment_many([_bucket(25)]))[0] for _ in range(30)]
+
+    # Leases of 10, 10, then the 5 left under the cap; afterwards the worker
+    # knows the bucket is spent and stops asking.
+    assert values == list(range(1, 26)) + [26] * 5
+    assert shared.calls == 3
+    assert shared.counters[_bucket(25)[:4]] == 25
+
+
+@pytest.mark.asyncio
+async def test_leased_workers_never_admit_past_the_cap():
+    shared = _SharedCounter()
+    workers = [
+        LeasedRateLimitCounterBackend(shared, lease_size=8, clock=_clock_at(_window()))
+        for _ in range(4)
+    ]
+    cap = 100
+    rng = random.Random(7)
+    admitted = 0
+
+    for _ in range(400):
+        worker = rng.choice(workers)
+        [value] = await worker.increment_many([_bucket(cap)])
+        admitted += value <= cap
+
+    # Unused reservations may reject early, never admit late.
+    assert cap - len(workers) * (8 - 1) <= admitted <= cap
+    assert shared.calls < 400
+
+
+@pytest.mark.asyncio
+async def test_leased_backend_refills_misses_in_one_call_and_passes_uncapped():
+    shared = _SharedCounter()
+    backend = LeasedRateLimitCounterBackend(
+        shared, lease_size=5, clock=_clock_at(_window())
+    )
+    batch = [_bucket(50), _bucket(50, scope_value="k-2"), _bucket(0, "k-3")]
+
+    first = await backend.increment_many(batch)
+    second = await backend.increment_many(batch)
+
+    assert first == [1, 1, 1]
+    assert second == [2, 2, 2]
+    # One refill call per batch for the uncapped bucket, none for the leased.
+    assert shared.calls == 2
+    assert shared.counters[batch[0][:4]] == 5
+    assert shared.counters[batch[2][:4]] == 2
+
+
+@pytest.mark.asyncio
+async def test_leased_backend_counts_bucket_amounts():
+    shared = _SharedCounter()
+    backend = LeasedRateLimitCounterBackend(
+        shared, lease_size=4, clock=_clock_at(_window())
+    )
+    capped = _bucket(10)
+    uncapped = _bucket(0, scope_value="k-2")
+
+    assert await backend.increment_many([capped]) == [1]
+    assert await backend.increment_many(
+        [capped._replace(amount=3), uncapped._replace(amount=2), uncapped]
+    ) == [4, 2, 3]
+    # The lease reserved up to 4 and the batch of 3 was refilled on top.
+    assert shared.counters[capped[:4]] == 8
+    # Eight more hits do not fit under the cap of 10: past it, hence rejected.
+    assert await backend.increment_many([capped._replace(amount=8)]) == [17]
+
+
+@pytest.mark.asyncio
+async def test_leased_backend_refunds_reserved_values_to_the_shared_counter():
+    shared = _SharedCounter()
+    backend = LeasedRateLimitCounterBackend(
+        shared, lease_size=1, clock=_clock_at(_window())
+    )
+    batch = [_bucket(5), _bucket(1, scope_value="k-2")]
+    await backend.increment_many(batch)
+
+    values = await backend.increment_many(batch)
+    await backend.refund_many(batch, values)
+
+    # k-1's 2 was within its cap and goes back; k-2's 2 was a local
+    # rejection past its cap that never reached the shared counter.
+    assert values == [2, 2]
+    assert shared.counters[batch[0][:4]] == 1
+    assert shared.counters[batch[1][:4]] == 1
+
+
+@pytest.mark.asyncio
+async def test_leased_backend_drops_leases_once_the_window_is_over():
+    shared = _SharedCounter()
+    now = [_window().timestamp() + 1]
+    backend = LeasedRateLimitCounterBackend(shared, lease_size=5, clock=lambda: now[0])
+
+    await backend.increment_many([_bucket(50)])
+    now[0] += 65
+    value = (await backend.increment_many([_bucket(50)]))[0]
+
+    # The stale lease's values 2..5 are abandoned, not handed out.
+    assert value == 6
+    assert shared.calls == 2
+
+
+def test_build_backend_wraps_shared_backend_when_leasing():
+    repository = MagicMock(spec=AbuseLimitCounterRepository)
+
+    backend = build_rate_limit_counter_backend(
+        repository=repository,
+        backend_name="database",
+        redis_url=None,
+        redis_key_prefix="game:rl:",
+        lease_size=16,
+    )
+
+    assert isinstance(backend, LeasedRateLimitCounterBackend)
+    assert isinstance(backend._backend, DatabaseRateLimitCounterBackend)
@@ -13,6 +13,7 @@ import uuid
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from typing import Dict, List, Optional
+from unittest.mock import AsyncMock
 
 from app.core.exceptions import (
     BadRequestError,
@@ -665,6 +666,23 @@ class TestRollback(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.strategy.id, v1.id)
         self.assertEqual(self.games.rows, [f"custom:{v1.id}"])
 
+    async def test_lifecycle_changes_invalidate_metadata_cache(self):
+        cache = SimpleNamespace(
+            invalidate_strategies=AsyncMock(),
+            invalidate_strategy_assignments=AsyncMock(),
+        )
+        self.service.metadata_cache = cache
+        _, v2 = await self._build_two_versions()
+
+        # publish(v1) and publish(v2) each drop the realm's definitions.
+        self.assertEqual(cache.invalidate_strategies.await_count, 2)
+        cache.invalidate_strategy_assignments.assert_not_awaited()
+
+        await self.service.rollback(id=v2.id, target_version=1, realmId="realm-a")
+
+        cache.invalidate_strategies.assert_awaited_with("realm-a")
+        cache.invalidate_strategy_assignments.assert_awaited_once()
+
     async def test_rollback_requires_assignment_repositories(self):
         """Without game/task repos wired the cascade would silently
         skip - refuse the operation up front."""
@@ -0,0 +1,128 @@
+"""
+StrategyReplayService behavioural tests.
+
+The repositories are mocked with in-memory row streams; the replay engine
+itself runs for real (in-process), so these tests check how rows become
+replay events and how the report is put together.
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.exceptions import BadRequestError
+from app.services.strategy_replay_service import StrategyReplayService
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _row(seconds, user="u-1", points=1, case="default", data=None):
+    return SimpleNamespace(
+        created_at=START + timedelta(seconds=seconds),
+        externalTaskId="t-1",
+        externalUserId=user,
+        points=points,
+        caseName=case,
+        data=data,
+    )
+
+
+def _rows(rows):
+    async def stream(*args, **kwargs):
+        for row in rows(*args, **kwargs):
+            yield row
+
+    return stream
+
+
+@pytest.fixture
+def service():
+    game_repository = MagicMock()
+    game_repository.read_by_id = AsyncMock(
+        return_value=SimpleNamespace(externalGameId="g-1")
+    )
+    strategy_service = MagicMock()
+    strategy_service.resolve = AsyncMock(
+        return_value={"kind": "BUILT_IN", "id": "default", "instance": object()}
+    )
+    points = [
+        _row(0),
+        _row(30),
+        _row(60, points=7, case="External_points_assigned"),
+        _row(90),
+    ]
+
+    def points_rows(gameId, *, since=None, until=None, with_payload=True):
+        return [
+            row
+            for row in points
+            if (since is None or row.created_at >= since)
+            and (until is None or row.created_at < until)
+        ]
+
+    user_points_repository = MagicMock()
+    user_points_repository.stream_game_points = _rows(points_rows)
+    user_actions_repository = MagicMock()
+    user_actions_repository.stream_game_actions = _rows(
+        lambda externalGameId, since=None, until=None: [_row(45, user="u-2")]
+    )
+    return StrategyReplayService(
+        game_repository=game_repository,
+        user_points_repository=user_points_repository,
+        user_actions_repository=user_actions_repository,
+        strategy_service=strategy_service,
+    )
+
+
+@pytest.mark.asyncio
+async def test_replay_scores_the_window_and_skips_direct_assignments(service):
+    report = await service.replay(
+        gameId="game-1", strategyId="default", since=START + timedelta(seconds=20)
+    )
+
+    assert report["externalGameId"] == "g-1"
+    assert report["since"] == (START + timedelta(seconds=20)).isoformat()
+    assert report["events"] == 2
+    assert report["skippedDirectAssignments"] == 1
+    assert report["actualPoints"] == 2
+    assert report["errors"] == {}
+    service.strategy_service.resolve.assert_awaited_once_with("default", realmId=None)
+
+
+@pytest.mark.asyncio
+async def test_replay_includes_game_tagged_user_actions_on_request(service):
+    without = await service.replay(gameId="game-1", strategyId="default")
+    with_actions = await service.replay(
+        gameId="game-1", strategyId="default", include_user_actions=True
+    )
+
+    assert without["events"] == 3
+    assert with_actions["events"] == 4
+    assert with_actions["actualPoints"] == without["actualPoints"]
+    assert {row["externalUserId"] for row in with_actions["largestUserDeltas"]} == {
+        "u-1",
+        "u-2",
+    }
+
+
+@pytest.mark.asyncio
+async def test_replay_rejects_an_empty_window(service):
+    with pytest.raises(BadRequestError):
+        await service.replay(
+            gameId="game-1", strategyId="default", since=START, until=START
+        )
+
+
+@pytest.mark.asyncio
+async def test_replay_reports_strategies_it_cannot_model_as_bad_requests(service):
+    service.strategy_service.resolve.return_value = {
+        "kind": "BUILT_IN",
+        "id": "greencrowdStrategy",
+        "instance": object(),
+    }
+
+    with pytest.raises(BadRequestError) as ctx:
+        await service.replay(gameId="game-1", strategyId="greencrowdStrategy")
+    assert "cannot be replayed" in ctx.value.detail
@@ -1,7 +1,12 @@
+import asyncio
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.core.exceptions import NotFoundError
+from app.engine import dsl_strategy
+from app.engine.all_engine_strategies import _strategy_metadata
+from app.engine.dsl_interpreter import DslInterpreter
+from app.schema.strategy_definition_schema import StrategyDefinitionRead
 from app.services.strategy_service import (
     CUSTOM_STRATEGY_PREFIX,
     StrategyService,
@@ -56,12 +61,15 @@ class TestStrategyService(unittest.TestCase):
         self.assertIsNone(self.service._repository)
 
     @patch(
-        "app.services.strategy_service.all_engine_strategies",
-        return_value=[FakeStrategyDefault(), FakeStrategySocioBee()],
+        "app.services.strategy_service.engine_strategy_metadata",
+        return_value=[
+            _strategy_metadata(FakeStrategyDefault()),
+            _strategy_metadata(FakeStrategySocioBee()),
+        ],
     )
     async def test_list_all_strategies_returns_cleaned_strategy_payloads(
         self,
-        _mock_all_engine_strategies,
+        _mock_engine_strategy,
     ):
         result = await self.service.list_all_strategies()
 
@@ -96,24 +104,21 @@ class TestStrategyService(unittest.TestCase):
         )
 
     @patch(
-        "app.services.strategy_service.all_engine_strategies",
-        return_value=[FakeStrategyDefault(), FakeStrategySocioBee()],
+        "app.services.strategy_service.engine_strategy",
+        return_value=FakeStrategySocioBee(),
     )
     async def test_get_class_by_id_returns_strategy_instance(
         self,
-        _mock_all_engine_strategies,
+        _mock_engine_strategy,
     ):
         result = await self.service.get_Class_by_id("socio_bee")
 
         self.assertIsInstance(result, FakeStrategySocioBee)
 
-    @patch(
-        "app.services.strategy_service.all_engine_strategies",
-        return_value=[FakeStrategyDefault()],
-    )
+    @patch("app.services.strategy_service.engine_strategy", return_value=None)
     async def test_get_class_by_id_raises_not_found_when_missing(
         self,
-        _mock_all_engine_strategies,
+        _mock_engine_strategy,
     ):
         with self.assertRaises(NotFoundError) as context:
             await self.service.get_Class_by_id("missing")
@@ -146,8 +151,8 @@ class TestStrategyServiceCompatLayer(unittest.IsolatedAsyncioTestCase):
         instance = MagicMock()
         instance.id = "default"
         with patch(
-            "app.services.strategy_service.all_engine_strategies",
-            return_value=[instance],
+            "app.services.strategy_service.engine_strategy",
+            return_value=instance,
         ):
             resolved = await service.resolve("default")
 
@@ -177,5 +182,118 @@ class TestStrategyServiceCompatLayer(unittest.IsolatedAsyncioTestCase):
             await service.resolve(f"{CUSTOM_STRATEGY_PREFIX}uuid-1", realmId="realm-a")
 
 
+def _definition(status="PUBLISHED", id="pub-1"):
+    return StrategyDefinitionRead(
+        id=id,
+        realmId="realm-a",
+        name="custom-1",
+        type="DSL_FULL",
+        astJson={
+            "type": "program",
+            "id": "p",
+            "rules": [
+                {
+                    "type": "rule",
+                    "id": "r1",
+                    "when": {"type": "literal", "id": "lt", "value": True},
+                    "then": [
+                        {
+                            "type": "assign_points",
+                            "id": "a1",
+                            "value": {
+                                "type": "field",
+                                "id": "f1",
+                                "path": "data.points",
+                            },
+                            "case_name": "C",
+                        }
+                    ],
+                }
+            ],
+        },
+        version=3,
+        status=status,
+    )
+
+
+class TestPublishedStrategyReuse(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        dsl_strategy._PUBLISHED_STRATEGY_CACHE.clear()
+        self.definition_service = MagicMock()
+        self.observer = MagicMock()
+        self.observer.record = AsyncMock()
+        self.service = StrategyService(
+            strategy_definition_service=self.definition_service,
+            dsl_interpreter=DslInterpreter(max_nodes=100, max_depth=8),
+            analytics_service=MagicMock(),
+            execution_observer=self.observer,
+        )
+
+    def tearDown(self):
+        dsl_strategy._PUBLISHED_STRATEGY_CACHE.clear()
+
+    async def test_published_strategy_is_built_once_and_reused(self):
+        self.definition_service.get_strategy = AsyncMock(return_value=_definition())
+
+        first = await self.service.get_strategy_instance(
+            f"{CUSTOM_STRATEGY_PREFIX}pub-1", realmId="realm-a"
+        )
+        second = await self.service.get_strategy_instance(
+            f"{CUSTOM_STRATEGY_PREFIX}pub-1", realmId="realm-a"
+        )
+
+        self.assertIs(first, second)
+        self.assertEqual(first._field_paths, frozenset({"data.points"}))
+        self.definition_service.get_strategy.assert_awaited_once()
+
+    async def test_drafts_are_rebuilt_on_every_call(self):
+        self.definition_service.get_strategy = AsyncMock(
+            return_value=_definition(status="DRAFT")
+        )
+
+        for _ in range(2):
+            await self.service.get_strategy_instance(
+                f"{CUSTOM_STRATEGY_PREFIX}pub-1", realmId="realm-a"
+            )
+
+        self.assertEqual(self.definition_service.get_strategy.await_count, 2)
+
+    async def test_invalidation_is_scoped_to_the_realm(self):
+        self.definition_service.get_strategy = AsyncMock(return_value=_definition())
+        for realm in ("realm-a", "realm-b"):
+            await self.service.get_strategy_instance(
+                f"{CUSTOM_STRATEGY_PREFIX}pub-1", realmId=realm
+            )
+
+        dsl_strategy.invalidate_published_strategies("realm-a")
+
+        self.assertIsNone(
+            dsl_strategy.get_cached_published_strategy("realm-a", "pub-1")
+        )
+        self.assertIsNotNone(
+            dsl_strategy.get_cached_published_strategy("realm-b", "pub-1")
+        )
+
+    async def test_reused_strategy_reports_a_separate_trace_per_call(self):
+        self.definition_service.get_strategy = AsyncMock(return_value=_definition())
+        strategy = await self.service.get_strategy_instance(
+            f"{CUSTOM_STRATEGY_PREFIX}pub-1", realmId="realm-a"
+        )
+
+        await asyncio.gather(
+            strategy.calculate_points("g", "t", "u", {"points": 4}),
+            strategy.calculate_points("g", "t", "u", {"points": 6}),
+        )
+
+        calls = self.observer.record.await_args_list
+        self.assertEqual(sorted(call.kwargs["points"] for call in calls), [4.0, 6.0])
+        self.assertEqual(
+            calls[0].kwargs["nodesExecuted"], calls[1].kwargs["nodesExecuted"]
+        )
+        self.assertEqual(
+            len(calls[0].kwargs["trace"]), calls[0].kwargs["nodesExecuted"]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
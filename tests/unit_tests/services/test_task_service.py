@@ -157,10 +157,9 @@ class TestTaskService(unittest.IsolatedAsyncioTestCase):
             CreateTaskParams(key="t_float", value="6.5"),
             CreateTaskParams(key="t_str", value="alpha"),
         ]
-        self.task_params_repository.read_by_column.side_effect = [
-            task_params_for_task_1,
-            None,
-        ]
+        self.task_params_repository.read_by_taskIds.return_value = {
+            task_id_1: task_params_for_task_1
+        }
 
         result = await self.service.get_tasks_list_by_gameId(game_id, find_query)
 
@@ -177,6 +176,43 @@ class TestTaskService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(first_task["gameParams"], game_params)
         self.assertEqual(first_task["taskParams"], task_params_for_task_1)
         self.assertEqual(second_task["taskParams"], [])
+        self.task_params_repository.read_by_taskIds.assert_awaited_once_with(
+            [task_id_1, task_id_2]
+        )
+        self.task_params_repository.read_by_column.assert_not_called()
+
+    async def test_get_tasks_list_by_game_id_resolves_each_strategy_once(self):
+        game_id = uuid4()
+        self.game_repository.read_by_id.return_value = self._game(game_id)
+        tasks = [
+            self._task(uuid4(), external_task_id=f"task-{index}") for index in range(3)
+        ]
+        self.task_repository.read_by_gameId.return_value = {"items": tasks}
+        self.strategy_service_instance.get_strategy_by_id.side_effect = (
+            lambda strategy_id: self._strategy_payload(
+                strategy_id=strategy_id, variables={"t_int": 0, "g_int": 0}
+            )
+        )
+        self.game_params_repository.read_by_column.return_value = [
+            CreateGameParams(key="g_int", value="4")
+        ]
+        self.task_params_repository.read_by_taskIds.return_value = {
+            tasks[0].id: [CreateTaskParams(key="t_int", value="9")]
+        }
+
+        result = await self.service.get_tasks_list_by_gameId(
+            game_id, PostFindTask(ordering="-created_at", page=1, page_size=10)
+        )
+
+        # Once for the game, once for the tasks' shared strategy.
+        self.assertEqual(
+            self.strategy_service_instance.get_strategy_by_id.call_count, 2
+        )
+        variables = [item["strategy"]["variables"] for item in result["items"]]
+        self.assertEqual(variables[0], {"t_int": 9, "g_int": 4})
+        # Task params of one task do not leak into its siblings.
+        self.assertEqual(variables[1], {"t_int": 0, "g_int": 4})
+        self.assertIsNot(variables[1], variables[2])
 
     async def test_get_task_by_game_id_external_task_id_raises_when_game_missing(self):
         self.game_repository.read_by_id.return_value = None
@@ -752,6 +788,20 @@ class TestTaskServiceDeleteAndDuplicate(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.externalTaskId, "task-1")
         self.task_repository.delete_task_by_id.assert_awaited_once_with(task_id)
 
+    async def test_delete_task_by_id_invalidates_metadata_cache(self):
+        game_id = uuid4()
+        task_id = uuid4()
+        self.service.metadata_cache = SimpleNamespace(invalidate_task=AsyncMock())
+        self.game_repository.read_by_id.return_value = SimpleNamespace(id=game_id)
+        self.task_repository.read_by_id.return_value = self._make_task(task_id, game_id)
+        self.task_repository.delete_task_by_id.return_value = True
+
+        await self.service.delete_task_by_id(game_id, task_id)
+
+        self.service.metadata_cache.invalidate_task.assert_awaited_once_with(
+            game_id, "task-1"
+        )
+
     async def test_delete_task_by_id_raises_when_game_missing(self):
         self.game_repository.read_by_id.return_value = None
 
@@ -75,6 +75,23 @@ class TestUserPointsAnalyticsService(unittest.IsolatedAsyncioTestCase):
             9.9,
         )
 
+    async def test_snapshot_methods_delegate_in_one_repository_call(self):
+        self.repo.get_scoring_snapshot.return_value = "scoring"
+        self.repo.get_effort_snapshot.return_value = "effort"
+
+        self.assertEqual(
+            await self.service.get_scoring_snapshot("game", "task", "user"),
+            "scoring",
+        )
+        self.assertEqual(
+            await self.service.get_effort_snapshot("game", "task", "user", 1),
+            "effort",
+        )
+        self.repo.get_scoring_snapshot.assert_awaited_once_with("game", "task", "user")
+        self.repo.get_effort_snapshot.assert_awaited_once_with(
+            "game", "task", "user", 1
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,19 @@
 import unittest
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
 
 from app.core.exceptions import (
+    ForbiddenError,
     InternalServerError,
     NotFoundError,
     PreconditionFailedError,
 )
 from app.schema.user_points_schema import PointsByUserInTask
+from app.services.metadata_cache import (
+    InMemoryMetadataCacheBackend,
+    ScoringMetadataCache,
+)
 from app.services.user_points_service import UserPointsService
 
 
@@ -69,9 +75,8 @@ class TestUserPointsService(unittest.IsolatedAsyncioTestCase):
         self.users_repository.read_by_column.return_value = SimpleNamespace(
             id="user-1", externalUserId="user_1"
         )
-        self.user_points_repository.create = AsyncMock(
-            return_value=SimpleNamespace(created_at="2026-02-09T00:00:00")
-        )
+        user_points = SimpleNamespace(created_at="2026-02-09T00:00:00")
+        self.user_points_repository.create = AsyncMock(return_value=user_points)
         wallet = SimpleNamespace(id="wallet-1", pointsBalance=10)
         self.wallet_repository.upsert_points_balance.return_value = wallet
         self.wallet_transaction_repository.create = AsyncMock(
@@ -87,6 +92,45 @@ class TestUserPointsService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(response.caseName, "External_points_assigned")
         self.wallet_repository.upsert_points_balance.assert_called_once()
         self.wallet_transaction_repository.create.assert_awaited_once()
+        record_awards = self.user_points_repository.task_stats_repository.record_awards
+        record_awards.assert_awaited_once_with(
+            [user_points], session=self._db_session, auto_commit=False
+        )
+        leaderboard = self.user_points_repository.leaderboard_repository
+        leaderboard.record_awards.assert_awaited_once_with(
+            "game-1", [user_points], session=self._db_session, auto_commit=False
+        )
+
+    async def test_persist_mirrors_committed_award_to_leaderboard_backend(self):
+        user_points = SimpleNamespace(created_at="2026-02-09T00:00:00")
+        self.user_points_repository.create = AsyncMock(return_value=user_points)
+        self.wallet_transaction_repository.create = AsyncMock(
+            return_value=SimpleNamespace(id="txn-1")
+        )
+        self.service.leaderboard_backend = AsyncMock()
+        self.service.leaderboard_backend.record.side_effect = ConnectionError("down")
+
+        result = await self.service._persist_points_wallet_and_transaction(
+            user_id="user-1",
+            task_id="task-1",
+            points=5,
+            case_name="Case",
+            data_to_add={},
+            description="desc",
+            api_key="api-key",
+            external_user_id="user_1",
+            external_task_id="task-external-1",
+            game_id="game-1",
+        )
+
+        self.assertIs(result[0], user_points)
+        self._db_session.commit.assert_awaited_once()
+        self.service.leaderboard_backend.record.assert_awaited_once_with(
+            "game-1", [user_points]
+        )
+        self.service.leaderboard_backend.discard.assert_awaited_once_with(
+            "game-1", [user_points]
+        )
 
     async def test_assign_points_to_user_raises_internal_error_when_case_name_missing(
         self,
@@ -138,69 +182,63 @@ class TestUserPointsService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result[0].externalTaskId, "task-external-1")
         self.assertEqual(result[1].externalTaskId, "task-external-2")
 
+    @staticmethod
+    def _user_game_task_row(externalGameId, externalTaskId, points, timesAwarded):
+        return SimpleNamespace(
+            gameId=f"id-{externalGameId}",
+            externalGameId=externalGameId,
+            gameCreatedAt="2026-01-01T00:00:00",
+            apiKey_used="key-1",
+            oauth_user_id=None,
+            externalTaskId=externalTaskId,
+            points=points,
+            timesAwarded=timesAwarded,
+            pointsData=[
+                {
+                    "points": points,
+                    "caseName": "rule",
+                    "created_at": "2026-02-01T00:00:00",
+                }
+            ],
+        )
+
     async def test_get_all_points_by_external_user_id_aggregates_all_games(self):
         self.users_repository.read_by_column.return_value = SimpleNamespace(id="user-1")
-        self.user_points_repository.get_task_by_externalUserId.return_value = [
-            SimpleNamespace(gameId="game-1"),
-            SimpleNamespace(gameId="game-2"),
-        ]
-        self.game_repository.read_by_column.side_effect = [
-            SimpleNamespace(id="game-1"),
-            SimpleNamespace(id="game-2"),
+        self.user_points_repository.get_user_points_by_game_and_task.return_value = [
+            self._user_game_task_row("external-game-1", "task-external-1", 7, 1),
+            self._user_game_task_row("external-game-1", "task-external-3", 0, 1),
+            self._user_game_task_row("external-game-2", "task-external-2", 5, 2),
         ]
-        game_one_detail = SimpleNamespace(
-            externalGameId="external-game-1",
-            task=[
-                SimpleNamespace(
-                    externalTaskId="task-external-1",
-                    points=[
-                        SimpleNamespace(
-                            externalUserId="user_1",
-                            points=7,
-                            timesAwarded=1,
-                            pointsData=[
-                                {
-                                    "points": 7,
-                                    "caseName": "rule_1",
-                                    "created_at": "2026-02-01T00:00:00",
-                                }
-                            ],
-                        )
-                    ],
-                )
-            ],
-        )
-        game_two_detail = SimpleNamespace(
-            externalGameId="external-game-2",
-            task=[
-                SimpleNamespace(
-                    externalTaskId="task-external-2",
-                    points=[
-                        SimpleNamespace(
-                            externalUserId="user_1",
-                            points=5,
-                            timesAwarded=2,
-                            pointsData=[
-                                {
-                                    "points": 5,
-                                    "caseName": "rule_2",
-                                    "created_at": "2026-02-02T00:00:00",
-                                }
-                            ],
-                        )
-                    ],
-                )
-            ],
-        )
-        self.service.get_points_by_gameId_with_details = AsyncMock(
-            side_effect=[game_one_detail, game_two_detail]
-        )
+        self.service.get_points_by_gameId_with_details = AsyncMock()
 
         result = await self.service.get_all_points_by_externalUserId("user_1")
 
         self.assertEqual(result.points, 12)
-        self.assertEqual(result.timesAwarded, 3)
-        self.assertEqual(len(result.games), 2)
+        self.assertEqual(result.timesAwarded, 4)
+        self.assertEqual(
+            [(game.externalGameId, game.points) for game in result.games],
+            [("external-game-1", 7), ("external-game-2", 5)],
+        )
+        self.assertEqual(result.games[0].tasks[0].externalTaskId, "task-external-1")
+        # The user's own rows only: no per-game, all-users aggregation.
+        self.service.get_points_by_gameId_with_details.assert_not_called()
+        self.game_repository.read_by_column.assert_not_called()
+
+    async def test_get_all_points_by_external_user_id_checks_each_game_scope(self):
+        self.users_repository.read_by_column.return_value = SimpleNamespace(
+            id="user-1", apiKey_used="key-1"
+        )
+        foreign = self._user_game_task_row("external-game-2", "task-external-2", 5, 1)
+        foreign.apiKey_used = "key-2"
+        self.user_points_repository.get_user_points_by_game_and_task.return_value = [
+            self._user_game_task_row("external-game-1", "task-external-1", 7, 1),
+            foreign,
+        ]
+
+        with self.assertRaises(ForbiddenError):
+            await self.service.get_all_points_by_externalUserId(
+                "user_1", api_key="key-1", enforce_scope=True
+            )
 
     def test_extract_points_supports_dict_and_object(self):
         self.assertEqual(UserPointsService._extract_points({"points": 4}), 4)
@@ -235,39 +273,54 @@ class TestUserPointsService(unittest.IsolatedAsyncioTestCase):
     async def test_get_users_by_game_id_returns_task_users_and_first_action(self):
         self.game_repository.read_by_column.return_value = SimpleNamespace(id="game-1")
         self.task_repository.read_by_column.return_value = [
-            SimpleNamespace(id="task-1", externalTaskId="task-ext-1")
+            SimpleNamespace(id="task-2", externalTaskId="task-ext-2"),
+            SimpleNamespace(id="task-1", externalTaskId="task-ext-1"),
         ]
-        self.user_points_repository.get_points_and_users_by_taskId.return_value = [
-            SimpleNamespace(externalUserId="user_1", userId="user-id-1")
+        self.user_points_repository.get_first_actions_by_taskIds.return_value = [
+            SimpleNamespace(
+                taskId="task-1",
+                externalUserId="user_1",
+                userCreatedAt="2026-01-01T00:00:00",
+                firstAction="2026-01-02T00:00:00",
+            )
         ]
-        self.users_repository.read_by_column.return_value = SimpleNamespace(
-            externalUserId="user_1", created_at="2026-01-01T00:00:00"
-        )
-        self.user_points_repository.get_first_user_points_in_external_task_id_by_user_id.return_value = SimpleNamespace(  # noqa
-            created_at="2026-01-02T00:00:00"
-        )
 
         result = await self.service.get_users_by_gameId(self.GAME_UUID)
 
         self.assertEqual(str(result.gameId), self.GAME_UUID)
-        self.assertEqual(result.tasks[0].externalTaskId, "task-ext-1")
+        self.assertEqual(
+            [task.externalTaskId for task in result.tasks],
+            ["task-ext-1", "task-ext-2"],
+        )
         self.assertEqual(result.tasks[0].users[0].externalUserId, "user_1")
+        self.assertEqual(result.tasks[0].users[0].created_at, "2026-01-01T00:00:00")
         self.assertEqual(result.tasks[0].users[0].firstAction, "2026-01-02T00:00:00")
+        self.assertEqual(result.tasks[1].users, [])
+        # One set-based query for every task; no per-user lookups.
+        self.user_points_repository.get_first_actions_by_taskIds.assert_awaited_once_with(
+            ["task-1", "task-2"]
+        )
+        self.users_repository.read_by_column.assert_not_called()
 
-    async def test_get_users_by_game_id_raises_when_point_user_lookup_returns_none(
-        self,
-    ):
+    async def test_get_users_by_game_id_pages_over_tasks(self):
         self.game_repository.read_by_column.return_value = SimpleNamespace(id="game-1")
         self.task_repository.read_by_column.return_value = [
-            SimpleNamespace(id="task-1", externalTaskId="task-ext-1")
+            SimpleNamespace(id=f"task-{i}", externalTaskId=f"task-ext-{i}")
+            for i in range(5)
         ]
-        self.user_points_repository.get_points_and_users_by_taskId.return_value = [
-            SimpleNamespace(externalUserId="missing_user", userId="user-id-404")
-        ]
-        self.users_repository.read_by_column.return_value = None
+        self.user_points_repository.get_first_actions_by_taskIds.return_value = []
 
-        with self.assertRaises(NotFoundError):
-            await self.service.get_users_by_gameId(self.GAME_UUID)
+        result = await self.service.get_users_by_gameId(
+            self.GAME_UUID, page=2, page_size=2
+        )
+
+        self.assertEqual(
+            [task.externalTaskId for task in result.tasks],
+            ["task-ext-2", "task-ext-3"],
+        )
+        self.user_points_repository.get_first_actions_by_taskIds.assert_awaited_once_with(
+            ["task-2", "task-3"]
+        )
 
     async def test_get_points_by_user_list_aggregates_each_user(self):
         self.service.get_all_points_by_externalUserId = AsyncMock(
@@ -288,53 +341,27 @@ class TestUserPointsService(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(NotFoundError):
             await self.service.get_points_by_externalUserId("missing_user")
 
-    async def test_get_points_by_external_user_id_filters_target_user(self):
+    async def test_get_points_by_external_user_id_returns_one_entry_per_task(self):
         self.users_repository.read_by_column.return_value = SimpleNamespace(
             id="user-id-1", externalUserId="user_1"
         )
-        self.user_points_repository.get_task_by_externalUserId.return_value = [
-            SimpleNamespace(gameId="game-1")
+        self.user_points_repository.get_user_points_by_game_and_task.return_value = [
+            self._user_game_task_row("external-game-1", "task-ext-1", 11, 2),
+            self._user_game_task_row("external-game-1", "task-ext-2", 3, 1),
         ]
-        self.game_repository.read_by_column.return_value = SimpleNamespace(id="game-1")
-        self.service.get_points_by_gameId_with_details = AsyncMock(
-            return_value=SimpleNamespace(
-                externalGameId="external-game-1",
-                created_at="2026-01-01T00:00:00",
-                task=[
-                    SimpleNamespace(
-                        externalTaskId="task-ext-1",
-                        points=[
-                            SimpleNamespace(
-                                externalUserId="user_1",
-                                points=11,
-                                timesAwarded=2,
-                                pointsData=[
-                                    {
-                                        "points": 11,
-                                        "caseName": "caseA",
-                                        "created_at": "2026-01-01T00:00:00",
-                                    }
-                                ],
-                            ),
-                            SimpleNamespace(
-                                externalUserId="other-user",
-                                points=50,
-                                timesAwarded=5,
-                                pointsData=[],
-                            ),
-                        ],
-                    )
-                ],
-            )
-        )
 
         result = await self.service.get_points_by_externalUserId("user_1")
 
-        self.assertEqual(len(result), 1)
+        self.assertEqual(len(result), 2)
         self.assertEqual(result[0].externalGameId, "external-game-1")
+        self.assertEqual(result[0].created_at, "2026-01-01T00:00:00")
         self.assertEqual(result[0].task[0].externalTaskId, "task-ext-1")
         self.assertEqual(result[0].task[0].points[0].externalUserId, "user_1")
         self.assertEqual(result[0].task[0].points[0].points, 11)
+        self.assertEqual(result[1].task[0].externalTaskId, "task-ext-2")
+        self.user_points_repository.get_user_points_by_game_and_task.assert_awaited_once_with(
+            "user_1"
+        )
 
     async def test_get_points_by_game_id_raises_when_tasks_not_found(self):
         self.game_repository.read_by_column.return_value = SimpleNamespace(id="game-1")
@@ -617,6 +644,56 @@ class TestUserPointsService(unittest.IsolatedAsyncioTestCase):
         self.assertIn("callbackData", schema.data)
         self.wallet_repository.upsert_points_balance.assert_called_once()
 
+    async def test_assign_points_to_user_reads_game_and_task_through_metadata_cache(
+        self,
+    ):
+        class FixedStrategy:
+            async def calculate_points(
+                self, externalGameId, externalTaskId, externalUserId, data
+            ):  # noqa
+                return (3, "case", {})
+
+        self.service.metadata_cache = ScoringMetadataCache(
+            InMemoryMetadataCacheBackend(), ttl_seconds=30
+        )
+        self.game_repository.read_by_column.return_value = SimpleNamespace(
+            id=UUID(self.GAME_UUID), externalGameId="external-game-1"
+        )
+        self.task_repository.read_by_gameId_and_externalTaskId.return_value = (
+            SimpleNamespace(
+                id=UUID("00000000-0000-0000-0000-000000000002"),
+                externalTaskId="task-external-1",
+                gameId=UUID(self.GAME_UUID),
+                strategyId="strategy-1",
+                status="open",
+            )
+        )
+        self.service.strategy_service.get_Class_by_id = MagicMock(
+            return_value=FixedStrategy()
+        )
+        self.users_repository.read_by_column.return_value = SimpleNamespace(
+            id="user-id-1", externalUserId="user_1"
+        )
+        self.user_points_repository.create = AsyncMock(
+            return_value=SimpleNamespace(created_at="2026-02-09T00:00:00")
+        )
+        self.wallet_transaction_repository.create = AsyncMock(
+            return_value=SimpleNamespace(id="txn-1")
+        )
+
+        for _ in range(2):
+            result = await self.service.assign_points_to_user(
+                self.GAME_UUID,
+                "task-external-1",
+                SimpleNamespace(externalUserId="user_1", data={}),
+                False,
+                "api-key",
+            )
+            self.assertEqual(result.points, 3)
+
+        self.game_repository.read_by_column.assert_awaited_once()
+        self.task_repository.read_by_gameId_and_externalTaskId.assert_awaited_once()
+
     async def test_assign_points_to_user_raises_when_task_not_found(self):
         self.game_repository.read_by_column.return_value = SimpleNamespace(
             id="game-1", externalGameId="external-game-1"
@@ -937,6 +1014,44 @@ class TestUserPointsService(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result[0]["group"], "dynamic_calculation")
         self.users_game_config_repository.create.assert_awaited_once()
 
+    async def test_get_points_simulated_of_user_in_game_uses_simulate_tasks_hook(self):
+        calls = []
+
+        class GameLevelStrategy:
+            async def simulate_tasks(
+                self, tasks, externalUserId, user, userGroup, user_last_task
+            ):
+                calls.append([task.id for task in tasks])
+                return [{"externalTaskId": task.externalTaskId} for task in tasks]
+
+            def simulate_strategy(self, data_to_simulate, userGroup, user_last_task):
+                raise AssertionError("per-task simulation should not run")
+
+        self.game_repository.read_by_column.return_value = SimpleNamespace(
+            id="game-1", externalGameId="external-game-1"
+        )
+        self.task_repository.read_by_column.return_value = [
+            SimpleNamespace(id="task-1", strategyId="strategy-1", externalTaskId="t-1"),
+            SimpleNamespace(id="task-2", strategyId="strategy-1", externalTaskId="t-2"),
+        ]
+        self.service.strategy_service.get_strategy_by_id = MagicMock(
+            return_value=object()
+        )
+        self.users_repository.read_by_column.return_value = SimpleNamespace(
+            id="user-id-1", externalUserId="user_1"
+        )
+        self.user_points_repository.get_last_task_by_userId.return_value = None
+        self.service.strategy_service.get_Class_by_id = MagicMock(
+            return_value=GameLevelStrategy()
+        )
+
+        result, _ = await self.service.get_points_simulated_of_user_in_game(
+            "game-1", "user_1"
+        )
+
+        self.assertEqual(calls, [["task-1", "task-2"]])
+        self.assertEqual(result, [{"externalTaskId": "t-1"}, {"externalTaskId": "t-2"}])
+
     async def test_get_points_simulated_of_user_in_game_raises_when_simulate_missing(
         self,
     ):
@@ -1078,6 +1193,262 @@ class TestUserPointsService(unittest.IsolatedAsyncioTestCase):
             [{"taskId": "task-1"}],
         )
 
+    def _setup_batch_assignment(self, strategy):
+        self.game_repository.read_by_column.return_value = SimpleNamespace(
+            id="game-1", externalGameId="external-game-1"
+        )
+        self.task_repository.read_by_gameId_and_externalTaskIds.return_value = {
+            "task-a": SimpleNamespace(id="task-a-id", strategyId="strategy-1"),
+            "task-b": SimpleNamespace(id="task-b-id", strategyId="strategy-1"),
+        }
+        self.users_repository.read_by_externalUserIds.return_value = {
+            "user_1": SimpleNamespace(id="user-id-1", externalUserId="user_1")
+        }
+        self.users_repository.create_users_by_externalUserIds.return_value = {
+            "user_2": SimpleNamespace(id="user-id-2", externalUserId="user_2")
+        }
+        self.service.strategy_service.get_Class_by_id = MagicMock(return_value=strategy)
+        self.user_points_repository.read_by_idempotency_keys = AsyncMock(
+            return_value={}
+        )
+        self.user_points_repository.create_many = AsyncMock(
+            side_effect=lambda schemas, **_: [
+                SimpleNamespace(
+                    created_at="2026-02-09T00:00:00",
+                    points=schema.points,
+                    caseName=schema.caseName,
+                    idempotencyKey=schema.idempotencyKey,
+                )
+                for schema in schemas
+            ]
+        )
+        self.wallet_repository.upsert_points_balances = AsyncMock(
+            return_value={"user-id-1": "wallet-1", "user-id-2": "wallet-2"}
+        )
+        self.wallet_transaction_repository.create_many = AsyncMock(return_value=[])
+
+    async def test_assign_points_batch_scores_and_persists_in_one_transaction(self):
+        class StrategyWithCaseName:
+            async def calculate_points(
+                self, externalGameId, externalTaskId, externalUserId, data
+            ):  # noqa
+                return (3, "CaseOk")
+
+        self._setup_batch_assignment(StrategyWithCaseName())
+        events = [
+            SimpleNamespace(externalTaskId="task-a", externalUserId="user_1", data={}),
+            SimpleNamespace(
+                externalTaskId="task-b", externalUserId="user_2", data=None
+            ),
+            SimpleNamespace(externalTaskId="task-a", externalUserId="user_1", data={}),
+        ]
+
+        result = await self.service.assign_points_to_users_batch(
+            self.GAME_UUID, events, "api-key"
+        )
+
+        self.assertEqual(result.succeeded, 3)
+        self.assertEqual(result.failed, 0)
+        self.assertEqual([item.index for item in result.results], [0, 1, 2])
+        self.assertFalse(result.results[0].result.isACreatedUser)
+        self.assertTrue(result.results[1].result.isACreatedUser)
+        self.task_repository.read_by_gameId_and_externalTaskIds.assert_awaited_once()
+        self.service.strategy_service.get_Class_by_id.assert_called_once_with(
+            "strategy-1"
+        )
+        self.user_points_repository.create_many.assert_awaited_once()
+        record_awards = self.user_points_repository.task_stats_repository.record_awards
+        record_awards.assert_awaited_once()
+        self.assertEqual(len(record_awards.await_args.args[0]), 3)
+        self.assertIs(record_awards.await_args.kwargs["session"], self._db_session)
+        leaderboard = self.user_points_repository.leaderboard_repository
+        leaderboard.record_awards.assert_awaited_once()
+        self.assertEqual(len(leaderboard.record_awards.await_args.args[1]), 3)
+        self.wallet_repository.upsert_points_balances.assert_awaited_once()
+        self.assertEqual(
+            self.wallet_repository.upsert_points_balances.await_args.kwargs[
+                "points_deltas"
+            ],
+            {"user-id-1": 6, "user-id-2": 3},
+        )
+        self._db_session.commit.assert_awaited_once()
+
+    async def test_assign_points_batch_reports_errors_per_event(self):
+        class StrategyRejectingUser2:
+            async def calculate_points(
+                self, externalGameId, externalTaskId, externalUserId, data
+            ):  # noqa
+                if externalUserId == "user_2":
+                    return (-1, "Rejected")
+                return (5, "CaseOk")
+
+        self._setup_batch_assignment(StrategyRejectingUser2())
+        events = [
+            SimpleNamespace(externalTaskId="missing", externalUserId="user_1", data={}),
+            SimpleNamespace(externalTaskId="task-a", externalUserId="user_2", data={}),
+            SimpleNamespace(externalTaskId="task-a", externalUserId="x", data={}),
+            SimpleNamespace(externalTaskId="task-a", externalUserId="user_1", data={}),
+        ]
+
+        result = await self.service.assign_points_to_users_batch(
+            self.GAME_UUID, events, "api-key"
+        )
+
+        self.assertEqual(result.succeeded, 1)
+        self.assertEqual(result.failed, 3)
+        self.assertEqual(result.results[0].statusCode, 404)
+        self.assertEqual(result.results[1].statusCode, 412)
+        self.assertEqual(result.results[1].error, "Rejected")
+        self.assertEqual(result.results[2].statusCode, 412)
+        self.assertEqual(result.results[3].result.points, 5)
+        self.users_repository.create_users_by_externalUserIds.assert_awaited_once_with(
+            ["user_2"]
+        )
+
+    async def test_assign_points_batch_marks_all_scored_events_failed_on_write_error(
+        self,
+    ):
+        class StrategyWithCaseName:
+            async def calculate_points(
+                self, externalGameId, externalTaskId, externalUserId, data
+            ):  # noqa
+                return (1, "CaseOk")
+
+        self._setup_batch_assignment(StrategyWithCaseName())
+        self.wallet_repository.upsert_points_balances.side_effect = RuntimeError("db")
+        events = [
+            SimpleNamespace(externalTaskId="task-a", externalUserId="user_1", data={}),
+            SimpleNamespace(externalTaskId="task-b", externalUserId="user_1", data={}),
+        ]
+
+        result = await self.service.assign_points_to_users_batch(
+            self.GAME_UUID, events, "api-key"
+        )
+
+        self.assertEqual(result.failed, 2)
+        self.assertTrue(all(item.statusCode == 500 for item in result.results))
+        self._db_session.rollback.assert_awaited_once()
+        self._db_session.commit.assert_not_awaited()
+
+    async def test_assign_points_batch_reuses_rows_for_repeated_idempotency_keys(self):
+        class StrategyWithCaseName:
+            async def calculate_points(
+                self, externalGameId, externalTaskId, externalUserId, data
+            ):  # noqa
+                return (2, "CaseOk")
+
+        self._setup_batch_assignment(StrategyWithCaseName())
+        self.user_points_repository.read_by_idempotency_keys.return_value = {
+            ("user-id-1", "task-a-id", "evt-1"): SimpleNamespace(
+                created_at="2026-02-01T00:00:00", points=7, caseName="Earlier"
+            )
+        }
+        events = [
+            SimpleNamespace(
+                externalTaskId="task-a",
+                externalUserId="user_1",
+                data={"eventId": "evt-1"},
+            ),
+            SimpleNamespace(
+                externalTaskId="task-b",
+                externalUserId="user_1",
+                data={"eventId": "evt-2"},
+            ),
+            SimpleNamespace(
+                externalTaskId="task-b",
+                externalUserId="user_1",
+                data={"eventId": "evt-2"},
+            ),
+        ]
+
+        result = await self.service.assign_points_to_users_batch(
+            self.GAME_UUID, events, "api-key"
+        )
+
+        self.assertEqual(result.succeeded, 3)
+        self.assertEqual(result.results[0].result.created_at, "2026-02-01T00:00:00")
+        # Answered from the stored row, not from this attempt's scoring.
+        self.assertEqual(result.results[0].result.points, 7)
+        self.assertEqual(result.results[0].result.caseName, "Earlier")
+        written = self.user_points_repository.create_many.await_args.args[0]
+        self.assertEqual(len(written), 1)
+        self.assertEqual(
+            self.wallet_repository.upsert_points_balances.await_args.kwargs[
+                "points_deltas"
+            ],
+            {"user-id-1": 2},
+        )
+
+    async def test_assign_points_batch_keeps_events_sharing_a_correlation_id(self):
+        class StrategyWithCaseName:
+            async def calculate_points(
+                self, externalGameId, externalTaskId, externalUserId, data
+            ):  # noqa
+                return (2, "CaseOk")
+
+        self._setup_batch_assignment(StrategyWithCaseName())
+        events = [
+            SimpleNamespace(
+                externalTaskId="task-a",
+                externalUserId="user_1",
+                data={"correlationId": "req-1"},
+            )
+            for _ in range(2)
+        ]
+
+        result = await self.service.assign_points_to_users_batch(
+            self.GAME_UUID, events, "api-key"
+        )
+
+        self.assertEqual(result.succeeded, 2)
+        written = self.user_points_repository.create_many.await_args.args[0]
+        self.assertEqual(
+            [schema.idempotencyKey for schema in written], ["req-1:0", "req-1:1"]
+        )
+        self.assertEqual(
+            self.wallet_repository.upsert_points_balances.await_args.kwargs[
+                "points_deltas"
+            ],
+            {"user-id-1": 4},
+        )
+        transactions = self.wallet_transaction_repository.create_many.await_args.args[0]
+        self.assertEqual(len(transactions), 2)
+
+    async def test_assign_points_batch_reads_game_through_metadata_cache(self):
+        class StrategyWithCaseName:
+            async def calculate_points(
+                self, externalGameId, externalTaskId, externalUserId, data
+            ):  # noqa
+                return (1, "CaseOk")
+
+        self._setup_batch_assignment(StrategyWithCaseName())
+        self.service.metadata_cache = ScoringMetadataCache(
+            InMemoryMetadataCacheBackend(), ttl_seconds=30
+        )
+        self.game_repository.read_by_column.return_value = SimpleNamespace(
+            id=UUID(self.GAME_UUID), externalGameId="external-game-1"
+        )
+        events = [
+            SimpleNamespace(externalTaskId="task-a", externalUserId="user_1", data={})
+        ]
+
+        for _ in range(2):
+            result = await self.service.assign_points_to_users_batch(
+                self.GAME_UUID, events, "api-key"
+            )
+            self.assertEqual(result.succeeded, 1)
+
+        self.game_repository.read_by_column.assert_awaited_once()
+
+    async def test_assign_points_batch_rejects_oversized_batches(self):
+        events = [
+            SimpleNamespace(externalTaskId="task-a", externalUserId="user_1", data={})
+        ] * 3
+        with patch("app.services.user_points.batch.configs.POINTS_BATCH_MAX_EVENTS", 2):
+            with self.assertRaises(PreconditionFailedError):
+                await self.service.assign_points_to_users_batch(self.GAME_UUID, events)
+        self.game_repository.read_by_column.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
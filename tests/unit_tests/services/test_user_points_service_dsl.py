@@ -29,6 +29,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 from app.engine.dsl_interpreter import DslInterpreter
 from app.schema.strategy_definition_schema import StrategyDefinitionRead
+from app.schema.user_points_schema import ScoringSnapshot
 from app.services.strategy_service import StrategyService
 from app.services.user_points_service import UserPointsService
 
@@ -97,19 +98,21 @@ class TestUserPointsServiceDslWiring(unittest.IsolatedAsyncioTestCase):
             )
         )
 
-        # ----- analytics service: configure all 6 methods as AsyncMocks so
-        # ExecutionContext.build_for_ast can await them. ``task=1`` triggers
-        # rule 1 (BasicEngagement) so the test asserts the simplest branch.
+        # ----- analytics service: the template's fields are all covered by
+        # the scoring snapshot, so ExecutionContext.build_for_ast awaits one
+        # ``get_scoring_snapshot``. ``task=1`` triggers rule 1
+        # (BasicEngagement) so the test asserts the simplest branch.
         self.analytics_service = MagicMock()
-        for method, value in {
-            "count_measurements_by_external_task_id": 1,
-            "get_user_task_measurements_count": 0,
-            "get_avg_time_between_tasks_by_user_and_game_task": 0,
-            "get_avg_time_between_tasks_for_all_users": 0,
-            "get_last_window_time_diff": 0,
-            "get_new_last_window_time_diff": 0,
-        }.items():
-            setattr(self.analytics_service, method, AsyncMock(return_value=value))
+        self.analytics_service.get_scoring_snapshot = AsyncMock(
+            return_value=ScoringSnapshot(
+                task_measurements_count=1,
+                user_task_measurements_count=0,
+                user_avg_time_between_tasks=0,
+                all_avg_time_between_tasks=0,
+                last_window_time_diff=0,
+                new_last_window_time_diff=0,
+            )
+        )
 
         # ----- strategy_service: real instance with mocks injected. This is
         # the wiring under test - we exercise the production constructor.
@@ -176,11 +179,10 @@ class TestUserPointsServiceDslWiring(unittest.IsolatedAsyncioTestCase):
             id=self.CUSTOM_STRATEGY_UUID, realmId=self.API_KEY
         )
 
-        # Sanity: the DSL did read the one analytics path it needed and
-        # short-circuited before any others mattered. ``user.measurements_count``
-        # is referenced by rule 2 so its analytic is also precomputed by
-        # ``ExecutionContext.build_for_ast`` even though rule 2 never runs.
-        self.analytics_service.count_measurements_by_external_task_id.assert_awaited_once()
+        # Sanity: every analytics path the AST references (rule 2's
+        # ``user.measurements_count`` included, though rule 2 never runs) was
+        # precomputed by ``ExecutionContext.build_for_ast`` in one query.
+        self.analytics_service.get_scoring_snapshot.assert_awaited_once()
 
     async def test_assign_points_with_custom_strategy_in_wrong_realm_404s(self):
         """
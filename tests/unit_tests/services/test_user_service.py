@@ -83,6 +83,22 @@ class TestUserService(unittest.IsolatedAsyncioTestCase):
             wallet_repository=self.wallet_repository,
             wallet_transaction_repository=self.wallet_transaction_repository,
         )
+        self._db_session = MagicMock()
+        self._db_session.commit = AsyncMock()
+        self._db_session.rollback = AsyncMock()
+        session_context = MagicMock()
+        session_context.__aenter__ = AsyncMock(return_value=self._db_session)
+        session_context.__aexit__ = AsyncMock(return_value=False)
+        self.user_points_repository.session_factory = MagicMock(
+            return_value=session_context
+        )
+        self.user_points_repository.task_stats_repository = MagicMock()
+        self.user_points_repository.task_stats_repository.record_awards = AsyncMock()
+        self.user_points_repository.leaderboard_repository = MagicMock()
+        self.user_points_repository.leaderboard_repository.record_awards = AsyncMock()
+        self.task_repository.read_by_id.return_value = SimpleNamespace(
+            id="task-1", gameId="game-1"
+        )
 
     def _setup_assign_points_default_mocks(
         self,
@@ -110,7 +126,7 @@ class TestUserService(unittest.IsolatedAsyncioTestCase):
             global_calculation
         )
         self.user_points_repository.create = AsyncMock(
-            side_effect=lambda user_points_schema: SimpleNamespace(
+            side_effect=lambda user_points_schema, **kwargs: SimpleNamespace(
                 id=uuid4(),
                 caseName=user_points_schema.caseName,
                 created_at=datetime(2026, 1, 1, 10, 0, 0),
@@ -205,6 +221,74 @@ class TestUserService(unittest.IsolatedAsyncioTestCase):
         )
         self.wallet_repository.create.assert_awaited_once()
         self.wallet_transaction_repository.create.assert_awaited_once()
+        record_awards = self.user_points_repository.task_stats_repository.record_awards
+        record_awards.assert_awaited_once_with(
+            [created_user_points], session=self._db_session, auto_commit=False
+        )
+        leaderboard_awards = (
+            self.user_points_repository.leaderboard_repository.record_awards
+        )
+        leaderboard_awards.assert_awaited_once_with(
+            "game-1",
+            [created_user_points],
+            session=self._db_session,
+            auto_commit=False,
+        )
+        self._db_session.commit.assert_awaited_once()
+
+    async def test_assign_points_to_user_mirrors_leaderboard_after_commit(self):
+        user = SimpleNamespace(id=uuid4())
+        self.user_repository.read_by_id.return_value = user
+        self.user_points_repository.get_user_measurement_count.return_value = 1
+        self.user_points_repository.get_start_time_for_last_task.return_value = None
+        self.user_points_repository.get_time_taken_for_last_task.return_value = None
+        self.user_points_repository.get_individual_calculation.return_value = 10
+        self.user_points_repository.get_global_calculation.return_value = 8
+        created_user_points = SimpleNamespace(
+            id=uuid4(),
+            caseName="CaseA",
+            created_at=datetime(2026, 1, 1, 10, 0, 0),
+            updated_at=datetime(2026, 1, 1, 10, 1, 0),
+            description="desc",
+            userId=user.id,
+            taskId="task-1",
+            points=1,
+            data={},
+        )
+        self.user_points_repository.create = AsyncMock(return_value=created_user_points)
+        self.wallet_repository.read_by_column.return_value = WalletModel(
+            id="wallet-1",
+            coinsBalance=0,
+            pointsBalance=0,
+            conversionRate=100,
+            updated_at=datetime(2026, 1, 1, 10, 2, 0),
+        )
+        self.wallet_repository.update = AsyncMock()
+        self.wallet_transaction_repository.create = AsyncMock(
+            return_value=SimpleNamespace()
+        )
+        backend = MagicMock()
+        backend.record = AsyncMock(side_effect=RuntimeError("redis down"))
+        backend.discard = AsyncMock()
+        self.service.leaderboard_backend = backend
+
+        schema = BaseUserPointsBaseModelWithCaseName(
+            userId=str(user.id),
+            taskId="task-1",
+            caseName="CaseA",
+            points=0,
+            description="desc",
+            data={},
+        )
+        response = await self.service.assign_points_to_user(
+            str(user.id), schema, "api-key"
+        )
+
+        # The award is committed, so a failed mirror only drops the boards.
+        self.assertEqual(response.points, 1)
+        self._db_session.commit.assert_awaited_once()
+        backend.record.assert_awaited_once_with("game-1", [created_user_points])
+        backend.discard.assert_awaited_once_with("game-1", [created_user_points])
 
     async def test_assign_points_to_user_updates_existing_wallet_when_points_present(
         self,
@@ -1,16 +1,14 @@
-import asyncio
 import unittest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 from app.schema.logs_schema import CreateLogs
-from app.schema.oauth_users_schema import CreateOAuthUser
 from app.util.add_log import add_log
 
 
 class TestAddLog(unittest.IsolatedAsyncioTestCase):
     async def test_add_log_success_with_api_key_and_oauth_user(self):
         service_log = MagicMock()
-        service_log.add = AsyncMock(return_value=None)
+        service_log.record = AsyncMock(return_value=None)
 
         result = await add_log(
             module="games",
@@ -23,9 +21,9 @@ class TestAddLog(unittest.IsolatedAsyncioTestCase):
         )
 
         self.assertIsNone(result)
-        service_log.add.assert_awaited_once()
+        service_log.record.assert_awaited_once()
 
-        log_entry = service_log.add.await_args.args[0]
+        log_entry = service_log.record.await_args.args[0]
         self.assertIsInstance(log_entry, CreateLogs)
         self.assertEqual(log_entry.module, "games")
         self.assertEqual(log_entry.log_level, "INFO")
@@ -36,7 +34,7 @@ class TestAddLog(unittest.IsolatedAsyncioTestCase):
 
     async def test_add_log_success_without_optional_identifiers(self):
         service_log = MagicMock()
-        service_log.add = AsyncMock(return_value=None)
+        service_log.record = AsyncMock(return_value=None)
 
         await add_log(
             module="users",
@@ -46,25 +44,18 @@ class TestAddLog(unittest.IsolatedAsyncioTestCase):
             service_log=service_log,
         )
 
-        service_log.add.assert_awaited_once()
-        log_entry = service_log.add.await_args.args[0]
+        service_log.record.assert_awaited_once()
+        log_entry = service_log.record.await_args.args[0]
         self.assertIsInstance(log_entry, CreateLogs)
         self.assertIsNone(log_entry.apiKey_used)
         self.assertIsNone(log_entry.oauth_user_id)
 
-    @patch("app.util.add_log.Container.oauth_users_service")
-    async def test_add_log_retries_after_failure_and_creates_oauth_user(
-        self, mock_oauth_users_service
-    ):
+    async def test_add_log_swallows_write_failure_without_retrying(self):
         service_log = MagicMock()
-        service_log.add = AsyncMock(side_effect=[Exception("db error"), None])
-
-        oauthusers_service = MagicMock()
-        oauthusers_service.add = AsyncMock(return_value=None)
-        mock_oauth_users_service.return_value = oauthusers_service
+        service_log.record = AsyncMock(side_effect=Exception("db error"))
 
         with self.assertLogs("app.util.add_log", level="WARNING") as captured:
-            retry_coroutine = await add_log(
+            result = await add_log(
                 module="apikey",
                 log_level="ERROR",
                 message="failing path",
@@ -74,23 +65,12 @@ class TestAddLog(unittest.IsolatedAsyncioTestCase):
                 oauth_user_id="oauth-user-2",
             )
 
-        self.assertTrue(asyncio.iscoroutine(retry_coroutine))
-        self.assertEqual(service_log.add.await_count, 1)
-        mock_oauth_users_service.assert_called_once()
-        oauthusers_service.add.assert_awaited_once()
-        created_oauth_user = oauthusers_service.add.await_args.args[0]
-        self.assertIsInstance(created_oauth_user, CreateOAuthUser)
-        self.assertEqual(created_oauth_user.provider, "keycloak")
-        self.assertEqual(created_oauth_user.provider_user_id, "oauth-user-2")
-        self.assertEqual(created_oauth_user.status, "active")
+        self.assertIsNone(result)
+        service_log.record.assert_awaited_once()
         joined = "\n".join(captured.output)
         self.assertIn("Failed to write audit log entry", joined)
         self.assertIn("db error", joined)
 
-        retry_result = await retry_coroutine
-        self.assertIsNone(retry_result)
-        self.assertEqual(service_log.add.await_count, 2)
-
 
 if __name__ == "__main__":
     unittest.main()
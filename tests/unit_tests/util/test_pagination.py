@@ -0,0 +1,114 @@
+import unittest
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions import BadRequestError
+from app.util.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+    keyset_order_by,
+)
+
+_table = Table(
+    "pagination_rows",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("name", String),
+    Column("created_at", DateTime),
+)
+
+
+def _sql(clause) -> str:
+    return str(
+        clause.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+class TestCursor(unittest.TestCase):
+    def test_round_trip_restores_column_types(self):
+        created = datetime(2026, 3, 1, 12, 30)
+        cursor = encode_cursor("-created_at", created, 42)
+
+        value, id_value = decode_cursor(
+            cursor, "-created_at", _table.c.created_at, _table.c.id
+        )
+
+        self.assertNotIn("=", cursor)
+        self.assertEqual(value, created)
+        self.assertEqual(id_value, 42)
+
+    def test_round_trip_keeps_null_values(self):
+        cursor = encode_cursor("name", None, UUID(int=7))
+
+        value, id_value = decode_cursor(cursor, "name", _table.c.name, _table.c.name)
+
+        self.assertIsNone(value)
+        self.assertEqual(id_value, str(UUID(int=7)))
+
+    def test_cursor_for_another_ordering_is_rejected(self):
+        cursor = encode_cursor("name", "a", 1)
+
+        with self.assertRaises(BadRequestError) as ctx:
+            decode_cursor(cursor, "-name", _table.c.name, _table.c.id)
+        self.assertIn("different ordering", ctx.exception.detail)
+
+    def test_malformed_cursor_is_rejected(self):
+        for cursor in ("%%%", "bm90LWpzb24", "e30"):
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(BadRequestError):
+                    decode_cursor(cursor, "name", _table.c.name, _table.c.id)
+
+
+class TestKeysetClauses(unittest.TestCase):
+    def test_order_by_adds_id_tiebreaker_in_same_direction(self):
+        ascending = [
+            _sql(term) for term in keyset_order_by(_table.c.name, _table.c.id, False)
+        ]
+        descending = [
+            _sql(term) for term in keyset_order_by(_table.c.name, _table.c.id, True)
+        ]
+
+        self.assertEqual(
+            ascending, ["pagination_rows.name ASC NULLS LAST", "pagination_rows.id ASC"]
+        )
+        self.assertEqual(
+            descending,
+            ["pagination_rows.name DESC NULLS FIRST", "pagination_rows.id DESC"],
+        )
+
+    def test_order_by_id_has_no_tiebreaker(self):
+        terms = keyset_order_by(_table.c.id, _table.c.id, False)
+
+        self.assertEqual(len(terms), 1)
+
+    def test_condition_ascending_keeps_trailing_nulls(self):
+        sql = _sql(keyset_condition(_table.c.name, _table.c.id, False, "m", 5))
+
+        self.assertIn("pagination_rows.name > 'm'", sql)
+        self.assertIn("pagination_rows.id > 5", sql)
+        self.assertIn("pagination_rows.name IS NULL", sql)
+
+    def test_condition_after_null_value(self):
+        ascending = _sql(keyset_condition(_table.c.name, _table.c.id, False, None, 5))
+        descending = _sql(keyset_condition(_table.c.name, _table.c.id, True, None, 5))
+
+        self.assertEqual(
+            ascending, "pagination_rows.name IS NULL AND pagination_rows.id > 5"
+        )
+        self.assertIn("pagination_rows.name IS NOT NULL", descending)
+        self.assertIn("pagination_rows.id < 5", descending)
+
+    def test_condition_on_id_only(self):
+        sql = _sql(keyset_condition(_table.c.id, _table.c.id, True, 9, 9))
+
+        self.assertEqual(sql, "pagination_rows.id < 9")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import io
+import zipfile
+from decimal import Decimal
+
+import pytest
+
+from app.util.xlsx_stream import StreamingXlsxWriter, _column_letter
+
+
+def _load(data):
+    openpyxl = pytest.importorskip("openpyxl")
+    return openpyxl.load_workbook(io.BytesIO(data))
+
+
+def test_column_letters():
+    assert [_column_letter(i) for i in (0, 25, 26, 51, 701, 702)] == [
+        "A",
+        "Z",
+        "AA",
+        "AZ",
+        "ZZ",
+        "AAA",
+    ]
+
+
+def test_written_workbook_reads_back_with_typed_cells():
+    writer = StreamingXlsxWriter(sheet_title="export")
+    writer.append(["id", "points", "rate", "flag", "note"])
+    writer.append(["u1", 10, 2.5, True, 'a < b & "c"'])
+    writer.append(["u2", "", None, False, "  padded\x00\x1f "])
+    writer.append([Decimal("1.25"), float("nan"), "x"])
+    data = writer.drain() + writer.close()
+
+    assert zipfile.ZipFile(io.BytesIO(data)).testzip() is None
+    sheet = _load(data)["export"]
+    assert [list(row) for row in sheet.iter_rows(values_only=True)] == [
+        ["id", "points", "rate", "flag", "note"],
+        ["u1", 10, 2.5, True, 'a < b & "c"'],
+        # Empty cells keep the following columns in place.
+        ["u2", None, None, False, "  padded "],
+        [1.25, "nan", "x", None, None],
+    ]
+
+
+def test_rows_are_drained_before_the_archive_is_closed():
+    writer = StreamingXlsxWriter()
+    writer.append(["id", "payload"])
+    chunks = []
+    for index in range(20_000):
+        writer.append([index, f"row-{index}-{index * 7919 % 104729}"])
+        if writer.pending_bytes >= 64 * 1024:
+            chunks.append(writer.drain())
+    tail = writer.close()
+
+    assert len(chunks) > 1
+    assert writer.pending_bytes == 0
+    assert writer.close() == b""
+    sheet = _load(b"".join(chunks) + tail).active
+    assert sheet.max_row == 20_001
+    assert sheet.cell(row=20_001, column=1).value == 19_999